@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the import time and the per call overhead of the library.
+
+Usage:
+
+::
+
+    python benchmark/bench_library.py
+    python benchmark/bench_library.py --path /path/to/other/checkout/lib
+
+The import is timed in fresh interpreters, once with nothing imported and
+once with the standard library modules it needs already imported, as they are
+in a test session, and then once more using a context and a function as a
+short test would, which also imports the parser. Compiled files are cached
+before timing, and the compilation of the library modules is timed apart. The
+calls are timed against an enode that answers instantly, so only the library
+overhead is measured.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import sys
+from os.path import abspath, dirname, join, exists
+from subprocess import check_output
+from argparse import ArgumentParser
+from timeit import repeat
+
+
+DEFAULT_PATH = join(dirname(dirname(abspath(__file__))), 'lib')
+
+IMPORT_SCRIPT = """\
+import sys
+sys.path.insert(0, {path!r})
+{preload}
+from timeit import default_timer
+start = default_timer()
+import topology_lib_vtysh.library
+{use}
+print(default_timer() - start)
+"""
+
+USE = """\
+topology_lib_vtysh.library.ConfigInterface
+topology_lib_vtysh.library.show_vlan
+"""
+
+PRELOAD = 'import re, weakref, collections'
+
+MODULES = ['library.py', 'commands.py', 'dispatch.py']
+
+MEMORY_SCRIPT = """\
+import sys
+sys.path.insert(0, {path!r})
+import tracemalloc
+tracemalloc.start()
+import topology_lib_vtysh.library
+print(tracemalloc.get_traced_memory()[0])
+"""
+
+CALLS = [
+    ('show_vlan(enode)', 'show_vlan(enode)'),
+    ('show_vlan(enode, vlanid)', "show_vlan(enode, '10')"),
+    ('ip_address(ipv4)', "ctx.ip_address('10.0.0.1/24')"),
+    ('ip_address(ipv4=ipv4)', "ctx.ip_address(ipv4='10.0.0.1/24')"),
+    ('no_shutdown()', 'ctx_vlan.no_shutdown()'),
+]
+
+CALLS_SETUP = """\
+import sys
+sys.path.insert(0, {path!r})
+from topology_lib_vtysh.library import ConfigInterface, ConfigVlan, show_vlan
+
+
+class Enode(object):
+    ports = {{'1': '1'}}
+
+    def __call__(self, command, shell=None):
+        return ''
+
+
+enode = Enode()
+ctx = ConfigInterface(enode, '1')
+ctx_vlan = ConfigVlan(enode, '10')
+"""
+
+
+def run_script(script):
+    return float(check_output([sys.executable, '-c', script]).strip())
+
+
+def bench_import(path, rounds):
+    """
+    Time the import of the library in fresh interpreters.
+
+    :rtype: list
+    :return: Best import time, in seconds, of the package, of the package
+     alone and of the package alone followed by the use of a context and a
+     function.
+    """
+    scripts = [
+        IMPORT_SCRIPT.format(path=path, preload='', use=''),
+        IMPORT_SCRIPT.format(
+            path=path, preload=PRELOAD, use=''
+        ),
+        IMPORT_SCRIPT.format(
+            path=path, preload=PRELOAD, use=USE
+        ),
+    ]
+
+    # Populate the cache of compiled files
+    run_script(scripts[0])
+
+    return [
+        min(run_script(script) for _ in range(rounds)) for script in scripts
+    ]
+
+
+def bench_compile(path, rounds):
+    """
+    Time the compilation of the library modules, which is paid on every
+    import when the compiled files can not be cached.
+
+    :rtype: float
+    :return: Best compilation time, in seconds.
+    """
+    sources = []
+    for module in MODULES:
+        filename = join(path, 'topology_lib_vtysh', module)
+        if exists(filename):
+            with open(filename) as fd:
+                sources.append((filename, fd.read()))
+
+    def run():
+        for filename, source in sources:
+            compile(source, filename, 'exec')
+
+    return min(repeat(run, number=1, repeat=rounds))
+
+
+def bench_memory(path):
+    """
+    Measure the memory allocated by the import of the library.
+
+    :rtype: int
+    :return: Bytes allocated, or ``None`` if tracemalloc is not available.
+    """
+    try:
+        return int(run_script(MEMORY_SCRIPT.format(path=path)))
+    except Exception:
+        return None
+
+
+def bench_calls(path, number):
+    """
+    Time the calls of some library functions.
+
+    :rtype: list
+    :return: Best time per call, in seconds, for every call in ``CALLS``.
+    """
+    setup = CALLS_SETUP.format(path=path)
+    return [
+        min(repeat(statement, setup=setup, number=number, repeat=5)) / number
+        for _, statement in CALLS
+    ]
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--path', default=DEFAULT_PATH,
+        help='Directory containing the topology_lib_vtysh package to time'
+    )
+    parser.add_argument('--rounds', type=int, default=30)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    total, library, used = bench_import(args.path, args.rounds)
+    print('import (total)           {:8.2f} ms'.format(total * 1e3))
+    print('import (package only)    {:8.2f} ms'.format(library * 1e3))
+    print('import and first use     {:8.2f} ms'.format(used * 1e3))
+    print('compile (no cache)       {:8.2f} ms'.format(
+        bench_compile(args.path, args.rounds) * 1e3
+    ))
+
+    memory = bench_memory(args.path)
+    if memory is not None:
+        print('import memory            {:8.1f} KiB'.format(memory / 1024))
+
+    for (name, _), seconds in zip(CALLS, bench_calls(args.path, args.number)):
+        print('{:<24} {:8.2f} us'.format(name, seconds * 1e6))
+
+
+if __name__ == '__main__':
+    main()
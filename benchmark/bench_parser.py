@@ -0,0 +1,356 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the per line cost of the parsers on large outputs.
+
+Usage:
+
+::
+
+    python benchmark/bench_parser.py
+    python benchmark/bench_parser.py --path /path/to/other/checkout/lib
+
+The parsers that go over their output line by line are timed on outputs of
+``--lines`` lines, so two checkouts can be compared. Then, if the parser
+module has a registry of compiled expressions, the search of a single line is
+timed with the expression given as a string to the :mod:`re` module, both
+when it is in the cache of the module and when it was evicted, and with the
+compiled expression of the registry.
+
+The memory peak of the streaming parsers is measured while they read
+``--lines`` lines and ten times that from a generator, to show that it does
+not grow with the size of the output, next to the memory peak of the parser
+that returns the whole list.
+
+The memory held by the results of the route and BGP parsers is measured
+for ``--lines`` lines, as dictionaries and as the compact records returned
+with ``compact=True``.
+
+Last, the search of an IPv6 network and next hop is timed on garbled lines
+made of more and more address fragments, with the scanner of the parser
+module and with the nested expression it replaced. The expression is only
+timed until a search takes more than ``--limit`` seconds, as its time grows
+exponentially with the length of the line, while the time of the scanner
+grows linearly.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import re
+import sys
+from tracemalloc import start, stop, get_traced_memory
+from os.path import abspath, dirname, join
+from argparse import ArgumentParser
+from timeit import repeat
+
+
+DEFAULT_PATH = join(dirname(dirname(abspath(__file__))), 'lib')
+
+
+def vlan_lines(count):
+    for index in range(count):
+        yield '{:<8} vlan{:<8} up      ok       1, 2, 3'.format(
+            index + 1, index + 1
+        )
+
+
+def bgp_lines(count):
+    for index in range(count):
+        yield '*> 10.{}.{}.0/24   20.1.1.1   0   0   0   65000 64100 i'.format(
+            index // 256 % 256, index % 256
+        )
+
+
+def ntp_lines(count):
+    for index in range(count):
+        yield (
+            '* {:<5} 192.168.1.100  192.168.1.100  3  -  172.16.135.123  4  U'
+            '  41  64  377  0.138  17.811  1.942'.format(index)
+        )
+
+
+def rib_lines(count):
+    yield 'ipv4 rib entries'
+    for index in range(count // 2):
+        yield '*10.{}.{}.0/24,  1 unicast next-hops'.format(
+            index // 256 % 256, index % 256
+        )
+        yield '\t*via  20.1.1.1,  [20/0],  BGP'
+    yield 'No ipv6 rib entries'
+
+
+def route_lines(count):
+    for index in range(count // 2):
+        yield '10.{}.{}.0/24,  1 unicast next-hops'.format(
+            index // 256 % 256, index % 256
+        )
+        yield '    via  20.1.1.1,  [20/0],  bgp'
+
+
+PARSERS = [
+    ('parse_show_vlan', vlan_lines, 'vlan'),
+    ('parse_show_ip_bgp', bgp_lines, 'bgp_route'),
+    ('parse_show_ntp_associations', ntp_lines, 'ntp_association'),
+    ('parse_show_rib', rib_lines, 'rib_ipv4_nexthop'),
+]
+
+
+def bench_parsers(parser, lines, rounds):
+    """
+    Time the line by line parsers.
+
+    :rtype: list
+    :return: Best time per line, in seconds, for every parser in ``PARSERS``.
+    """
+    results = []
+    for name, generate, _ in PARSERS:
+        output = '\n'.join(generate(lines))
+        parse = getattr(parser, name)
+        best = min(repeat(lambda: parse(output), number=1, repeat=rounds))
+        results.append(best / lines)
+    return results
+
+
+def bench_search(parser, number):
+    """
+    Time the search of a single line.
+
+    :rtype: list
+    :return: For every parser in ``PARSERS``, the best time per search, in
+     seconds, with the expression as a string in the cache of the re module,
+     as a string evicted from that cache, and compiled.
+    """
+    patterns = parser._PATTERNS
+    results = []
+    for _, generate, name in PARSERS:
+        pattern, flags = patterns._sources[name]
+        line = list(generate(2))[-1]
+        search = getattr(patterns, name).search
+
+        def cached():
+            re.search(pattern, line, flags)
+
+        def evicted():
+            re.purge()
+            re.search(pattern, line, flags)
+
+        def compiled():
+            search(line)
+
+        results.append([
+            min(repeat(function, number=count, repeat=5)) / count
+            for function, count in (
+                (cached, number), (evicted, number // 100), (compiled, number)
+            )
+        ])
+    return results
+
+
+STREAMS = [
+    ('show_ip_bgp', bgp_lines),
+    ('show_ip_route', route_lines),
+]
+
+
+def bench_stream(parser, lines):
+    """
+    Measure the memory peak of the streaming parsers.
+
+    :rtype: list
+    :return: For every parser in ``STREAMS``, the memory peak, in bytes, of
+     the streaming parser reading ``lines`` and ten times as many lines, and
+     of the parser returning a list, given ``lines`` lines as a string.
+    """
+    def peak(function):
+        start()
+        try:
+            function()
+            return get_traced_memory()[1]
+        finally:
+            stop()
+
+    results = []
+    for name, generate in STREAMS:
+        stream = getattr(parser, 'iter_' + name)
+        parse = getattr(parser, 'parse_' + name)
+        output = '\n'.join(generate(lines))
+        results.append([
+            peak(lambda: sum(1 for _ in stream(generate(lines)))),
+            peak(lambda: sum(1 for _ in stream(generate(lines * 10)))),
+            peak(lambda: parse(output)),
+        ])
+    return results
+
+
+RECORDS = [
+    ('parse_show_rib', rib_lines),
+    ('parse_show_ip_route', route_lines),
+    ('parse_show_ip_bgp', bgp_lines),
+]
+
+
+def bench_records(parser, lines):
+    """
+    Measure the memory held by the results of the parsers.
+
+    :rtype: list
+    :return: For every parser in ``RECORDS``, the memory, in bytes, held by
+     its result as dictionaries and as compact records.
+    """
+    def held(parse, output, **kwargs):
+        start()
+        try:
+            # The result is only dropped once its memory is measured
+            result = parse(output, **kwargs)
+            size = get_traced_memory()[0]
+            del result
+            return size
+        finally:
+            stop()
+
+    results = []
+    for name, generate in RECORDS:
+        parse = getattr(parser, name)
+        output = '\n'.join(generate(lines))
+        results.append([
+            held(parse, output), held(parse, output, compact=True)
+        ])
+    return results
+
+
+# The expression that matched an IPv6 address before the scanner
+NESTED = r'(?:(?:(?:[0-9A-Za-z]+:)+:?([0-9A-Za-z]+)?)+)'
+
+GARBLED = [
+    (
+        'network', '_search_ipv6_network',
+        r'(?P<selected>\*?)(?P<network>' + NESTED + r'/\d+)',
+        lambda count: '*' + 'ab1:' * count + '/x',
+    ),
+    (
+        'next hop', '_search_rib_ipv6_nexthop',
+        r'(?P<selected>\*?)via\s+(?P<via>(?:' + NESTED + r'|\d+)),\s+'
+        r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)',
+        lambda count: '\t*via  ' + '2001:' * count + 'x',
+    ),
+]
+
+GARBLED_COUNTS = [2, 4, 6, 8, 10, 12, 64, 256, 1024, 4096, 16384]
+
+
+def bench_garbled(parser, limit):
+    """
+    Time the search of IPv6 addresses on garbled lines.
+
+    :rtype: list
+    :return: For every search in ``GARBLED``, a list with a
+     ``(length, nested, scanner)`` tuple for every count of fragments in
+     ``GARBLED_COUNTS``, with the length of the line and the time of the
+     search, in seconds, with the nested expression and with the scanner.
+     The time of the expression is ``None`` once it goes over ``limit``.
+    """
+    results = []
+    for _, name, pattern, generate in GARBLED:
+        search = re.compile(pattern).search
+        scan = getattr(parser, name)
+        timings = []
+        nested = 0
+        for count in GARBLED_COUNTS:
+            line = generate(count)
+            if nested is not None and nested <= limit:
+                nested = min(repeat(lambda: search(line), number=1, repeat=3))
+            else:
+                nested = None
+            scanner = min(repeat(lambda: scan(line), number=10, repeat=3))
+            timings.append((len(line), nested, scanner / 10))
+        results.append(timings)
+    return results
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--path', default=DEFAULT_PATH,
+        help='Directory containing the topology_lib_vtysh package to time'
+    )
+    parser.add_argument('--lines', type=int, default=100000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument('--number', type=int, default=100000)
+    parser.add_argument('--limit', type=float, default=0.1)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from topology_lib_vtysh import parser as vtysh_parser
+
+    print('{:<32} {:>10}'.format('parser', 'us/line'))
+    timings = bench_parsers(vtysh_parser, args.lines, args.rounds)
+    for (name, _, _), seconds in zip(PARSERS, timings):
+        print('{:<32} {:10.3f}'.format(name, seconds * 1e6))
+
+    if hasattr(vtysh_parser, '_PATTERNS'):
+        print()
+        print('{:<32} {:>10} {:>10} {:>10}'.format(
+            'search of a line (us)', 'cached', 'evicted', 'compiled'
+        ))
+        timings = bench_search(vtysh_parser, args.number)
+        for (_, _, name), seconds in zip(PARSERS, timings):
+            print('{:<32} {:10.3f} {:10.3f} {:10.3f}'.format(
+                name, *(value * 1e6 for value in seconds)
+            ))
+
+    if hasattr(vtysh_parser, 'iter_show_ip_bgp'):
+        print()
+        print('{:<32} {:>10} {:>10} {:>10}'.format(
+            'memory peak (KiB)', 'iter', 'iter x10', 'parse'
+        ))
+        sizes = bench_stream(vtysh_parser, args.lines)
+        for (name, _), size in zip(STREAMS, sizes):
+            print('{:<32} {:10.1f} {:10.1f} {:10.1f}'.format(
+                name, *(value / 1024 for value in size)
+            ))
+
+    if hasattr(vtysh_parser, '_compacted'):
+        print()
+        print('{:<32} {:>10} {:>10} {:>10}'.format(
+            'result memory (KiB)', 'dict', 'compact', 'ratio'
+        ))
+        sizes = bench_records(vtysh_parser, args.lines)
+        for (name, _), (full, compact) in zip(RECORDS, sizes):
+            print('{:<32} {:10.1f} {:10.1f} {:10.2f}'.format(
+                name, full / 1024, compact / 1024, full / compact
+            ))
+
+    if hasattr(vtysh_parser, '_search_ipv6_network'):
+        timings = bench_garbled(vtysh_parser, args.limit)
+        for (label, _, _, _), results in zip(GARBLED, timings):
+            print()
+            print('{:<32} {:>10} {:>10} {:>10}'.format(
+                'garbled ' + label + ' (ms)', 'length', 'nested', 'scanner'
+            ))
+            for length, nested, scanner in results:
+                print('{:<32} {:10d} {:>10} {:10.3f}'.format(
+                    '', length,
+                    '-' if nested is None else '{:.3f}'.format(nested * 1e3),
+                    scanner * 1e3
+                ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,463 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Benchmark the parsers on synthetic outputs of large tables.
+
+Usage:
+
+::
+
+    python benchmark/bench_scale.py --save baseline.json
+    # ... change the parsers ...
+    python benchmark/bench_scale.py --compare baseline.json --threshold 0.2
+
+Every parser with a generator is given the output of a table of ``--count``
+items, like routes, VLANs, BGP neighbors, DHCP leases or NTP associations.
+The number of items it returns is checked, so a parser that stops matching
+its output is not reported as a fast one. The throughput, in lines per
+second, is the best of ``--rounds`` parses, and the memory peak of a parse is
+measured apart, as tracing the memory slows down the parse.
+
+The results can be saved as a JSON baseline, and later runs compared with
+it. A parser regresses when its throughput falls, or its memory peak grows,
+by more than ``--threshold`` of the baseline, and the script then exits with
+a non zero status, so it can be run in a continuous integration job. The
+memory peaks repeat exactly from run to run, but the throughput varies with
+the load of the machine, so a baseline is only worth comparing with runs on
+the same machine, with a threshold over the noise of its timings. The
+parsers of outputs that do not grow with a table are listed as not covered.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import sys
+import json
+import platform
+from tracemalloc import start, stop, get_traced_memory
+from os.path import abspath, dirname, join
+from argparse import ArgumentParser
+from timeit import repeat, default_timer
+
+
+DEFAULT_PATH = join(dirname(dirname(abspath(__file__))), 'lib')
+
+# Least time of a round of parses, in seconds
+MINIMUM = 0.2
+
+
+def ipv4(index, first=10):
+    return '{}.{}.{}.{}'.format(
+        first, index >> 16 & 0xff, index >> 8 & 0xff, index & 0xff
+    )
+
+
+def vlan_lines(count):
+    yield '-' * 80
+    yield 'VLAN    Name      Status   Reason         Reserved       Ports'
+    yield '-' * 80
+    for index in range(count):
+        yield (
+            '{:<8}vlan{:<6}up       ok                            '
+            '7, 3, 8, 1'.format(index + 1, index + 1)
+        )
+
+
+def lacp_aggregate_lines(count):
+    for index in range(count):
+        yield 'Aggregate-name        : lag{}'.format(index + 1)
+        yield 'Aggregated-interfaces : {} {}'.format(index * 2, index * 2 + 1)
+        yield 'Heartbeat rate        : slow'
+        yield 'Fallback              : false'
+        yield 'Hash                  : l3-src-dst'
+        yield 'Aggregate mode        : off'
+        yield ''
+
+
+def bgp_summary_lines(count):
+    yield 'BGP router identifier 2.0.0.1, local AS number 64000'
+    yield 'RIB entries {}'.format(count)
+    yield 'Peers {}'.format(count)
+    yield ''
+    yield 'Neighbor             AS MsgRcvd MsgSent Up/Down  State'
+    for index in range(count):
+        yield '{:<17} {:>5}       0       0 never         Active'.format(
+            ipv4(index, 20), 65000 + index % 100
+        )
+
+
+BGP_COUNTERS = [
+    'dropped_count', 'dynamic_cap_in_count', 'dynamic_cap_out_count',
+    'established_count', 'keepalive_in_count', 'keepalive_out_count',
+    'notify_in_count', 'notify_out_count', 'open_in_count',
+    'open_out_count', 'readtime', 'refresh_in_count', 'refresh_out_count',
+    'resettime', 'update_in_count', 'update_out_count', 'uptime',
+]
+
+
+def bgp_neighbor_lines(count):
+    for index in range(count):
+        yield '  name: {}, remote-as: {}'.format(
+            ipv4(index, 20), 65000 + index % 100
+        )
+        yield '    state: Active'
+        yield '    tcp_port_number: 179'
+        yield ''
+        yield '    statistics:'
+        for counter in BGP_COUNTERS:
+            yield '       bgp_peer_{}: {}'.format(counter, index)
+        yield ''
+
+
+def bgp_header():
+    yield 'Status codes: s suppressed, d damped, h history, * valid, > best'
+    yield 'Origin codes: i - IGP, e - EGP, ? - incomplete'
+    yield ''
+    yield 'Local router-id 1.1.1.2'
+    yield '   Network          Next Hop            Metric LocPrf Weight Path'
+
+
+def ip_bgp_lines(count):
+    for line in bgp_header():
+        yield line
+    for index in range(count):
+        yield '*> {}/32   20.1.1.{}   0   0   0   65000 {} i'.format(
+            ipv4(index), index % 250 + 1, 64000 + index % 1000
+        )
+    yield 'Total number of entries {}'.format(count)
+
+
+def ipv6_bgp_lines(count):
+    for line in bgp_header():
+        yield line
+    for index in range(count):
+        yield '*> 10::{:x}/126   3::{:x}   0   0   0   65000 {} i'.format(
+            index * 4, index % 250 + 1, 64000 + index % 1000
+        )
+    yield 'Total number of entries {}'.format(count)
+
+
+def rib_lines(count):
+    yield 'Displaying ipv4 rib entries'
+    yield ''
+    yield '\'*\' denotes selected'
+    yield '\'[x/y]\' denotes [distance/metric]'
+    yield ''
+    for index in range(count // 2):
+        yield '*{}/32,  1 unicast next-hops'.format(ipv4(index))
+        yield '\t*via  20.1.1.{},  [20/0],  BGP'.format(index % 250 + 1)
+    yield ''
+    yield 'Displaying ipv6 rib entries'
+    yield ''
+    for index in range(count - count // 2):
+        yield '*10::{:x}/126,  1 unicast next-hops'.format(index * 4)
+        yield '\t*via  3::{:x},  [20/0],  BGP'.format(index % 250 + 1)
+
+
+def ip_route_lines(count):
+    yield 'Displaying ipv4 routes selected for forwarding'
+    yield ''
+    for index in range(count):
+        yield '{}/32,  1 unicast next-hops'.format(ipv4(index))
+        yield '\tvia  20.1.1.{},  [20/0],  bgp'.format(index % 250 + 1)
+
+
+def ipv6_route_lines(count):
+    yield 'Displaying ipv6 routes selected for forwarding'
+    yield ''
+    for index in range(count):
+        yield '10::{:x}/126,  1 unicast next-hops'.format(index * 4)
+        yield '\tvia  3::{:x},  [20/0],  bgp'.format(index % 250 + 1)
+
+
+def running_config_lines(count):
+    yield 'Current configuration:'
+    yield '!'
+    yield 'router bgp 64001'
+    yield '     bgp router-id 2.0.0.1'
+    for index in range(count):
+        yield '     network {}/32'.format(ipv4(index))
+    yield '!'
+
+
+def ntp_association_lines(count):
+    yield '-' * 120
+    yield (
+        'ID             NAME           REMOTE  VER  KEYID           REF-ID  '
+        'ST  T  LAST  POLL  REACH    DELAY  OFFSET  JITTER'
+    )
+    yield '-' * 120
+    for index in range(count):
+        yield (
+            '*  {}    {}    {}    3      10  172.16.135.123   4  U'
+            '    41    64    377    0.138  17.811   1.942'.format(
+                index + 1, ipv4(index, 192), ipv4(index, 192)
+            )
+        )
+
+
+def ntp_authentication_key_lines(count):
+    yield '-' * 27
+    yield 'Auth-key       MD5 password'
+    yield '-' * 27
+    for index in range(count):
+        yield '    {}        Password_{}'.format(index + 1, index)
+    yield '-' * 27
+
+
+def ntp_trusted_key_lines(count):
+    yield '-' * 12
+    yield 'Trusted-keys'
+    yield '-' * 12
+    for index in range(count):
+        yield '    {}'.format(index + 1)
+    yield '-' * 12
+
+
+def dhcp_lease_lines(count):
+    yield (
+        'Expiry Time                MAC Address       IP Address  '
+        'Hostname and Client-id'
+    )
+    yield '-' * 79
+    for index in range(count):
+        yield (
+            'Thu Mar  3 05:36:11 2016   00:50:56:{:02x}:{:02x}:{:02x}   {}  '
+            'host{}   *'.format(
+                index >> 16 & 0xff, index >> 8 & 0xff, index & 0xff,
+                ipv4(index, 192), index
+            )
+        )
+
+
+def rib_size(result):
+    return len(result['ipv4_entries']) + len(result['ipv6_entries'])
+
+
+def bgp_summary_size(result):
+    return len(result) - 4
+
+
+def running_config_size(result):
+    return len(result['bgp']['64001']['networks'])
+
+
+# The parsers of the outputs that grow with a table, with the generator of
+# an output of a given number of items, and the number of items of a result
+SCALES = [
+    ('parse_show_vlan', vlan_lines, len),
+    ('parse_show_lacp_aggregates', lacp_aggregate_lines, len),
+    ('parse_show_ip_bgp_summary', bgp_summary_lines, bgp_summary_size),
+    ('parse_show_ip_bgp_neighbors', bgp_neighbor_lines, len),
+    ('parse_show_ip_bgp', ip_bgp_lines, len),
+    ('parse_show_ipv6_bgp', ipv6_bgp_lines, len),
+    ('parse_show_rib', rib_lines, rib_size),
+    ('parse_show_ip_route', ip_route_lines, len),
+    ('parse_show_ipv6_route', ipv6_route_lines, len),
+    ('parse_show_running_config', running_config_lines, running_config_size),
+    ('parse_show_ntp_associations', ntp_association_lines, len),
+    ('parse_show_ntp_authentication_key', ntp_authentication_key_lines, len),
+    ('parse_show_ntp_trusted_keys', ntp_trusted_key_lines, len),
+    ('parse_show_dhcp_server_leases', dhcp_lease_lines, len),
+]
+
+
+def timer(function):
+    """
+    Time a single call of a function.
+    """
+    begin = default_timer()
+    function()
+    return default_timer() - begin
+
+
+def peak(function):
+    """
+    Measure the memory peak of a function, over the memory in use before it
+    is called.
+    """
+    start()
+    try:
+        function()
+        return get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def bench_scales(parser, count, rounds, names=None):
+    """
+    Time the parsers on outputs of ``count`` items and measure their memory.
+
+    :param names: Names of the parsers to run, or ``None`` to run all the
+     parsers in ``SCALES`` found in the parser module.
+    :rtype: dict
+    :return: For every parser, a dictionary with the ``lines`` of its output,
+     its best ``seconds``, its ``lines_per_second`` and its ``peak`` memory,
+     in bytes.
+    :raise AssertionError: If a parser does not return ``count`` items.
+    """
+    results = {}
+    for name, generate, size in SCALES:
+        if names and name not in names:
+            continue
+        parse = getattr(parser, name, None)
+        if parse is None:
+            continue
+
+        output = '\n'.join(generate(count)) + '\n'
+
+        found = size(parse(output))
+        assert found == count, '{} found {} of {} items'.format(
+            name, found, count
+        )
+
+        # Short parses are repeated, so a round lasts long enough to not be
+        # dominated by the noise of the timer and the system
+        number = max(1, int(MINIMUM / max(timer(lambda: parse(output)), 1e-9)))
+        seconds = min(
+            repeat(lambda: parse(output), number=number, repeat=rounds)
+        ) / number
+        lines = output.count('\n')
+        results[name] = {
+            'lines': lines,
+            'seconds': seconds,
+            'lines_per_second': lines / seconds,
+            'peak': peak(lambda: parse(output)),
+        }
+    return results
+
+
+def uncovered(parser):
+    """
+    List the parsers of the parser module that have no generator.
+
+    :rtype: list
+    """
+    covered = set(name for name, _, _ in SCALES)
+    return sorted(
+        name for name in dir(parser)
+        if name.startswith('parse_') and name not in covered
+    )
+
+
+def compare(baseline, results, threshold):
+    """
+    Compare the results of a run with a baseline.
+
+    :param dict baseline: The baseline, as saved by :func:`save`.
+    :param dict results: The results, as returned by :func:`bench_scales`.
+    :param float threshold: The fraction of the baseline a parser may lose
+     in throughput, or gain in memory peak, before it regresses.
+    :rtype: list
+    :return: A ``(name, speed, memory, regressed)`` tuple for every parser
+     found in both, with the ratios of the throughput and of the memory peak
+     of the run to the ones of the baseline, and if they regressed.
+    """
+    comparisons = []
+    parsers = baseline['parsers']
+    for name, result in sorted(results.items()):
+        if name not in parsers:
+            continue
+        speed = result['lines_per_second'] / parsers[name]['lines_per_second']
+        memory = result['peak'] / max(parsers[name]['peak'], 1)
+        regressed = speed < 1 - threshold or memory > 1 + threshold
+        comparisons.append((name, speed, memory, regressed))
+    return comparisons
+
+
+def save(path, count, results):
+    """
+    Save the results of a run as a baseline.
+    """
+    baseline = {
+        'count': count,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'parsers': results,
+    }
+    with open(path, 'w') as fd:
+        json.dump(baseline, fd, indent=4, sort_keys=True)
+
+
+def main():
+    parser = ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--path', default=DEFAULT_PATH,
+        help='Directory containing the topology_lib_vtysh package to time'
+    )
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=5)
+    parser.add_argument(
+        '--parser', action='append', dest='parsers',
+        help='Name of a parser to run, all of them if not given'
+    )
+    parser.add_argument('--save', help='Save the results as a baseline')
+    parser.add_argument('--compare', help='Compare with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=0.2)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.path)
+    from topology_lib_vtysh import parser as vtysh_parser
+
+    results = bench_scales(
+        vtysh_parser, args.count, args.rounds, args.parsers
+    )
+
+    print('{:<36} {:>10} {:>12} {:>12}'.format(
+        'parser ({} items)'.format(args.count), 'lines', 'lines/s',
+        'peak (KiB)'
+    ))
+    for name, result in sorted(results.items()):
+        print('{:<36} {:10d} {:12.0f} {:12.1f}'.format(
+            name, result['lines'], result['lines_per_second'],
+            result['peak'] / 1024
+        ))
+    if not args.parsers:
+        print()
+        print('Not covered: {}'.format(', '.join(uncovered(vtysh_parser))))
+
+    if args.save:
+        save(args.save, args.count, results)
+
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as fd:
+        baseline = json.load(fd)
+    if baseline['count'] != args.count:
+        print()
+        print('The baseline was taken with --count {}'.format(
+            baseline['count']
+        ))
+        return 2
+
+    print()
+    print('{:<36} {:>10} {:>12}'.format(
+        'against the baseline', 'speed', 'memory'
+    ))
+    comparisons = compare(baseline, results, args.threshold)
+    for name, speed, memory, regressed in comparisons:
+        print('{:<36} {:9.2f}x {:11.2f}x {}'.format(
+            name, speed, memory, 'REGRESSED' if regressed else ''
+        ))
+    return 1 if any(regressed for _, _, _, regressed in comparisons) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
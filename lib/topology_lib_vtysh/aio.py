@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Vtysh auto-generated asyncio communication library module.
+
+This module provides the same functions and contexts of
+:mod:`topology_lib_vtysh.library` as coroutines, for enodes whose call is a
+coroutine too:
+
+::
+
+    output = await enode('show vlan', shell='vtysh')
+
+Usage:
+
+::
+
+    vlans = await show_vlan(enode)
+
+    async with ConfigInterface(enode, '1') as ctx:
+        await ctx.no_shutdown()
+
+.. note::
+
+   This module requires Python 3.5 or later.
+
+.. warning::
+
+   This is auto-generated, do not modify manually!!
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from sys import version_info
+
+from .exceptions import determine_exception
+from .batch import split_output, supports_batch
+from .session import ContextState, RangeState
+from .instrument import _HOOKS, pre_call, post_call, run_parser
+from .cache import _ENABLED, invalidate, get_cache
+from .dispatch import NAME, TEMPLATE, renderer, Binder
+from .commands import ROOT, CONTEXTS
+
+
+async def _call(enode, command):
+    """
+    Run a command of a batch.
+    """
+    start = pre_call(enode, 'batch', command)
+    output = await enode(command, shell='vtysh')
+    post_call(enode, 'batch', command, start, output)
+    return output
+
+
+async def _recover(enode, commands):
+    """
+    Send the commands that go back to a known mode after a batch failed.
+    """
+    for command in commands:
+        await _call(enode, command)
+
+
+async def run_batch(enode, commands, recover=('end', )):
+    """
+    Coroutine version of :func:`topology_lib_vtysh.batch.run_batch`.
+
+    With a call per command the batch stops at the first command that fails,
+    or that an instrumentation hook raises for, and the ``recover`` commands
+    are sent before raising.
+    """
+    if not commands:
+        return
+
+    if supports_batch(enode):
+        segments = split_output(
+            commands, await _call(enode, '\n'.join(commands)) or ''
+        )
+    else:
+        segments = []
+        for index, command in enumerate(commands, 1):
+            try:
+                output = await _call(enode, command)
+            except Exception:
+                if index < len(commands):
+                    await _recover(enode, recover)
+                raise
+            if output:
+                segments.append((command, output))
+                await _recover(enode, recover)
+                break
+
+    for command, output in segments:
+        if output:
+            raise determine_exception(output)(output, command=command)
+
+
+async def run_cached(enode, command, parse, name=None):
+    """
+    Coroutine version of :func:`topology_lib_vtysh.cache.run_cached`.
+    """
+    cache = get_cache(enode)
+    if cache is not None:
+        found, result = cache.get(command)
+        if found:
+            return result
+
+    name = name or command
+    start = pre_call(enode, name, command)
+    output = await enode(command, shell='vtysh')
+    post_call(enode, name, command, start, output)
+    result = run_parser(enode, name, command, parse, output)
+
+    if cache is not None:
+        cache.put(command, result)
+    return result
+
+
+class ContextManager(ContextState):
+    """
+    Asynchronous version of
+    :class:`topology_lib_vtysh.library.ContextManager`.
+
+    Usage:
+
+    ::
+
+        async with ClassName(parameters) as ctx:
+            await ctx.first_function()
+            await ctx.second_function()
+
+    Mode tracking and batch mode behave as in the blocking library.
+    """
+
+    async def __aenter__(self):
+        await self._enter(self._pre_commands)
+
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self._exit(self._post_commands, failed=type is not None)
+
+    async def _send(self, commands):
+        """
+        Run a list of mode commands.
+
+        An error raised by an instrumentation hook, like a round trip budget
+        exceeded, is raised once all the commands are sent, so the shell
+        still ends in the mode the session expects.
+        """
+        name = type(self).__name__
+        error = None
+        for command in commands:
+            start = pre_call(self.enode, name, command)
+            result = await self.enode(command, shell='vtysh')
+            try:
+                post_call(self.enode, name, command, start, result)
+            except Exception as exc:
+                error = error or exc
+            if result:
+                raise determine_exception(result)(result, command=command)
+        if error is not None:
+            raise error
+
+    async def _enter(self, commands):
+        """
+        Go to the mode of this context.
+
+        :param tuple commands: The pre_commands of the context, or ``None``
+         if the context does not care about the mode.
+        """
+        commands = self._open(commands)
+        try:
+            await self._send(commands)
+        except Exception:
+            self._abort()
+            raise
+        invalidate(self.enode)
+
+    async def _exit(self, commands, failed=False):
+        """
+        Leave the mode of this context, and send the batch if this context
+        started it.
+
+        :param tuple commands: The post_commands of the context.
+        :param bool failed: True if the ``async with`` block raised.
+        """
+        try:
+            await self._send(self._close(commands))
+        finally:
+            invalidate(self.enode)
+
+        queue, recover = self._flush(failed)
+        if queue is not None:
+            await run_batch(self.enode, queue, recover=recover)
+            invalidate(self.enode)
+
+    async def _run(self, command, name=None):
+        """
+        Run a context command, or queue it when in batch mode.
+        """
+        invalidate(self.enode)
+
+        if self._queue is not None:
+            self._queue.append(command)
+            return ''
+
+        name = name or type(self).__name__
+        start = pre_call(self.enode, name, command)
+        result = await self.enode(command, shell='vtysh')
+        post_call(self.enode, name, command, start, result)
+        return result
+
+
+class ConfigSession(ContextManager):
+    """
+    Asynchronous version of :class:`topology_lib_vtysh.library.ConfigSession`.
+    """
+    def __init__(self, enode, batch=False):
+        self.enode = enode
+        self._batch = batch
+
+
+class ContextRange(RangeState, ContextManager):
+    """
+    Asynchronous version of :class:`topology_lib_vtysh.library.ContextRange`.
+
+    :param list members: Values of the context argument, one per member.
+    """
+
+    def __getattr__(self, name):
+        defer = self._defer(name)
+
+        async def apply(*args, **kwargs):
+            defer(*args, **kwargs)
+        return apply
+
+    async def __aenter__(self):
+        await self._enter(None)
+        self._take()
+
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        calls = self._take()
+        failed = True
+        try:
+            if type is None:
+                for member in self.members:
+                    async with member:
+                        for name, args, kwargs in calls:
+                            await getattr(member, name)(*args, **kwargs)
+                failed = False
+        finally:
+            await self._exit((), failed=failed)
+
+
+def _function(command, parse):
+    """
+    Create a root coroutine of the library from its command.
+    """
+    name = command[NAME]
+    cached = command[TEMPLATE].startswith('show ')
+    render = renderer(command)
+
+    async def function(enode, *args, **kwargs):
+        line = render(enode, args, kwargs)
+        # Without hooks nor caches there is nothing to report or flush
+        if not _HOOKS and not _ENABLED:
+            result = await enode(line, shell='vtysh')
+            if parse is not None:
+                return parse(result)
+        elif cached:
+            return await run_cached(enode, line, parse, name)
+        else:
+            start = pre_call(enode, name, line)
+            result = await enode(line, shell='vtysh')
+            post_call(enode, name, line, start, result)
+            if parse is not None:
+                return run_parser(enode, name, line, parse, result)
+            invalidate(enode)
+
+        if result:
+            raise determine_exception(result)(result, command=line)
+    function.render = render
+    return function
+
+
+def _method(command, parse):
+    """
+    Create a context coroutine of the library from its command.
+    """
+    name = command[NAME]
+    render = renderer(command)
+
+    async def method(self, *args, **kwargs):
+        line = render(self.enode, args, kwargs)
+        if self._queue is None and not _HOOKS and not _ENABLED:
+            result = await self.enode(line, shell='vtysh')
+            if parse is not None:
+                return parse(result)
+        else:
+            qualified = '{}.{}'.format(type(self).__name__, name)
+            result = await self._run(line, qualified)
+            if parse is not None:
+                return run_parser(self.enode, qualified, line, parse, result)
+
+        if result:
+            raise determine_exception(result)(result, command=line)
+    method.render = render
+    return method
+
+
+_binder = Binder(
+    ROOT, CONTEXTS, _function, _method, ContextManager, ContextRange
+)
+
+if version_info >= (3, 7):
+    def _parser(name):
+        # The parsers can be taken from this module too, but the parser
+        # module is only imported when one of them is asked for
+        if name.startswith(('parse_', 'iter_')):
+            from . import parser
+            if name in parser.__all__:
+                return getattr(parser, name)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
+        )
+
+    def __getattr__(name):
+        try:
+            bound = _binder.get(name)
+        except KeyError:
+            bound = _parser(name)
+        globals()[name] = bound
+        return bound
+
+    def __dir__():
+        from . import parser
+        return sorted(
+            set(globals()) | set(_binder.names()) | set(parser.__all__)
+        )
+else:
+    from .parser import *  # noqa
+    globals().update(_binder.build())
+
+
+__all__ = [
+    'ContextManager',
+    'ConfigSession',
+    'ContextRange',
+    'Configure',
+    'RouteMap',
+    'ConfigInterface',
+    'ConfigInterfaceRange',
+    'ConfigInterfaceVlan',
+    'ConfigInterfaceLoopback',
+    'ConfigInterfaceLag',
+    'ConfigInterfaceLagRange',
+    'ConfigInterfaceMgmt',
+    'ConfigRouterBgp',
+    'ConfigVlan',
+    'ConfigVlanRange',
+    'show_interface',
+    'show_vlan',
+    'show_lacp_interface',
+    'show_lacp_aggregates',
+    'show_lacp_configuration',
+    'show_lldp_neighbor_info',
+    'show_lldp_statistics',
+    'show_ip_bgp_summary',
+    'show_ip_bgp_neighbors',
+    'show_ip_bgp',
+    'show_ipv6_bgp',
+    'show_running_config',
+    'show_ip_route',
+    'show_ipv6_route',
+    'show_sflow',
+    'show_sflow_interface',
+    'show_udld_interface',
+    'show_rib',
+    'show_ip_ecmp',
+    'clear_udld_statistics',
+    'clear_udld_statistics_interface',
+    'ping_repetitions',
+    'ping6_repetitions',
+    'show_ntp_associations',
+    'show_ntp_authentication_key',
+    'show_ntp_statistics',
+    'show_ntp_status',
+    'show_ntp_trusted_keys',
+    'show_dhcp_server_leases',
+    'show_dhcp_server'
+]
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Send several vtysh commands to an enode.
+
+Topology shells send the text of a call and wait for the first prompt, with
+the echo of the terminal turned off, so they run a single command per call.
+Enodes whose shell runs every line of a call and echoes each command after
+its prompt, as the vtysh shell does when several lines are pasted into it,
+declare it with a true ``vtysh_batch`` attribute. Only those get a batch in a
+single shell call, the others get a call per command.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from .exceptions import determine_exception
+from .instrument import pre_call, post_call
+
+
+def is_echo(line, command):
+    """
+    Check if a line of output is the shell echo of a command.
+
+    The vtysh shell echoes every command after its prompt, for example
+    ``switch(config)# vlan 10``, so a line is considered an echo if it ends
+    with the command and whatever precedes it is empty or ends with a prompt
+    character.
+
+    :param str line: Line of shell output.
+    :param str command: The command to look for.
+    :rtype: bool
+    :return: True if the line is the echo of the command.
+    """
+    line = line.rstrip()
+    if not line.endswith(command):
+        return False
+    prompt = line[:len(line) - len(command)].rstrip()
+    return not prompt or prompt[-1] in '#>'
+
+
+def split_output(commands, output):
+    """
+    Split the combined output of a batch of commands into per-command
+    segments.
+
+    When several commands are sent in one shell call, the shell echoes each
+    command before its output. Those echoes are used as the boundaries of the
+    segments. Output found before the first echo belongs to the first
+    command, as the echo of the command that started the call is not
+    returned by the shell.
+
+    :param list commands: The commands sent to the shell, in order.
+    :param str output: The combined output of the shell call.
+    :rtype: list
+    :return: A list of ``(command, output)`` tuples, one for each command
+     and in the same order.
+    """
+    segments = [[] for _ in commands]
+    index = 0
+
+    for line in output.splitlines():
+        if index + 1 < len(commands) and is_echo(line, commands[index + 1]):
+            index += 1
+            continue
+        if index == 0 and not segments[0] and is_echo(line, commands[0]):
+            continue
+        segments[index].append(line)
+
+    return [
+        (command, '\n'.join(segment).strip())
+        for command, segment in zip(commands, segments)
+    ]
+
+
+def supports_batch(enode):
+    """
+    Check if an enode runs several commands sent in a single shell call.
+
+    :param enode: Engine node to check.
+    :type enode: topology.platforms.base.BaseNode
+    :rtype: bool
+    :return: True if the enode has a true ``vtysh_batch`` attribute.
+    """
+    return getattr(enode, 'vtysh_batch', False) is True
+
+
+def iter_batch(enode, commands, shell='vtysh', name='batch'):
+    """
+    Run several commands, in a single shell call if the enode supports it,
+    or in a call per command.
+
+    With a call per command, each command is only sent when the iterator
+    gets to it, so stopping the iteration stops the batch.
+
+    :param enode: Engine node to communicate with.
+    :type enode: topology.platforms.base.BaseNode
+    :param list commands: The commands to run, in order.
+    :param str shell: Shell to run the commands on.
+    :param str name: Name of the calls for the instrumentation hooks.
+    :return: An iterator of ``(command, output)`` tuples, one for each
+     command and in the same order.
+    """
+    if not commands:
+        return
+
+    if supports_batch(enode):
+        line = '\n'.join(commands)
+        start = pre_call(enode, name, line)
+        output = enode(line, shell=shell)
+        post_call(enode, name, line, start, output)
+        for segment in split_output(commands, output or ''):
+            yield segment
+        return
+
+    for command in commands:
+        start = pre_call(enode, name, command)
+        output = enode(command, shell=shell)
+        post_call(enode, name, command, start, output)
+        yield command, output
+
+
+def run_batch(enode, commands, shell='vtysh', recover=('end', )):
+    """
+    Run a batch of commands, see :func:`iter_batch`, and raise the typed
+    exception of the first command that fails, with the ``command`` attribute
+    set to that command.
+
+    With a call per command the batch stops at the first command that fails,
+    so the commands after it are not run in a mode they were not meant for.
+    The shell can be left in any mode by then, so the ``recover`` commands
+    are sent to go back to a known one before raising. These enodes make a
+    round trip per command anyway, so a batch saves none on them. An error
+    raised by an instrumentation hook, like
+    :class:`topology_lib_vtysh.budget.RoundTripBudgetExceeded`, stops the
+    batch too, and is raised once the ``recover`` commands are sent.
+
+    Enodes that run the whole batch in a single call, see
+    :func:`supports_batch`, run the rest of the lines after an error, as
+    vtysh does with the lines pasted into it, so the batch ends in the mode
+    its last commands go to.
+
+    :param enode: Engine node to communicate with.
+    :type enode: topology.platforms.base.BaseNode
+    :param list commands: The commands to run, in order.
+    :param str shell: Shell to run the commands on.
+    :param tuple recover: The commands that go to the mode the batch ends in
+     from any mode, the exec mode by default.
+    """
+    single = supports_batch(enode)
+    sent = 0
+    try:
+        for command, output in iter_batch(enode, commands, shell=shell):
+            sent += 1
+            if output:
+                break
+        else:
+            return
+    except Exception:
+        if not single and sent + 1 < len(commands):
+            _recover(enode, recover, shell)
+        raise
+
+    if not single:
+        _recover(enode, recover, shell)
+    raise determine_exception(output)(output, command=command)
+
+
+def _recover(enode, commands, shell):
+    for _ in iter_batch(enode, commands, shell=shell):
+        pass
+
+
+__all__ = [
+    'is_echo', 'split_output', 'supports_batch', 'iter_batch', 'run_batch'
+]
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+BGP tables indexed by the AS numbers of their paths.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.bgp import BgpTable
+    from topology_lib_vtysh.parser import iter_show_ip_bgp
+
+    table = BgpTable(iter_show_ip_bgp(enode('show ip bgp', shell='vtysh')))
+    originated = table.prefixes_by_origin(64100)
+    through = table.prefixes_by_transit(65000)
+
+A full table has far fewer distinct AS paths than entries, so every distinct
+path is parsed once into a tuple of AS numbers, that all the entries with
+that path share. The table keeps an index from every AS number to the
+distinct paths it is found in, so finding the entries of an AS only goes over
+those paths instead of the whole table.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+
+ORIGINS = ('i', 'e', '?')
+
+
+def parse_as_path(path):
+    """
+    Parse an AS path, as found in a BGP table.
+
+    :param str path: The AS path, followed by its origin code, like
+     ``65000 64100 i``.
+    :rtype: tuple
+    :return: A ``(numbers, origin)`` tuple, with a tuple of the AS numbers of
+     the path and its origin code, ``i``, ``e`` or ``?``, or ``None`` if it
+     has none. The AS numbers of AS sets, like ``{64101,64102}``, are part of
+     the numbers of the path.
+    """
+    numbers = []
+    origin = None
+    for token in '{}'.format(path).split():
+        if token in ORIGINS:
+            origin = token
+        else:
+            numbers.extend(
+                int(number) for number in token.strip('{}').split(',')
+                if number.isdigit()
+            )
+    return tuple(numbers), origin
+
+
+class BgpTable(object):
+    """
+    BGP table with its AS paths interned and indexed by AS number.
+
+    The entries are kept as they are given, and are found by their index in
+    the table. The origin AS of an entry is the last AS number of its path,
+    and its transit ASes are the other ones.
+
+    :param paths: Entries to add to the table, as returned by
+     :func:`topology_lib_vtysh.parser.iter_show_ip_bgp` or
+     :func:`topology_lib_vtysh.parser.iter_show_ipv6_bgp`, in any of their
+     modes but the columnar one.
+    """
+    def __init__(self, paths=()):
+        self.entries = []
+        self._as_paths = []
+        self._parsed = {}
+        self._interned = {}
+        self._indexes = {}
+        self._by_as = {}
+        self.update(paths)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __getitem__(self, index):
+        return self.entries[index]
+
+    def add(self, path):
+        """
+        Add an entry to the table.
+
+        :param dict path: The entry, as parsed from a BGP table.
+        """
+        self.update((path, ))
+
+    def update(self, paths):
+        """
+        Add several entries to the table.
+
+        :param paths: The entries, as parsed from a BGP table.
+        """
+        entries = self.entries
+        as_paths = self._as_paths
+        parsed = self._parsed
+        indexes = self._indexes
+
+        for path in paths:
+            text = path['path']
+            numbers = parsed.get(text)
+            if numbers is None:
+                numbers = parsed[text] = self._intern(
+                    parse_as_path(text)[0]
+                )
+            indexes[numbers].append(len(entries))
+            entries.append(path)
+            as_paths.append(numbers)
+
+    def _intern(self, numbers):
+        """
+        Get the shared tuple of an AS path, indexing it the first time.
+        """
+        interned = self._interned.get(numbers)
+        if interned is None:
+            interned = self._interned[numbers] = numbers
+            self._indexes[numbers] = []
+            for number in set(numbers):
+                self._by_as.setdefault(number, []).append(numbers)
+        return interned
+
+    def as_path(self, index):
+        """
+        Get the AS path of an entry.
+
+        :param int index: Index of the entry in the table.
+        :rtype: tuple
+        :return: The AS numbers of the path, shared with the other entries
+         with the same path.
+        """
+        return self._as_paths[index]
+
+    @property
+    def as_paths(self):
+        """
+        The distinct AS paths of the table.
+
+        :rtype: list
+        """
+        return list(self._indexes)
+
+    def indexes_by_origin(self, number):
+        """
+        Find the entries originated by an AS.
+
+        :param int number: The AS number.
+        :rtype: list
+        :return: The indexes of the entries, in the order of the table.
+        """
+        return self._find(number, lambda numbers: numbers[-1] == number)
+
+    def indexes_by_transit(self, number):
+        """
+        Find the entries whose path goes through an AS that did not originate
+        them.
+
+        :param int number: The AS number.
+        :rtype: list
+        :return: The indexes of the entries, in the order of the table.
+        """
+        return self._find(number, lambda numbers: numbers[-1] != number)
+
+    def _find(self, number, matches):
+        indexes = self._indexes
+        found = []
+        for numbers in self._by_as.get(number, ()):
+            if matches(numbers):
+                found.extend(indexes[numbers])
+        found.sort()
+        return found
+
+    def prefixes_by_origin(self, number):
+        """
+        Find the networks originated by an AS.
+
+        :param int number: The AS number.
+        :rtype: list
+        :return: The distinct networks, in the order of the table.
+        """
+        return self._networks(self.indexes_by_origin(number))
+
+    def prefixes_by_transit(self, number):
+        """
+        Find the networks reached through an AS that did not originate them.
+
+        :param int number: The AS number.
+        :rtype: list
+        :return: The distinct networks, in the order of the table.
+        """
+        return self._networks(self.indexes_by_transit(number))
+
+    def _networks(self, indexes):
+        entries = self.entries
+        seen = set()
+        networks = []
+        for index in indexes:
+            network = entries[index]['network']
+            if network not in seen:
+                seen.add(network)
+                networks.append(network)
+        return networks
+
+
+__all__ = ['ORIGINS', 'parse_as_path', 'BgpTable']
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Count the round trips the library makes to an enode, and keep them within a
+budget.
+
+A round trip is a shell call made by a function or context of the library,
+or by a batch or a snapshot. Results served from the result cache and
+commands queued in a batch are not round trips.
+
+Count the round trips of an enode:
+
+::
+
+    from topology_lib_vtysh.budget import enable_counter
+
+    counter = enable_counter(enode)
+    show_running_config(enode)
+    assert counter.total == 1
+    assert counter.by_template() == {'show running-config': 1}
+
+Fail a test as soon as a block makes more round trips than expected:
+
+::
+
+    from topology_lib_vtysh.budget import RoundTripBudget
+
+    with RoundTripBudget(enode, 3):
+        configure_uplinks(enode)
+
+The counters are kept with the instrumentation hooks of
+:mod:`topology_lib_vtysh.instrument`, that are only registered while a
+counter or a budget is active.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import re
+from weakref import WeakKeyDictionary
+
+from .instrument import Hook, add_hook, remove_hook
+
+
+_COUNTERS = WeakKeyDictionary()
+_BUDGETS = WeakKeyDictionary()
+_TEMPLATES = {}
+_KEY = re.compile(r'(?<!%)%\((\w+)\)s')
+
+
+def template(name):
+    """
+    Get the command template of a function of the library.
+
+    :param str name: Name of the function, as reported to the hooks, like
+     ``show_vlan`` or ``ConfigInterface.no_shutdown``. For the mode commands
+     of a context, the name of the context.
+    :rtype: str
+    :return: The template as written in the vtysh specification, like
+     ``show vlan`` or ``vlan access {vlan_id}``, the name of a context
+     followed by ``mode`` for its mode commands, as they can enter or leave
+     it, or the name itself if it is not a function of the library, like
+     ``batch``.
+    """
+    if not _TEMPLATES:
+        from .commands import ROOT, CONTEXTS
+        from .dispatch import NAME, TEMPLATE
+
+        for command in ROOT:
+            _TEMPLATES[command[NAME]] = _spec(command[TEMPLATE])
+        for context in CONTEXTS:
+            prefix, commands = context[0], context[6]
+            _TEMPLATES[prefix] = '{} mode'.format(prefix)
+            for command in commands:
+                _TEMPLATES['{}.{}'.format(prefix, command[NAME])] = _spec(
+                    command[TEMPLATE]
+                )
+    return _TEMPLATES.get(name, name)
+
+
+def _spec(template):
+    # The command table has the templates of the specification with their
+    # arguments as %-format keys
+    return _KEY.sub(r'{\1}', template).replace('%%', '%')
+
+
+class RoundTrips(object):
+    """
+    Round trips made to an enode.
+
+    :var int total: Number of round trips.
+    :var dict by_name: Number of round trips by name of the function that
+     made them.
+    """
+    def __init__(self):
+        self.total = 0
+        self.by_name = {}
+
+    def __len__(self):
+        return self.total
+
+    def add(self, name, count=1):
+        """
+        Count round trips.
+
+        :param str name: Name of the function that made them.
+        :param int count: Number of round trips.
+        """
+        self.total += count
+        self.by_name[name] = self.by_name.get(name, 0) + count
+
+    def by_template(self):
+        """
+        Get the number of round trips by command template.
+
+        :rtype: dict
+        """
+        templates = {}
+        for name, count in self.by_name.items():
+            key = template(name)
+            templates[key] = templates.get(key, 0) + count
+        return templates
+
+    def reset(self):
+        """
+        Forget the round trips counted.
+        """
+        self.total = 0
+        self.by_name.clear()
+
+
+class _Counting(Hook):
+    """
+    Hook that gives the shell calls to the counters and the budgets of their
+    enode.
+    """
+    def post_call(self, enode, name, command, seconds, size):
+        # The mode commands of a context are given to the common library of
+        # the enode together, and it runs them one at a time. Batches and
+        # snapshots are only joined for enodes that run them in one call.
+        if name in ('batch', 'snapshot'):
+            count = 1
+        else:
+            count = command.count('\n') + 1
+        counter = _COUNTERS.get(enode)
+        if counter is not None:
+            counter.add(name, count)
+        for budget in list(_BUDGETS.get(enode, ())):
+            budget.add(name, count)
+
+
+_HOOK = _Counting()
+
+
+def _update_hook():
+    if _COUNTERS or _BUDGETS:
+        add_hook(_HOOK)
+    else:
+        remove_hook(_HOOK)
+
+
+def enable_counter(enode):
+    """
+    Start counting the round trips to an enode.
+
+    :param enode: Engine node to count the round trips to.
+    :type enode: topology.platforms.base.BaseNode
+    :rtype: RoundTrips
+    :return: The counter of the enode, a new one if it was not enabled.
+    """
+    counter = _COUNTERS.get(enode)
+    if counter is None:
+        counter = _COUNTERS[enode] = RoundTrips()
+        _update_hook()
+    return counter
+
+
+def disable_counter(enode):
+    """
+    Stop counting the round trips to an enode.
+
+    :param enode: Engine node to stop counting the round trips to.
+    :type enode: topology.platforms.base.BaseNode
+    """
+    _COUNTERS.pop(enode, None)
+    _update_hook()
+
+
+def get_counter(enode):
+    """
+    Get the round trip counter of an enode.
+
+    :param enode: Engine node to get the counter of.
+    :type enode: topology.platforms.base.BaseNode
+    :rtype: RoundTrips
+    :return: The counter of the enode, or ``None`` if it is not enabled.
+    """
+    return _COUNTERS.get(enode)
+
+
+class RoundTripBudgetExceeded(AssertionError):
+    """
+    Raised when a block made more round trips than its budget.
+
+    :param enode: Engine node the round trips were made to.
+    :param int budget: The number of round trips allowed.
+    :param RoundTrips round_trips: The round trips made.
+    """
+    def __init__(self, enode, budget, round_trips):
+        lines = [
+            '{} round trips made to {}, over the budget of {}:'.format(
+                round_trips.total, getattr(enode, 'identifier', enode),
+                budget
+            )
+        ]
+        counts = round_trips.by_template()
+        for key in sorted(counts, key=lambda key: (-counts[key], key)):
+            lines.append('    {:>6}  {}'.format(counts[key], key))
+        super(RoundTripBudgetExceeded, self).__init__('\n'.join(lines))
+        self.enode = enode
+        self.budget = budget
+        self.round_trips = round_trips
+
+
+class RoundTripBudget(object):
+    """
+    Context manager that fails if its block makes more round trips to an
+    enode than a budget.
+
+    The first round trip over the budget raises, so the traceback shows the
+    code that made it, and the rest of the block is not run. The round trips
+    made are available as the ``round_trips`` attribute of the budget,
+    returned by the ``with`` statement. Budgets can be nested.
+
+    :param enode: Engine node to count the round trips to.
+    :type enode: topology.platforms.base.BaseNode
+    :param int budget: Number of round trips allowed.
+    :var RoundTrips round_trips: The round trips made by the block.
+    """
+    def __init__(self, enode, budget):
+        self.enode = enode
+        self.budget = budget
+        self.round_trips = RoundTrips()
+
+    def __enter__(self):
+        self.round_trips.reset()
+        _BUDGETS.setdefault(self.enode, []).append(self)
+        _update_hook()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        budgets = _BUDGETS.get(self.enode, [])
+        if self in budgets:
+            budgets.remove(self)
+        if not budgets:
+            _BUDGETS.pop(self.enode, None)
+        _update_hook()
+
+    def add(self, name, count=1):
+        """
+        Count round trips made by the block.
+
+        :param str name: Name of the function that made them.
+        :param int count: Number of round trips.
+        :raise RoundTripBudgetExceeded: If the block went over its budget.
+        """
+        over = self.round_trips.total > self.budget
+        self.round_trips.add(name, count)
+        # Only the call that goes over the budget raises, so the commands the
+        # contexts run to leave their mode while the error propagates do not
+        # replace it
+        if not over and self.round_trips.total > self.budget:
+            raise RoundTripBudgetExceeded(
+                self.enode, self.budget, self.round_trips
+            )
+
+
+__all__ = [
+    'template', 'RoundTrips', 'enable_counter', 'disable_counter',
+    'get_counter', 'RoundTripBudgetExceeded', 'RoundTripBudget'
+]
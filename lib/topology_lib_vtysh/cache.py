@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Cache the parsed results of the show functions of the library.
+
+The cache is disabled by default and is enabled per enode:
+
+::
+
+    from topology_lib_vtysh.cache import enable_cache
+
+    cache = enable_cache(enode, ttl=10, maxsize=64)
+    show_vlan(enode)  # Runs the command
+    show_vlan(enode)  # Served from the cache
+    assert cache.hits == 1
+
+Results are keyed by the rendered command and expire after ``ttl`` seconds.
+The cache of an enode is flushed every time a context of the library runs a
+command on it, and when a root function that is not a show command (for
+example ``clear udld statistics``) is run.
+
+.. warning::
+
+   Cached results are shared between callers, copy them before modifying
+   them.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+
+from .compat import clock
+from .instrument import pre_call, post_call, run_parser
+
+
+_CACHES = WeakKeyDictionary()
+
+# Not empty while a cache may be enabled, so the library can skip the caches
+# with a cheap check. It is kept when the enodes are collected, which only
+# costs the lookups it would save.
+_ENABLED = []
+
+
+class ResultCache(object):
+    """
+    Least recently used cache of parsed results with expiration.
+
+    :param float ttl: Seconds a result is valid for.
+    :param int maxsize: Maximum number of results to keep.
+    :var int hits: Number of lookups served from the cache.
+    :var int misses: Number of lookups not found or expired.
+    """
+    def __init__(self, ttl=5.0, maxsize=128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, command):
+        """
+        Lookup the result of a command.
+
+        :param str command: The rendered command.
+        :rtype: tuple
+        :return: A ``(found, result)`` tuple.
+        """
+        entry = self._entries.pop(command, None)
+        if entry is None or entry[0] < clock():
+            self.misses += 1
+            return False, None
+
+        self._entries[command] = entry
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, command, result):
+        """
+        Store the result of a command, evicting the least recently used one
+        if the cache is full.
+
+        :param str command: The rendered command.
+        :param result: The parsed result of the command.
+        """
+        self._entries.pop(command, None)
+        while self._entries and len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+        self._entries[command] = (clock() + self.ttl, result)
+
+    def clear(self):
+        """
+        Remove all the results.
+        """
+        self._entries.clear()
+
+
+def enable_cache(enode, ttl=5.0, maxsize=128):
+    """
+    Enable the result cache of an enode.
+
+    :param enode: Engine node to cache the results of.
+    :type enode: topology.platforms.base.BaseNode
+    :param float ttl: Seconds a result is valid for.
+    :param int maxsize: Maximum number of results to keep.
+    :rtype: ResultCache
+    :return: The cache of the enode, which exposes its hit and miss counters.
+    """
+    cache = _CACHES[enode] = ResultCache(ttl=ttl, maxsize=maxsize)
+    _ENABLED[:] = [True]
+    return cache
+
+
+def disable_cache(enode):
+    """
+    Disable the result cache of an enode.
+
+    :param enode: Engine node to stop caching the results of.
+    :type enode: topology.platforms.base.BaseNode
+    """
+    _CACHES.pop(enode, None)
+    if not _CACHES:
+        del _ENABLED[:]
+
+
+def get_cache(enode):
+    """
+    Get the result cache of an enode.
+
+    :param enode: Engine node to get the cache of.
+    :type enode: topology.platforms.base.BaseNode
+    :rtype: ResultCache
+    :return: The cache of the enode, or ``None`` if it is not enabled.
+    """
+    return _CACHES.get(enode)
+
+
+def invalidate(enode):
+    """
+    Flush the result cache of an enode, if it is enabled.
+
+    :param enode: Engine node whose configuration changed.
+    :type enode: topology.platforms.base.BaseNode
+    """
+    cache = _CACHES.get(enode)
+    if cache is not None:
+        cache.clear()
+
+
+def run_cached(enode, command, parse, name=None):
+    """
+    Run a show command and parse its output, using the cache of the enode.
+
+    :param enode: Engine node to communicate with.
+    :type enode: topology.platforms.base.BaseNode
+    :param str command: The rendered command.
+    :param function parse: The parser for the output of the command.
+    :param str name: Name of the function that runs the command, for the
+     instrumentation hooks. The command itself if not given.
+    :return: The parsed result of the command.
+    """
+    cache = _CACHES.get(enode)
+    if cache is not None:
+        found, result = cache.get(command)
+        if found:
+            return result
+
+    name = name or command
+    start = pre_call(enode, name, command)
+    output = enode(command, shell='vtysh')
+    post_call(enode, name, command, start, output)
+    result = run_parser(enode, name, command, parse, output)
+
+    if cache is not None:
+        cache.put(command, result)
+    return result
+
+
+__all__ = [
+    'ResultCache', 'enable_cache', 'disable_cache', 'get_cache',
+    'invalidate', 'run_cached'
+]
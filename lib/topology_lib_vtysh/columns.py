@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Columnar BGP tables, for analysis over many paths at once.
+
+Given ``columnar=True``, the BGP parsers fill a :class:`BgpColumns` with a
+typed :mod:`array` per attribute of the paths, instead of returning a
+dictionary per path. With NumPy installed, the columns can be used as NumPy
+arrays without copying them, so filters run over whole columns:
+
+::
+
+    from topology_lib_vtysh.parser import parse_show_ip_bgp
+
+    columns = parse_show_ip_bgp(
+        enode('show ip bgp', shell='vtysh'), columnar=True
+    )
+    arrays = columns.numpy()
+    selected = (arrays['locprf'] > 100) & (
+        arrays['next_hop'] == columns.address('20.1.1.1')
+    )
+
+NumPy is an optional dependency, install it with the ``numpy`` extra.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from array import array
+from collections import OrderedDict
+
+from .bgp import ORIGINS as _ORIGINS, parse_as_path
+from .routes import parse_prefix
+
+
+# Typecode of the unsigned integers of at least 32 bits
+_UINT32 = 'I' if array(str('I')).itemsize >= 4 else 'L'
+
+
+def _words(value):
+    """
+    Split an IPv6 address in its four 32 bit words, the most significant
+    first.
+    """
+    return (
+        value >> 96, (value >> 64) & 0xFFFFFFFF, (value >> 32) & 0xFFFFFFFF,
+        value & 0xFFFFFFFF
+    )
+
+
+class _Codes(object):
+    """
+    Table of the strings of a column, that holds their codes instead.
+    """
+    def __init__(self):
+        self.values = []
+        self._codes = {}
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _parse_path(path):
+    """
+    Parse an AS path, followed by its origin code.
+
+    :rtype: tuple
+    :return: A ``(numbers, origin)`` tuple with the AS numbers and the code
+     of the origin.
+    """
+    numbers, origin = parse_as_path(path)
+    return numbers, 255 if origin is None else _ORIGINS.index(origin)
+
+
+class BgpColumns(object):
+    """
+    BGP table stored as a typed array per attribute of its paths.
+
+    Every column has an item per path, in the order of the table:
+
+    - ``network`` and ``next_hop``, the addresses as integers. IPv6
+      addresses do not fit in the typed arrays of every Python version, so
+      they take four items per path, their 32 bit words from the most
+      significant one.
+    - ``length``, the length of the prefix of the network.
+    - ``metric``, ``locprf`` and ``weight``.
+    - ``status``, the code of the status of the path, like ``*>``, in
+      ``statuses``.
+    - ``origin``, the code of the origin of the path in ``origins``, or
+      ``255`` if it has none.
+
+    The AS paths are stored as a pair of columns: ``path_values`` holds the
+    AS numbers of all the paths, one after the other, and the AS numbers of
+    path ``index`` are the ones between ``path_offsets[index]`` and
+    ``path_offsets[index + 1]``. AS sets are stored as their AS numbers.
+
+    :param paths: Paths to add to the table, as returned by
+     :func:`topology_lib_vtysh.parser.iter_show_ip_bgp` or
+     :func:`topology_lib_vtysh.parser.iter_show_ipv6_bgp`.
+    :param int version: IP version of the table, 4 or 6.
+    :var list statuses: The statuses of the paths, by code.
+    :var tuple origins: The origins of the paths, by code.
+    """
+    def __init__(self, paths=(), version=4):
+        if version not in (4, 6):
+            raise ValueError('Invalid IP version {!r}'.format(version))
+        self.version = version
+        self.origins = _ORIGINS
+
+        self._columns = OrderedDict()
+        for name, code in (
+            ('network', _UINT32), ('next_hop', _UINT32),
+            ('length', 'B'), ('metric', _UINT32), ('locprf', _UINT32),
+            ('weight', _UINT32), ('status', 'B'), ('origin', 'B'),
+            ('path_offsets', _UINT32), ('path_values', _UINT32),
+        ):
+            self._columns[name] = array(str(code))
+        self._columns['path_offsets'].append(0)
+
+        self._statuses = _Codes()
+        self.statuses = self._statuses.values
+        self.extend(paths)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__['_columns'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __len__(self):
+        return len(self._columns['length'])
+
+    def address(self, address):
+        """
+        Get the value of an address in the columns of the table.
+
+        :param str address: The address, like ``20.1.1.1``.
+        :return: The address as an integer, or for IPv6 a tuple with its
+         four 32 bit words.
+        :raise ValueError: If it is not an address of the version of the
+         table.
+        """
+        value, _, version = parse_prefix(address)
+        if version != self.version:
+            raise ValueError(
+                '{} is not an IPv{} address'.format(address, self.version)
+            )
+        if version == 4:
+            return value
+        return _words(value)
+
+    def append(self, path):
+        """
+        Add a path to the table.
+
+        :param dict path: The path, as parsed from a BGP table.
+        """
+        self.extend((path, ))
+
+    def extend(self, paths):
+        """
+        Add several paths to the table.
+
+        :param paths: The paths, as parsed from a BGP table.
+        """
+        columns = self._columns
+        # IPv4 addresses are an item, and IPv6 ones a tuple of four
+        if self.version == 4:
+            networks = columns['network'].append
+            next_hops = columns['next_hop'].append
+        else:
+            networks = columns['network'].extend
+            next_hops = columns['next_hop'].extend
+        length = columns['length'].append
+        metric = columns['metric'].append
+        locprf = columns['locprf'].append
+        weight = columns['weight'].append
+        status = columns['status'].append
+        origin = columns['origin'].append
+        offsets = columns['path_offsets'].append
+        values = columns['path_values']
+        code = self._statuses.code
+
+        # Next hops and AS paths repeat across the table, and are only
+        # parsed the first time they are found
+        addresses = {}
+        as_paths = {}
+
+        for path in paths:
+            value, prefix = self._split(path['network'])
+            networks(value)
+            next_hop = path['next_hop']
+            if next_hop not in addresses:
+                addresses[next_hop] = self._split(next_hop)[0]
+            next_hops(addresses[next_hop])
+
+            length(prefix)
+            metric(path['metric'])
+            locprf(path['locprf'])
+            weight(path['weight'])
+            status(code(path['route_status']))
+
+            as_path = path['path']
+            if as_path not in as_paths:
+                as_paths[as_path] = _parse_path(as_path)
+            numbers, path_origin = as_paths[as_path]
+            values.extend(numbers)
+            origin(path_origin)
+            offsets(len(values))
+
+    def _split(self, prefix):
+        """
+        Get the values of a network in the address columns, and the length of
+        its prefix.
+        """
+        value, length, _ = parse_prefix(prefix)
+        if self.version == 4:
+            return value, length
+        return _words(value), length
+
+    def path(self, index):
+        """
+        Get the AS numbers of the path of an entry.
+
+        :param int index: Index of the entry in the table.
+        :rtype: list
+        """
+        offsets = self._columns['path_offsets']
+        return self._columns['path_values'][
+            offsets[index]:offsets[index + 1]
+        ].tolist()
+
+    def arrays(self):
+        """
+        Get the columns of the table.
+
+        :rtype: OrderedDict
+        :return: The typed arrays, by name.
+        """
+        return OrderedDict(self._columns)
+
+    def numpy(self):
+        """
+        Get the columns of the table as NumPy arrays that share the memory of
+        the typed arrays, so they are only valid while the table does not
+        change. The IPv6 addresses have a row of four words per path, to
+        compare them with :meth:`address`:
+
+        ::
+
+            arrays = columns.numpy()
+            selected = (
+                arrays['next_hop'] == columns.address('2001::1')
+            ).all(axis=1)
+
+        :rtype: OrderedDict
+        :return: The NumPy arrays, by name.
+        :raise ImportError: If NumPy is not installed.
+        """
+        import numpy
+
+        arrays = OrderedDict(
+            (name, numpy.frombuffer(
+                column, dtype='u{}'.format(column.itemsize)
+            ))
+            for name, column in self._columns.items()
+        )
+        if self.version == 6:
+            for name in ('network', 'next_hop'):
+                arrays[name] = arrays[name].reshape(-1, 4)
+        return arrays
+
+
+__all__ = ['BgpColumns']
@@ -0,0 +1,5130 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Vtysh auto-generated command table.
+
+The format of the table is described in :mod:`topology_lib_vtysh.dispatch`,
+which turns it into the functions and classes of the library.
+
+.. warning::
+
+   This is auto-generated, do not modify manually!!
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+
+ROOT = (
+    (
+        'show_interface',
+        'show interface %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        'parse_show_interface',
+        r"""
+        show_interface(enode, portlbl)
+
+        Interface infomation.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show interface {port}
+
+        :param portlbl: Label that identifies interface.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_interface`
+        """
+    ),
+    (
+        'show_vlan',
+        'show vlan',
+        ('vlanid', ),
+        (
+            ('vlanid', ' %(vlanid)s'),
+        ),
+        'show vlan',
+        None,
+        'parse_show_vlan',
+        r"""
+        show_vlan(enode, vlanid='')
+
+        Show VLAN configuration.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show vlan
+
+        :param vlanid: Vlan ID number.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_vlan`
+        """
+    ),
+    (
+        'show_lacp_interface',
+        'show lacp interface %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        'parse_show_lacp_interface',
+        r"""
+        show_lacp_interface(enode, portlbl)
+
+        Show LACP interface.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show lacp interface {port}
+
+        :param portlbl: Label that identifies interface.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_lacp_interface`
+        """
+    ),
+    (
+        'show_lacp_aggregates',
+        'show lacp aggregates',
+        ('lag', ),
+        (
+            ('lag', ' %(lag)s'),
+        ),
+        'show lacp aggregates',
+        None,
+        'parse_show_lacp_aggregates',
+        r"""
+        show_lacp_aggregates(enode, lag='')
+
+        Show LACP aggregates.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show lacp aggregates
+
+        :param lag: Link-aggregate name.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_lacp_aggregates`
+        """
+    ),
+    (
+        'show_lacp_configuration',
+        'show lacp configuration',
+        (),
+        (),
+        'show lacp configuration',
+        'show lacp configuration',
+        'parse_show_lacp_configuration',
+        r"""
+        show_lacp_configuration(enode)
+
+        Show LACP configuration.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show lacp configuration
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_lacp_configuration`
+        """
+    ),
+    (
+        'show_lldp_neighbor_info',
+        'show lldp neighbor-info %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        'parse_show_lldp_neighbor_info',
+        r"""
+        show_lldp_neighbor_info(enode, portlbl)
+
+        Show global LLDP neighbor information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show lldp neighbor-info {port}
+
+        :param portlbl: Label that identifies interface.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_lldp_neighbor_info`
+        """
+    ),
+    (
+        'show_lldp_statistics',
+        'show lldp statistics',
+        (),
+        (),
+        'show lldp statistics',
+        'show lldp statistics',
+        'parse_show_lldp_statistics',
+        r"""
+        show_lldp_statistics(enode)
+
+        Show LLDP statistics.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show lldp statistics
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_lldp_statistics`
+        """
+    ),
+    (
+        'show_ip_bgp_summary',
+        'show ip bgp summary',
+        (),
+        (),
+        'show ip bgp summary',
+        'show ip bgp summary',
+        'parse_show_ip_bgp_summary',
+        r"""
+        show_ip_bgp_summary(enode)
+
+        Show bgp neighbors information summary.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ip bgp summary
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ip_bgp_summary`
+        """
+    ),
+    (
+        'show_ip_bgp_neighbors',
+        'show ip bgp neighbors',
+        (),
+        (),
+        'show ip bgp neighbors',
+        'show ip bgp neighbors',
+        'parse_show_ip_bgp_neighbors',
+        r"""
+        show_ip_bgp_neighbors(enode)
+
+        Show bgp neighbors information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ip bgp neighbors
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ip_bgp_neighbors`
+        """
+    ),
+    (
+        'show_ip_bgp',
+        'show ip bgp',
+        (),
+        (),
+        'show ip bgp',
+        'show ip bgp',
+        'parse_show_ip_bgp',
+        r"""
+        show_ip_bgp(enode)
+
+        Show bgp routing information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ip bgp
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ip_bgp`
+        """
+    ),
+    (
+        'show_ipv6_bgp',
+        'show ipv6 bgp',
+        (),
+        (),
+        'show ipv6 bgp',
+        'show ipv6 bgp',
+        'parse_show_ipv6_bgp',
+        r"""
+        show_ipv6_bgp(enode)
+
+        Show bgp routing information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ipv6 bgp
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ipv6_bgp`
+        """
+    ),
+    (
+        'show_running_config',
+        'show running-config',
+        (),
+        (),
+        'show running-config',
+        'show running-config',
+        'parse_show_running_config',
+        r"""
+        show_running_config(enode)
+
+        Show running-config information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show running-config
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_running_config`
+        """
+    ),
+    (
+        'show_ip_route',
+        'show ip route',
+        (),
+        (),
+        'show ip route',
+        'show ip route',
+        'parse_show_ip_route',
+        r"""
+        show_ip_route(enode)
+
+        Show Routing Table.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ip route
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ip_route`
+        """
+    ),
+    (
+        'show_ipv6_route',
+        'show ipv6 route',
+        (),
+        (),
+        'show ipv6 route',
+        'show ipv6 route',
+        'parse_show_ipv6_route',
+        r"""
+        show_ipv6_route(enode)
+
+        Display the routing table.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ipv6 route
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ipv6_route`
+        """
+    ),
+    (
+        'show_sflow',
+        'show sflow',
+        (),
+        (),
+        'show sflow',
+        'show sflow',
+        'parse_show_sflow',
+        r"""
+        show_sflow(enode)
+
+        Show sFlow information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show sflow
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_sflow`
+        """
+    ),
+    (
+        'show_sflow_interface',
+        'show sflow interface %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        'parse_show_sflow_interface',
+        r"""
+        show_sflow_interface(enode, portlbl)
+
+        Show sFlow information for the interface.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show sflow interface {port}
+
+        :param portlbl: Label that identifies interface.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_sflow_interface`
+        """
+    ),
+    (
+        'show_udld_interface',
+        'show udld interface %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        'parse_show_udld_interface',
+        r"""
+        show_udld_interface(enode, portlbl)
+
+        Show UDLD information for the interface.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show udld interface {port}
+
+        :param portlbl: Label that identifies interface.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_udld_interface`
+        """
+    ),
+    (
+        'show_rib',
+        'show rib',
+        (),
+        (),
+        'show rib',
+        'show rib',
+        'parse_show_rib',
+        r"""
+        show_rib(enode)
+
+        Show Routing Information Base.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show rib
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_rib`
+        """
+    ),
+    (
+        'show_ip_ecmp',
+        'show ip ecmp',
+        (),
+        (),
+        'show ip ecmp',
+        'show ip ecmp',
+        'parse_show_ip_ecmp',
+        r"""
+        show_ip_ecmp(enode)
+
+        Show ECMP Configuration
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ip ecmp
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ip_ecmp`
+        """
+    ),
+    (
+        'clear_udld_statistics',
+        'clear udld statistics',
+        (),
+        (),
+        'clear udld statistics',
+        'clear udld statistics',
+        None,
+        r"""
+        clear_udld_statistics(enode)
+
+        Clear UDLD statistics from all interfaces.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # clear udld statistics
+
+        """
+    ),
+    (
+        'clear_udld_statistics_interface',
+        'clear udld statistics interface %(port)s',
+        ('portlbl', ),
+        (),
+        None,
+        None,
+        None,
+        r"""
+        clear_udld_statistics_interface(enode, portlbl)
+
+        Clear UDLD statistics for the interface.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # clear udld statistics interface {port}
+
+        :param portlbl: Label that identifies interface.
+        """
+    ),
+    (
+        'ping_repetitions',
+        'ping %(destination)s repetitions %(count)s',
+        ('destination', 'count', ),
+        (),
+        None,
+        'ping %s repetitions %s',
+        'parse_ping_repetitions',
+        r"""
+        ping_repetitions(enode, destination, count)
+
+        Send IPv4 ping
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # ping {destination} repetitions {count}
+
+        :param destination: <A.B.C.D> IPv4 address.
+        :param count: Number of packets to send.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_ping_repetitions`
+        """
+    ),
+    (
+        'ping6_repetitions',
+        'ping6 %(destination)s repetitions %(count)s',
+        ('destination', 'count', ),
+        (),
+        None,
+        'ping6 %s repetitions %s',
+        'parse_ping6_repetitions',
+        r"""
+        ping6_repetitions(enode, destination, count)
+
+        Send IPv6 ping
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # ping6 {destination} repetitions {count}
+
+        :param destination: <X:X::X:X> IPv6 address.
+        :param count: Number of packets to send.
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_ping6_repetitions`
+        """
+    ),
+    (
+        'show_ntp_associations',
+        'show ntp associations',
+        (),
+        (),
+        'show ntp associations',
+        'show ntp associations',
+        'parse_show_ntp_associations',
+        r"""
+        show_ntp_associations(enode)
+
+        Show NTP Association summary.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ntp associations
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ntp_associations`
+        """
+    ),
+    (
+        'show_ntp_authentication_key',
+        'show ntp authentication-key',
+        (),
+        (),
+        'show ntp authentication-key',
+        'show ntp authentication-key',
+        'parse_show_ntp_authentication_key',
+        r"""
+        show_ntp_authentication_key(enode)
+
+        Show NTP Authentication Keys information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ntp authentication-key
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ntp_authentication_key`
+        """
+    ),
+    (
+        'show_ntp_statistics',
+        'show ntp statistics',
+        (),
+        (),
+        'show ntp statistics',
+        'show ntp statistics',
+        'parse_show_ntp_statistics',
+        r"""
+        show_ntp_statistics(enode)
+
+        Show NTP Statistics information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ntp statistics
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ntp_statistics`
+        """
+    ),
+    (
+        'show_ntp_status',
+        'show ntp status',
+        (),
+        (),
+        'show ntp status',
+        'show ntp status',
+        'parse_show_ntp_status',
+        r"""
+        show_ntp_status(enode)
+
+        Show NTP Status information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ntp status
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ntp_status`
+        """
+    ),
+    (
+        'show_ntp_trusted_keys',
+        'show ntp trusted-keys',
+        (),
+        (),
+        'show ntp trusted-keys',
+        'show ntp trusted-keys',
+        'parse_show_ntp_trusted_keys',
+        r"""
+        show_ntp_trusted_keys(enode)
+
+        Show NTP Trusted Keys information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show ntp trusted-keys
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_ntp_trusted_keys`
+        """
+    ),
+    (
+        'show_dhcp_server_leases',
+        'show dhcp-server leases',
+        (),
+        (),
+        'show dhcp-server leases',
+        'show dhcp-server leases',
+        'parse_show_dhcp_server_leases',
+        r"""
+        show_dhcp_server_leases(enode)
+
+        Show DHCP server leases information.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show dhcp-server leases
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_dhcp_server_leases`
+        """
+    ),
+    (
+        'show_dhcp_server',
+        'show dhcp-server',
+        (),
+        (),
+        'show dhcp-server',
+        'show dhcp-server',
+        'parse_show_dhcp_server',
+        r"""
+        show_dhcp_server(enode)
+
+        Display DHCP server configuration.
+
+        This function runs the following vtysh command:
+
+        ::
+
+            # show dhcp-server
+
+        :return: A dictionary as returned by
+         :func:`topology_lib_vtysh.parser.parse_show_dhcp_server`
+        """
+    ),
+)
+
+
+CONTEXTS = (
+    (
+        'Configure',
+        r"""
+        Configuration terminal
+
+        pre_commands:
+
+        ::
+
+            ['configure terminal']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        (),
+        (
+            'configure terminal',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'no_vlan',
+                'no vlan %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan %s',
+                None,
+                r"""
+                no_vlan(vlan_id)
+
+                Delete a VLAN
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan {vlan_id}
+
+                :param vlan_id: VLAN Identifier.
+                """
+            ),
+            (
+                'no_interface_lag',
+                'no interface lag %(lag_id)s',
+                ('lag_id', ),
+                (),
+                None,
+                'no interface lag %s',
+                None,
+                r"""
+                no_interface_lag(lag_id)
+
+                Delete a lag
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no interface lag {lag_id}
+
+                :param lag_id: link-aggregation identifier.
+                """
+            ),
+            (
+                'ip_route',
+                'ip route %(ipv4)s %(next_hop)s',
+                ('ipv4', 'next_hop', 'metric', ),
+                (
+                    ('metric', ' %(metric)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                ip_route(ipv4, next_hop, metric='')
+
+                Configure static routes
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip route {ipv4} {next_hop}
+
+                :param ipv4: A.B.C.D/M IP destination prefix.
+                :param next_hop: Can be an ip address or a interface.
+                :param metric: Optional, route address to configure.
+                """
+            ),
+            (
+                'no_ip_route',
+                'no ip route %(ipv4)s %(next_hop)s',
+                ('ipv4', 'next_hop', 'metric', ),
+                (
+                    ('metric', ' %(metric)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_ip_route(ipv4, next_hop, metric='')
+
+                Un-configure static routes
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip route {ipv4} {next_hop}
+
+                :param ipv4: A.B.C.D/M IP destination prefix.
+                :param next_hop: Can be an ip address or a interface.
+                :param metric: Optional, route address to configure.
+                """
+            ),
+            (
+                'ip_prefix_list_seq',
+                'ip prefix-list %(prefix_name)s seq %(seq)s %(permission)s %(network)s',  # noqa
+                ('prefix_name', 'seq', 'permission', 'network', ),
+                (),
+                None,
+                'ip prefix-list %s seq %s %s %s',  # noqa
+                None,
+                r"""
+                ip_prefix_list_seq(prefix_name, seq, permission, network)
+
+                Configure prefix list
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip prefix-list {prefix_name} seq {seq} {permission} {network}  # noqa
+
+                :param prefix_name: WORD  Name of a prefix list.
+                :param seq: <1-4294967295>  Sequence number.
+                :param permission: deny    Specify packets to rejectpermit
+                 Specify packets to forward
+                :param network: A.B.C.D/M  IP prefix <network>/<length>,
+                 e.g., 35.0.0.0/8 any Any prefix match. Same as "0.0.0.0/0
+                 le 32"
+                """
+            ),
+            (
+                'no_ip_prefix_list_seq',
+                'no ip prefix-list %(prefix_name)s seq %(seq)s %(permission)s %(network)s',  # noqa
+                ('prefix_name', 'seq', 'permission', 'network', ),
+                (),
+                None,
+                'no ip prefix-list %s seq %s %s %s',  # noqa
+                None,
+                r"""
+                no_ip_prefix_list_seq(prefix_name, seq, permission,
+                    network)
+
+                Un-configure prefix list
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip prefix-list {prefix_name} seq {seq} {permission} {network}  # noqa
+
+                :param prefix_name: WORD  Name of a prefix list.
+                :param seq: <1-4294967295>  Sequence number.
+                :param permission: deny    Specify packets to rejectpermit
+                 Specify packets to forward
+                :param network: A.B.C.D/M  IP prefix <network>/<length>,
+                 e.g., 35.0.0.0/8 any Any prefix match. Same as "0.0.0.0/0
+                 le 32"
+                """
+            ),
+            (
+                'ipv6_prefix_list_seq',
+                'ipv6 prefix-list %(prefix_name)s seq %(seq)s %(permission)s %(network)s',  # noqa
+                ('prefix_name', 'seq', 'permission', 'network', ),
+                (),
+                None,
+                'ipv6 prefix-list %s seq %s %s %s',  # noqa
+                None,
+                r"""
+                ipv6_prefix_list_seq(prefix_name, seq, permission, network)
+
+                Configure IPv6 prefix-based filtering
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 prefix-list {prefix_name} seq {seq} {permission} {network}  # noqa
+
+                :param prefix_name: WORD  The IP prefix-list name
+                :param seq: <1-4294967295>  Sequence number
+                :param permission: deny    Specify packets to rejectpermit
+                 Specify packets to forward
+                :param network: X:X::X:X/M IPv6 prefix
+                """
+            ),
+            (
+                'no_ipv6_prefix_list_seq',
+                'no ipv6 prefix-list %(prefix_name)s seq %(seq)s %(permission)s %(network)s',  # noqa
+                ('prefix_name', 'seq', 'permission', 'network', ),
+                (),
+                None,
+                'no ipv6 prefix-list %s seq %s %s %s',  # noqa
+                None,
+                r"""
+                no_ipv6_prefix_list_seq(prefix_name, seq, permission,
+                    network)
+
+                Deletes the IPv6 prefix-list
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 prefix-list {prefix_name} seq {seq} {permission} {network}  # noqa
+
+                :param prefix_name: WORD  The IP prefix-list name
+                :param seq: <1-4294967295>  Sequence number
+                :param permission: deny    Specify packets to rejectpermit
+                 Specify packets to forward
+                :param network: X:X::X:X/M IPv6 prefix
+                """
+            ),
+            (
+                'no_route_map',
+                'no route-map %(routemap_name)s %(permission)s %(seq)s',
+                ('routemap_name', 'permission', 'seq', ),
+                (),
+                None,
+                'no route-map %s %s %s',
+                None,
+                r"""
+                no_route_map(routemap_name, permission, seq)
+
+                Route-map configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no route-map {routemap_name} {permission} {seq}
+
+                :param routemap_name: WORD  Route map tag
+                :param permission: deny  Route map denies set
+                 operationspermit  Route map permits set operations
+                :param seq: <1-65535>  Sequence to insert to/delete from
+                 existing route-map entry
+                """
+            ),
+            (
+                'ipv6_route',
+                'ipv6 route %(ipv6)s %(next_hop)s',
+                ('ipv6', 'next_hop', 'metric', ),
+                (
+                    ('metric', ' %(metric)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                ipv6_route(ipv6, next_hop, metric='')
+
+                Configure static routes
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 route {ipv6} {next_hop}
+
+                :param ipv6: X:X::X:X/M IP destination prefix.
+                :param next_hop: Can be an ip address or a interface.
+                :param metric: Optional, route address to configure.
+                """
+            ),
+            (
+                'no_ipv6_route',
+                'no ipv6 route %(ipv6)s %(next_hop)s',
+                ('ipv6', 'next_hop', 'metric', ),
+                (
+                    ('metric', ' %(metric)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_ipv6_route(ipv6, next_hop, metric='')
+
+                Un-configure static routes
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 route {ipv6} {next_hop}
+
+                :param ipv6: X:X::X:X/M IP destination prefix.
+                :param next_hop: Can be an ip address or a interface.
+                :param metric: Optional, route address to configure.
+                """
+            ),
+            (
+                'lacp_system_priority',
+                'lacp system-priority %(priority)s',
+                ('priority', ),
+                (),
+                None,
+                'lacp system-priority %s',
+                None,
+                r"""
+                lacp_system_priority(priority)
+
+                Set LACP system priority.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp system-priority {priority}
+
+                :param priority: <0-65535>  The range is 0 to 65535.
+                """
+            ),
+            (
+                'lldp_enable',
+                'lldp enable',
+                (),
+                (),
+                'lldp enable',
+                'lldp enable',
+                None,
+                r"""
+                lldp_enable()
+
+                Enable LLDP globally.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lldp enable
+
+                """
+            ),
+            (
+                'no_lldp_enable',
+                'no lldp enable',
+                (),
+                (),
+                'no lldp enable',
+                'no lldp enable',
+                None,
+                r"""
+                no_lldp_enable()
+
+                Disable LLDP globally.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lldp enable
+
+                """
+            ),
+            (
+                'sflow_enable',
+                'sflow enable',
+                (),
+                (),
+                'sflow enable',
+                'sflow enable',
+                None,
+                r"""
+                sflow_enable()
+
+                Configure sFlow.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow enable
+
+                """
+            ),
+            (
+                'no_sflow_enable',
+                'no sflow enable',
+                (),
+                (),
+                'no sflow enable',
+                'no sflow enable',
+                None,
+                r"""
+                no_sflow_enable()
+
+                Un-configure sFlow.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no sflow enable
+
+                """
+            ),
+            (
+                'sflow_sampling',
+                'sflow sampling %(rate)s',
+                ('rate', ),
+                (),
+                None,
+                'sflow sampling %s',
+                None,
+                r"""
+                sflow_sampling(rate)
+
+                Set sFlow sampling rate.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow sampling {rate}
+
+                :param rate: <1-1000000000>  The range is 1 to 1000000000.
+                """
+            ),
+            (
+                'no_sflow_sampling',
+                'no sflow sampling',
+                (),
+                (),
+                'no sflow sampling',
+                'no sflow sampling',
+                None,
+                r"""
+                no_sflow_sampling()
+
+                Reset sFlow sampling rate to default.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no sflow sampling
+
+                """
+            ),
+            (
+                'sflow_polling',
+                'sflow polling %(interval)s',
+                ('interval', ),
+                (),
+                None,
+                'sflow polling %s',
+                None,
+                r"""
+                sflow_polling(interval)
+
+                Set sFlow polling interval.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow polling {interval}
+
+                :param interval: <0-3600>  The range is 0 to 3600.
+                """
+            ),
+            (
+                'no_sflow_polling',
+                'no sflow polling',
+                (),
+                (),
+                'no sflow polling',
+                'no sflow polling',
+                None,
+                r"""
+                no_sflow_polling()
+
+                Reset sFlow polling interval to default.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no sflow polling
+
+                """
+            ),
+            (
+                'sflow_agent_interface',
+                'sflow agent-interface %(portlbl)s',
+                ('portlbl', 'address_family', ),
+                (
+                    ('address_family', ' %(address_family)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                sflow_agent_interface(portlbl, address_family='')
+
+                Set sFlow agent interface
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow agent-interface {portlbl}
+
+                :param portlbl: Valid L3 interface name.
+                :param address_family: Optional, IPv4 or IPv6 (Default :
+                 IPv4).
+                """
+            ),
+            (
+                'no_sflow_agent_interface',
+                'no sflow agent-interface',
+                (),
+                (),
+                'no sflow agent-interface',
+                'no sflow agent-interface',
+                None,
+                r"""
+                no_sflow_agent_interface()
+
+                Remove sFlow agent interface configuration.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no sflow agent-interface
+
+                """
+            ),
+            (
+                'sflow_collector',
+                'sflow collector %(ip)s',
+                ('ip', ),
+                (),
+                None,
+                'sflow collector %s',
+                None,
+                r"""
+                sflow_collector(ip)
+
+                Set sFlow collector configuration (IP)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow collector {ip}
+
+                :param ip: IP address of collector.
+                """
+            ),
+            (
+                'sflow_collector_port',
+                'sflow collector %(ip)s port %(port)s',
+                ('ip', 'port', ),
+                (),
+                None,
+                'sflow collector %s port %s',
+                None,
+                r"""
+                sflow_collector_port(ip, port)
+
+                Set sFlow collector configuration (IP, port)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow collector {ip} port {port}
+
+                :param ip: IP address of collector.
+                :param port: Port of collector <0-65535> (Default : 6343).
+                """
+            ),
+            (
+                'sflow_collector_vrf',
+                'sflow collector %(ip)s vrf %(vrf)s',
+                ('ip', 'vrf', ),
+                (),
+                None,
+                'sflow collector %s vrf %s',
+                None,
+                r"""
+                sflow_collector_vrf(ip, vrf)
+
+                Set sFlow collector configuration (IP, vrf)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow collector {ip} vrf {vrf}
+
+                :param ip: IP address of collector.
+                :param vrf: Name of VRF (Default : vrf_default).
+                """
+            ),
+            (
+                'sflow_collector_port_vrf',
+                'sflow collector %(ip)s port %(port)s vrf %(vrf)s',
+                ('ip', 'port', 'vrf', ),
+                (),
+                None,
+                'sflow collector %s port %s vrf %s',
+                None,
+                r"""
+                sflow_collector_port_vrf(ip, port, vrf)
+
+                Set sFlow collector configuration (IP, port, vrf)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow collector {ip} port {port} vrf {vrf}
+
+                :param ip: IP address of collector.
+                :param port: Port of collector <0-65535> (Default : 6343).
+                :param vrf: Name of VRF (Default : vrf_default).
+                """
+            ),
+            (
+                'no_router_bgp',
+                'no router bgp %(asn)s',
+                ('asn', ),
+                (),
+                None,
+                'no router bgp %s',
+                None,
+                r"""
+                no_router_bgp(asn)
+
+                Removes the BGP Router
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no router bgp {asn}
+
+                :param asn: Autonomous System Number.
+                """
+            ),
+            (
+                'ip_ecmp_disable',
+                'ip ecmp disable',
+                (),
+                (),
+                'ip ecmp disable',
+                'ip ecmp disable',
+                None,
+                r"""
+                ip_ecmp_disable()
+
+                Completely disable ECMP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_disable',
+                'no ip ecmp disable',
+                (),
+                (),
+                'no ip ecmp disable',
+                'no ip ecmp disable',
+                None,
+                r"""
+                no_ip_ecmp_disable()
+
+                Completely disable ECMP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp disable
+
+                """
+            ),
+            (
+                'ip_ecmp_load_balance_dst_ip_disable',
+                'ip ecmp load-balance dst-ip disable',
+                (),
+                (),
+                'ip ecmp load-balance dst-ip disable',
+                'ip ecmp load-balance dst-ip disable',
+                None,
+                r"""
+                ip_ecmp_load_balance_dst_ip_disable()
+
+                Disable load balancing by destination IP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp load-balance dst-ip disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_load_balance_dst_ip_disable',
+                'no ip ecmp load-balance dst-ip disable',
+                (),
+                (),
+                'no ip ecmp load-balance dst-ip disable',
+                'no ip ecmp load-balance dst-ip disable',
+                None,
+                r"""
+                no_ip_ecmp_load_balance_dst_ip_disable()
+
+                Disable load balancing by destination IP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp load-balance dst-ip disable
+
+                """
+            ),
+            (
+                'ip_ecmp_load_balance_dst_port_disable',
+                'ip ecmp load-balance dst-port disable',
+                (),
+                (),
+                'ip ecmp load-balance dst-port disable',
+                'ip ecmp load-balance dst-port disable',
+                None,
+                r"""
+                ip_ecmp_load_balance_dst_port_disable()
+
+                Disable load balancing by destination port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp load-balance dst-port disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_load_balance_dst_port_disable',
+                'no ip ecmp load-balance dst-port disable',
+                (),
+                (),
+                'no ip ecmp load-balance dst-port disable',
+                'no ip ecmp load-balance dst-port disable',
+                None,
+                r"""
+                no_ip_ecmp_load_balance_dst_port_disable()
+
+                Disable load balancing by destination port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp load-balance dst-port disable
+
+                """
+            ),
+            (
+                'ip_ecmp_load_balance_src_port_disable',
+                'ip ecmp load-balance src-port disable',
+                (),
+                (),
+                'ip ecmp load-balance src-port disable',
+                'ip ecmp load-balance src-port disable',
+                None,
+                r"""
+                ip_ecmp_load_balance_src_port_disable()
+
+                Disable load balancing by source port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp load-balance src-port disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_load_balance_src_port_disable',
+                'no ip ecmp load-balance src-port disable',
+                (),
+                (),
+                'no ip ecmp load-balance src-port disable',
+                'no ip ecmp load-balance src-port disable',
+                None,
+                r"""
+                no_ip_ecmp_load_balance_src_port_disable()
+
+                Disable load balancing by source port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp load-balance src-port disable
+
+                """
+            ),
+            (
+                'ip_ecmp_load_balance_src_ip_disable',
+                'ip ecmp load-balance src-ip disable',
+                (),
+                (),
+                'ip ecmp load-balance src-ip disable',
+                'ip ecmp load-balance src-ip disable',
+                None,
+                r"""
+                ip_ecmp_load_balance_src_ip_disable()
+
+                Disable load balancing by source IP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp load-balance src-ip disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_load_balance_src_ip_disable',
+                'no ip ecmp load-balance src-ip disable',
+                (),
+                (),
+                'no ip ecmp load-balance src-ip disable',
+                'no ip ecmp load-balance src-ip disable',
+                None,
+                r"""
+                no_ip_ecmp_load_balance_src_ip_disable()
+
+                Disable load balancing by source IP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp load-balance src-ip disable
+
+                """
+            ),
+            (
+                'ip_ecmp_load_balance_resilient_disable',
+                'ip ecmp load-balance resilient disable',
+                (),
+                (),
+                'ip ecmp load-balance resilient disable',
+                'ip ecmp load-balance resilient disable',
+                None,
+                r"""
+                ip_ecmp_load_balance_resilient_disable()
+
+                Disable resilient hashing for load balancing
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip ecmp load-balance resilient disable
+
+                """
+            ),
+            (
+                'no_ip_ecmp_load_balance_resilient_disable',
+                'no ip ecmp load-balance resilient disable',
+                (),
+                (),
+                'no ip ecmp load-balance resilient disable',
+                'no ip ecmp load-balance resilient disable',
+                None,
+                r"""
+                no_ip_ecmp_load_balance_resilient_disable()
+
+                Disable resilient hashing for load balancing
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip ecmp load-balance resilient disable
+
+                """
+            ),
+            (
+                'ntp_server',
+                'ntp server %(host)s',
+                ('host', ),
+                (),
+                None,
+                'ntp server %s',
+                None,
+                r"""
+                ntp_server(host)
+
+                NTP Association configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp server {host}
+
+                :param host: NTP Association name or IPv4 Address.
+                """
+            ),
+            (
+                'no_ntp_server',
+                'no ntp server %(host)s',
+                ('host', ),
+                (),
+                None,
+                'no ntp server %s',
+                None,
+                r"""
+                no_ntp_server(host)
+
+                Remove NTP association
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ntp server {host}
+
+                :param host: NTP Association name or IPv4 Address.
+                """
+            ),
+            (
+                'ntp_server_prefer',
+                'ntp server %(host)s prefer',
+                ('host', ),
+                (),
+                None,
+                'ntp server %s prefer',
+                None,
+                r"""
+                ntp_server_prefer(host)
+
+                Add NTP Association preference configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp server {host} prefer
+
+                :param host: NTP Association name or IPv4 Address.
+                """
+            ),
+            (
+                'ntp_server_key_id',
+                'ntp server %(host)s key-id %(key_id)s',
+                ('host', 'key_id', ),
+                (),
+                None,
+                'ntp server %s key-id %s',
+                None,
+                r"""
+                ntp_server_key_id(host, key_id)
+
+                Add NTP Key ID
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp server {host} key-id {key_id}
+
+                :param host: NTP Association name or IPv4 Address.
+                :param key_id: WORD  NTP Key Number between 1-65534
+                """
+            ),
+            (
+                'ntp_server_version',
+                'ntp server %(host)s version %(version)s',
+                ('host', 'version', ),
+                (),
+                None,
+                'ntp server %s version %s',
+                None,
+                r"""
+                ntp_server_version(host, version)
+
+                Add NTP Association version configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp server {host} version {version}
+
+                :param host: NTP Association name or IPv4 Address.
+                :param version: WORD  Version can be 3 or 4
+                """
+            ),
+            (
+                'ntp_authentication_enable',
+                'ntp authentication enable',
+                (),
+                (),
+                'ntp authentication enable',
+                'ntp authentication enable',
+                None,
+                r"""
+                ntp_authentication_enable()
+
+                Enable NTP Authentication configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp authentication enable
+
+                """
+            ),
+            (
+                'no_ntp_authentication_enable',
+                'no ntp authentication enable',
+                (),
+                (),
+                'no ntp authentication enable',
+                'no ntp authentication enable',
+                None,
+                r"""
+                no_ntp_authentication_enable()
+
+                Disable NTP Authentication configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ntp authentication enable
+
+                """
+            ),
+            (
+                'ntp_authentication_key_md5',
+                'ntp authentication-key %(key_id)s md5 %(password)s',
+                ('key_id', 'password', ),
+                (),
+                None,
+                'ntp authentication-key %s md5 %s',
+                None,
+                r"""
+                ntp_authentication_key_md5(key_id, password)
+
+                Add NTP Authentication Key
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp authentication-key {key_id} md5 {password}
+
+                :param key_id: WORD  NTP Key Number between 1-65534
+                :param password: WORD  NTP MD5 Password <8-16> chars
+                """
+            ),
+            (
+                'no_ntp_authentication_key',
+                'no ntp authentication-key %(key_id)s',
+                ('key_id', ),
+                (),
+                None,
+                'no ntp authentication-key %s',
+                None,
+                r"""
+                no_ntp_authentication_key(key_id)
+
+                Remove NTP Authentication Key
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ntp authentication-key {key_id}
+
+                :param key_id: WORD  NTP Key Number between 1-65534
+                """
+            ),
+            (
+                'ntp_trusted_key',
+                'ntp trusted-key %(key_id)s',
+                ('key_id', ),
+                (),
+                None,
+                'ntp trusted-key %s',
+                None,
+                r"""
+                ntp_trusted_key(key_id)
+
+                Add NTP Trusted Key
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ntp trusted-key {key_id}
+
+                :param key_id: WORD  NTP Key Number between 1-65534
+                """
+            ),
+            (
+                'no_ntp_trusted_key',
+                'no ntp trusted-key %(key_id)s',
+                ('key_id', ),
+                (),
+                None,
+                'no ntp trusted-key %s',
+                None,
+                r"""
+                no_ntp_trusted_key(key_id)
+
+                Remove NTP Trusted Key
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ntp trusted-key {key_id}
+
+                :param key_id: WORD  NTP Key Number between 1-65534
+                """
+            ),
+        ),
+    ),
+    (
+        'RouteMap',
+        r"""
+        Route-map configuration
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'route-map {routemap_name} {permission} {seq}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('routemap_name', 'permission', 'seq', ),
+        (
+            'config terminal',
+            'route-map {routemap_name} {permission} {seq}',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'description',
+                'description %(description)s',
+                ('description', ),
+                (),
+                None,
+                'description %s',
+                None,
+                r"""
+                description(description)
+
+                Set description
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # description {description}
+
+                :param description: LINE  Comment describing this route-map
+                 rule
+                """
+            ),
+            (
+                'no_description',
+                'no description %(description)s',
+                ('description', ),
+                (),
+                None,
+                'no description %s',
+                None,
+                r"""
+                no_description(description)
+
+                Unset description
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no description {description}
+
+                :param description: LINE  Comment describing this route-map
+                 rule
+                """
+            ),
+            (
+                'match_ip_address_prefix_list',
+                'match ip address prefix-list %(prefix_name)s',
+                ('prefix_name', ),
+                (),
+                None,
+                'match ip address prefix-list %s',
+                None,
+                r"""
+                match_ip_address_prefix_list(prefix_name)
+
+                Set prefix-list
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # match ip address prefix-list {prefix_name}
+
+                :param prefix_name: WORD  IP prefix-list name
+                """
+            ),
+            (
+                'no_match_ip_address_prefix_list',
+                'no match ip address prefix-list',
+                ('prefix_name', ),
+                (
+                    ('prefix_name', ' %(prefix_name)s'),
+                ),
+                'no match ip address prefix-list',
+                None,
+                None,
+                r"""
+                no_match_ip_address_prefix_list(prefix_name='')
+
+                Unset prefix-list
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no match ip address prefix-list
+
+                :param prefix_name: WORD  IP prefix-list name
+                """
+            ),
+            (
+                'set_metric',
+                'set metric %(metric)s',
+                ('metric', ),
+                (),
+                None,
+                'set metric %s',
+                None,
+                r"""
+                set_metric(metric)
+
+                Set metric
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # set metric {metric}
+
+                :param metric: <0-4294967295>  Metric value
+                """
+            ),
+            (
+                'no_set_metric',
+                'no set metric',
+                ('metric', ),
+                (
+                    ('metric', ' %(metric)s'),
+                ),
+                'no set metric',
+                None,
+                None,
+                r"""
+                no_set_metric(metric='')
+
+                Unset metric
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no set metric
+
+                :param metric: <0-4294967295>  Metric value
+                """
+            ),
+            (
+                'set_community',
+                'set community %(community)s',
+                ('community', ),
+                (),
+                None,
+                'set community %s',
+                None,
+                r"""
+                set_community(community)
+
+                Set community
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # set community {community}
+
+                :param community: AA:NN  Community number in aa:nn format
+                 or local-AS\|no-advertise\|no-export\|internet or additive
+                """
+            ),
+            (
+                'no_set_community',
+                'no set community',
+                ('community', ),
+                (
+                    ('community', ' %(community)s'),
+                ),
+                'no set community',
+                None,
+                None,
+                r"""
+                no_set_community(community='')
+
+                Unset community
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no set community
+
+                :param community: AA:NN  Community number in aa:nn format
+                 orlocal-AS\|no-advertise\|no-export\|internet or additive
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigInterface',
+        r"""
+        Interface configuration.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'interface {port}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('portlbl', ),
+        (
+            'config terminal',
+            'interface {port}',
+        ),
+        (
+            'end',
+        ),
+        r"""
+        Range of :class:`ConfigInterface` contexts.
+
+        :param list members: List of portlbl values. Label that identifies
+         an interface.
+        """,
+        (
+            (
+                'ip_address',
+                'ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s',
+                None,
+                r"""
+                ip_address(ipv4)
+
+                Set IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address',
+                'no ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s',
+                None,
+                r"""
+                no_ip_address(ipv4)
+
+                Unset IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ip_address_secondary',
+                'ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s secondary',
+                None,
+                r"""
+                ip_address_secondary(ipv4)
+
+                Set secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address_secondary',
+                'no ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s secondary',
+                None,
+                r"""
+                no_ip_address_secondary(ipv4)
+
+                Unset secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ipv6_address',
+                'ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s',
+                None,
+                r"""
+                ipv6_address(ipv6)
+
+                Set IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address',
+                'no ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s',
+                None,
+                r"""
+                no_ipv6_address(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'ipv6_address_secondary',
+                'ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s secondary',
+                None,
+                r"""
+                ipv6_address_secondary(ipv6)
+
+                Set secondary IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address_secondary',
+                'no ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s secondary',
+                None,
+                r"""
+                no_ipv6_address_secondary(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'routing',
+                'routing',
+                (),
+                (),
+                'routing',
+                'routing',
+                None,
+                r"""
+                routing()
+
+                Configure interface as L3.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # routing
+
+                """
+            ),
+            (
+                'no_routing',
+                'no routing',
+                (),
+                (),
+                'no routing',
+                'no routing',
+                None,
+                r"""
+                no_routing()
+
+                Unconfigure interface as L3.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no routing
+
+                """
+            ),
+            (
+                'shutdown',
+                'shutdown',
+                (),
+                (),
+                'shutdown',
+                'shutdown',
+                None,
+                r"""
+                shutdown()
+
+                Enable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # shutdown
+
+                """
+            ),
+            (
+                'no_shutdown',
+                'no shutdown',
+                (),
+                (),
+                'no shutdown',
+                'no shutdown',
+                None,
+                r"""
+                no_shutdown()
+
+                Disable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no shutdown
+
+                """
+            ),
+            (
+                'vlan_access',
+                'vlan access %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan access %s',
+                None,
+                r"""
+                vlan_access(vlan_id)
+
+                Access configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan access {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_access',
+                'no vlan access %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan access %s',
+                None,
+                r"""
+                no_vlan_access(vlan_id)
+
+                Remove vlan access
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan access {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'vlan_trunk_allowed',
+                'vlan trunk allowed %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan trunk allowed %s',
+                None,
+                r"""
+                vlan_trunk_allowed(vlan_id)
+
+                Allow VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk allowed {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_trunk_allowed',
+                'no vlan trunk allowed %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan trunk allowed %s',
+                None,
+                r"""
+                no_vlan_trunk_allowed(vlan_id)
+
+                Disallow VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk allowed {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'vlan_trunk_native_tag',
+                'vlan trunk native tag',
+                (),
+                (),
+                'vlan trunk native tag',
+                'vlan trunk native tag',
+                None,
+                r"""
+                vlan_trunk_native_tag()
+
+                Tag configuration on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk native tag
+
+                """
+            ),
+            (
+                'no_vlan_trunk_native_tag',
+                'no vlan trunk native tag',
+                (),
+                (),
+                'no vlan trunk native tag',
+                'no vlan trunk native tag',
+                None,
+                r"""
+                no_vlan_trunk_native_tag()
+
+                Remove tag configuration on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk native tag
+
+                """
+            ),
+            (
+                'vlan_trunk_native',
+                'vlan trunk native %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan trunk native %s',
+                None,
+                r"""
+                vlan_trunk_native(vlan_id)
+
+                Native VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk native {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_trunk_native',
+                'no vlan trunk native %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan trunk native %s',
+                None,
+                r"""
+                no_vlan_trunk_native(vlan_id)
+
+                Remove native VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk native {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'lacp_port_id',
+                'lacp port-id %(port_id)s',
+                ('port_id', ),
+                (),
+                None,
+                'lacp port-id %s',
+                None,
+                r"""
+                lacp_port_id(port_id)
+
+                Set port ID used in LACP negotiation.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp port-id {port_id}
+
+                :param port_id: <1-65535>  .The range is 1 to 65535
+                """
+            ),
+            (
+                'lacp_port_priority',
+                'lacp port-priority %(port_priority)s',
+                ('port_priority', ),
+                (),
+                None,
+                'lacp port-priority %s',
+                None,
+                r"""
+                lacp_port_priority(port_priority)
+
+                Set port priority is used in LACP negotiation.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp port-priority {port_priority}
+
+                :param port_priority: <1-65535>  The range is 1 to 65535
+                """
+            ),
+            (
+                'lag',
+                'lag %(lag_id)s',
+                ('lag_id', ),
+                (),
+                None,
+                'lag %s',
+                None,
+                r"""
+                lag(lag_id)
+
+                Add the current interface to link aggregation.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lag {lag_id}
+
+                :param lag_id: <1-2000>  LAG number ranges from 1 to 2000
+                """
+            ),
+            (
+                'no_lag',
+                'no lag %(lag_id)s',
+                ('lag_id', ),
+                (),
+                None,
+                'no lag %s',
+                None,
+                r"""
+                no_lag(lag_id)
+
+                Remove the current interface to link aggregation.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lag {lag_id}
+
+                :param lag_id: <1-2000>  LAG number ranges from 1 to 2000
+                """
+            ),
+            (
+                'lldp_transmission',
+                'lldp transmission',
+                (),
+                (),
+                'lldp transmission',
+                'lldp transmission',
+                None,
+                r"""
+                lldp_transmission()
+
+                Set the transmission on lldp.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lldp transmission
+
+                """
+            ),
+            (
+                'no_lldp_transmission',
+                'no lldp transmission',
+                (),
+                (),
+                'no lldp transmission',
+                'no lldp transmission',
+                None,
+                r"""
+                no_lldp_transmission()
+
+                Un-set the transmission on lldp.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lldp transmission
+
+                """
+            ),
+            (
+                'lldp_reception',
+                'lldp reception',
+                (),
+                (),
+                'lldp reception',
+                'lldp reception',
+                None,
+                r"""
+                lldp_reception()
+
+                Set the reception on lldp.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lldp reception
+
+                """
+            ),
+            (
+                'no_lldp_reception',
+                'no lldp reception',
+                (),
+                (),
+                'no lldp reception',
+                'no lldp reception',
+                None,
+                r"""
+                no_lldp_reception()
+
+                Un-set the reception on lldp.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lldp reception
+
+                """
+            ),
+            (
+                'udld_enable',
+                'udld enable',
+                (),
+                (),
+                'udld enable',
+                'udld enable',
+                None,
+                r"""
+                udld_enable()
+
+                Enable UDLD in the interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # udld enable
+
+                """
+            ),
+            (
+                'no_udld_enable',
+                'no udld enable',
+                (),
+                (),
+                'no udld enable',
+                'no udld enable',
+                None,
+                r"""
+                no_udld_enable()
+
+                Disable UDLD in the interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no udld enable
+
+                """
+            ),
+            (
+                'udld_interval',
+                'udld interval %(interval)s',
+                ('interval', ),
+                (),
+                None,
+                'udld interval %s',
+                None,
+                r"""
+                udld_interval(interval)
+
+                Set the packet interval
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # udld interval {interval}
+
+                :param interval: <100-10000> Allowed is 100 ms to 10,000 ms
+                """
+            ),
+            (
+                'udld_retries',
+                'udld retries %(retries)s',
+                ('retries', ),
+                (),
+                None,
+                'udld retries %s',
+                None,
+                r"""
+                udld_retries(retries)
+
+                Set the retries
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # udld retries {retries}
+
+                :param retries: <3-10> Allowed is from 3 to 10 retries.
+                """
+            ),
+            (
+                'udld_mode',
+                'udld mode %(mode)s',
+                ('mode', ),
+                (),
+                None,
+                'udld mode %s',
+                None,
+                r"""
+                udld_mode(mode)
+
+                Set the operation mode
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # udld mode {mode}
+
+                :param mode: <forward_then_verify | verify_then_forward>
+                """
+            ),
+            (
+                'sflow_enable',
+                'sflow enable',
+                (),
+                (),
+                'sflow enable',
+                'sflow enable',
+                None,
+                r"""
+                sflow_enable()
+
+                Enable sflow feature on interface
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # sflow enable
+
+                """
+            ),
+            (
+                'no_sflow_enable',
+                'no sflow enable',
+                (),
+                (),
+                'no sflow enable',
+                'no sflow enable',
+                None,
+                r"""
+                no_sflow_enable()
+
+                Disable sflow feature on interface
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no sflow enable
+
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigInterfaceVlan',
+        r"""
+        VLAN configuration.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'interface vlan {vlan_id}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('vlan_id', ),
+        (
+            'config terminal',
+            'interface vlan {vlan_id}',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'ip_address',
+                'ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s',
+                None,
+                r"""
+                ip_address(ipv4)
+
+                Set IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address',
+                'no ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s',
+                None,
+                r"""
+                no_ip_address(ipv4)
+
+                Unset IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ip_address_secondary',
+                'ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s secondary',
+                None,
+                r"""
+                ip_address_secondary(ipv4)
+
+                Set secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address_secondary',
+                'no ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s secondary',
+                None,
+                r"""
+                no_ip_address_secondary(ipv4)
+
+                Unset secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ipv6_address',
+                'ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s',
+                None,
+                r"""
+                ipv6_address(ipv6)
+
+                Set IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address',
+                'no ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s',
+                None,
+                r"""
+                no_ipv6_address(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'ipv6_address_secondary',
+                'ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s secondary',
+                None,
+                r"""
+                ipv6_address_secondary(ipv6)
+
+                Set secondary IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address_secondary',
+                'no ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s secondary',
+                None,
+                r"""
+                no_ipv6_address_secondary(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'shutdown',
+                'shutdown',
+                (),
+                (),
+                'shutdown',
+                'shutdown',
+                None,
+                r"""
+                shutdown()
+
+                Enable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # shutdown
+
+                """
+            ),
+            (
+                'no_shutdown',
+                'no shutdown',
+                (),
+                (),
+                'no shutdown',
+                'no shutdown',
+                None,
+                r"""
+                no_shutdown()
+
+                Disable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no shutdown
+
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigInterfaceLoopback',
+        r"""
+        Loopback interface configuration.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'interface loopback {loopback_id}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('loopback_id', ),
+        (
+            'config terminal',
+            'interface loopback {loopback_id}',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'ip_address',
+                'ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s',
+                None,
+                r"""
+                ip_address(ipv4)
+
+                Set IPv4 address for loopback
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Loopback IP address.
+                """
+            ),
+            (
+                'no_ip_address',
+                'no ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s',
+                None,
+                r"""
+                no_ip_address(ipv4)
+
+                Unset IPv4 address for loopback
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Loopback IP address.
+                """
+            ),
+            (
+                'ipv6_address',
+                'ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s',
+                None,
+                r"""
+                ipv6_address(ipv6)
+
+                Set IPv6 address on Loopback
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Loopback IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address',
+                'no ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s',
+                None,
+                r"""
+                no_ipv6_address(ipv6)
+
+                Unset IPv6 address on loopback interface
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Loopback IPv6 address
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigInterfaceLag',
+        r"""
+        Configure link-aggregation parameters.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'interface lag {lag}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('lag', ),
+        (
+            'config terminal',
+            'interface lag {lag}',
+        ),
+        (
+            'end',
+        ),
+        r"""
+        Range of :class:`ConfigInterfaceLag` contexts.
+
+        :param list members: List of lag values. LAG number ranges from 1
+         to 2000.
+        """,
+        (
+            (
+                'ip_address',
+                'ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s',
+                None,
+                r"""
+                ip_address(ipv4)
+
+                Set IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address',
+                'no ip address %(ipv4)s',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s',
+                None,
+                r"""
+                no_ip_address(ipv4)
+
+                Unset IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4}
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ip_address_secondary',
+                'ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'ip address %s secondary',
+                None,
+                r"""
+                ip_address_secondary(ipv4)
+
+                Set secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'no_ip_address_secondary',
+                'no ip address %(ipv4)s secondary',
+                ('ipv4', ),
+                (),
+                None,
+                'no ip address %s secondary',
+                None,
+                r"""
+                no_ip_address_secondary(ipv4)
+
+                Unset secondary IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip address {ipv4} secondary
+
+                :param ipv4: A.B.C.D/M Interface IP address.
+                """
+            ),
+            (
+                'ipv6_address',
+                'ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s',
+                None,
+                r"""
+                ipv6_address(ipv6)
+
+                Set IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address',
+                'no ipv6 address %(ipv6)s',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s',
+                None,
+                r"""
+                no_ipv6_address(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6}
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'ipv6_address_secondary',
+                'ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'ipv6 address %s secondary',
+                None,
+                r"""
+                ipv6_address_secondary(ipv6)
+
+                Set secondary IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'no_ipv6_address_secondary',
+                'no ipv6 address %(ipv6)s secondary',
+                ('ipv6', ),
+                (),
+                None,
+                'no ipv6 address %s secondary',
+                None,
+                r"""
+                no_ipv6_address_secondary(ipv6)
+
+                Unset IPv6 address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ipv6 address {ipv6} secondary
+
+                :param ipv6: X:X::X:X/M  Interface IPv6 address
+                """
+            ),
+            (
+                'shutdown',
+                'shutdown',
+                (),
+                (),
+                'shutdown',
+                'shutdown',
+                None,
+                r"""
+                shutdown()
+
+                Enable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # shutdown
+
+                """
+            ),
+            (
+                'no_shutdown',
+                'no shutdown',
+                (),
+                (),
+                'no shutdown',
+                'no shutdown',
+                None,
+                r"""
+                no_shutdown()
+
+                Disable an interface.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no shutdown
+
+                """
+            ),
+            (
+                'routing',
+                'routing',
+                (),
+                (),
+                'routing',
+                'routing',
+                None,
+                r"""
+                routing()
+
+                Configure interface as L3.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # routing
+
+                """
+            ),
+            (
+                'no_routing',
+                'no routing',
+                (),
+                (),
+                'no routing',
+                'no routing',
+                None,
+                r"""
+                no_routing()
+
+                Unconfigure interface as L3.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no routing
+
+                """
+            ),
+            (
+                'vlan_access',
+                'vlan access %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan access %s',
+                None,
+                r"""
+                vlan_access(vlan_id)
+
+                Access configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan access {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_access',
+                'no vlan access %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan access %s',
+                None,
+                r"""
+                no_vlan_access(vlan_id)
+
+                Remove vlan access
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan access {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'vlan_trunk_allowed',
+                'vlan trunk allowed %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan trunk allowed %s',
+                None,
+                r"""
+                vlan_trunk_allowed(vlan_id)
+
+                Allow VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk allowed {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_trunk_allowed',
+                'no vlan trunk allowed %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan trunk allowed %s',
+                None,
+                r"""
+                no_vlan_trunk_allowed(vlan_id)
+
+                Disallow VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk allowed {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'vlan_trunk_native_tag',
+                'vlan trunk native tag',
+                (),
+                (),
+                'vlan trunk native tag',
+                'vlan trunk native tag',
+                None,
+                r"""
+                vlan_trunk_native_tag()
+
+                Tag configuration on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk native tag
+
+                """
+            ),
+            (
+                'no_vlan_trunk_native_tag',
+                'no vlan trunk native tag',
+                (),
+                (),
+                'no vlan trunk native tag',
+                'no vlan trunk native tag',
+                None,
+                r"""
+                no_vlan_trunk_native_tag()
+
+                Remove tag configuration on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk native tag
+
+                """
+            ),
+            (
+                'vlan_trunk_native',
+                'vlan trunk native %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'vlan trunk native %s',
+                None,
+                r"""
+                vlan_trunk_native(vlan_id)
+
+                Native VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # vlan trunk native {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'no_vlan_trunk_native',
+                'no vlan trunk native %(vlan_id)s',
+                ('vlan_id', ),
+                (),
+                None,
+                'no vlan trunk native %s',
+                None,
+                r"""
+                no_vlan_trunk_native(vlan_id)
+
+                Remove native VLAN on the trunk port
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no vlan trunk native {vlan_id}
+
+                :param vlan_id: <1-4094>  VLAN identifier
+                """
+            ),
+            (
+                'lacp_mode_passive',
+                'lacp mode passive',
+                (),
+                (),
+                'lacp mode passive',
+                'lacp mode passive',
+                None,
+                r"""
+                lacp_mode_passive()
+
+                Sets an interface as LACP passive.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp mode passive
+
+                """
+            ),
+            (
+                'no_lacp_mode_passive',
+                'no lacp mode passive',
+                (),
+                (),
+                'no lacp mode passive',
+                'no lacp mode passive',
+                None,
+                r"""
+                no_lacp_mode_passive()
+
+                Sets an LACP passive interface off.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lacp mode passive
+
+                """
+            ),
+            (
+                'lacp_mode_active',
+                'lacp mode active',
+                (),
+                (),
+                'lacp mode active',
+                'lacp mode active',
+                None,
+                r"""
+                lacp_mode_active()
+
+                Sets an interface as LACP active.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp mode active
+
+                """
+            ),
+            (
+                'no_lacp_mode_active',
+                'no lacp mode active',
+                (),
+                (),
+                'no lacp mode active',
+                'no lacp mode active',
+                None,
+                r"""
+                no_lacp_mode_active()
+
+                Sets an LACP active interface off.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lacp mode active
+
+                """
+            ),
+            (
+                'lacp_fallback',
+                'lacp fallback',
+                (),
+                (),
+                'lacp fallback',
+                'lacp fallback',
+                None,
+                r"""
+                lacp_fallback()
+
+                Enable LACP fallback mode.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp fallback
+
+                """
+            ),
+            (
+                'hash_l2_src_dst',
+                'hash l2-src-dst',
+                (),
+                (),
+                'hash l2-src-dst',
+                'hash l2-src-dst',
+                None,
+                r"""
+                hash_l2_src_dst()
+
+                Base the hash on l2-src-dst.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # hash l2-src-dst
+
+                """
+            ),
+            (
+                'hash_l3_src_dst',
+                'hash l3-src-dst',
+                (),
+                (),
+                'hash l3-src-dst',
+                'hash l3-src-dst',
+                None,
+                r"""
+                hash_l3_src_dst()
+
+                Base the hash on l3-src-dst.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # hash l3-src-dst
+
+                """
+            ),
+            (
+                'hash_l4_src_dst',
+                'hash l4-src-dst',
+                (),
+                (),
+                'hash l4-src-dst',
+                'hash l4-src-dst',
+                None,
+                r"""
+                hash_l4_src_dst()
+
+                Base the hash on l4-src-dst.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # hash l4-src-dst
+
+                """
+            ),
+            (
+                'lacp_rate_fast',
+                'lacp rate fast',
+                (),
+                (),
+                'lacp rate fast',
+                'lacp rate fast',
+                None,
+                r"""
+                lacp_rate_fast()
+
+                Set LACP heartbeats are requested at the rate of one per
+                second.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # lacp rate fast
+
+                """
+            ),
+            (
+                'no_lacp_rate_fast',
+                'no lacp rate fast',
+                (),
+                (),
+                'no lacp rate fast',
+                'no lacp rate fast',
+                None,
+                r"""
+                no_lacp_rate_fast()
+
+                Set LACP heartbeats slow which is once every  30 seconds.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no lacp rate fast
+
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigInterfaceMgmt',
+        r"""
+        Configure management interface.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'interface mgmt']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        (),
+        (
+            'config terminal',
+            'interface mgmt',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'ip_static',
+                'ip static %(ip)s',
+                ('ip', ),
+                (),
+                None,
+                'ip static %s',
+                None,
+                r"""
+                ip_static(ip)
+
+                Set IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip static {ip}
+
+                :param ip: Interface IP (ipv4 or ipv6) address.
+                """
+            ),
+            (
+                'no_ip_static',
+                'no ip static %(ip)s',
+                ('ip', ),
+                (),
+                None,
+                'no ip static %s',
+                None,
+                r"""
+                no_ip_static(ip)
+
+                Unset IP address
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no ip static {ip}
+
+                :param ip: Interface IP (ipv4 or ipv6) address.
+                """
+            ),
+            (
+                'default_gateway',
+                'default-gateway %(gateway)s',
+                ('gateway', ),
+                (),
+                None,
+                'default-gateway %s',
+                None,
+                r"""
+                default_gateway(gateway)
+
+                Configure the Default gateway address (IPv4 and IPv6)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # default-gateway {gateway}
+
+                :param gateway: IP (ipv4 or ipv6) address.
+                """
+            ),
+            (
+                'no_default_gateway',
+                'no default-gateway %(gateway)s',
+                ('gateway', ),
+                (),
+                None,
+                'no default-gateway %s',
+                None,
+                r"""
+                no_default_gateway(gateway)
+
+                Remove the Default gateway address (IPv4 and IPv6)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no default-gateway {gateway}
+
+                :param gateway: IP (ipv4 or ipv6) address.
+                """
+            ),
+            (
+                'nameserver',
+                'nameserver %(primary_nameserver)s',
+                ('primary_nameserver', 'secondary_nameserver', ),
+                (
+                    ('secondary_nameserver', ' %(secondary_nameserver)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                nameserver(primary_nameserver, secondary_nameserver='')
+
+                Configure the nameserver
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # nameserver {primary_nameserver}
+
+                :param primary_nameserver: Primary nameserver (ipv4 or
+                 ipv6) address.
+                :param secondary_nameserver: Secondary nameserver (ipv4 or
+                 ipv6) address.
+                """
+            ),
+            (
+                'no_nameserver',
+                'no nameserver %(primary_nameserver)s',
+                ('primary_nameserver', 'secondary_nameserver', ),
+                (
+                    ('secondary_nameserver', ' %(secondary_nameserver)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_nameserver(primary_nameserver, secondary_nameserver='')
+
+                Configure the nameserver
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no nameserver {primary_nameserver}
+
+                :param primary_nameserver: Primary nameserver (ipv4 or
+                 ipv6) address.
+                :param secondary_nameserver: Secondary nameserver (ipv4 or
+                 ipv6) address.
+                """
+            ),
+            (
+                'ip_dhcp',
+                'ip dhcp',
+                (),
+                (),
+                'ip dhcp',
+                'ip dhcp',
+                None,
+                r"""
+                ip_dhcp()
+
+                Set the mode as dhcp.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # ip dhcp
+
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigRouterBgp',
+        r"""
+        BGP configuration.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'router bgp {asn}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('asn', ),
+        (
+            'config terminal',
+            'router bgp {asn}',
+        ),
+        (
+            'end',
+        ),
+        None,
+        (
+            (
+                'bgp_router_id',
+                'bgp router-id %(id)s',
+                ('id', ),
+                (),
+                None,
+                'bgp router-id %s',
+                None,
+                r"""
+                bgp_router_id(id)
+
+                Specifies the BGP router-ID for a BGP Router
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # bgp router-id {id}
+
+                :param id: <A.B.C.D> IPv4 address
+                """
+            ),
+            (
+                'no_bgp_router_id',
+                'no bgp router-id %(id)s',
+                ('id', ),
+                (),
+                None,
+                'no bgp router-id %s',
+                None,
+                r"""
+                no_bgp_router_id(id)
+
+                Removes the BGP router-ID for a BGP Router
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no bgp router-id {id}
+
+                :param id: <A.B.C.D> IPv4 address
+                """
+            ),
+            (
+                'bgp_fast_external_failover',
+                'bgp fast-external-failover',
+                (),
+                (),
+                'bgp fast-external-failover',
+                'bgp fast-external-failover',
+                None,
+                r"""
+                bgp_fast_external_failover()
+
+                Immediately reset session if a link to a directly connected
+                external peer goes down
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # bgp fast-external-failover
+
+                """
+            ),
+            (
+                'no_bgp_fast_external_failover',
+                'no bgp fast-external-failover',
+                (),
+                (),
+                'no bgp fast-external-failover',
+                'no bgp fast-external-failover',
+                None,
+                r"""
+                no_bgp_fast_external_failover()
+
+                Disables BGP fast external failover
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no bgp fast-external-failover
+
+                """
+            ),
+            (
+                'network',
+                'network %(network)s',
+                ('network', ),
+                (),
+                None,
+                'network %s',
+                None,
+                r"""
+                network(network)
+
+                Adds the announcement network for BGP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # network {network}
+
+                :param network: <A.B.C.D/M> IPv4 address with the prefix
+                 len
+                """
+            ),
+            (
+                'no_network',
+                'no network %(network)s',
+                ('network', ),
+                (),
+                None,
+                'no network %s',
+                None,
+                r"""
+                no_network(network)
+
+                Removes the announcement network for BGP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no network {network}
+
+                :param network: <A.B.C.D/M> IPv4 address with the prefix
+                 length
+                """
+            ),
+            (
+                'maximum_paths',
+                'maximum-paths %(num)s',
+                ('num', ),
+                (),
+                None,
+                'maximum-paths %s',
+                None,
+                r"""
+                maximum_paths(num)
+
+                Sets the maximum number of paths for a BGP route
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # maximum-paths {num}
+
+                :param num: <1-255> Maximum number of paths. Default is 1
+                """
+            ),
+            (
+                'no_maximum_paths',
+                'no maximum-paths %(num)s',
+                ('num', ),
+                (),
+                None,
+                'no maximum-paths %s',
+                None,
+                r"""
+                no_maximum_paths(num)
+
+                Set the max number of paths to the default value of 1
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no maximum-paths {num}
+
+                :param num: <1-255> Maximum number of paths. Default is 1
+                """
+            ),
+            (
+                'timers_bgp',
+                'timers bgp %(keepalive)s %(hold)s',
+                ('keepalive', 'hold', ),
+                (),
+                None,
+                'timers bgp %s %s',
+                None,
+                r"""
+                timers_bgp(keepalive, hold)
+
+                Sets the keepalive interval and hold time for a BGP router
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # timers bgp {keepalive} {hold}
+
+                :param keepalive: <0-65535> Keepalive interval in seconds.
+                 Default is 60
+                :param hold: <0 - 65535> Hold time in seconds. Default is
+                 180
+                """
+            ),
+            (
+                'no_timers_bgp',
+                'no timers bgp',
+                ('keepalive', 'hold', ),
+                (
+                    ('keepalive', ' %(keepalive)s'),
+                    ('hold', ' %(hold)s'),
+                ),
+                'no timers bgp',
+                None,
+                None,
+                r"""
+                no_timers_bgp(keepalive='', hold='')
+
+                Sets the default values for keepalive interval and hold
+                time for a BGP router
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no timers bgp
+
+                :param keepalive: <0 - 65535> Keepalive interval in
+                 seconds. Default is 60
+                :param hold: <0 - 65535> Hold time in seconds. Default is
+                 180
+                """
+            ),
+            (
+                'neighbor_remote_as',
+                'neighbor %(ip)s remote-as %(asn)s',
+                ('ip', 'asn', ),
+                (),
+                None,
+                'neighbor %s remote-as %s',
+                None,
+                r"""
+                neighbor_remote_as(ip, asn)
+
+                Configures a BGP neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} remote-as {asn}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param asn: <1 - 4294967295> Neighbor AS number. Ranges
+                 from 1 to 4294967295
+                """
+            ),
+            (
+                'no_neighbor',
+                'no neighbor %(ip)s',
+                ('ip', ),
+                (),
+                None,
+                'no neighbor %s',
+                None,
+                r"""
+                no_neighbor(ip)
+
+                Removes a BGP neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'neighbor_route_map',
+                'neighbor %(ip)s route-map %(route_name)s %(action)s',
+                ('ip', 'route_name', 'action', ),
+                (),
+                None,
+                'neighbor %s route-map %s %s',
+                None,
+                r"""
+                neighbor_route_map(ip, route_name, action)
+
+                Configures a BGP neighbor route-map
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} route-map {route_name} {action}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param route_name: WORD  Name of route map
+                :param action: export  Apply map to routes coming
+                 from a Route-Server client
+                 import  Apply map to routes going into
+                 a Route-Server client's table
+                 in      Apply map to incoming routes
+                 out     Apply map to outbound routes
+                """
+            ),
+            (
+                'no_neighbor_route_map',
+                'no neighbor %(ip)s route-map %(route_name)s %(action)s',  # noqa
+                ('ip', 'route_name', 'action', ),
+                (),
+                None,
+                'no neighbor %s route-map %s %s',
+                None,
+                r"""
+                no_neighbor_route_map(ip, route_name, action)
+
+                Unconfigures a BGP neighbor route-map
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} route-map {route_name} {action}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param route_name: WORD  Name of route map
+                :param action: export  Apply map to routes coming
+                 from a Route-Server client
+                 import  Apply map to routes going into
+                 a Route-Server client's table
+                 in      Apply map to incoming routes
+                 out     Apply map to outbound routes
+                """
+            ),
+            (
+                'neighbor_prefix_list',
+                'neighbor %(peer)s prefix-list %(prefix_name)s',
+                ('peer', 'prefix_name', 'filter_direction', ),
+                (
+                    ('filter_direction', ' %(filter_direction)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                neighbor_prefix_list(peer, prefix_name,
+                    filter_direction='')
+
+                Applies a prefix-list to the neighbor to filter updates to
+                and from the neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {peer} prefix-list {prefix_name}
+
+                :param peer: <A.B.C.D|X:X::X:X|WORD> peer IPv4/IPv6 address
+                 or neighbor tag
+                :param prefix_name: <WORD> The name of a prefix list
+                :param filter_direction: <in|out> Filters incoming/outgoing
+                 routes
+                """
+            ),
+            (
+                'no_neighbor_prefix_list',
+                'no neighbor %(peer)s prefix-list %(prefix_name)s',
+                ('peer', 'prefix_name', 'filter_direction', ),
+                (
+                    ('filter_direction', ' %(filter_direction)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_neighbor_prefix_list(peer, prefix_name,
+                    filter_direction='')
+
+                Remove a prefix-list filter from the neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {peer} prefix-list {prefix_name}
+
+                :param peer: <A.B.C.D|X:X::X:X|WORD> peer IPv4/IPv6 address
+                 or neighbor tag
+                :param prefix_name: <WORD> The name of a prefix list
+                :param filter_direction: <in|out> Filters incoming/outgoing
+                 routes
+                """
+            ),
+            (
+                'neighbor_description',
+                'neighbor %(ip)s description %(text)s',
+                ('ip', 'text', ),
+                (),
+                None,
+                'neighbor %s description %s',
+                None,
+                r"""
+                neighbor_description(ip, text)
+
+                Removes a BGP neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} description {text}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param text: Description of the peer router. String of
+                 maximum length 80 chars
+                """
+            ),
+            (
+                'no_neighbor_description',
+                'no neighbor %(ip)s description',
+                ('ip', 'text', ),
+                (
+                    ('text', ' %(text)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_neighbor_description(ip, text='')
+
+                Removes a BGP neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} description
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param text: Description of the peer router.String of
+                 maximum length 80 chars
+                """
+            ),
+            (
+                'neighbor_password',
+                'neighbor %(ip)s password %(pwd)s',
+                ('ip', 'pwd', ),
+                (),
+                None,
+                'neighbor %s password %s',
+                None,
+                r"""
+                neighbor_password(ip, pwd)
+
+                Enables MD5 authentication on a TCP connection between BGP
+                peers.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} password {pwd}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param pwd: Password in plain text.String of maximum length
+                 80 chars
+                """
+            ),
+            (
+                'no_neighbor_password',
+                'no neighbor %(ip)s password',
+                ('ip', ),
+                (),
+                None,
+                'no neighbor %s password',
+                None,
+                r"""
+                no_neighbor_password(ip)
+
+                Removes MD5 authentication on a TCP connection between BGP
+                peers.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} password
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'neighbor_timers',
+                'neighbor %(ip)s timers %(keepalive)s %(hold)s',
+                ('ip', 'keepalive', 'hold', ),
+                (),
+                None,
+                'neighbor %s timers %s %s',
+                None,
+                r"""
+                neighbor_timers(ip, keepalive, hold)
+
+                Sets the keepalive interval and hold time for a specific
+                BGP peer
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} timers {keepalive} {hold}
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param keepalive: <0 - 65535> Keepalive interval in
+                 seconds.Default is 60
+                :param hold: <0-65535> Hold time in seconds. Default is 180
+                """
+            ),
+            (
+                'no_neighbor_timers',
+                'no neighbor %(ip)s timers',
+                ('ip', 'keepalive', 'hold', ),
+                (
+                    ('keepalive', ' %(keepalive)s'),
+                    ('hold', ' %(hold)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_neighbor_timers(ip, keepalive='', hold='')
+
+                Sets the default values for keepalive interval and hold
+                time for a specific BGP peer
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} timers
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param keepalive: <0 - 65535> Keepalive interval in
+                 seconds.Default is 0
+                :param hold: <0 - 65535> Hold time in seconds. Default is 0
+                """
+            ),
+            (
+                'neighbor_allowas_in',
+                'neighbor %(ip)s allowas-in',
+                ('ip', 'val', ),
+                (
+                    ('val', ' %(val)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                neighbor_allowas_in(ip, val='')
+
+                Specifies an allow-as-in occurrence number for an AS to be
+                in the AS path
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} allowas-in
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param val: <0 - 10> Number of times BGP can allow an
+                 instance of AS to be in the AS_PATH
+                """
+            ),
+            (
+                'no_neighbor_allowas_in',
+                'no neighbor %(ip)s allowas-in',
+                ('ip', 'val', ),
+                (
+                    ('val', ' %(val)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_neighbor_allowas_in(ip, val='')
+
+                Clears the allow-as-in occurrence number for an AS to be in
+                the AS path
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} allowas-in
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                :param val: <0 - 10> Number of times BGP can allow
+                 aninstance of AS to be in the AS_PATH
+                """
+            ),
+            (
+                'neighbor_remove_private_as',
+                'neighbor %(ip)s remove-private-AS',
+                ('ip', ),
+                (),
+                None,
+                'neighbor %s remove-private-AS',
+                None,
+                r"""
+                neighbor_remove_private_as(ip)
+
+                Removes private AS numbers from the AS pathin outbound
+                routing updates
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} remove-private-AS
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'no_neighbor_remove_private_as',
+                'no neighbor %(ip)s remove-private-AS',
+                ('ip', ),
+                (),
+                None,
+                'no neighbor %s remove-private-AS',
+                None,
+                r"""
+                no_neighbor_remove_private_as(ip)
+
+                Resets to a cleared state (default)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} remove-private-AS
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'neighbor_soft_reconfiguration_inbound',
+                'neighbor %(ip)s soft-reconfiguration inbound',
+                ('ip', ),
+                (),
+                None,
+                'neighbor %s soft-reconfiguration inbound',
+                None,
+                r"""
+                neighbor_soft_reconfiguration_inbound(ip)
+
+                Enables software-based reconfiguration to generate updates
+                from a neighbor without clearing the BGP session
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} soft-reconfiguration inbound
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'no_neighbor_soft_reconfiguration_inbound',
+                'no neighbor %(ip)s soft-reconfiguration inbound',
+                ('ip', ),
+                (),
+                None,
+                'no neighbor %s soft-reconfiguration inbound',
+                None,
+                r"""
+                no_neighbor_soft_reconfiguration_inbound(ip)
+
+                Resets to a cleared state (default)
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} soft-reconfiguration inbound
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'neighbor_shutdown',
+                'neighbor %(ip)s shutdown',
+                ('ip', ),
+                (),
+                None,
+                'neighbor %s shutdown',
+                None,
+                r"""
+                neighbor_shutdown(ip)
+
+                Shuts down the neighbor. This disables the peer routerbut
+                preserves neighbor configuration
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip} shutdown
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'no_neighbor_shutdown',
+                'no neighbor %(ip)s shutdown',
+                ('ip', ),
+                (),
+                None,
+                'no neighbor %s shutdown',
+                None,
+                r"""
+                no_neighbor_shutdown(ip)
+
+                Re-enables the neighbor
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip} shutdown
+
+                :param ip: <A.B.C.D> Neighbor IPv4 address
+                """
+            ),
+            (
+                'neighbor_peer_group',
+                'neighbor %(ip_or_group)s peer-group %(group)s',
+                ('ip_or_group', 'group', ),
+                (
+                    ('group', ' %(group)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                neighbor_peer_group(ip_or_group, group='')
+
+                Assigns a neighbor to a peer-group
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # neighbor {ip_or_group} peer-group {group}
+
+                :param ip_or_group: <A.B.C.D> Neighbor IPv4
+                 address<X:X::X:X> Neighbor IPv6 address<WORD> Neighbor
+                 group
+                :param group: ('Peer-group name.String of maximum length 80
+                 chars',)
+                """
+            ),
+            (
+                'no_neighbor_peer_group',
+                'no neighbor %(ip_or_group)s peer-group %(group)s',
+                ('ip_or_group', 'group', ),
+                (
+                    ('group', ' %(group)s'),
+                ),
+                None,
+                None,
+                None,
+                r"""
+                no_neighbor_peer_group(ip_or_group, group='')
+
+                Removes the neighbor from the peer-group
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no neighbor {ip_or_group} peer-group {group}
+
+                :param ip_or_group: <A.B.C.D> Neighbor IPv4
+                 address<X:X::X:X> Neighbor IPv6 address<WORD> Neighbor
+                 group
+                :param group: Peer-group name. String of maximum length 80
+                 chars
+                """
+            ),
+            (
+                'redistribute',
+                'redistribute %(type)s',
+                ('type', ),
+                (),
+                None,
+                'redistribute %s',
+                None,
+                r"""
+                redistribute(type)
+
+                Configures route redistribution of the specified protocol
+                into BGP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # redistribute {type}
+
+                :param type: <connected | static | ospf>
+                """
+            ),
+            (
+                'no_redistribute',
+                'no redistribute %(type)s',
+                ('type', ),
+                (),
+                None,
+                'no redistribute %s',
+                None,
+                r"""
+                no_redistribute(type)
+
+                Unconfigures route redistribution of the specified protocol
+                into BGP
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no redistribute {type}
+
+                :param type: <connected | static | ospf>
+                """
+            ),
+        ),
+    ),
+    (
+        'ConfigVlan',
+        r"""
+        VLAN configuration.
+
+        pre_commands:
+
+        ::
+
+            ['config terminal', 'vlan {vlan_id}']
+
+        post_commands:
+
+        ::
+
+            ['end']
+        """,
+        ('vlan_id', ),
+        (
+            'config terminal',
+            'vlan {vlan_id}',
+        ),
+        (
+            'end',
+        ),
+        r"""
+        Range of :class:`ConfigVlan` contexts.
+
+        :param list members: List of vlan_id values. <1-4094>  VLAN
+         identifier.
+        """,
+        (
+            (
+                'shutdown',
+                'shutdown',
+                (),
+                (),
+                'shutdown',
+                'shutdown',
+                None,
+                r"""
+                shutdown()
+
+                Enable the VLAN.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # shutdown
+
+                """
+            ),
+            (
+                'no_shutdown',
+                'no shutdown',
+                (),
+                (),
+                'no shutdown',
+                'no shutdown',
+                None,
+                r"""
+                no_shutdown()
+
+                Disable the VLAN.
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no shutdown
+
+                """
+            ),
+            (
+                'description',
+                'description %(description)s',
+                ('description', ),
+                (),
+                None,
+                'description %s',
+                None,
+                r"""
+                description(description)
+
+                Set VLAN description
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # description {description}
+
+                :param description: VLAN description.
+                """
+            ),
+            (
+                'no_description',
+                'no description %(description)s',
+                ('description', ),
+                (),
+                None,
+                'no description %s',
+                None,
+                r"""
+                no_description(description)
+
+                Un-set VLAN description
+
+                This function runs the following vtysh command:
+
+                ::
+
+                    # no description {description}
+
+                :param description: VLAN description.
+                """
+            ),
+        ),
+    ),
+)
+
+
+__all__ = ['ROOT', 'CONTEXTS']
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare the snapshots of a route table taken at different times.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.diff import Snapshot
+    from topology_lib_vtysh.parser import iter_show_rib
+
+    snapshot = Snapshot(show_rib(enode))
+    # ... change the configuration ...
+    changes = snapshot.update(iter_show_rib(enode('show rib', shell='vtysh')))
+    for (prefix, next_hop), (old, new) in changes.changed.items():
+        print(prefix, next_hop, old, new)
+
+The entries of a table are indexed by their prefix and next hop, so two
+snapshots are compared in linear time. A snapshot keeps its index, and a new
+output can be parsed one entry at a time straight into the index it is
+compared with, so the previous table is not parsed again and the new one is
+never held as a list.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from collections import OrderedDict
+
+from .routes import route_prefix
+
+
+def iter_entries(result):
+    """
+    Iterate over the entries of a parsed route table, one per prefix and
+    next hop.
+
+    :param result: The result of
+     :func:`topology_lib_vtysh.parser.parse_show_rib`, the routes of
+     :func:`topology_lib_vtysh.parser.parse_show_ip_route` and
+     :func:`topology_lib_vtysh.parser.parse_show_ipv6_route`, or the entries
+     of :func:`topology_lib_vtysh.parser.parse_show_ip_bgp` and
+     :func:`topology_lib_vtysh.parser.parse_show_ipv6_bgp`. Any iterable of
+     them does, like the generators of the streaming parsers.
+    :return: A generator of ``(key, entry)`` tuples. The key is a
+     ``(prefix, next_hop)`` tuple. For BGP the entry is the parsed entry, and
+     for the other tables it is a ``(route, next_hop)`` tuple with the route
+     and one of its next hops, or ``None`` if it has none.
+    """
+    entries = result
+    if isinstance(result, dict):
+        entries = (
+            entry for key in ('ipv4_entries', 'ipv6_entries')
+            for entry in result.get(key, ())
+        )
+
+    for entry in entries:
+        # The entries of iter_show_rib() come with their family
+        if isinstance(entry, tuple):
+            entry = entry[1]
+
+        if 'next_hops' not in entry:
+            yield (entry['network'], entry['next_hop']), entry
+            continue
+
+        prefix = route_prefix(entry)
+        if not entry['next_hops']:
+            yield (prefix, None), (entry, None)
+        for next_hop in entry['next_hops']:
+            yield (prefix, next_hop['via']), (entry, next_hop)
+
+
+def index(result):
+    """
+    Index the entries of a parsed route table by prefix and next hop.
+
+    :param result: The parsed table, as given to :func:`iter_entries`.
+    :rtype: OrderedDict
+    :return: The entries, by ``(prefix, next_hop)`` key. If several entries
+     have the same key, the last one is kept.
+    """
+    return OrderedDict(iter_entries(result))
+
+
+def _same(old, new):
+    if not isinstance(old, tuple):
+        return old == new
+
+    # Only the route attributes that are not next hops are compared, the
+    # other next hops are entries of their own
+    (old_route, old_next_hop), (new_route, new_next_hop) = old, new
+    if old_next_hop != new_next_hop:
+        return False
+    if len(old_route) != len(new_route):
+        return False
+    return all(
+        key == 'next_hops' or new_route.get(key) == value
+        for key, value in old_route.items()
+    )
+
+
+class Diff(object):
+    """
+    Differences between two snapshots of a route table.
+
+    All the mappings are keyed by ``(prefix, next_hop)`` and hold entries as
+    returned by :func:`iter_entries`.
+
+    :var OrderedDict added: Entries only found in the new snapshot.
+    :var OrderedDict removed: Entries only found in the old snapshot.
+    :var OrderedDict changed: ``(old, new)`` tuples of the entries found in
+     both snapshots, but with different attributes.
+    """
+    def __init__(self, added, removed, changed):
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return '<Diff added={} removed={} changed={}>'.format(
+            len(self.added), len(self.removed), len(self.changed)
+        )
+
+
+def diff(old, new):
+    """
+    Compare two indexed snapshots of a route table.
+
+    :param dict old: The old entries, as returned by :func:`index`.
+    :param dict new: The new entries, as returned by :func:`index`.
+    :rtype: Diff
+    :return: The differences between the snapshots.
+    """
+    added = OrderedDict()
+    changed = OrderedDict()
+    for key, entry in new.items():
+        previous = old.get(key)
+        if previous is None:
+            added[key] = entry
+        elif not _same(previous, entry):
+            changed[key] = (previous, entry)
+
+    removed = OrderedDict(
+        (key, entry) for key, entry in old.items() if key not in new
+    )
+    return Diff(added, removed, changed)
+
+
+class Snapshot(object):
+    """
+    Indexed snapshot of a route table, to compare newer ones with.
+
+    :param result: The parsed table, as given to :func:`iter_entries`.
+    :var OrderedDict entries: The entries of the snapshot, as returned by
+     :func:`index`.
+    """
+    def __init__(self, result=()):
+        self.entries = index(result)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def diff(self, result):
+        """
+        Compare a newer table with the snapshot.
+
+        :param result: The newer table, as given to :func:`iter_entries`.
+        :rtype: Diff
+        :return: The differences from the snapshot to the newer table.
+        """
+        return diff(self.entries, index(result))
+
+    def update(self, result):
+        """
+        Compare a newer table with the snapshot, and make it the snapshot.
+
+        :param result: The newer table, as given to :func:`iter_entries`.
+        :rtype: Diff
+        :return: The differences from the snapshot to the newer table.
+        """
+        entries = index(result)
+        changes = diff(self.entries, entries)
+        self.entries = entries
+        return changes
+
+
+__all__ = ['iter_entries', 'index', 'diff', 'Diff', 'Snapshot']
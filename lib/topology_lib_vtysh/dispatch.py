@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Bind the functions and contexts of the library from the command table.
+
+The table in :mod:`topology_lib_vtysh.commands` is generated from the vtysh
+specification. Every command of it is a
+``(name, template, params, optional, static, positional, parse, doc)``
+tuple:
+
+- ``template`` is the vtysh command with ``%(argument)s`` placeholders.
+- ``params`` are the names of the arguments, in order.
+- ``optional`` holds a ``(name, suffix)`` pair for every optional argument,
+  and the suffix is appended to the command when the argument is given.
+- ``static`` is the command run when no argument is given, or ``None`` if
+  the command has required arguments.
+- ``positional`` is the vtysh command with ``%s`` placeholders for the
+  arguments in order, or ``None`` if the command can not be rendered like
+  that.
+- ``parse`` is the name of the parser of the output, if any.
+
+The commands are rendered by :func:`renderer`, and the library functions,
+methods and context classes are created from the table by a
+:class:`Binder`. What is done with the rendered command is up to the
+factories given to it, so the blocking and the asyncio libraries share the
+table.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import re
+from operator import itemgetter
+from collections import OrderedDict
+
+try:
+    from inspect import Parameter, Signature
+except ImportError:
+    Signature = None
+
+
+_NAMED = re.compile(r'%\((\w+)\)s')
+
+
+def bind(name, params, defaults, args, kwargs):
+    """
+    Map the arguments of a call to the parameters of a function, raising
+    like Python does for a function with that signature.
+
+    :param str name: Name of the function, for the error messages.
+    :param tuple params: Names of the parameters, in order.
+    :param dict defaults: Default values of the optional parameters.
+    :param tuple args: Positional arguments of the call.
+    :param dict kwargs: Keyword arguments of the call.
+    :rtype: dict
+    :return: The value of every parameter.
+    """
+    if len(args) > len(params):
+        raise TypeError(
+            '{}() takes at most {} arguments ({} given)'.format(
+                name, len(params), len(args)
+            )
+        )
+
+    values = dict(zip(params, args))
+    for key, value in kwargs.items():
+        if key not in params:
+            raise TypeError(
+                "{}() got an unexpected keyword argument '{}'".format(
+                    name, key
+                )
+            )
+        if key in values:
+            raise TypeError(
+                "{}() got multiple values for argument '{}'".format(
+                    name, key
+                )
+            )
+        values[key] = value
+
+    for param in params[len(args):]:
+        if param in values:
+            continue
+        if param not in defaults:
+            raise TypeError(
+                "{}() missing required argument '{}'".format(name, param)
+            )
+        values[param] = defaults[param]
+
+    return values
+
+
+def signature(params, defaults, leading=('enode', )):
+    """
+    Create the signature of a function that takes its arguments with
+    ``*args`` and ``**kwargs`` and binds them with :func:`bind`, so
+    :func:`inspect.signature` and the help show its parameters.
+
+    :param tuple params: Names of the parameters, in order.
+    :param dict defaults: Default values of the optional parameters.
+    :param tuple leading: Names of the parameters before them.
+    :rtype: inspect.Signature
+    :return: The signature, or ``None`` on Python 2.
+    """
+    if Signature is None:
+        return None
+
+    kind = Parameter.POSITIONAL_OR_KEYWORD
+    return Signature([Parameter(str(name), kind) for name in leading] + [
+        Parameter(
+            str(param), kind, default=defaults.get(param, Parameter.empty)
+        )
+        for param in params
+    ])
+
+
+NAME, TEMPLATE, PARAMS, OPTIONAL, STATIC, POSITIONAL, PARSE, DOC = range(8)
+
+
+def _positional(template, params):
+    """
+    Turn the ``%(argument)s`` placeholders of a template into ``%s`` ones,
+    if they are the given parameters, once each and in order.
+
+    :rtype: str
+    :return: The template with positional placeholders, or ``None``.
+    """
+    if _NAMED.findall(template) != list(params):
+        return None
+    return _NAMED.sub('%s', template)
+
+
+def renderer(command):
+    """
+    Compile the renderer of a command of the command table.
+
+    :param tuple command: The command, as found in the command table.
+    :rtype: function
+    :return: A function that takes the enode, the positional arguments and
+     the keyword arguments of a call and returns the command line to run.
+     The enode is used to resolve port labels.
+    """
+    name, template, params, optional, static, positional, _, _ = command
+    count = len(params)
+    required = count - len(optional)
+    defaults = {param: '' for param, _ in optional}
+    portlbl = 'portlbl' in params
+
+    # The command with positional placeholders for every number of arguments
+    # given, assuming the optional ones given are not empty. Optional
+    # arguments always follow the required ones.
+    formats = [None] * (count + 1)
+    formats[count] = positional
+    if optional and not portlbl:
+        line = template
+        for given in range(required, count + 1):
+            if given > required:
+                line += optional[given - required - 1][1]
+            formats[given] = _positional(line, params[:given])
+
+    # Getters of the values of the first parameters from keyword arguments
+    pickers = [itemgetter(*params[:given]) for given in range(1, count + 1)]
+
+    def render(enode, args, kwargs):
+        if kwargs and not args and len(kwargs) <= count:
+            # Keyword arguments for the first parameters are taken in order
+            try:
+                args = pickers[len(kwargs) - 1](kwargs)
+            except KeyError:
+                pass
+            else:
+                if len(kwargs) == 1:
+                    args = (args, )
+                kwargs = None
+
+        given = len(args)
+        if kwargs:
+            values = bind(name, params, defaults, args, kwargs)
+        elif required <= given <= count:
+            line = formats[given]
+            if line is not None and all(args):
+                return line % args
+            values = dict(defaults)
+            values.update(zip(params, args))
+        else:
+            values = bind(name, params, defaults, args, {})
+
+        if portlbl:
+            values['port'] = enode.ports.get(
+                values['portlbl'], values['portlbl']
+            )
+
+        line = template % values
+        for param, suffix in optional:
+            if values[param]:
+                line += suffix % values
+        return line
+
+    return render
+
+
+def _context(base, name, doc, arguments, pre_commands, post_commands):
+    """
+    Create the namespace of a context class, without its methods.
+    """
+    params = arguments + ('batch', )
+    defaults = {'batch': False}
+
+    def init(self, enode, *args, **kwargs):
+        values = bind(name, params, defaults, args, kwargs)
+        self.enode = enode
+        for param in arguments:
+            if param == 'portlbl':
+                self.port = enode.ports.get(values[param], values[param])
+            else:
+                setattr(self, param, values[param])
+        self._batch = values['batch']
+
+    if Signature is not None:
+        init.__signature__ = signature(params, defaults, ('self', 'enode'))
+
+    return {
+        '__doc__': doc,
+        '__module__': base.__module__,
+        '__init__': init,
+        '_pre_commands': pre_commands,
+        '_post_commands': post_commands,
+    }
+
+
+def _bind(factory, command, prefix=''):
+    """
+    Create a function from a command of the command table.
+    """
+    parse = command[PARSE]
+    if parse is not None:
+        # Imported here so the parsers are only loaded once a function that
+        # needs one is created
+        from . import parser
+        parse = getattr(parser, parse)
+
+    function = factory(command, parse)
+    function.__name__ = str(command[NAME])
+    function.__doc__ = command[DOC]
+    if hasattr(function, '__qualname__'):
+        function.__qualname__ = prefix + command[NAME]
+    if Signature is not None:
+        function.__signature__ = signature(
+            command[PARAMS], {param: '' for param, _ in command[OPTIONAL]},
+            ('self', ) if prefix else ('enode', )
+        )
+    return function
+
+
+class Binder(object):
+    """
+    Create the functions and context classes of a library from the command
+    table, the first time they are requested.
+
+    :param tuple root: Commands of the root context.
+    :param tuple contexts: The other contexts, as
+     ``(name, doc, arguments, pre_commands, post_commands, range_doc,
+     commands)`` tuples. ``range_doc`` is the documentation of the range
+     class of the context, or ``None`` if it has no range class.
+    :param function function: Factory of the root functions. It is called
+     with the command and its parser, or ``None``, and returns the
+     function.
+    :param function method: Factory of the context methods, called like
+     ``function``.
+    :param type manager: Base class of the contexts.
+    :param type context_range: Base class of the range classes.
+    """
+    def __init__(
+            self, root, contexts, function, method, manager, context_range):
+        self._function = function
+        self._method = method
+        self._manager = manager
+        self._context_range = context_range
+        self._bound = {}
+
+        self._index = OrderedDict()
+        for context in contexts:
+            self._index[context[0]] = (self._context, context)
+            if context[5] is not None:
+                self._index[context[0] + 'Range'] = (self._range, context)
+        for command in root:
+            self._index[command[NAME]] = (self._root, command)
+
+    def names(self):
+        """
+        Get the names of all the functions and classes.
+
+        :rtype: list
+        """
+        return list(self._index)
+
+    def get(self, name):
+        """
+        Get a function or class, creating it if needed.
+
+        :param str name: Name of the function or class.
+        :return: The function or class.
+        :raise KeyError: If there is no function or class with that name.
+        """
+        bound = self._bound.get(name)
+        if bound is None:
+            create, row = self._index[name]
+            # If several threads race, all of them get the first one stored
+            bound = self._bound.setdefault(name, create(row))
+        return bound
+
+    def build(self):
+        """
+        Create all the functions and classes.
+
+        :rtype: OrderedDict
+        :return: The functions and classes, by name.
+        """
+        return OrderedDict((name, self.get(name)) for name in self._index)
+
+    def _root(self, command):
+        return _bind(self._function, command)
+
+    def _context(self, context):
+        (
+            name, doc, arguments, pre_commands, post_commands, _, commands
+        ) = context
+        attributes = _context(
+            self._manager, name, doc, arguments, pre_commands, post_commands
+        )
+        prefix = name + '.'
+        for command in commands:
+            attributes[command[NAME]] = _bind(self._method, command, prefix)
+        return type(str(name), (self._manager, ), attributes)
+
+    def _range(self, context):
+        name, range_doc = context[0], context[5]
+        return type(str(name + 'Range'), (self._context_range, ), {
+            '__doc__': range_doc,
+            '__module__': self._manager.__module__,
+            'context': self.get(name),
+        })
+
+
+__all__ = [
+    'NAME', 'TEMPLATE', 'PARAMS', 'OPTIONAL', 'STATIC', 'POSITIONAL',
+    'PARSE', 'DOC',
+    'bind', 'signature', 'renderer', 'Binder'
+]
@@ -26,7 +26,7 @@ Vtysh auto-generated typed exceptions module.
 from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
-from re import match
+import re
 from collections import OrderedDict
 
 
@@ -35,10 +35,12 @@ class VtyshException(Exception):
     Base exception class for vtysh shell errors.
 
     :param str output: The shell output that triggered this exception.
+    :param str command: The command that produced the output, if known.
     """
-    def __init__(self, output):
+    def __init__(self, output, command=None):
         super(VtyshException, self).__init__()
         self.output = output
+        self.command = command
 
 
 class UnknownVtyshException(VtyshException):
@@ -86,20 +88,69 @@ VTYSH_EXCEPTIONS = OrderedDict([
 ])
 
 
+def _compile(exceptions):
+    """
+    Compile the expressions of all the exceptions into a single case
+    insensitive expression, with a group named after each exception, so the
+    output is scanned once whatever the number of exceptions.
+
+    :param OrderedDict exceptions: The expressions of every exception class.
+    :rtype: tuple
+    :return: The compiled expression, and the exception classes by name.
+    """
+    groups = [
+        '(?P<{}>{})'.format(
+            exc.__name__,
+            '|'.join('(?:{})'.format(expression) for expression in matches)
+        )
+        for exc, matches in exceptions.items()
+    ]
+    classes = {exc.__name__: exc for exc in exceptions}
+    # Without exceptions, an expression that never matches
+    return re.compile('|'.join(groups) or '(?!)', re.IGNORECASE), classes
+
+
+_EXPRESSION, _CLASSES = _compile(VTYSH_EXCEPTIONS)
+
+
 def determine_exception(output):
     """
     Determine which exception to raise from shell error message.
 
+    The expressions of the exceptions are searched anywhere in the output,
+    ignoring case, and the exception of the first one found is returned.
+
     :param str output: The shell output error.
     :rtype: VtyshException subclass.
     :return: The corresponding exception class for given message.
     """
-    output = output.lower()  # recommended
-    for exc, matches in VTYSH_EXCEPTIONS.items():
-        for expression in matches:
-            if match(expression, output):
-                return exc
-    return UnknownVtyshException
+    found = _EXPRESSION.search(output)
+    if found is None:
+        return UnknownVtyshException
+    return _CLASSES[found.lastgroup]
+
+
+def classify(output):
+    """
+    Find the errors in the output of several commands, like the output of a
+    batch.
+
+    :param str output: The shell output.
+    :rtype: list
+    :return: A ``(line, exception)`` tuple for every line of the output with
+     an error, in order, with the exception class of the error.
+    """
+    errors = []
+    end = -1
+    for found in _EXPRESSION.finditer(output):
+        if found.start() <= end:
+            continue
+        start = output.rfind('\n', 0, found.start()) + 1
+        end = output.find('\n', found.end())
+        if end < 0:
+            end = len(output)
+        errors.append((output[start:end], _CLASSES[found.lastgroup]))
+    return errors
 
 
 __all__ = [
@@ -108,5 +159,6 @@ __all__ = [
     'UnknownCommandException',
     'IncompleteCommandException',
     'VTYSH_EXCEPTIONS',
-    'determine_exception'
+    'determine_exception',
+    'classify'
 ]
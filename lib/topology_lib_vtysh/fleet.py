@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Run a library function on many enodes concurrently.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.fleet import run_fleet
+
+    results = run_fleet(
+        [sw1, sw2, sw3], 'show_ip_bgp_summary', max_workers=16, timeout=30
+    )
+    for enode, result in results.items():
+        if isinstance(result, Exception):
+            ...
+
+The calls spend almost all their time waiting for the enodes, so they run on
+a bounded pool of threads. Parsing happens inside the threads too, so the
+results are ready to use.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from collections import OrderedDict
+from concurrent.futures import (
+    ThreadPoolExecutor, TimeoutError, wait, FIRST_COMPLETED
+)
+
+from six import string_types
+
+from . import library
+from .compat import clock
+
+
+def run_fleet(
+        enodes, function, args=(), kwargs=None, max_workers=8,
+        timeout=None):
+    """
+    Run a library function on several enodes concurrently.
+
+    :param list enodes: Engine nodes to run the function on.
+    :param function: Root function of :mod:`topology_lib_vtysh.library`, or
+     its name.
+    :param tuple args: Arguments for the function, after the enode.
+    :param dict kwargs: Keyword arguments for the function.
+    :param int max_workers: Maximum number of enodes to talk to at once.
+    :param float timeout: Seconds each enode has to complete the call since
+     it started. Enodes that take longer get a
+     :class:`concurrent.futures.TimeoutError` as result, although their
+     thread can not be interrupted and completes in the background.
+    :rtype: OrderedDict
+    :return: A dictionary mapping every enode, in the given order, to the
+     value returned by the function or to the exception it raised.
+    """
+    if isinstance(function, string_types):
+        function = getattr(library, function)
+    kwargs = kwargs or {}
+
+    started = {}
+    results = OrderedDict((enode, None) for enode in enodes)
+
+    def call(enode):
+        started[enode] = clock()
+        return function(enode, *args, **kwargs)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {
+            executor.submit(call, enode): enode for enode in results
+        }
+
+        while pending:
+            wait_for = None
+            if timeout is not None:
+                now = clock()
+                for future, enode in list(pending.items()):
+                    if enode in started and started[enode] + timeout <= now:
+                        del pending[future]
+                        results[enode] = TimeoutError(
+                            'Timeout after {} seconds'.format(timeout)
+                        )
+                if not pending:
+                    break
+
+                # Enodes waiting for a thread have no deadline yet
+                deadlines = [
+                    started[enode] + timeout
+                    for enode in pending.values() if enode in started
+                ]
+                wait_for = 0.01
+                if deadlines:
+                    wait_for = max(min(deadlines) - now, 0)
+
+            done, _ = wait(
+                list(pending), timeout=wait_for, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                enode = pending.pop(future)
+                try:
+                    results[enode] = future.result()
+                except Exception as e:
+                    results[enode] = e
+    finally:
+        executor.shutdown(wait=timeout is None)
+
+    return results
+
+
+__all__ = ['run_fleet']
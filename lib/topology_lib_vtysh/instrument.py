@@ -0,0 +1,423 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Hooks around the shell calls and the parsers of the library.
+
+Every function and context method of the library, and the mode commands and
+batches of the contexts, report their shell calls and the parsing of their
+outputs to the hooks registered:
+
+::
+
+    from topology_lib_vtysh.instrument import Hook, add_hook
+
+    class Slow(Hook):
+        def post_call(self, enode, name, command, seconds, size):
+            if seconds > 1.0:
+                print('{} took {:.2f} s'.format(command, seconds))
+
+    add_hook(Slow())
+
+The built-in :class:`Collector` keeps a latency histogram of the calls and
+of the parsing of every function, and ranks the slowest and the most frequent
+ones:
+
+::
+
+    from topology_lib_vtysh.instrument import start_collector
+
+    collector = start_collector(report=True)
+
+With ``report=True`` the summary is printed when the process exits, at the
+end of a test session, and ``collector.summary()`` returns it at any time.
+
+Calls are named after the function or method that made them, like
+``show_vlan`` or ``ConfigInterface.no_shutdown``. The mode commands of a
+context are named after the context, and batches ``batch``. When no hook is
+registered, the calls are not timed at all.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import sys
+import atexit
+
+from .compat import clock
+
+
+_HOOKS = []
+
+
+class Hook(object):
+    """
+    Base class of the hooks, that ignores everything.
+
+    Subclasses override the callbacks they need. ``name`` is the name of the
+    function that made the call, ``command`` the rendered command, ``seconds``
+    the time the call or the parser took, and ``size`` the length of the
+    output of the command.
+    """
+    def pre_call(self, enode, name, command):
+        """
+        Called before a shell call.
+        """
+
+    def post_call(self, enode, name, command, seconds, size):
+        """
+        Called after a shell call returned.
+        """
+
+    def pre_parse(self, enode, name, command, size):
+        """
+        Called before the output of a command is parsed.
+        """
+
+    def post_parse(self, enode, name, command, seconds, size):
+        """
+        Called after the output of a command was parsed.
+        """
+
+
+def add_hook(hook):
+    """
+    Register a hook.
+
+    :param Hook hook: The hook.
+    """
+    if hook not in _HOOKS:
+        _HOOKS.append(hook)
+
+
+def remove_hook(hook):
+    """
+    Unregister a hook, if it is registered.
+
+    :param Hook hook: The hook.
+    """
+    if hook in _HOOKS:
+        _HOOKS.remove(hook)
+
+
+def get_hooks():
+    """
+    Get the hooks registered.
+
+    :rtype: list
+    """
+    return list(_HOOKS)
+
+
+def pre_call(enode, name, command):
+    """
+    Report a shell call that is about to be made.
+
+    :param enode: Engine node the call is made to.
+    :type enode: topology.platforms.base.BaseNode
+    :param str name: Name of the function that makes the call.
+    :param str command: The command.
+    :rtype: float
+    :return: The time the call started, to give to :func:`post_call`, or
+     ``None`` if there are no hooks.
+    """
+    if not _HOOKS:
+        return None
+    for hook in list(_HOOKS):
+        hook.pre_call(enode, name, command)
+    return clock()
+
+
+def post_call(enode, name, command, start, output):
+    """
+    Report a shell call that returned.
+
+    :param enode: Engine node the call was made to.
+    :type enode: topology.platforms.base.BaseNode
+    :param str name: Name of the function that made the call.
+    :param str command: The command.
+    :param float start: The value returned by :func:`pre_call`.
+    :param str output: The output of the call.
+    """
+    if start is None:
+        return
+    seconds = clock() - start
+    size = len(output) if output else 0
+    for hook in list(_HOOKS):
+        hook.post_call(enode, name, command, seconds, size)
+
+
+def run_parser(enode, name, command, parse, output):
+    """
+    Parse the output of a command, reporting it to the hooks.
+
+    :param enode: Engine node the command was run on.
+    :type enode: topology.platforms.base.BaseNode
+    :param str name: Name of the function that ran the command.
+    :param str command: The command.
+    :param function parse: The parser of the output.
+    :param str output: The output of the command.
+    :return: The parsed result.
+    """
+    if not _HOOKS:
+        return parse(output)
+
+    hooks = list(_HOOKS)
+    size = len(output) if output else 0
+    for hook in hooks:
+        hook.pre_parse(enode, name, command, size)
+    start = clock()
+    result = parse(output)
+    seconds = clock() - start
+    for hook in hooks:
+        hook.post_parse(enode, name, command, seconds, size)
+    return result
+
+
+class Histogram(object):
+    """
+    Histogram of durations with buckets of bounded relative size, like HDR
+    histograms.
+
+    Durations are recorded in microseconds. Values below ``2 ** precision``
+    get a bucket each, and every power of two above that is split in
+    ``2 ** (precision - 1)`` buckets, so the values reported are at most
+    ``2 ** (1 - precision)`` lower than the ones recorded, under 2% with the
+    default precision. Only the buckets used are stored.
+
+    :param int precision: Bits of precision of the buckets.
+    :var int count: Number of durations recorded.
+    :var float total: Sum of the durations recorded, in seconds.
+    :var float minimum: Shortest duration recorded, in seconds.
+    :var float maximum: Longest duration recorded, in seconds.
+    """
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self._buckets = {}
+
+    def __len__(self):
+        return self.count
+
+    def record(self, seconds):
+        """
+        Record a duration.
+
+        :param float seconds: The duration.
+        """
+        value = int(seconds * 1e6)
+        shift = max(value.bit_length() - self.precision, 0)
+        key = (shift << self.precision) | (value >> shift)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    def merge(self, other):
+        """
+        Add the durations recorded in another histogram of the same
+        precision.
+
+        :param Histogram other: The other histogram.
+        """
+        if other.precision != self.precision:
+            raise ValueError('Histograms of different precision')
+        for key, count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.minimum, other.maximum):
+            if value is None:
+                continue
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+
+    @property
+    def mean(self):
+        """
+        Mean duration, in seconds, or ``None`` if nothing was recorded.
+        """
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent):
+        """
+        Get a percentile of the durations.
+
+        :param float percent: The percentile, from 0 to 100.
+        :rtype: float
+        :return: The lower bound of the bucket of the percentile, in seconds,
+         or ``None`` if nothing was recorded.
+        """
+        if not self.count:
+            return None
+
+        mask = (1 << self.precision) - 1
+        rank = max(percent / 100 * self.count, 1)
+        seen = 0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen >= rank:
+                break
+        return ((key & mask) << (key >> self.precision)) / 1e6
+
+
+def _format_seconds(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 1e-3:
+        return '{:.0f}us'.format(seconds * 1e6)
+    if seconds < 1.0:
+        return '{:.1f}ms'.format(seconds * 1e3)
+    return '{:.2f}s'.format(seconds)
+
+
+class Collector(Hook):
+    """
+    Hook that keeps a histogram of the latency of the calls and of the time
+    spent parsing their outputs, by name of the function.
+
+    :var dict calls: The latency histograms, by name.
+    :var dict parses: The parse time histograms, by name.
+    :var dict sizes: Total length of the outputs, by name.
+    """
+    def __init__(self, precision=7):
+        self.precision = precision
+        self.calls = {}
+        self.parses = {}
+        self.sizes = {}
+
+    def _histogram(self, histograms, name):
+        histogram = histograms.get(name)
+        if histogram is None:
+            histogram = histograms[name] = Histogram(self.precision)
+        return histogram
+
+    def post_call(self, enode, name, command, seconds, size):
+        self._histogram(self.calls, name).record(seconds)
+        self.sizes[name] = self.sizes.get(name, 0) + size
+
+    def post_parse(self, enode, name, command, seconds, size):
+        self._histogram(self.parses, name).record(seconds)
+
+    def clear(self):
+        """
+        Forget everything recorded.
+        """
+        self.calls.clear()
+        self.parses.clear()
+        self.sizes.clear()
+
+    def slowest(self, top=10):
+        """
+        Rank the functions by the total time of their calls and parsing.
+
+        :param int top: Number of functions to return.
+        :rtype: list
+        :return: The names of the functions, slowest first.
+        """
+        def total(name):
+            parsed = self.parses.get(name)
+            return self.calls[name].total + (parsed.total if parsed else 0)
+        return sorted(self.calls, key=lambda name: (-total(name), name))[:top]
+
+    def most_frequent(self, top=10):
+        """
+        Rank the functions by their number of calls.
+
+        :param int top: Number of functions to return.
+        :rtype: list
+        :return: The names of the functions, most called first.
+        """
+        return sorted(
+            self.calls, key=lambda name: (-self.calls[name].count, name)
+        )[:top]
+
+    def summary(self, top=10):
+        """
+        Render the slowest and the most frequent functions as tables.
+
+        :param int top: Number of functions in each table.
+        :rtype: str
+        """
+        header = '{:<40} {:>7} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}'.format(
+            'Command', 'Calls', 'Total', 'p50', 'p99', 'Max', 'Parse',
+            'Parse p99'
+        )
+
+        def row(name):
+            calls = self.calls[name]
+            parses = self.parses.get(name)
+            return '{:<40} {:>7} {:>9} {:>9} {:>9} {:>9} {:>9} {:>9}'.format(
+                name[:40], calls.count, _format_seconds(calls.total),
+                _format_seconds(calls.percentile(50)),
+                _format_seconds(calls.percentile(99)),
+                _format_seconds(calls.maximum),
+                _format_seconds(parses.total if parses else None),
+                _format_seconds(parses.percentile(99) if parses else None),
+            )
+
+        lines = []
+        for title, names in (
+            ('Slowest commands', self.slowest(top)),
+            ('Most frequent commands', self.most_frequent(top)),
+        ):
+            lines.extend([title, header, '-' * len(header)])
+            lines.extend(row(name) for name in names)
+            lines.append('')
+        return '\n'.join(lines)
+
+    def report(self, stream=None, top=10):
+        """
+        Print the summary, if anything was recorded.
+
+        :param stream: File to print to, the standard error if not given.
+        :param int top: Number of functions in each table.
+        """
+        if self.calls:
+            print(self.summary(top), file=stream or sys.stderr)
+
+
+def start_collector(report=False, top=10):
+    """
+    Create a :class:`Collector` and register it.
+
+    :param bool report: Print the summary of the collector when the process
+     exits.
+    :param int top: Number of functions in each table of that summary.
+    :rtype: Collector
+    """
+    collector = Collector()
+    add_hook(collector)
+    if report:
+        atexit.register(collector.report, top=top)
+    return collector
+
+
+__all__ = [
+    'Hook', 'add_hook', 'remove_hook', 'get_hooks',
+    'pre_call', 'post_call', 'run_parser',
+    'Histogram', 'Collector', 'start_collector'
+]
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Libraries of the engine nodes provided by this package.
+
+Topology gives every enode a ``libs`` attribute with the libraries of its
+platform. The enodes of :mod:`topology_lib_vtysh.replay` and
+:mod:`topology_lib_vtysh.simulator` give a :class:`Libs` instead, so the
+contexts of the library and the code written for real enodes work with them:
+
+::
+
+    switch.libs.vtysh.show_vlan()
+
+    with switch.libs.vtysh.ConfigInterface('1') as ctx:
+        ctx.no_shutdown()
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from functools import partial
+
+
+class CommonLib(object):
+    """
+    ``common`` library of an enode, that runs the batches of mode commands
+    one command at a time.
+
+    :param enode: Engine node to run the commands on.
+    """
+    def __init__(self, enode):
+        self.enode = enode
+
+    def assert_batch(self, commands, replace=None, shell=None):
+        """
+        Run several commands, one per line, and check that none of them
+        outputs anything.
+
+        :param str commands: The commands to run, one per line.
+        :param dict replace: Values to format the commands with.
+        :param str shell: Shell to run the commands on.
+        :raise AssertionError: At the first command that outputs something.
+        """
+        for command in commands.splitlines():
+            command = command.strip()
+            if not command:
+                continue
+            if replace is not None:
+                command = command.format(**replace)
+            output = self.enode(command, shell=shell)
+            assert not output, output
+
+
+class VtyshLib(object):
+    """
+    ``vtysh`` library of an enode, the root functions and the contexts of
+    :mod:`topology_lib_vtysh.library` with the enode given to them.
+
+    :param enode: Engine node to give to the library.
+    """
+    def __init__(self, enode):
+        self.enode = enode
+
+    def __getattr__(self, name):
+        from . import library
+
+        if name not in library.__all__:
+            raise AttributeError(name)
+        bound = partial(getattr(library, name), self.enode)
+        setattr(self, name, bound)
+        return bound
+
+    def __dir__(self):
+        from . import library
+        return sorted(set(dir(type(self))) | set(library.__all__))
+
+
+class Libs(object):
+    """
+    ``libs`` attribute of an enode.
+
+    :param enode: Engine node the libraries are bound to.
+    :param libs: ``libs`` attribute of the enode wrapped by this one, whose
+     other libraries are given as they are, or ``None``.
+    :var CommonLib common: The ``common`` library.
+    :var VtyshLib vtysh: The ``vtysh`` library.
+    """
+    def __init__(self, enode, libs=None):
+        self.common = CommonLib(enode)
+        self.vtysh = VtyshLib(enode)
+        self._libs = libs
+
+    def __getattr__(self, name):
+        libs = self.__dict__.get('_libs')
+        if libs is None or name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(libs, name)
+
+
+__all__ = ['CommonLib', 'VtyshLib', 'Libs']
@@ -17,6 +17,18 @@
 
 """
 Parse vtysh commands with output to a python dictionary.
+
+The parsers of the route and BGP tables have an ``iter_`` variant that
+yields the entries one at a time, from the raw result or any iterable of its
+lines, and all of them take two options:
+
+- ``compact`` returns the records of :mod:`topology_lib_vtysh.records`, that
+  share the strings repeated across the entries, instead of dictionaries.
+- ``normalize`` replaces the networks and the next hop addresses with their
+  ``(value, length, version)`` integer tuples, as returned by
+  :meth:`topology_lib_vtysh.routes.PrefixCache.get`. Given ``True`` the
+  tuples are shared through :data:`topology_lib_vtysh.routes.PREFIXES`, or a
+  :class:`topology_lib_vtysh.routes.PrefixCache` of their own can be given.
 """
 
 from __future__ import unicode_literals, absolute_import
@@ -26,6 +38,185 @@ from __future__ import print_function, division
 import re
 
 
+class _Patterns(object):
+    """
+    Registry of the regular expressions used by the parsers.
+
+    Every expression is registered with a name when this module is imported,
+    but it is only compiled the first time a parser uses it, as compiling all
+    of them at once costs much more than importing the module. From then on
+    the compiled expression is an attribute of the registry, so the parsers
+    call its ``match`` or ``search`` methods directly and do not depend on
+    the cache of the :mod:`re` module, that can evict them when many
+    expressions are in use:
+
+    ::
+
+        _PATTERNS.register('vlan_id', r'(?P<vlan_id>[0-9]+)')
+        search = _PATTERNS.vlan_id.search
+    """
+
+    def __init__(self):
+        self._sources = {}
+
+    def register(self, name, pattern, flags=0):
+        """
+        Register a regular expression.
+
+        :param str name: Name of the expression in the registry.
+        :param str pattern: The regular expression.
+        :param int flags: Flags to compile the expression with.
+        """
+        assert name not in self._sources, name
+        self._sources[name] = (pattern, flags)
+
+    def compile(self):
+        """
+        Compile all the expressions that are not compiled yet.
+        """
+        for name in self._sources:
+            getattr(self, name)
+
+    def __getattr__(self, name):
+        try:
+            pattern, flags = self.__dict__['_sources'][name]
+        except KeyError:
+            raise AttributeError(name)
+        compiled = re.compile(pattern, flags)
+        setattr(self, name, compiled)
+        return compiled
+
+
+_PATTERNS = _Patterns()
+
+
+def _iter_lines(raw_result):
+    """
+    Iterate over the lines of a raw result, without their line endings.
+
+    :param raw_result: The raw result string, or any iterable of its lines.
+    """
+    if not hasattr(raw_result, 'splitlines'):
+        for line in raw_result:
+            yield line.rstrip('\r\n')
+        return
+
+    # The string is split as the lines are used, instead of holding a list
+    # with all of them
+    find = raw_result.find
+    start = 0
+    end = find('\n')
+    while end >= 0:
+        yield raw_result[start:end].rstrip('\r')
+        start = end + 1
+        end = find('\n', start)
+    if start < len(raw_result):
+        yield raw_result[start:].rstrip('\r')
+
+
+def _compacted(entries, kind):
+    """
+    Turn the entries of a streaming parser into compact records, that share
+    the strings repeated across the entries.
+
+    :param entries: The entries, as dictionaries.
+    :param str kind: ``route``, ``bgp_path`` or ``rib`` for the
+     ``(key, route)`` tuples of :func:`iter_show_rib`.
+    """
+    from . import records
+
+    strings = {}
+    if kind == 'rib':
+        for key, entry in entries:
+            yield key, records.compact_route(entry, strings)
+        return
+
+    compact = getattr(records, 'compact_' + kind)
+    for entry in entries:
+        yield compact(entry, strings)
+
+
+def _finish(entries, kind, compact, normalize):
+    """
+    Apply the ``compact`` and ``normalize`` options of a streaming parser to
+    its entries.
+
+    :param entries: The entries, as dictionaries.
+    :param str kind: ``route``, ``bgp_path`` or ``rib`` for the
+     ``(key, route)`` tuples of :func:`iter_show_rib`.
+    """
+    if normalize not in (False, None):
+        entries = _normalized(entries, kind, normalize)
+    if compact:
+        return _compacted(entries, kind)
+    return entries
+
+
+def _normalized(entries, kind, cache):
+    """
+    Replace the addresses and networks of the entries of a streaming parser
+    with their integer tuples.
+
+    :param entries: The entries, as dictionaries.
+    :param str kind: ``route``, ``bgp_path`` or ``rib`` for the
+     ``(key, route)`` tuples of :func:`iter_show_rib`.
+    :param cache: The :class:`topology_lib_vtysh.routes.PrefixCache` of the
+     tuples, or ``True`` for the one shared by the parsers.
+    """
+    from . import routes
+
+    if cache is True:
+        cache = routes.PREFIXES
+    if kind == 'rib':
+        for key, entry in entries:
+            yield key, routes.normalize_route(entry, cache)
+        return
+
+    normalize = getattr(routes, 'normalize_' + kind)
+    for entry in entries:
+        yield normalize(entry, cache)
+
+
+_PATTERNS.register(
+    'show_interface',
+    r'\s*Interface (?P<port>\d+) is (?P<interface_state>\S+)\s*'
+    r'(\((?P<state_description>.*)\))?\s*'
+    r'Admin state is (?P<admin_state>\S+)\s+'
+    r'(State information: (?P<state_information>\S+))?\s*'
+    r'Hardware: (?P<hardware>\S+), MAC Address: (?P<mac_address>\S+)\s+'
+    r'(IPv4 address (?P<ipv4>\S+))?\s*'
+    r'(IPv6 address (?P<ipv6>\S+))?\s*'
+    r'MTU (?P<mtu>\d+)\s+'
+    r'(?P<conection_type>\S+)\s+'
+    r'Speed (?P<speed>\d+) (?P<speed_unit>\S+)\s+'
+    r'Auto-Negotiation is turned (?P<autonegotiation>\S+)\s+'
+    r'Input flow-control is (?P<input_flow_control>\w+),\s+'
+    r'output flow-control is (?P<output_flow_control>\w+)\s+'
+    r'RX\s+'
+    r'(?P<rx_packets>\d+) input packets\s+'
+    r'(?P<rx_bytes>\d+) bytes\s+'
+    r'(?P<rx_error>\d+) input error\s+'
+    r'(?P<rx_dropped>\d+) dropped\s+'
+    r'(?P<rx_crc_fcs>\d+) CRC/FCS\s+'
+    r'(L3:)?'
+    r'(\s*ucast:\s+(?P<rx_l3_ucast_packets>\d+) packets,)?\s*'
+    r'((?P<rx_l3_ucast_bytes>\d+) bytes)?'
+    r'(\s*mcast:\s+(?P<rx_l3_mcast_packets>\d+) packets,)?\s+'
+    r'((?P<rx_l3_mcast_bytes>\d+) bytes\s+)?'
+    r'TX\s+'
+    r'(?P<tx_packets>\d+) output packets\s+'
+    r'(?P<tx_bytes>\d+) bytes\s+'
+    r'(?P<tx_errors>\d+) input error\s+'
+    r'(?P<tx_dropped>\d+) dropped\s+'
+    r'(?P<tx_collisions>\d+) collision'
+    r'(\s*L3:)?'
+    r'(\s*ucast:\s+(?P<tx_l3_ucast_packets>\d+) packets,\s+)?'
+    r'((?P<tx_l3_ucast_bytes>\d+) bytes)?'
+    r'(\s*mcast:\s+(?P<tx_l3_mcast_packets>\d+) packets,\s+)?'
+    r'((?P<tx_l3_mcast_bytes>\d+) bytes)?'
+)
+
+
 def parse_show_interface(raw_result):
     """
     Parse the 'show interface' command raw output.
@@ -66,45 +257,7 @@ def parse_show_interface(raw_result):
         }
     """
 
-    show_re = (
-        r'\s*Interface (?P<port>\d+) is (?P<interface_state>\S+)\s*'
-        r'(\((?P<state_description>.*)\))?\s*'
-        r'Admin state is (?P<admin_state>\S+)\s+'
-        r'(State information: (?P<state_information>\S+))?\s*'
-        r'Hardware: (?P<hardware>\S+), MAC Address: (?P<mac_address>\S+)\s+'
-        r'(IPv4 address (?P<ipv4>\S+))?\s*'
-        r'(IPv6 address (?P<ipv6>\S+))?\s*'
-        r'MTU (?P<mtu>\d+)\s+'
-        r'(?P<conection_type>\S+)\s+'
-        r'Speed (?P<speed>\d+) (?P<speed_unit>\S+)\s+'
-        r'Auto-Negotiation is turned (?P<autonegotiation>\S+)\s+'
-        r'Input flow-control is (?P<input_flow_control>\w+),\s+'
-        r'output flow-control is (?P<output_flow_control>\w+)\s+'
-        r'RX\s+'
-        r'(?P<rx_packets>\d+) input packets\s+'
-        r'(?P<rx_bytes>\d+) bytes\s+'
-        r'(?P<rx_error>\d+) input error\s+'
-        r'(?P<rx_dropped>\d+) dropped\s+'
-        r'(?P<rx_crc_fcs>\d+) CRC/FCS\s+'
-        r'(L3:)?'
-        r'(\s*ucast:\s+(?P<rx_l3_ucast_packets>\d+) packets,)?\s*'
-        r'((?P<rx_l3_ucast_bytes>\d+) bytes)?'
-        r'(\s*mcast:\s+(?P<rx_l3_mcast_packets>\d+) packets,)?\s+'
-        r'((?P<rx_l3_mcast_bytes>\d+) bytes\s+)?'
-        r'TX\s+'
-        r'(?P<tx_packets>\d+) output packets\s+'
-        r'(?P<tx_bytes>\d+) bytes\s+'
-        r'(?P<tx_errors>\d+) input error\s+'
-        r'(?P<tx_dropped>\d+) dropped\s+'
-        r'(?P<tx_collisions>\d+) collision'
-        r'(\s*L3:)?'
-        r'(\s*ucast:\s+(?P<tx_l3_ucast_packets>\d+) packets,\s+)?'
-        r'((?P<tx_l3_ucast_bytes>\d+) bytes)?'
-        r'(\s*mcast:\s+(?P<tx_l3_mcast_packets>\d+) packets,\s+)?'
-        r'((?P<tx_l3_mcast_bytes>\d+) bytes)?'
-    )
-
-    re_result = re.match(show_re, raw_result)
+    re_result = _PATTERNS.show_interface.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -119,6 +272,19 @@ def parse_show_interface(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'show_udld_interface',
+    r'\s*Interface (?P<interface>.*)\n'
+    r' Status: (?P<status>.*)\n'
+    r' Mode: (?P<mode>.*)\n'
+    r' Interval: (?P<interval>\d+) milliseconds\n'
+    r' Retries: (?P<retries>\d+)\n'
+    r' Port transitions: (?P<port_transition>\d+)\n'
+    r' RX: (?P<rx>\d+) valid packets, (?P<rx_discard>\d+) discarded.*\n'
+    r' TX: (?P<tx>\d+) packets$'
+)
+
+
 def parse_show_udld_interface(raw_result):
     """
     Parse the 'show udld interface {intf}' command raw output.
@@ -156,18 +322,7 @@ def parse_show_udld_interface(raw_result):
      TX: 0 packets
     """
 
-    show_re = (
-        r'\s*Interface (?P<interface>.*)\n'
-        r' Status: (?P<status>.*)\n'
-        r' Mode: (?P<mode>.*)\n'
-        r' Interval: (?P<interval>\d+) milliseconds\n'
-        r' Retries: (?P<retries>\d+)\n'
-        r' Port transitions: (?P<port_transition>\d+)\n'
-        r' RX: (?P<rx>\d+) valid packets, (?P<rx_discard>\d+) discarded.*\n'
-        r' TX: (?P<tx>\d+) packets$'
-    )
-
-    re_result = re.match(show_re, raw_result)
+    re_result = _PATTERNS.show_udld_interface.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -179,6 +334,13 @@ def parse_show_udld_interface(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'vlan',
+    r'(?P<vlan_id>\d+)\s+(?P<name>\S+)\s+(?P<status>\S+)\s+'
+    r'(?P<reason>\S+)\s*(?P<reserved>\(\w+\))?\s*(?P<ports>[\w ,]*)'
+)
+
+
 def parse_show_vlan(raw_result):
     """
     Parse the 'show vlan' command raw output.
@@ -209,14 +371,10 @@ def parse_show_vlan(raw_result):
         }
     """
 
-    vlan_re = (
-        r'(?P<vlan_id>\d+)\s+(?P<name>\S+)\s+(?P<status>\S+)\s+'
-        r'(?P<reason>\S+)\s*(?P<reserved>\(\w+\))?\s*(?P<ports>[\w ,]*)'
-    )
-
     result = {}
+    search = _PATTERNS.vlan.search
     for line in raw_result.splitlines():
-        re_result = re.search(vlan_re, line)
+        re_result = search(line)
         if re_result:
             partial = re_result.groupdict()
             partial['ports'] = partial['ports'].split(', ')
@@ -225,6 +383,25 @@ def parse_show_vlan(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'lacp_interface',
+    r'Aggregate-name\s*:\s*[lag]*(?P<lag_id>\w*)?[\s \S]*'
+    r'Port-id\s*\|\s*(?P<local_port_id>\d*)?\s*\|'
+    r'\s*(?P<remote_port_id>\d*)?\s+'
+    r'Port-priority\s*\|\s*(?P<local_port_priority>\d*)?\s*\|'
+    r'\s*(?P<remote_port_priority>\d*)?\s+'
+    r'Key\s*\|\s*(?P<local_key>\d*)?\s*\|'
+    r'\s*(?P<remote_key>\d*)?\s+'
+    r'State\s*\|\s*(?P<local_state>[APFISLNOCDXE]*)?\s*\|'
+    r'\s*(?P<remote_state>[APFISLNOCDXE]*)?\s+'
+    r'System-id\s*\|\s*'
+    r'(?P<local_system_id>([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2})?\s*\|'
+    r'\s*(?P<remote_system_id>([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2})?\s+'
+    r'System-priority\s*\|\s*(?P<local_system_priority>\d*)?\s*\|'
+    r'\s*(?P<remote_system_priority>\d*)?\s+'
+)
+
+
 def parse_show_lacp_interface(raw_result):
     """
     Parse the 'show lacp interface' command raw output.
@@ -279,24 +456,7 @@ def parse_show_lacp_interface(raw_result):
             }
     """
 
-    lacp_re = (
-        r'Aggregate-name\s*:\s*[lag]*(?P<lag_id>\w*)?[\s \S]*'
-        r'Port-id\s*\|\s*(?P<local_port_id>\d*)?\s*\|'
-        r'\s*(?P<remote_port_id>\d*)?\s+'
-        r'Port-priority\s*\|\s*(?P<local_port_priority>\d*)?\s*\|'
-        r'\s*(?P<remote_port_priority>\d*)?\s+'
-        r'Key\s*\|\s*(?P<local_key>\d*)?\s*\|'
-        r'\s*(?P<remote_key>\d*)?\s+'
-        r'State\s*\|\s*(?P<local_state>[APFISLNOCDXE]*)?\s*\|'
-        r'\s*(?P<remote_state>[APFISLNOCDXE]*)?\s+'
-        r'System-id\s*\|\s*'
-        r'(?P<local_system_id>([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2})?\s*\|'
-        r'\s*(?P<remote_system_id>([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2})?\s+'
-        r'System-priority\s*\|\s*(?P<local_system_priority>\d*)?\s*\|'
-        r'\s*(?P<remote_system_priority>\d*)?\s+'
-    )
-
-    re_result = re.search(lacp_re, raw_result)
+    re_result = _PATTERNS.lacp_interface.search(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -322,6 +482,17 @@ def parse_show_lacp_interface(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'lacp_aggregate',
+    r'Aggregate-name[ ]+: (?P<name>\w+)\s*'
+    r'Aggregated-interfaces\s+:[ ]?(?P<interfaces>[\w \-]*)\s*'
+    r'Heartbeat rate[ ]+: (?P<heartbeat_rate>slow|fast)\s*'
+    r'Fallback[ ]+: (?P<fallback>true|false)\s*'
+    r'Hash[ ]+: (?P<hash>l2-src-dst|l3-src-dst|l4-src-dst)\s*'
+    r'Aggregate mode[ ]+: (?P<mode>off|passive|active)\s*'
+)
+
+
 def parse_show_lacp_aggregates(raw_result):
     """
     Parse the 'show lacp aggregates' command raw output.
@@ -353,17 +524,8 @@ def parse_show_lacp_aggregates(raw_result):
             }
     """
 
-    lacp_re = (
-        r'Aggregate-name[ ]+: (?P<name>\w+)\s*'
-        r'Aggregated-interfaces\s+:[ ]?(?P<interfaces>[\w \-]*)\s*'
-        r'Heartbeat rate[ ]+: (?P<heartbeat_rate>slow|fast)\s*'
-        r'Fallback[ ]+: (?P<fallback>true|false)\s*'
-        r'Hash[ ]+: (?P<hash>l2-src-dst|l3-src-dst|l4-src-dst)\s*'
-        r'Aggregate mode[ ]+: (?P<mode>off|passive|active)\s*'
-    )
-
     result = {}
-    for re_result in re.finditer(lacp_re, raw_result):
+    for re_result in _PATTERNS.lacp_aggregate.finditer(raw_result):
         lag = re_result.groupdict()
         lag['interfaces'] = lag['interfaces'].split()
         lag['fallback'] = lag['fallback'] == 'True'
@@ -374,6 +536,13 @@ def parse_show_lacp_aggregates(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'lacp_configuration',
+    r'\s*System-id\s*:\s*(?P<id>\S+)\s*'
+    r'System-priority\s*:\s*(?P<priority>\d+)\s*'
+)
+
+
 def parse_show_lacp_configuration(raw_result):
     """
     Parse the 'show lacp configuration' command raw output.
@@ -391,12 +560,7 @@ def parse_show_lacp_configuration(raw_result):
             }
     """
 
-    configuration_re = (
-        r'\s*System-id\s*:\s*(?P<id>\S+)\s*'
-        r'System-priority\s*:\s*(?P<priority>\d+)\s*'
-    )
-
-    re_result = re.match(configuration_re, raw_result)
+    re_result = _PATTERNS.lacp_configuration.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -404,6 +568,16 @@ def parse_show_lacp_configuration(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'sflow_interface',
+    r'sFlow Configuration - Interface\s(?P<interface>\d+)\s*'
+    r'-----------------------------------------\s*'
+    r'sFlow\s*(?P<sflow>\S+)\s*'
+    r'Sampling\sRate\s*(?P<sampling_rate>\d+)\s*'
+    r'Number\sof\sSamples\s*(?P<number_of_samples>\d+)\s*'
+)
+
+
 def parse_show_sflow_interface(raw_result):
     """
     Parse the 'show sflow interface' command raw output.
@@ -423,15 +597,7 @@ def parse_show_sflow_interface(raw_result):
         }
     """
 
-    sflow_info_re = (
-        r'sFlow Configuration - Interface\s(?P<interface>\d+)\s*'
-        r'-----------------------------------------\s*'
-        r'sFlow\s*(?P<sflow>\S+)\s*'
-        r'Sampling\sRate\s*(?P<sampling_rate>\d+)\s*'
-        r'Number\sof\sSamples\s*(?P<number_of_samples>\d+)\s*'
-    )
-
-    re_result = re.search(sflow_info_re, raw_result)
+    re_result = _PATTERNS.sflow_interface.search(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -441,6 +607,28 @@ def parse_show_sflow_interface(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'lldp_neighbor_info',
+    r'\s*Port\s+:\s*(?P<port>\d+)\n'
+    r'Neighbor entries\s+:\s*(?P<neighbor_entries>\d+)\n'
+    r'Neighbor entries deleted\s+:\s*(?P<neighbor_entries_deleted>\d+)\n'
+    r'Neighbor entries dropped\s+:\s*(?P<neighbor_entries_dropped>\d+)\n'
+    r'Neighbor entries age-out\s+:\s*(?P<neighbor_entries_age_out>\d+)\n'
+    r'Neighbor Chassis-Name\s+:\s*(?P<neighbor_chassis_name>\S+)?\n'
+    r'Neighbor Chassis-Description\s+:\s*'
+    r'(?P<neighbor_chassis_description>[\w\s\n/,.*()_-]+)?'
+    r'Neighbor Chassis-ID\s+:\s*(?P<neighbor_chassis_id>[0-9a-f:]+)?\n'
+    r'Neighbor Management-Address\s+:\s*'
+    r'(?P<neighbor_mgmt_address>[\w:.]+)?\n'
+    r'Chassis Capabilities Available\s+:\s*'
+    r'(?P<chassis_capabilities_available>[\w\s\n,.*_-]+)?\n'
+    r'Chassis Capabilities Enabled\s+:\s*'
+    r'(?P<chassis_capabilities_enabled>[\w\s\n,.*_-]+)?\n'
+    r'Neighbor Port-ID\s+:\s*(?P<neighbor_port_id>[\w\s\n/,.*_-]+)?\n'
+    r'TTL\s+:\s*(?P<ttl>\d+)?'
+)
+
+
 def parse_show_lldp_neighbor_info(raw_result):
     """
     Parse the 'show lldp neighbor-info' command raw output.
@@ -469,27 +657,7 @@ def parse_show_lldp_neighbor_info(raw_result):
             }
     """
 
-    neighbor_info_re = (
-        r'\s*Port\s+:\s*(?P<port>\d+)\n'
-        r'Neighbor entries\s+:\s*(?P<neighbor_entries>\d+)\n'
-        r'Neighbor entries deleted\s+:\s*(?P<neighbor_entries_deleted>\d+)\n'
-        r'Neighbor entries dropped\s+:\s*(?P<neighbor_entries_dropped>\d+)\n'
-        r'Neighbor entries age-out\s+:\s*(?P<neighbor_entries_age_out>\d+)\n'
-        r'Neighbor Chassis-Name\s+:\s*(?P<neighbor_chassis_name>\S+)?\n'
-        r'Neighbor Chassis-Description\s+:\s*'
-        r'(?P<neighbor_chassis_description>[\w\s\n/,.*()_-]+)?'
-        r'Neighbor Chassis-ID\s+:\s*(?P<neighbor_chassis_id>[0-9a-f:]+)?\n'
-        r'Neighbor Management-Address\s+:\s*'
-        r'(?P<neighbor_mgmt_address>[\w:.]+)?\n'
-        r'Chassis Capabilities Available\s+:\s*'
-        r'(?P<chassis_capabilities_available>[\w\s\n,.*_-]+)?\n'
-        r'Chassis Capabilities Enabled\s+:\s*'
-        r'(?P<chassis_capabilities_enabled>[\w\s\n,.*_-]+)?\n'
-        r'Neighbor Port-ID\s+:\s*(?P<neighbor_port_id>[\w\s\n/,.*_-]+)?\n'
-        r'TTL\s+:\s*(?P<ttl>\d+)?'
-    )
-
-    re_result = re.match(neighbor_info_re, raw_result)
+    re_result = _PATTERNS.lldp_neighbor_info.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -499,6 +667,17 @@ def parse_show_lldp_neighbor_info(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'lldp_statistics',
+    r'\s*Total\sPackets\stransmitted\s*:\s*'
+    r'(?P<total_packets_transmited>\d+)\s*'
+    r'Total\sPackets\sreceived\s*:\s*(?P<total_packets_received>\d+)\s*'
+    r'Total\sPacket\sreceived\sand\sdiscarded\s*:\s*'
+    r'(?P<total_packets_received_and_discarded>\d+)\s*'
+    r'Total\sTLVs\sunrecognized\s*:\s*(?P<total_tlvs_unrecognized>\d+)\s*'
+)
+
+
 def parse_show_lldp_statistics(raw_result):
     """
     Parse the 'show lldp statistics' command raw output.
@@ -518,17 +697,7 @@ def parse_show_lldp_statistics(raw_result):
             }
     """
 
-    neighbor_info_re = (
-        r'\s*Total\sPackets\stransmitted\s*:\s*'
-        r'(?P<total_packets_transmited>\d+)\s*'
-        r'Total\sPackets\sreceived\s*:\s*(?P<total_packets_received>\d+)\s*'
-        r'Total\sPacket\sreceived\sand\sdiscarded\s*:\s*'
-        r'(?P<total_packets_received_and_discarded>\d+)\s*'
-        r'Total\sTLVs\sunrecognized\s*:\s*(?P<total_tlvs_unrecognized>\d+)\s*'
-
-    )
-
-    re_result = re.match(neighbor_info_re, raw_result)
+    re_result = _PATTERNS.lldp_statistics.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -539,6 +708,20 @@ def parse_show_lldp_statistics(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'bgp_local',
+    r'BGP router identifier (?P<bgp_router_identifier>[^,]+), '
+    r'local AS number (?P<local_as_number>\d+)\nRIB entries '
+    r'(?P<rib_entries>\d+)\nPeers (?P<peers>\d+)\n\n'
+)
+
+_PATTERNS.register(
+    'bgp_summary',
+    r'(?P<neighbor>\S+)\s+(?P<as_number>\d+)\s+(?P<msgrcvd>\d+)\s+'
+    r'(?P<msgsent>\d+)\s+(?P<up_down>\S+)\s+(?P<state>\w+)\s*'
+)
+
+
 def parse_show_ip_bgp_summary(raw_result):
     """
     Parse the 'show ip bgp summary' command raw output.
@@ -572,27 +755,17 @@ def parse_show_ip_bgp_summary(raw_result):
         }
     """
 
-    local_bgp_re = (
-        r'BGP router identifier (?P<bgp_router_identifier>[^,]+), '
-        r'local AS number (?P<local_as_number>\d+)\nRIB entries '
-        r'(?P<rib_entries>\d+)\nPeers (?P<peers>\d+)\n\n'
-    )
-
-    summary_re = (
-        r'(?P<neighbor>\S+)\s+(?P<as_number>\d+)\s+(?P<msgrcvd>\d+)\s+'
-        r'(?P<msgsent>\d+)\s+(?P<up_down>\S+)\s+(?P<state>\w+)\s*'
-    )
-
     result = {}
-    re_result = re.match(local_bgp_re, raw_result)
+    re_result = _PATTERNS.bgp_local.match(raw_result)
     assert re_result
     result = re_result.groupdict()
     for key, value in result.items():
         if value and value.isdigit():
             result[key] = int(value)
 
+    search = _PATTERNS.bgp_summary.search
     for line in raw_result.splitlines():
-        re_result = re.search(summary_re, line)
+        re_result = search(line)
         if re_result:
             partial = re_result.groupdict()
             for key, value in partial.items():
@@ -603,6 +776,34 @@ def parse_show_ip_bgp_summary(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'bgp_neighbor',
+    r'\s*name: (?P<name>[^,]+), remote-as: (?P<remote_as>\d+)\s+state: '
+    r'(?P<state>\w+)\s*tcp_port_number: (?P<tcp_port_number>\d+)'
+    r'\s*statistics:\s*bgp_peer_dropped_count: '
+    r'(?P<bgp_peer_dropped_count>\d+)\s*bgp_peer_dynamic_cap_in_count: '
+    r'(?P<bgp_peer_dynamic_cap_in_count>\d+)'
+    r'\s*bgp_peer_dynamic_cap_out_count: '
+    r'(?P<bgp_peer_dynamic_cap_out_count>\d+)'
+    r'\s*bgp_peer_established_count: (?P<bgp_peer_established_count>\d+)'
+    r'\s*bgp_peer_keepalive_in_count: '
+    r'(?P<bgp_peer_keepalive_in_count>\d+)'
+    r'\s*bgp_peer_keepalive_out_count: '
+    r'(?P<bgp_peer_keepalive_out_count>\d+)\s*bgp_peer_notify_in_count: '
+    r'(?P<bgp_peer_notify_in_count>\d+)\s*bgp_peer_notify_out_count: '
+    r'(?P<bgp_peer_notify_out_count>\d+)\s*bgp_peer_open_in_count: '
+    r'(?P<bgp_peer_open_in_count>\d+)\s*bgp_peer_open_out_count: '
+    r'(?P<bgp_peer_open_out_count>\d+)\s*bgp_peer_readtime: '
+    r'(?P<bgp_peer_readtime>\d+)\s*bgp_peer_refresh_in_count: '
+    r'(?P<bgp_peer_refresh_in_count>\d+)\s*bgp_peer_refresh_out_count: '
+    r'(?P<bgp_peer_refresh_out_count>\d+)\s*bgp_peer_resettime: '
+    r'(?P<bgp_peer_resettime>\d+)\s*bgp_peer_update_in_count: '
+    r'(?P<bgp_peer_update_in_count>\d+)\s*bgp_peer_update_out_count: '
+    r'(?P<bgp_peer_update_out_count>\d+)\s*bgp_peer_uptime: '
+    r'(?P<bgp_peer_uptime>\d+)\s*'
+)
+
+
 def parse_show_ip_bgp_neighbors(raw_result):
     """
     Parse the 'show ip bgp neighbor' command raw output.
@@ -663,34 +864,8 @@ def parse_show_ip_bgp_neighbors(raw_result):
              }
     """
 
-    neighbor_re = (
-        r'\s*name: (?P<name>[^,]+), remote-as: (?P<remote_as>\d+)\s+state: '
-        r'(?P<state>\w+)\s*tcp_port_number: (?P<tcp_port_number>\d+)'
-        r'\s*statistics:\s*bgp_peer_dropped_count: '
-        r'(?P<bgp_peer_dropped_count>\d+)\s*bgp_peer_dynamic_cap_in_count: '
-        r'(?P<bgp_peer_dynamic_cap_in_count>\d+)'
-        r'\s*bgp_peer_dynamic_cap_out_count: '
-        r'(?P<bgp_peer_dynamic_cap_out_count>\d+)'
-        r'\s*bgp_peer_established_count: (?P<bgp_peer_established_count>\d+)'
-        r'\s*bgp_peer_keepalive_in_count: '
-        r'(?P<bgp_peer_keepalive_in_count>\d+)'
-        r'\s*bgp_peer_keepalive_out_count: '
-        r'(?P<bgp_peer_keepalive_out_count>\d+)\s*bgp_peer_notify_in_count: '
-        r'(?P<bgp_peer_notify_in_count>\d+)\s*bgp_peer_notify_out_count: '
-        r'(?P<bgp_peer_notify_out_count>\d+)\s*bgp_peer_open_in_count: '
-        r'(?P<bgp_peer_open_in_count>\d+)\s*bgp_peer_open_out_count: '
-        r'(?P<bgp_peer_open_out_count>\d+)\s*bgp_peer_readtime: '
-        r'(?P<bgp_peer_readtime>\d+)\s*bgp_peer_refresh_in_count: '
-        r'(?P<bgp_peer_refresh_in_count>\d+)\s*bgp_peer_refresh_out_count: '
-        r'(?P<bgp_peer_refresh_out_count>\d+)\s*bgp_peer_resettime: '
-        r'(?P<bgp_peer_resettime>\d+)\s*bgp_peer_update_in_count: '
-        r'(?P<bgp_peer_update_in_count>\d+)\s*bgp_peer_update_out_count: '
-        r'(?P<bgp_peer_update_out_count>\d+)\s*bgp_peer_uptime: '
-        r'(?P<bgp_peer_uptime>\d+)\s*'
-    )
-
     result = {}
-    for re_result in re.finditer(neighbor_re, raw_result):
+    for re_result in _PATTERNS.bgp_neighbor.finditer(raw_result):
         partial = re_result.groupdict()
         for key, value in partial.items():
             if value and value.isdigit():
@@ -700,11 +875,44 @@ def parse_show_ip_bgp_neighbors(raw_result):
     return result
 
 
-def parse_show_ip_bgp(raw_result):
+_PATTERNS.register(
+    'bgp_route',
+    r'(?P<route_status>[*>sdh=iSR]+)\s+(?P<network>\S+)\s+'
+    r'(?P<next_hop>\S+)\s+(?P<metric>\d+)\s+(?P<locprf>\d+)\s+'
+    r'(?P<weight>\d+)\s+(?P<path>.*)\w?\s*'
+)
+
+
+def _iter_bgp_routes(raw_result):
+    """
+    Iterate over the routes of the 'show ip bgp' and 'show ipv6 bgp' command
+    raw output, that share their format.
+    """
+    search = _PATTERNS.bgp_route.search
+    for line in _iter_lines(raw_result):
+        re_result = search(line)
+        if re_result:
+            partial = re_result.groupdict()
+            for key, value in partial.items():
+                if value and value.isdigit():
+                    partial[key] = int(value)
+            yield partial
+
+
+def parse_show_ip_bgp(
+        raw_result, compact=False, normalize=False, columnar=False):
     """
     Parse the 'show ip bgp' command raw output.
 
     :param str raw_result: vtysh raw result string.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_bgp_path`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_bgp_path`.
+    :param bool columnar: Return the paths as the columns of a
+     :class:`topology_lib_vtysh.columns.BgpColumns` instead of a list. The
+     columns already hold the addresses as integers, so ``compact`` and
+     ``normalize`` are ignored.
     :rtype: dict
     :return: The parsed result of the show ip bgp command in a \
         list of dictionaries of the form:
@@ -733,30 +941,46 @@ def parse_show_ip_bgp(raw_result):
         ]
     """
 
-    routes_re = (
-        r'(?P<route_status>[*>sdh=iSR]+)\s+(?P<network>\S+)\s+'
-        r'(?P<next_hop>\S+)\s+(?P<metric>\d+)\s+(?P<locprf>\d+)\s+'
-        r'(?P<weight>\d+)\s+(?P<path>.*)\w?\s*'
-    )
+    if columnar:
+        from .columns import BgpColumns
+        return BgpColumns(iter_show_ip_bgp(raw_result), version=4)
 
-    result = []
-    for line in raw_result.splitlines():
-        re_result = re.search(routes_re, line)
-        if re_result:
-            partial = re_result.groupdict()
-            for key, value in partial.items():
-                if value and value.isdigit():
-                    partial[key] = int(value)
-            result.append(partial)
+    return list(iter_show_ip_bgp(
+        raw_result, compact=compact, normalize=normalize
+    ))
 
-    return result
 
+def iter_show_ip_bgp(raw_result, compact=False, normalize=False):
+    """
+    Parse the 'show ip bgp' command raw output one route at a time.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines,
+     like a file object.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_bgp_path`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_bgp_path`.
+    :return: A generator of the routes, as found in the list returned by
+     :func:`parse_show_ip_bgp`.
+    """
+    routes = _iter_bgp_routes(raw_result)
+    return _finish(routes, 'bgp_path', compact, normalize)
 
-def parse_show_ipv6_bgp(raw_result):
+
+def parse_show_ipv6_bgp(
+        raw_result, compact=False, normalize=False, columnar=False):
     """
     Parse the 'show ipv6 bgp' command raw output.
 
     :param str raw_result: vtysh raw result string.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_bgp_path`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_bgp_path`.
+    :param bool columnar: Return the paths as the columns of a
+     :class:`topology_lib_vtysh.columns.BgpColumns` instead of a list. The
+     columns already hold the addresses as integers, so ``compact`` and
+     ``normalize`` are ignored.
     :rtype: dict
     :return: The parsed result of the show ipv6 bgp command in a \
         list of dictionaries of the form:
@@ -785,23 +1009,39 @@ def parse_show_ipv6_bgp(raw_result):
         ]
     """
 
-    routes_re = (
-        r'(?P<route_status>[*>sdh=iSR]+)\s+(?P<network>\S+)\s+'
-        r'(?P<next_hop>\S+)\s+(?P<metric>\d+)\s+(?P<locprf>\d+)\s+'
-        r'(?P<weight>\d+)\s+(?P<path>.*)\w?\s*'
-    )
+    if columnar:
+        from .columns import BgpColumns
+        return BgpColumns(iter_show_ipv6_bgp(raw_result), version=6)
 
-    result = []
-    for line in raw_result.splitlines():
-        re_result = re.search(routes_re, line)
-        if re_result:
-            partial = re_result.groupdict()
-            for key, value in partial.items():
-                if value and value.isdigit():
-                    partial[key] = int(value)
-            result.append(partial)
+    return list(iter_show_ipv6_bgp(
+        raw_result, compact=compact, normalize=normalize
+    ))
 
-    return result
+
+def iter_show_ipv6_bgp(raw_result, compact=False, normalize=False):
+    """
+    Parse the 'show ipv6 bgp' command raw output one route at a time.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines,
+     like a file object.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_bgp_path`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_bgp_path`.
+    :return: A generator of the routes, as found in the list returned by
+     :func:`parse_show_ipv6_bgp`.
+    """
+    routes = _iter_bgp_routes(raw_result)
+    return _finish(routes, 'bgp_path', compact, normalize)
+
+
+_PATTERNS.register(
+    'ping',
+    r'^(?P<transmitted>\d+) packets transmitted, '
+    r'(?P<received>\d+) received,'
+    r'( \+(?P<errors>\d+) errors,)? '
+    r'(?P<packet_loss>\d+)% packet loss, '
+)
 
 
 def parse_ping_repetitions(raw_result):
@@ -823,16 +1063,10 @@ def parse_ping_repetitions(raw_result):
         }
     """
 
-    ping_re = (
-        r'^(?P<transmitted>\d+) packets transmitted, '
-        r'(?P<received>\d+) received,'
-        r'( \+(?P<errors>\d+) errors,)? '
-        r'(?P<packet_loss>\d+)% packet loss, '
-    )
-
     result = {}
+    search = _PATTERNS.ping.search
     for line in raw_result.splitlines():
-        re_result = re.search(ping_re, line)
+        re_result = search(line)
         if re_result:
             for key, value in re_result.groupdict().items():
                 if value is None:
@@ -862,16 +1096,10 @@ def parse_ping6_repetitions(raw_result):
         }
     """
 
-    ping_re = (
-        r'^(?P<transmitted>\d+) packets transmitted, '
-        r'(?P<received>\d+) received,'
-        r'( \+(?P<errors>\d+) errors,)? '
-        r'(?P<packet_loss>\d+)% packet loss, '
-    )
-
     result = {}
+    search = _PATTERNS.ping.search
     for line in raw_result.splitlines():
-        re_result = re.search(ping_re, line)
+        re_result = search(line)
         if re_result:
             for key, value in re_result.groupdict().items():
                 if value is None:
@@ -882,11 +1110,109 @@ def parse_ping6_repetitions(raw_result):
     return result
 
 
-def parse_show_rib(raw_result):
+_PATTERNS.register(
+    'rib_entries',
+    r'(?<!No )(?P<family>ipv4|ipv6) rib entries'
+)
+
+_PATTERNS.register(
+    'rib_ipv4_network',
+    r'(?P<selected>\*?)(?P<network>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)'
+)
+
+# The IPv6 expressions match any alphanumeric characters and colons, and
+# _search_ipv6_network() and _search_ipv6_nexthop() check that they have the
+# format of an address. Checking it in the expression needs nested repeats,
+# that backtrack exponentially on long lines of garbled output
+_PATTERNS.register(
+    'ipv6_network',
+    r'(?P<selected>\*?)(?<![0-9A-Za-z:])(?P<network>[0-9A-Za-z:]+/\d+)'
+)
+
+_PATTERNS.register(
+    'rib_ipv4_nexthop',
+    r'(?P<selected>\*?)via\s+(?P<via>(?:\d+\.\d+\.\d+\.\d+|\d+)),\s+'
+    r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
+)
+
+_PATTERNS.register(
+    'rib_ipv6_nexthop',
+    r'(?P<selected>\*?)via\s+(?P<via>[0-9A-Za-z:]+|\d+),\s+'
+    r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
+)
+
+
+def _is_ipv6(token):
+    """
+    Check if a token of alphanumeric characters and colons has the format of
+    an IPv6 address: it starts with an alphanumeric character, has colons,
+    and never more than two in a row.
+    """
+    return token[:1] != ':' and ':' in token and ':::' not in token
+
+
+def _search_ipv6_network(line):
+    """
+    Search a line for an IPv6 network and the length of its prefix.
+
+    The expression only starts matching at the first character of a token,
+    so the line is searched in linear time, and the groups of the match are
+    the same as the ones of an expression that checks the format of the
+    address.
+
+    :param str line: The line to search.
+    :return: The match of the ``ipv6_network`` expression, or ``None``.
+    """
+    search = _PATTERNS.ipv6_network.search
+    re_result = search(line)
+    while re_result:
+        network = re_result.group('network')
+        token = network[:network.index('/')]
+        if _is_ipv6(token):
+            return re_result
+
+        # The address can still be the end of the token, after its last
+        # three colons and any colon that follows them
+        first = token.rfind(':::') + 1
+        first = len(token) - len(token[first:].lstrip(':'))
+        if ':' in token[first:]:
+            return search(network[first:])
+        re_result = search(line, re_result.start('network') + len(token) + 1)
+    return None
+
+
+def _search_ipv6_nexthop(line, pattern='ipv6_nexthop'):
+    """
+    Search a line for an IPv6 next hop, in linear time.
+
+    :param str line: The line to search.
+    :param str pattern: Name of the expression to search for,
+     ``ipv6_nexthop`` or ``rib_ipv6_nexthop``.
+    :return: The match of the expression, or ``None``.
+    """
+    search = getattr(_PATTERNS, pattern).search
+    re_result = search(line)
+    while re_result:
+        via = re_result.group('via')
+        if via.isdigit() or _is_ipv6(via):
+            return re_result
+        re_result = search(line, re_result.start('via'))
+    return None
+
+
+def _search_rib_ipv6_nexthop(line):
+    return _search_ipv6_nexthop(line, 'rib_ipv6_nexthop')
+
+
+def parse_show_rib(raw_result, compact=False, normalize=False):
     """
     Parse the 'show rib' command raw output.
 
     :param str raw_result: vtysh raw result string.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
     :rtype: dict
     :return: The parsed result of the show rib command in a \
         dictionary of the form:
@@ -990,149 +1316,122 @@ def parse_show_rib(raw_result):
         }
     """
 
-    ipv4_entries_re = (
-        r'(?<!No )ipv4 rib entries'
-    )
-
-    ipv6_entries_re = (
-        r'(?<!No )ipv6 rib entries'
-    )
-
-    ipv4_network_re = (
-        r'(?P<selected>\*?)(?P<network>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)'
-    )
-
-    ipv6_network_re = (
-        r'(?P<selected>\*?)'
-        r'(?P<network>(?:(?:(?:[0-9A-Za-z]+:)+:?([0-9A-Za-z]+)?)+)/\d+)'
-    )
-
-    ipv4_nexthop_re = (
-        r'(?P<selected>\*?)via\s+(?P<via>(?:\d+\.\d+\.\d+\.\d+|\d+)),\s+'
-        r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
-    )
-
-    ipv6_nexthop_re = (
-        r'(?P<selected>\*?)'
-        r'via\s+(?P<via>(?:(?:(?:[0-9A-Za-z]+:)+:?([0-9A-Za-z]+)?)+|\d+)),\s+'
-        r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
-    )
-
     result = {}
     result['ipv4_entries'] = []
     result['ipv6_entries'] = []
 
-    lines = raw_result.splitlines()
-    line_index = 0
-
-    while line_index < len(lines):
-        if re.search(ipv4_entries_re, lines[line_index]):
-
-            check_for_ipv4_entries = False
-
-            while (not check_for_ipv4_entries and line_index < len(lines)):
-                if re.search(ipv4_network_re, lines[line_index]):
-                    check_for_ipv4_entries = True
-                else:
-                    line_index += 1
-
-            while (check_for_ipv4_entries and line_index < len(lines)):
-                re_result = re.search(ipv4_network_re, lines[line_index])
-
-                if re_result:
-                    network = {}
-                    partial = re_result.groupdict()
-
-                    if partial['selected'] == '*':
-                        network['selected'] = True
-                    else:
-                        network['selected'] = False
-
-                    network['id'] = partial['network']
-                    network['prefix'] = partial['prefix']
-
-                    network['next_hops'] = []
-                    check_for_next_hops = True
-
-                    line_index += 1
-
-                    while (check_for_next_hops and line_index < len(lines)):
-                        re_result = re.search(
-                            ipv4_nexthop_re,
-                            lines[line_index]
-                            )
-
-                        if re_result:
-                            partial = re_result.groupdict()
-
-                            if partial['selected'] == '*':
-                                partial['selected'] = True
-                            else:
-                                partial['selected'] = False
-
-                            network['next_hops'].append(partial)
-                            line_index += 1
-                        else:
-                            check_for_next_hops = False
-
-                    result['ipv4_entries'].append(network)
-                else:
-                    check_for_ipv4_entries = False
-
-        if re.search(ipv6_entries_re, lines[line_index]):
-            check_for_ipv6_entries = False
-
-            while (not check_for_ipv6_entries and line_index < len(lines)):
-                if re.search(ipv6_network_re, lines[line_index]):
-                    check_for_ipv6_entries = True
-                else:
-                    line_index += 1
-
-            while (check_for_ipv6_entries and line_index < len(lines)):
-                re_result = re.search(ipv6_network_re, lines[line_index])
-
-                if re_result:
-                    network = {}
-                    partial = re_result.groupdict()
+    entries = iter_show_rib(
+        raw_result, compact=compact, normalize=normalize
+    )
+    for key, entry in entries:
+        result[key].append(entry)
 
-                    if partial['selected'] == '*':
-                        network['selected'] = True
-                    else:
-                        network['selected'] = False
+    return result
 
-                    network['id'] = partial['network']
 
-                    network['next_hops'] = []
-                    check_for_next_hops = True
+def iter_show_rib(raw_result, compact=False, normalize=False):
+    """
+    Parse the 'show rib' command raw output one entry at a time.
+
+    The output is read in a single pass, and every entry is yielded as soon
+    as all its next hops are read, so the entries of a full table do not have
+    to be held in memory at once.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines,
+     like a file object.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
+    :return: A generator of ``(key, entry)`` tuples, where ``key`` is
+     ``'ipv4_entries'`` or ``'ipv6_entries'`` and ``entry`` is a dictionary as
+     found in the lists returned by :func:`parse_show_rib`.
+    """
+    entries = _iter_rib(raw_result)
+    return _finish(entries, 'rib', compact, normalize)
 
-                    line_index += 1
 
-                    while (check_for_next_hops and line_index < len(lines)):
-                        re_result = re.search(
-                            ipv6_nexthop_re,
-                            lines[line_index]
-                            )
+def _iter_rib(raw_result):
+    """
+    Iterate over the entries of the 'show rib' command raw output.
+    """
+    search_entries = _PATTERNS.rib_entries.search
+    families = {
+        'ipv4': (
+            'ipv4_entries',
+            _PATTERNS.rib_ipv4_network.search,
+            _PATTERNS.rib_ipv4_nexthop.search
+        ),
+        'ipv6': (
+            'ipv6_entries',
+            _search_ipv6_network,
+            _search_rib_ipv6_nexthop
+        ),
+    }
+
+    # The family of the entries being listed, once its header is found
+    key = search_network = search_nexthop = None
+    listing = False
+    entry = None
+
+    for line in _iter_lines(raw_result):
+        if entry is not None:
+            re_result = 'via' in line and search_nexthop(line)
+            if re_result:
+                next_hop = re_result.groupdict()
+                next_hop['selected'] = next_hop['selected'] == '*'
+                entry['next_hops'].append(next_hop)
+                continue
+            yield key, entry
+            entry = None
+
+        if search_network is not None:
+            re_result = search_network(line)
+            if re_result:
+                entry = {}
+                entry['selected'] = re_result.group('selected') == '*'
+                entry['id'] = re_result.group('network')
+                if key == 'ipv4_entries':
+                    entry['prefix'] = re_result.group('prefix')
+                entry['next_hops'] = []
+                listing = True
+                continue
+            # Any other line after the entries ends the listing
+            if listing:
+                key = search_network = search_nexthop = None
+                listing = False
+
+        re_result = 'rib entries' in line and search_entries(line)
+        if re_result:
+            key, search_network, search_nexthop = families[
+                re_result.group('family')
+            ]
+            listing = False
 
-                        if re_result:
-                            partial = re_result.groupdict()
+    if entry is not None:
+        yield key, entry
 
-                            if partial['selected'] == '*':
-                                partial['selected'] = True
-                            else:
-                                partial['selected'] = False
 
-                            network['next_hops'].append(partial)
-                            line_index += 1
-                        else:
-                            check_for_next_hops = False
+_PATTERNS.register(
+    'bgp_section',
+    r'router bgp.*(?=!)',
+    re.DOTALL
+)
 
-                    result['ipv6_entries'].append(network)
-                else:
-                    check_for_ipv6_entries = False
+_PATTERNS.register(
+    'bgp_as_number',
+    r'router bgp\s+(\d+)'
+)
 
-        line_index += 1
+_PATTERNS.register(
+    'bgp_router_id',
+    r'\s+bgp router-id\s+(.*)'
+)
 
-    return result
+_PATTERNS.register(
+    'bgp_network',
+    r'\s+network\s+(.*)'
+)
 
 
 def parse_show_running_config(raw_result):
@@ -1168,25 +1467,24 @@ def parse_show_running_config(raw_result):
     result = {}
 
     # Only the bgp section is captured
-    bgp_section_re = r'router bgp.*(?=!)'
-    re_bgp_section = re.findall(bgp_section_re, raw_result, re.DOTALL)
-    as_number_re = r'router bgp\s+(\d+)'
-    router_id_re = r'\s+bgp router-id\s+(.*)'
-    network_re = r'\s+network\s+(.*)'
+    re_bgp_section = _PATTERNS.bgp_section.findall(raw_result)
     re_as_number = None
     result['bgp'] = {}
     if re_bgp_section:
+        match_as_number = _PATTERNS.bgp_as_number.match
+        match_router_id = _PATTERNS.bgp_router_id.match
+        match_network = _PATTERNS.bgp_network.match
         for line in re_bgp_section[0].splitlines():
-            re_result = re.match(as_number_re, line)
+            re_result = match_as_number(line)
             if re_result:
                 re_as_number = re_result.group(1)
                 result['bgp'][re_as_number] = {}
 
-            re_result = re.match(router_id_re, line)
+            re_result = match_router_id(line)
             if re_result:
                 result['bgp'][re_as_number]['router_id'] = re_result.group(1)
 
-            re_result = re.match(network_re, line)
+            re_result = match_network(line)
             if re_result:
                 network = re_result.group(1)
                 if 'networks' not in result['bgp'][re_as_number].keys():
@@ -1198,11 +1496,63 @@ def parse_show_running_config(raw_result):
     return result
 
 
-def parse_show_ip_route(raw_result):
+def _iter_routes(raw_result, search_network, search_nexthop, prefix):
+    """
+    Iterate over the routes of the 'show ip route' and 'show ipv6 route'
+    command raw output, that only differ in the format of the addresses.
+
+    Every route is yielded once the line after its last next hop is read.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines.
+    :param function search_network: Search for the route in a line.
+    :param function search_nexthop: Search for a next hop in a line.
+    :param bool prefix: If the length of the prefix of the route is given
+     apart from its address.
+    """
+    route = None
+
+    for line in _iter_lines(raw_result):
+        if route is not None:
+            re_result = 'via' in line and search_nexthop(line)
+            if re_result:
+                route['next_hops'].append(re_result.groupdict())
+                continue
+            yield route
+            route = None
+
+        re_result = search_network(line)
+        if re_result:
+            route = {}
+            route['id'] = re_result.group('network')
+            if prefix:
+                route['prefix'] = re_result.group('prefix')
+            route['next_hops'] = []
+
+    if route is not None:
+        yield route
+
+
+_PATTERNS.register(
+    'ipv4_network',
+    r'(?P<network>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)'
+)
+
+_PATTERNS.register(
+    'ipv4_nexthop',
+    r'via\s+(?P<via>(?:\d+\.\d+\.\d+\.\d+|\d+)),\s+'
+    r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
+)
+
+
+def parse_show_ip_route(raw_result, compact=False, normalize=False):
     """
     Parse the 'show ip route' command raw output.
 
     :param str raw_result: vtysh raw result string.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
     :rtype: list
     :return: The parsed result of the show ip route command in a \
         list of dictionaries of the form:
@@ -1255,61 +1605,47 @@ def parse_show_ip_route(raw_result):
         ]
     """
 
-    ipv4_network_re = (
-        r'(?P<network>\d+\.\d+\.\d+\.\d+)/(?P<prefix>\d+)'
-    )
-
-    ipv4_nexthop_re = (
-        r'via\s+(?P<via>(?:\d+\.\d+\.\d+\.\d+|\d+)),\s+'
-        r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
-    )
-
-    result = []
-
-    lines = raw_result.splitlines()
-    line_index = 0
-
-    while line_index < len(lines):
-        re_result = re.search(ipv4_network_re, lines[line_index])
-
-        if re_result:
-            network = {}
-            partial = re_result.groupdict()
-
-            network['id'] = partial['network']
-            network['prefix'] = partial['prefix']
-
-            network['next_hops'] = []
-            check_for_next_hops = True
-
-            line_index += 1
+    return list(iter_show_ip_route(
+        raw_result, compact=compact, normalize=normalize
+    ))
 
-            while (check_for_next_hops and line_index < len(lines)):
-                re_result = re.search(
-                    ipv4_nexthop_re,
-                    lines[line_index]
-                    )
 
-                if re_result:
-                    partial = re_result.groupdict()
-
-                    network['next_hops'].append(partial)
-                    line_index += 1
-                else:
-                    check_for_next_hops = False
+def iter_show_ip_route(raw_result, compact=False, normalize=False):
+    """
+    Parse the 'show ip route' command raw output one route at a time.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines,
+     like a file object.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
+    :return: A generator of the routes, as found in the list returned by
+     :func:`parse_show_ip_route`.
+    """
+    routes = _iter_routes(
+        raw_result, _PATTERNS.ipv4_network.search,
+        _PATTERNS.ipv4_nexthop.search, True
+    )
+    return _finish(routes, 'route', compact, normalize)
 
-            result.append(network)
-        else:
-            line_index += 1
 
-    return result
+_PATTERNS.register(
+    'ipv6_nexthop',
+    r'via\s+(?P<via>[0-9A-Za-z:]+|\d+),\s+'
+    r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
+)
 
 
-def parse_show_ipv6_route(raw_result):
+def parse_show_ipv6_route(raw_result, compact=False, normalize=False):
     """
     Parse the 'show ipv6 route' command raw output.
 
     :param str raw_result: vtysh raw result string.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
     :rtype: list
     :return: The parsed result of the show ipv6 route command in a \
         list of dictionaries of the form:
@@ -1362,54 +1698,41 @@ def parse_show_ipv6_route(raw_result):
         ]
     """
 
-    ipv6_network_re = (
-        r'(?P<selected>\*?)'
-        r'(?P<network>(?:(?:(?:[0-9A-Za-z]+:)+:?([0-9A-Za-z]+)?)+)/\d+)'
-    )
-
-    ipv6_nexthop_re = (
-        r'via\s+(?P<via>(?:(?:(?:[0-9A-Za-z]+:)+:?([0-9A-Za-z]+)?)+|\d+)),\s+'
-        r'\[(?P<distance>\d+)/(?P<metric>\d+)\],\s+(?P<from>\S+)'
-    )
+    return list(iter_show_ipv6_route(
+        raw_result, compact=compact, normalize=normalize
+    ))
 
-    result = []
 
-    lines = raw_result.splitlines()
-    line_index = 0
-
-    while line_index < len(lines):
-        re_result = re.search(ipv6_network_re, lines[line_index])
-
-        if re_result:
-            network = {}
-            partial = re_result.groupdict()
-
-            network['id'] = partial['network']
-
-            network['next_hops'] = []
-            check_for_next_hops = True
-
-            line_index += 1
-
-            while (check_for_next_hops and line_index < len(lines)):
-                re_result = re.search(
-                    ipv6_nexthop_re,
-                    lines[line_index]
-                    )
-
-                if re_result:
-                    partial = re_result.groupdict()
-
-                    network['next_hops'].append(partial)
-                    line_index += 1
-                else:
-                    check_for_next_hops = False
+def iter_show_ipv6_route(raw_result, compact=False, normalize=False):
+    """
+    Parse the 'show ipv6 route' command raw output one route at a time.
+
+    :param raw_result: vtysh raw result string, or any iterable of its lines,
+     like a file object.
+    :param bool compact: Return compact records, see
+     :func:`topology_lib_vtysh.records.compact_route`.
+    :param normalize: Normalize the entries, see
+     :func:`topology_lib_vtysh.routes.normalize_route`.
+    :return: A generator of the routes, as found in the list returned by
+     :func:`parse_show_ipv6_route`.
+    """
+    routes = _iter_routes(
+        raw_result, _search_ipv6_network, _search_ipv6_nexthop, False
+    )
+    return _finish(routes, 'route', compact, normalize)
 
-            result.append(network)
-        else:
-            line_index += 1
 
-    return result
+_PATTERNS.register(
+    'ip_ecmp',
+    r'\s*ECMP Configuration\s*-*\s*'
+    r'ECMP Status\s*: (?P<global_status>\S+)\s*'
+    r'(Resilient Hashing\s*: (?P<resilient>\S+))?\s*'
+    r'ECMP Load Balancing by\s*-*\s*'
+    r'Source IP\s*: (?P<src_ip>\S+)\s*'
+    r'Destination IP\s*: (?P<dest_ip>\S+)\s*'
+    r'Source Port\s*: (?P<src_port>\S+)\s*'
+    r'Destination Port\s*: (?P<dest_port>\S+)\s*'
+)
 
 
 def parse_show_ip_ecmp(raw_result):
@@ -1433,18 +1756,7 @@ def parse_show_ip_ecmp(raw_result):
         }
     """
 
-    show_ip_ecmp_re = (
-        r'\s*ECMP Configuration\s*-*\s*'
-        r'ECMP Status\s*: (?P<global_status>\S+)\s*'
-        r'(Resilient Hashing\s*: (?P<resilient>\S+))?\s*'
-        r'ECMP Load Balancing by\s*-*\s*'
-        r'Source IP\s*: (?P<src_ip>\S+)\s*'
-        r'Destination IP\s*: (?P<dest_ip>\S+)\s*'
-        r'Source Port\s*: (?P<src_port>\S+)\s*'
-        r'Destination Port\s*: (?P<dest_port>\S+)\s*'
-    )
-
-    re_result = re.match(show_ip_ecmp_re, raw_result)
+    re_result = _PATTERNS.ip_ecmp.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -1458,6 +1770,16 @@ def parse_show_ip_ecmp(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'ntp_association',
+    r'(?P<code>\D)\s+(?P<id>\d+)\s+(?P<name>\S+)\s+'
+    r'(?P<remote>\S+)\s+(?P<version>\d+)\s+(?P<key_id>\S+)\s+'
+    r'(?P<reference_id>\S+)\s+(?P<stratum>\S+)\s+(?P<type>\S+)\s+'
+    r'(?P<last>\S+)\s+(?P<poll>\S+)\s+(?P<reach>\S+)\s+'
+    r'(?P<delay>\S+)\s+(?P<offset>\S+)\s+(?P<jitter>\S+)'
+)
+
+
 def parse_show_ntp_associations(raw_result):
     """
     Parse the 'show ntp associations' command raw output.
@@ -1505,17 +1827,10 @@ def parse_show_ntp_associations(raw_result):
         }
     """
 
-    ntp_asssociations_re = (
-        r'(?P<code>\D)\s+(?P<id>\d+)\s+(?P<name>\S+)\s+'
-        r'(?P<remote>\S+)\s+(?P<version>\d+)\s+(?P<key_id>\S+)\s+'
-        r'(?P<reference_id>\S+)\s+(?P<stratum>\S+)\s+(?P<type>\S+)\s+'
-        r'(?P<last>\S+)\s+(?P<poll>\S+)\s+(?P<reach>\S+)\s+'
-        r'(?P<delay>\S+)\s+(?P<offset>\S+)\s+(?P<jitter>\S+)'
-    )
-
     result = {}
+    search = _PATTERNS.ntp_association.search
     for line in raw_result.splitlines():
-        re_result = re.search(ntp_asssociations_re, line)
+        re_result = search(line)
         if re_result:
             partial = re_result.groupdict()
             result[partial['id']] = partial
@@ -1523,6 +1838,12 @@ def parse_show_ntp_associations(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'ntp_authentication_key',
+    r'\s(?P<key_id>\d+)\s+(?P<md5_password>\S+)'
+)
+
+
 def parse_show_ntp_authentication_key(raw_result):
     """
     Parse the 'show ntp authentication-keys' command raw output.
@@ -1544,13 +1865,10 @@ def parse_show_ntp_authentication_key(raw_result):
         }
     """
 
-    ntp_authentication_key_re = (
-        r'\s(?P<key_id>\d+)\s+(?P<md5_password>\S+)'
-    )
-
     result = {}
+    search = _PATTERNS.ntp_authentication_key.search
     for line in raw_result.splitlines():
-        re_result = re.search(ntp_authentication_key_re, line)
+        re_result = search(line)
         if re_result:
             partial = re_result.groupdict()
             result[partial['key_id']] = partial
@@ -1558,6 +1876,20 @@ def parse_show_ntp_authentication_key(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'ntp_statistics',
+    r'\s*Rx-pkts\s*(?P<rx_pkts>\d+)\s*'
+    r'Cur\sVer\sRx-pkts\s*(?P<cur_ver_rx_pkts>\d+)\s*'
+    r'Old\sVer\sRx-pkts\s*(?P<old_ver_rx_pkts>\d+)\s*'
+    r'Error\spkts\s*(?P<error_pkts>\d+)\s*'
+    r'Auth-failed\spkts\s*(?P<auth_failed_pkts>\d+)\s*'
+    r'Declined\spkts\s*(?P<declined_pkts>\d+)\s*'
+    r'Restricted\spkts\s*(?P<restricted_pkts>\d+)\s*'
+    r'Rate-limited\spkts\s*(?P<rate_limited_pkts>\d+)\s*'
+    r'KOD\spkts\s*(?P<kod_pkts>\d+)\s*'
+)
+
+
 def parse_show_ntp_statistics(raw_result):
     """
     Parse the 'show ntp statistics' command raw output.
@@ -1582,19 +1914,7 @@ def parse_show_ntp_statistics(raw_result):
         }
     """
 
-    ntp_statistics_re = (
-        r'\s*Rx-pkts\s*(?P<rx_pkts>\d+)\s*'
-        r'Cur\sVer\sRx-pkts\s*(?P<cur_ver_rx_pkts>\d+)\s*'
-        r'Old\sVer\sRx-pkts\s*(?P<old_ver_rx_pkts>\d+)\s*'
-        r'Error\spkts\s*(?P<error_pkts>\d+)\s*'
-        r'Auth-failed\spkts\s*(?P<auth_failed_pkts>\d+)\s*'
-        r'Declined\spkts\s*(?P<declined_pkts>\d+)\s*'
-        r'Restricted\spkts\s*(?P<restricted_pkts>\d+)\s*'
-        r'Rate-limited\spkts\s*(?P<rate_limited_pkts>\d+)\s*'
-        r'KOD\spkts\s*(?P<kod_pkts>\d+)\s*'
-    )
-
-    re_result = re.match(ntp_statistics_re, raw_result)
+    re_result = _PATTERNS.ntp_statistics.match(raw_result)
 
     result = re_result.groupdict()
     for key, value in result.items():
@@ -1604,6 +1924,23 @@ def parse_show_ntp_statistics(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'ntp_status',
+    r'\s*NTP\sis\s*(?P<status>\w+)\s*'
+    r'NTP\sauthentication\sis\s*(?P<authentication_status>\w+)\s*'
+    r'Uptime:\s*(?P<uptime>\d+)\s*'
+)
+
+_PATTERNS.register(
+    'ntp_status_synchronized',
+    r'\s*Synchronized\sto\sNTP\sServer\s*(?P<server>\S+)\s*'
+    r'at\sstratum\s*(?P<stratum>\d+)\s*'
+    r'Poll\sinterval\s=\s*(?P<poll_interval>\d+)\s*seconds\s*'
+    r'Time\saccuracy\sis\swithin\s*(?P<time_accuracy>\S+)\s*seconds\s*'
+    r'Reference\stime:\s*(?P<reference_time>[\S+\s*]{34})\s*'
+)
+
+
 def parse_show_ntp_status(raw_result):
     """
     Parse the 'show ntp status' command raw output.
@@ -1627,26 +1964,14 @@ def parse_show_ntp_status(raw_result):
         }
     """
 
-    ntp_status_re = (
-        r'\s*NTP\sis\s*(?P<status>\w+)\s*'
-        r'NTP\sauthentication\sis\s*(?P<authentication_status>\w+)\s*'
-        r'Uptime:\s*(?P<uptime>\d+)\s*'
-    )
-
-    ntp_status_synchronized_re = (
-        r'\s*Synchronized\sto\sNTP\sServer\s*(?P<server>\S+)\s*'
-        r'at\sstratum\s*(?P<stratum>\d+)\s*'
-        r'Poll\sinterval\s=\s*(?P<poll_interval>\d+)\s*seconds\s*'
-        r'Time\saccuracy\sis\swithin\s*(?P<time_accuracy>\S+)\s*seconds\s*'
-        r'Reference\stime:\s*(?P<reference_time>[\S+\s*]{34})\s*'
-    )
-
     result = {}
-    re_result = re.match(ntp_status_re, raw_result)
+    re_result = _PATTERNS.ntp_status.match(raw_result)
     result = re_result.groupdict()
     result['uptime'] = int(result['uptime'])
 
-    re_result_synchronized = re.search(ntp_status_synchronized_re, raw_result)
+    re_result_synchronized = _PATTERNS.ntp_status_synchronized.search(
+        raw_result
+    )
     if re_result_synchronized is not None:
         result_synchronized = re_result_synchronized.groupdict()
         for key, value in result_synchronized.items():
@@ -1655,6 +1980,12 @@ def parse_show_ntp_status(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'ntp_trusted_key',
+    r'(?P<key_id>\d+)'
+)
+
+
 def parse_show_ntp_trusted_keys(raw_result):
     """
     Parse the 'show ntp trusted-keys' command raw output.
@@ -1672,13 +2003,10 @@ def parse_show_ntp_trusted_keys(raw_result):
         }
     """
 
-    ntp_trusted_key_re = (
-        r'(?P<key_id>\d+)'
-    )
-
     result = {}
+    search = _PATTERNS.ntp_trusted_key.search
     for line in raw_result.splitlines():
-        re_result = re.search(ntp_trusted_key_re, line)
+        re_result = search(line)
         if re_result:
             partial = re_result.groupdict()
             result[partial['key_id']] = partial
@@ -1686,6 +2014,13 @@ def parse_show_ntp_trusted_keys(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'dhcp_server_lease',
+    r'\n+(?P<expiry_time>[\S+\s*]{24})\s+(?P<mac_address>\S+)\s+'
+    r'(?P<ip_address>\S+)\s+(?P<hostname>\S+)\s+(?P<client_id>\S+)'
+)
+
+
 def parse_show_dhcp_server_leases(raw_result):
     """
     Parse the 'show dchp-server leases' command raw output.
@@ -1717,18 +2052,37 @@ def parse_show_dhcp_server_leases(raw_result):
         }
     """
 
-    dhcp_server_leases_re = (
-        r'\n+(?P<expiry_time>[\S+\s*]{24})\s+(?P<mac_address>\S+)\s+'
-        r'(?P<ip_address>\S+)\s+(?P<hostname>\S+)\s+(?P<client_id>\S+)'
-    )
-
     result = {}
-    for re_result in re.finditer(dhcp_server_leases_re, raw_result):
+    for re_result in _PATTERNS.dhcp_server_lease.finditer(raw_result):
         lease = re_result.groupdict()
         result[lease['ip_address']] = lease
     return result
 
 
+_PATTERNS.register(
+    'dhcp_server_pool',
+    r'(?P<pool_name>[\w_\-]+)'
+    r'\s+(?P<start_ip>[\d\.:]+)'
+    r'\s+(?P<end_ip>[\d\.:]+)'
+    r'\s+(?P<netmask>[\d\.*]+)'
+    r'\s+(?P<broadcast>[\d\.*]+)'
+    r'\s+(?P<prefix_len>[\w\*/]+)'
+    r'\s+(?P<lease_time>[\d]+)'
+    r'\s+(?P<static_bind>True|False)'
+    r'\s+(?P<set_tag>[\w\*]+)'
+    r'\s+(?P<match_tag>[\w\*]+)'
+)
+
+_PATTERNS.register(
+    'dhcp_server_option',
+    r'\n(?P<option_number>[\d\*]+)'
+    r'\s+(?P<option_name>[\w\*]+)'
+    r'\s+(?P<option_value>[\w_\-\.]+)'
+    r'\s+(?P<ipv6_option>True|False)'
+    r'\s+(?P<match_tags>[\w\*]+)'
+)
+
+
 def parse_show_dhcp_server(raw_result):
     """
     Parse the 'show dhcp-server' command raw output.
@@ -1774,35 +2128,14 @@ def parse_show_dhcp_server(raw_result):
         }
     """
 
-    dhcp_dynamic_re = (
-        r'(?P<pool_name>[\w_\-]+)'
-        r'\s+(?P<start_ip>[\d\.:]+)'
-        r'\s+(?P<end_ip>[\d\.:]+)'
-        r'\s+(?P<netmask>[\d\.*]+)'
-        r'\s+(?P<broadcast>[\d\.*]+)'
-        r'\s+(?P<prefix_len>[\w\*/]+)'
-        r'\s+(?P<lease_time>[\d]+)'
-        r'\s+(?P<static_bind>True|False)'
-        r'\s+(?P<set_tag>[\w\*]+)'
-        r'\s+(?P<match_tag>[\w\*]+)'
-    )
-
-    dhcp_options_re = (
-        r'\n(?P<option_number>[\d\*]+)'
-        r'\s+(?P<option_name>[\w\*]+)'
-        r'\s+(?P<option_value>[\w_\-\.]+)'
-        r'\s+(?P<ipv6_option>True|False)'
-        r'\s+(?P<match_tags>[\w\*]+)'
-    )
-
     result = {}
     pools_list = []
     options_list = []
-    for output in re.finditer(dhcp_dynamic_re, raw_result):
+    for output in _PATTERNS.dhcp_server_pool.finditer(raw_result):
         dhcp_dynamic = output.groupdict()
         pools_list.append(dhcp_dynamic)
     result['pools'] = pools_list
-    for output in re.finditer(dhcp_options_re, raw_result):
+    for output in _PATTERNS.dhcp_server_option.finditer(raw_result):
         dhcp_options = output.groupdict()
         options_list.append(dhcp_options)
     result['options'] = options_list
@@ -1811,6 +2144,23 @@ def parse_show_dhcp_server(raw_result):
     return result
 
 
+_PATTERNS.register(
+    'sflow',
+    r'\s*sFlow\s*Configuration\s*'
+    r'\s*-----------------------------------------\s*'
+    r'\s*sFlow\s*(?P<sflow>\S+)\s*'
+    r'Collector\sIP/Port/Vrf\s*(?P<collector>.+)'
+    r'Agent\sInterface\s*(?P<agent_interface>.+)'
+    r'Agent\sAddress\sFamily\s*(?P<agent_address_family>Not set|ipv4|ipv6)\s*'  # noqa
+    r'Sampling\sRate\s*(?P<sampling_rate>\d+)\s*'
+    r'Polling\sInterval\s*(?P<polling_interval>\d+)\s*'
+    r'Header\sSize\s*(?P<header_size>\d+)\s*'
+    r'Max\sDatagram\sSize\s*(?P<max_datagram_size>\d+)\s*'
+    r'Number\sof\sSamples\s*(?P<number_of_samples>\d+)\s*',
+    re.DOTALL
+)
+
+
 def parse_show_sflow(raw_result):
     """
     Parse the 'show sflow' command raw output.
@@ -1846,21 +2196,7 @@ def parse_show_sflow(raw_result):
             }
     """
 
-    sflow_info_re = (
-         r'\s*sFlow\s*Configuration\s*'
-         r'\s*-----------------------------------------\s*'
-         r'\s*sFlow\s*(?P<sflow>\S+)\s*'
-         r'Collector\sIP/Port/Vrf\s*(?P<collector>.+)'
-         r'Agent\sInterface\s*(?P<agent_interface>.+)'
-         r'Agent\sAddress\sFamily\s*(?P<agent_address_family>Not set|ipv4|ipv6)\s*'  # noqa
-         r'Sampling\sRate\s*(?P<sampling_rate>\d+)\s*'
-         r'Polling\sInterval\s*(?P<polling_interval>\d+)\s*'
-         r'Header\sSize\s*(?P<header_size>\d+)\s*'
-         r'Max\sDatagram\sSize\s*(?P<max_datagram_size>\d+)\s*'
-         r'Number\sof\sSamples\s*(?P<number_of_samples>\d+)\s*'
-    )
-
-    re_result = re.match(sflow_info_re, raw_result, re.DOTALL)
+    re_result = _PATTERNS.sflow.match(raw_result)
     assert re_result
 
     result = re_result.groupdict()
@@ -1897,5 +2233,6 @@ __all__ = [
     'parse_show_ntp_statistics', 'parse_show_ntp_status',
     'parse_show_ntp_trusted_keys', 'parse_show_sflow',
     'parse_show_dhcp_server_leases', 'parse_show_dhcp_server',
-    'parse_show_sflow_interface'
+    'parse_show_sflow_interface', 'iter_show_rib', 'iter_show_ip_route',
+    'iter_show_ipv6_route', 'iter_show_ip_bgp', 'iter_show_ipv6_bgp'
 ]
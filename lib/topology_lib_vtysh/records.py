@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Compact records for the routes, next hops and BGP paths of the parsers.
+
+The parsers of the route and BGP tables return dictionaries, that take much
+more memory than their values on large tables. Given ``compact=True`` they
+return the records of this module instead:
+
+::
+
+    from topology_lib_vtysh.parser import parse_show_rib
+
+    result = parse_show_rib(enode('show rib', shell='vtysh'), compact=True)
+    route = result['ipv4_entries'][0]
+    assert route.next_hops[0].distance == route['next_hops'][0]['distance']
+
+The records have a slot for every value instead of a dictionary, their
+numbers are integers, and the strings repeated across a table, like next
+hops and protocols, are shared. They are also read-only mappings with the
+same keys as the dictionaries, so code written for those keeps working.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from six.moves.collections_abc import (
+    Mapping, KeysView, ItemsView, ValuesView
+)
+
+
+class _Record(object):
+    """
+    Read-only mapping over the slots of a record.
+
+    ``_keys`` holds a ``(key, slot)`` pair for every key of the mapping, and
+    slots that are not set are not keys of it.
+
+    It does not derive from :class:`Mapping`, whose bases have no
+    ``__slots__`` on Python 2 and would give every record a ``__dict__``, it
+    is registered as one instead.
+    """
+    __slots__ = ()
+    __hash__ = None
+    _keys = ()
+
+    def __init__(self, values):
+        for key, slot in self._keys:
+            if key in values:
+                setattr(self, slot, values[key])
+
+    def __getitem__(self, key):
+        for name, slot in self._keys:
+            if name == key:
+                try:
+                    return getattr(self, slot)
+                except AttributeError:
+                    break
+        raise KeyError(key)
+
+    def __iter__(self):
+        for key, slot in self._keys:
+            if hasattr(self, slot):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return KeysView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, dict(self))
+
+    def __reduce__(self):
+        return type(self), (dict(self), )
+
+
+Mapping.register(_Record)
+
+
+class NextHop(_Record):
+    """
+    Next hop of a route.
+
+    :var str via: Address of the next hop, or its port.
+    :var int distance: Administrative distance.
+    :var int metric: Metric of the route through the next hop.
+    :var str from_: Protocol the route was learned from, the ``from`` key of
+     the mapping.
+    :var bool selected: If the next hop is selected, only in the entries of
+     the RIB.
+    """
+    __slots__ = ('selected', 'via', 'distance', 'metric', 'from_')
+    _keys = (
+        ('selected', 'selected'), ('via', 'via'), ('distance', 'distance'),
+        ('metric', 'metric'), ('from', 'from_'),
+    )
+
+
+class Route(_Record):
+    """
+    Route of a route table, or entry of the RIB.
+
+    :var bool selected: If the route is selected, only in the RIB.
+    :var str id: Network of the route. For IPv6 it includes the length of
+     the prefix. Given ``normalize=True`` it is the ``(value, length,
+     version)`` tuple of the network.
+    :var int prefix: Length of the prefix, only for IPv4 when not
+     normalized.
+    :var tuple next_hops: The :class:`NextHop` records of the route.
+    """
+    __slots__ = ('selected', 'id', 'prefix', 'next_hops')
+    _keys = (
+        ('selected', 'selected'), ('id', 'id'), ('prefix', 'prefix'),
+        ('next_hops', 'next_hops'),
+    )
+
+
+class BgpPath(_Record):
+    """
+    Path of a BGP table.
+
+    :var str route_status: Status codes of the path, like ``*>``.
+    :var str network: Network of the path.
+    :var str next_hop: Next hop of the path.
+    :var int metric: Metric.
+    :var int locprf: Local preference.
+    :var int weight: Weight.
+    :var str path: AS path and origin.
+    """
+    __slots__ = (
+        'route_status', 'network', 'next_hop', 'metric', 'locprf', 'weight',
+        'path',
+    )
+    _keys = tuple((slot, slot) for slot in __slots__)
+
+
+def _number(value):
+    return int(value) if value.isdigit() else value
+
+
+def compact_route(route, strings):
+    """
+    Create the record of a parsed route and its next hops.
+
+    :param dict route: The route, as parsed from a route table or the RIB.
+    :param dict strings: Strings already used by the records of the table,
+     by value, so the next hops and protocols repeated in it are shared.
+    :rtype: Route
+    """
+    intern = strings.setdefault
+    next_hops = []
+    for next_hop in route['next_hops']:
+        values = dict(next_hop)
+        values['via'] = intern(next_hop['via'], next_hop['via'])
+        values['from'] = intern(next_hop['from'], next_hop['from'])
+        values['distance'] = _number(next_hop['distance'])
+        values['metric'] = _number(next_hop['metric'])
+        next_hops.append(NextHop(values))
+
+    values = dict(route)
+    if 'prefix' in route:
+        values['prefix'] = _number(route['prefix'])
+    values['next_hops'] = tuple(next_hops)
+    return Route(values)
+
+
+def compact_bgp_path(path, strings):
+    """
+    Create the record of a parsed BGP path.
+
+    :param dict path: The path, as parsed from a BGP table.
+    :param dict strings: Strings already used by the records of the table,
+     by value.
+    :rtype: BgpPath
+    """
+    intern = strings.setdefault
+    values = dict(path)
+    for key in ('route_status', 'next_hop', 'path'):
+        if values[key] is not None:
+            values[key] = intern(values[key], values[key])
+    return BgpPath(values)
+
+
+__all__ = [
+    'NextHop', 'Route', 'BgpPath', 'compact_route', 'compact_bgp_path'
+]
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Record the shell calls of an enode, and replay them without a device.
+
+Record a run against a real switch:
+
+::
+
+    from topology_lib_vtysh.replay import RecordingEnode
+
+    recorder = RecordingEnode(enode)
+    show_vlan(recorder)
+    with ConfigInterface(recorder, '1') as ctx:
+        ctx.no_shutdown()
+    recorder.transcript.save('playbook.json.gz')
+
+Then run the same code offline, as many times as needed:
+
+::
+
+    from topology_lib_vtysh.replay import ReplayEnode, Transcript
+
+    enode = ReplayEnode(Transcript.load('playbook.json.gz'))
+    show_vlan(enode)
+    with ConfigInterface(enode, '1') as ctx:
+        ctx.no_shutdown()
+    print(enode.round_trips, enode.seconds)
+
+The replay enode answers every call with the output recorded for the same
+shell and command, in the order they were recorded. It counts the round
+trips and adds up the time they took on the device, so the cost of a run can
+be measured without waiting for it, or the recorded latencies can be waited
+for, as they are or scaled.
+
+Transcripts are saved as JSON, compressed with gzip if the name of the file
+ends with ``.gz``. Every distinct output is only saved once.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import json
+from io import open
+from gzip import open as gzip_open
+from time import sleep
+from collections import deque
+
+from .batch import supports_batch
+from .compat import clock
+from .libs import Libs
+
+
+class ReplayError(LookupError):
+    """
+    Raised when a replayed call was not recorded.
+
+    :param str shell: The shell of the call.
+    :param str command: The command of the call.
+    """
+    def __init__(self, shell, command):
+        super(ReplayError, self).__init__(
+            'No output recorded for {!r} in shell {!r}'.format(command, shell)
+        )
+        self.shell = shell
+        self.command = command
+
+
+class Transcript(object):
+    """
+    Shell calls of an enode, with their outputs and the time they took.
+
+    :param dict ports: The ports of the enode, as found in its ``ports``
+     attribute.
+    :param bool batch: True if the enode runs several commands sent in a
+     single shell call, see :func:`topology_lib_vtysh.batch.supports_batch`.
+    :var list calls: A ``(shell, command, output, seconds)`` tuple per call,
+     in order.
+    """
+    def __init__(self, ports=None, batch=False):
+        self.ports = dict(ports or {})
+        self.batch = batch
+        self.calls = []
+
+    def __len__(self):
+        return len(self.calls)
+
+    def append(self, shell, command, output, seconds):
+        """
+        Add a call to the transcript.
+
+        :param str shell: The shell the command was run in.
+        :param str command: The command.
+        :param str output: The output of the command.
+        :param float seconds: The time the call took.
+        """
+        self.calls.append((shell, command, output, seconds))
+
+    @property
+    def seconds(self):
+        """
+        Time all the calls took, in seconds.
+        """
+        return sum(call[3] for call in self.calls)
+
+    def save(self, path):
+        """
+        Save the transcript to a file.
+
+        :param str path: The file, compressed if its name ends with ``.gz``.
+        """
+        outputs = {}
+        calls = [
+            [
+                shell, command, outputs.setdefault(output, len(outputs)),
+                round(seconds, 6)
+            ]
+            for shell, command, output, seconds in self.calls
+        ]
+        data = json.dumps({
+            'version': 1,
+            'ports': self.ports,
+            'batch': self.batch,
+            'outputs': sorted(outputs, key=outputs.get),
+            'calls': calls,
+        }, separators=(',', ':'))
+
+        if path.endswith('.gz'):
+            with gzip_open(path, 'wb') as fd:
+                fd.write(data.encode('utf-8'))
+        else:
+            with open(path, 'w', encoding='utf-8') as fd:
+                fd.write(data)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a transcript saved to a file.
+
+        :param str path: The file, compressed if its name ends with ``.gz``.
+        :rtype: Transcript
+        """
+        if path.endswith('.gz'):
+            with gzip_open(path, 'rb') as fd:
+                data = json.loads(fd.read().decode('utf-8'))
+        else:
+            with open(path, encoding='utf-8') as fd:
+                data = json.load(fd)
+
+        transcript = cls(data['ports'], data.get('batch', False))
+        outputs = data['outputs']
+        for shell, command, output, seconds in data['calls']:
+            transcript.append(shell, command, outputs[output], seconds)
+        return transcript
+
+
+class RecordingEnode(object):
+    """
+    Engine node that runs the calls on another one and records them.
+
+    The other attributes of the enode, like its ports, are the ones of the
+    recorded enode. Its ``common`` and ``vtysh`` libraries run on the
+    recording enode, see :class:`topology_lib_vtysh.libs.Libs`, and the
+    batches of commands of the library contexts are run one command at a
+    time, so each of them is recorded. The other libraries are the ones of
+    the recorded enode, and their calls are not recorded.
+
+    :param enode: Engine node to record the calls of.
+    :type enode: topology.platforms.base.BaseNode
+    :param Transcript transcript: The transcript to add the calls to, a new
+     one if not given.
+    :var Transcript transcript: The recorded calls.
+    """
+    def __init__(self, enode, transcript=None):
+        self.enode = enode
+        if transcript is None:
+            transcript = Transcript(
+                getattr(enode, 'ports', None), supports_batch(enode)
+            )
+        self.transcript = transcript
+        self.libs = Libs(self, getattr(enode, 'libs', None))
+
+    def __getattr__(self, name):
+        return getattr(self.__dict__['enode'], name)
+
+    def __call__(self, command, shell=None, **kwargs):
+        start = clock()
+        output = self.enode(command, shell=shell, **kwargs)
+        self.transcript.append(shell, command, output, clock() - start)
+        return output
+
+
+class ReplayEnode(object):
+    """
+    Engine node that answers the calls with the outputs of a transcript.
+
+    The calls of the same command are answered with its outputs in the order
+    they were recorded, and the last output of a command is repeated once
+    there are no more.
+
+    :param Transcript transcript: The recorded calls.
+    :param float latency: Factor of the recorded time of a call to wait for
+     before answering it, ``1.0`` to reproduce the recorded latencies, or
+     ``0.0`` to answer at once.
+    :var dict ports: The ports of the recorded enode.
+    :var bool vtysh_batch: True if the recorded enode runs several commands
+     sent in a single shell call.
+    :var list calls: A ``(shell, command)`` tuple for every call answered.
+    :var float seconds: Time the calls answered took when recorded.
+    """
+    def __init__(self, transcript, latency=0.0):
+        self.transcript = transcript
+        self.latency = latency
+        self.ports = dict(transcript.ports)
+        self.vtysh_batch = transcript.batch
+        self.libs = Libs(self)
+        self.calls = []
+        self.seconds = 0.0
+        self._outputs = {}
+        for shell, command, output, seconds in transcript.calls:
+            self._outputs.setdefault(
+                (shell, command), deque()
+            ).append((output, seconds))
+
+    @property
+    def round_trips(self):
+        """
+        Number of calls answered.
+        """
+        return len(self.calls)
+
+    def __call__(self, command, shell=None, **kwargs):
+        outputs = self._outputs.get((shell, command))
+        if not outputs:
+            raise ReplayError(shell, command)
+
+        output, seconds = (
+            outputs.popleft() if len(outputs) > 1 else outputs[0]
+        )
+        if self.latency:
+            sleep(seconds * self.latency)
+        self.seconds += seconds
+        self.calls.append((shell, command))
+        return output
+
+
+__all__ = ['ReplayError', 'Transcript', 'RecordingEnode', 'ReplayEnode']
@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Longest prefix match over the routes parsed from a route table.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.parser import iter_show_rib
+    from topology_lib_vtysh.routes import RouteTable
+
+    table = RouteTable(iter_show_rib(enode('show rib', shell='vtysh')))
+    route = table.lookup('10.1.2.3')
+    next_hops = route['next_hops']
+
+The routes are kept in a compressed binary trie per address family, keyed
+on the addresses as integers, so finding the route of an address or the
+routes around a prefix takes time in the order of the length of the prefix
+instead of the number of routes.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from binascii import hexlify
+from socket import inet_pton, error as socket_error, AF_INET, AF_INET6
+
+
+def parse_prefix(prefix):
+    """
+    Parse an address or a network into an integer.
+
+    :param str prefix: The address, like ``10.1.2.3`` or ``2001::1``, or the
+     network, like ``10.0.0.0/8`` or ``2001::/16``. The host bits of the
+     network are ignored.
+    :rtype: tuple
+    :return: A ``(value, length, version)`` tuple, with the network as an
+     integer, the length of its prefix, which is the length of the address
+     if no length was given, and the IP version, 4 or 6, so the tuples
+     compare and sort by address.
+    :raise ValueError: If the address or the length are not valid.
+    """
+    address, _, length = prefix.partition('/')
+    if ':' in address:
+        version, family, width = 6, AF_INET6, 128
+    else:
+        version, family, width = 4, AF_INET, 32
+
+    try:
+        value = int(hexlify(inet_pton(family, address)), 16)
+    except (socket_error, ValueError):
+        raise ValueError('Invalid address {!r}'.format(prefix))
+    try:
+        length = int(length) if length else width
+    except ValueError:
+        length = -1
+    if not 0 <= length <= width:
+        raise ValueError('Invalid prefix length {!r}'.format(prefix))
+
+    return value >> (width - length) << (width - length), length, version
+
+
+def route_prefix(route):
+    """
+    Get the network of a route, as parsed from a route table.
+
+    :param dict route: The route, as found in the result of
+     :func:`topology_lib_vtysh.parser.parse_show_ip_route`,
+     :func:`topology_lib_vtysh.parser.parse_show_ipv6_route` or
+     :func:`topology_lib_vtysh.parser.parse_show_rib`.
+    :return: The network, like ``10.0.0.0/8``, or its
+     ``(value, length, version)`` tuple if the route was normalized.
+    """
+    if 'prefix' in route:
+        return '{}/{}'.format(route['id'], route['prefix'])
+    return route['id']
+
+
+class PrefixCache(object):
+    """
+    Interning cache of the addresses and networks parsed into integers.
+
+    The same networks and next hops are found over and over in the tables of
+    a device, so they are parsed once and their tuples are shared by all the
+    entries that have them, saving both the time and the memory.
+
+    :param int maxsize: Number of prefixes to keep. The cache is emptied when
+     it is full, so it does not grow without bound across many tables.
+    """
+    def __init__(self, maxsize=1 << 20):
+        self.maxsize = maxsize
+        self._prefixes = {}
+
+    def __len__(self):
+        return len(self._prefixes)
+
+    def get(self, prefix):
+        """
+        Get the normalized form of an address or a network.
+
+        :param str prefix: The address or the network, as given to
+         :func:`parse_prefix`.
+        :rtype: tuple
+        :return: A ``(value, length, version)`` tuple, with the address as an
+         integer, the length of the prefix and the IP version, 4 or 6, so
+         they compare and sort by address.
+        :raise ValueError: If the address or the length are not valid.
+        """
+        normalized = self._prefixes.get(prefix)
+        if normalized is None:
+            normalized = parse_prefix(prefix)
+            if len(self._prefixes) >= self.maxsize:
+                self._prefixes.clear()
+            self._prefixes[prefix] = normalized
+        return normalized
+
+    def clear(self):
+        """
+        Remove all the prefixes from the cache.
+        """
+        self._prefixes.clear()
+
+
+PREFIXES = PrefixCache()
+"""
+Cache shared by the parsers given ``normalize=True``.
+"""
+
+
+def normalize_route(route, cache=PREFIXES):
+    """
+    Replace the network and the next hop addresses of a parsed route with
+    their ``(value, length, version)`` tuples.
+
+    The ``id`` of the route holds the network, the same for IPv4 and IPv6,
+    and the ``prefix`` key is removed. Next hops that are ports instead of
+    addresses are kept as they are.
+
+    :param dict route: The route, as parsed from a route table or the RIB.
+     It is changed in place.
+    :param PrefixCache cache: The cache of the tuples.
+    :rtype: dict
+    :return: The route.
+    """
+    get = cache.get
+    route['id'] = get(route_prefix(route))
+    route.pop('prefix', None)
+    for next_hop in route['next_hops']:
+        via = next_hop['via']
+        if '.' in via or ':' in via:
+            next_hop['via'] = get(via)
+    return route
+
+
+def normalize_bgp_path(path, cache=PREFIXES):
+    """
+    Replace the network and the next hop of a parsed BGP path with their
+    ``(value, length, version)`` tuples.
+
+    :param dict path: The path, as parsed from a BGP table. It is changed in
+     place.
+    :param PrefixCache cache: The cache of the tuples.
+    :rtype: dict
+    :return: The path.
+    """
+    get = cache.get
+    path['network'] = get(path['network'])
+    if path['next_hop'] is not None:
+        path['next_hop'] = get(path['next_hop'])
+    return path
+
+
+# Every node of a trie is a [value, length, route, zero, one] list, with the
+# prefix, the route to it, if any, and the children for the next bit
+_VALUE, _LENGTH, _ROUTE, _ZERO, _ONE = range(5)
+
+
+class _Trie(object):
+    """
+    Compressed binary trie of the prefixes of an address family.
+
+    Nodes are only created for the prefixes of the routes and where two of
+    them branch, so the depth of the trie is bounded by the length of the
+    addresses.
+
+    :param int width: Length of the addresses, in bits.
+    """
+    def __init__(self, width):
+        self.width = width
+        self.root = [0, 0, None, None, None]
+
+    def insert(self, value, length, route):
+        """
+        Add the route to a prefix, replacing the one it had, if any.
+
+        :rtype: bool
+        :return: ``True`` if the prefix had no route yet.
+        """
+        width = self.width
+        node = self.root
+        while node[_LENGTH] < length:
+            index = _ZERO + (value >> (width - 1 - node[_LENGTH]) & 1)
+            child = node[index]
+            if child is None:
+                node[index] = [value, length, route, None, None]
+                return True
+
+            # Length of the prefix shared by the child and the new one
+            common = min(width - (child[_VALUE] ^ value).bit_length(), length)
+            if common >= child[_LENGTH]:
+                node = child
+                continue
+
+            shift = width - common
+            branch = [value >> shift << shift, common, None, None, None]
+            branch[_ZERO + (child[_VALUE] >> (shift - 1) & 1)] = child
+            node[index] = branch
+            node = branch
+
+        added = node[_ROUTE] is None
+        node[_ROUTE] = route
+        return added
+
+    def lookup(self, value):
+        """
+        Find the route to the longest prefix that contains an address.
+        """
+        width = self.width
+        best = None
+        node = self.root
+        while node is not None:
+            length = node[_LENGTH]
+            if (node[_VALUE] ^ value) >> (width - length):
+                break
+            if node[_ROUTE] is not None:
+                best = node[_ROUTE]
+            if length == width:
+                break
+            node = node[_ZERO + (value >> (width - 1 - length) & 1)]
+        return best
+
+    def covering(self, value, length):
+        """
+        Find the routes to all the prefixes that contain a prefix, from the
+        shortest one to the longest.
+        """
+        width = self.width
+        routes = []
+        node = self.root
+        while node is not None and node[_LENGTH] <= length:
+            if (node[_VALUE] ^ value) >> (width - node[_LENGTH]):
+                break
+            if node[_ROUTE] is not None:
+                routes.append(node[_ROUTE])
+            if node[_LENGTH] == length:
+                break
+            node = node[_ZERO + (value >> (width - 1 - node[_LENGTH]) & 1)]
+        return routes
+
+    def more_specifics(self, value, length):
+        """
+        Find the routes to all the prefixes contained in a prefix, but not
+        to the prefix itself, in address order.
+        """
+        width = self.width
+        node = self.root
+        while node is not None and node[_LENGTH] < length:
+            if (node[_VALUE] ^ value) >> (width - node[_LENGTH]):
+                return []
+            node = node[_ZERO + (value >> (width - 1 - node[_LENGTH]) & 1)]
+        if node is None or (node[_VALUE] ^ value) >> (width - length):
+            return []
+
+        routes = []
+        if node[_LENGTH] > length and node[_ROUTE] is not None:
+            routes.append(node[_ROUTE])
+        # Depth first, with the zero child popped before the one child
+        pending = [node[_ONE], node[_ZERO]]
+        while pending:
+            node = pending.pop()
+            if node is not None:
+                if node[_ROUTE] is not None:
+                    routes.append(node[_ROUTE])
+                pending.append(node[_ONE])
+                pending.append(node[_ZERO])
+        return routes
+
+
+class RouteTable(object):
+    """
+    Route table that finds the routes of addresses and prefixes by longest
+    prefix match.
+
+    :param routes: Routes to add to the table, as found in the result of
+     :func:`topology_lib_vtysh.parser.parse_show_ip_route` or
+     :func:`topology_lib_vtysh.parser.parse_show_ipv6_route`, or the
+     ``(key, entry)`` tuples of
+     :func:`topology_lib_vtysh.parser.iter_show_rib`. Any iterable does, so
+     the table can be built from the streaming parsers without holding a
+     list of the routes.
+    """
+    def __init__(self, routes=()):
+        self._tries = {4: _Trie(32), 6: _Trie(128)}
+        self._count = 0
+        self.update(routes)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, route):
+        """
+        Add a route to the table, replacing the route to the same network.
+
+        :param dict route: The route, as parsed from a route table.
+        """
+        network = route_prefix(route)
+        if not isinstance(network, tuple):
+            network = parse_prefix(network)
+        value, length, version = network
+        self._count += self._tries[version].insert(value, length, route)
+
+    def update(self, routes):
+        """
+        Add several routes to the table.
+
+        :param routes: The routes, as given to the table.
+        """
+        add = self.add
+        for route in routes:
+            if isinstance(route, tuple):
+                route = route[1]
+            add(route)
+
+    def lookup(self, address):
+        """
+        Find the route that forwards an address.
+
+        :param str address: The address, like ``10.1.2.3``.
+        :rtype: dict
+        :return: The route to the longest prefix that contains the address,
+         or ``None`` if there is no such route.
+        """
+        value, _, version = parse_prefix(address)
+        return self._tries[version].lookup(value)
+
+    def covering(self, prefix):
+        """
+        Find the routes to the prefixes that contain a network, including the
+        route to the network itself.
+
+        :param str prefix: The network, like ``10.1.0.0/16``.
+        :rtype: list
+        :return: The routes, from the shortest prefix to the longest.
+        """
+        value, length, version = parse_prefix(prefix)
+        return self._tries[version].covering(value, length)
+
+    def more_specifics(self, prefix):
+        """
+        Find the routes to the longer prefixes contained in a network.
+
+        :param str prefix: The network, like ``10.0.0.0/8``.
+        :rtype: list
+        :return: The routes, in address order, without the route to the
+         network itself.
+        """
+        value, length, version = parse_prefix(prefix)
+        return self._tries[version].more_specifics(value, length)
+
+
+__all__ = [
+    'parse_prefix', 'route_prefix', 'PrefixCache', 'PREFIXES',
+    'normalize_route', 'normalize_bgp_path', 'RouteTable'
+]
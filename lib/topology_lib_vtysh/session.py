@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Track the vtysh mode of every enode.
+
+A mode is the list of commands that lead to it from the exec mode, for
+example ``['config terminal', 'interface 1']``. The exec mode is the empty
+list.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from weakref import WeakKeyDictionary
+
+
+_SESSIONS = WeakKeyDictionary()
+
+
+def normalize(command):
+    """
+    Normalize a mode command so equivalent spellings compare equal.
+
+    All abbreviations of ``configure terminal`` are normalized to it, and
+    whitespace is collapsed for any other command.
+
+    :param str command: The command to normalize.
+    :rtype: str
+    :return: The normalized command.
+    """
+    words = command.split()
+    if (
+        len(words) == 2 and
+        'configure'.startswith(words[0]) and
+        'terminal'.startswith(words[1])
+    ):
+        return 'configure terminal'
+    return ' '.join(words)
+
+
+def transition(current, target):
+    """
+    Compute the commands needed to go from a mode to another one.
+
+    The commands the modes have in common are kept, and the rest of the
+    current mode is left with ``exit`` before the rest of the target mode is
+    entered. If the modes have nothing in common, or the current mode is
+    ``[None]`` because it is unknown, ``end`` is used to return to the exec
+    mode first.
+
+    >>> current = ['config terminal', 'interface 1']
+    >>> transition(current, ['conf t', 'vlan 2']) == ['exit', 'vlan 2']
+    True
+    >>> transition(current, []) == ['end']
+    True
+
+    :param list current: The current mode.
+    :param list target: The mode to go to.
+    :rtype: list
+    :return: The commands to send, in order.
+    """
+    common = 0
+    for have, want in zip(current, target):
+        if have is None or normalize(have) != normalize(want):
+            break
+        common += 1
+
+    if common == len(current):
+        return list(target[common:])
+    if common == 0:
+        return ['end'] + list(target)
+    return ['exit'] * (len(current) - common) + list(target[common:])
+
+
+class Session(object):
+    """
+    Vtysh session state of an enode.
+
+    :var list mode: The mode the shell is in, ``[None]`` if it is unknown.
+    :var list stack: The modes required by the contexts currently open, from
+     the outermost to the innermost. ``None`` marks a context that does not
+     care about the mode.
+    :var list batch: Commands queued by the batch context currently open, or
+     ``None`` if no batch is open.
+    """
+    def __init__(self):
+        self.mode = []
+        self.stack = []
+        self.batch = None
+
+    def move(self, target):
+        """
+        Go to the given mode.
+
+        :param list target: The mode to go to.
+        :rtype: list
+        :return: The commands that must be sent to the shell to get there.
+        """
+        commands = transition(self.mode, target)
+        self.mode = list(target)
+        return commands
+
+    def open(self, mode):
+        """
+        Register a context that was just entered.
+
+        When no other context is open the shell is assumed to be in the exec
+        mode.
+
+        :param list mode: The mode the context requires, or ``None`` if it
+         does not care about the mode.
+        :rtype: list
+        :return: The commands that must be sent to the shell.
+        """
+        if not self.stack:
+            self.mode = []
+        self.stack.append(mode)
+        return self.move(mode) if mode is not None else []
+
+    def abort(self):
+        """
+        Unregister the innermost context when the commands to enter it
+        failed.
+
+        The commands may have failed after some of them changed the mode, so
+        the mode of the shell is unknown until the next move, that starts
+        with ``end``. When no other context is open the shell is assumed to
+        be back in the exec mode.
+        """
+        self.stack.pop()
+        self.mode = [None] if self.stack else []
+
+    def close(self, post_commands):
+        """
+        Unregister the innermost context, going back to the mode of the
+        enclosing context.
+
+        :param list post_commands: The post_commands of the context, used if
+         it is the outermost one to return to the exec mode.
+        :rtype: list
+        :return: The commands that must be sent to the shell.
+        """
+        self.stack.pop()
+        if self.stack:
+            target = self.stack[-1]
+            return self.move(target) if target is not None else []
+
+        commands = post_commands or self.move([])
+        self.mode = []
+        return commands
+
+
+class ContextState(object):
+    """
+    Mode and batch state of a context, shared by the contexts of
+    :mod:`topology_lib_vtysh.library` and :mod:`topology_lib_vtysh.aio`.
+
+    These methods only update the session of the enode of the context and
+    return the commands to send, the subclasses send them.
+    """
+
+    _batch = False
+    _queue = None
+    _restore = None
+    _pre_commands = None
+    _post_commands = ()
+
+    def _lines(self, commands):
+        """
+        Render the pre_commands or post_commands of this context.
+        """
+        return [command.format(**self.__dict__) for command in commands]
+
+    def _pending(self, commands):
+        """
+        Queue commands when in batch mode.
+
+        :param list commands: The commands to run.
+        :rtype: list
+        :return: The commands to send now, none in batch mode.
+        """
+        if self._queue is not None:
+            self._queue.extend(commands)
+            return []
+        return commands
+
+    def _open(self, commands):
+        """
+        Register this context in the session of its enode, starting a batch
+        if it is the first context in batch mode.
+
+        :param tuple commands: The pre_commands of the context, or ``None``
+         if the context does not care about the mode.
+        :rtype: list
+        :return: The commands to send to go to the mode of this context.
+        """
+        session = get_session(self.enode)
+        if self._batch and session.batch is None:
+            self._restore = list(session.mode) if session.stack else []
+            session.batch = []
+        self._queue = session.batch
+
+        mode = None if commands is None else self._lines(commands)
+        return self._pending(session.open(mode))
+
+    def _abort(self):
+        """
+        Forget this context when the commands to enter its mode failed.
+
+        The block is not run and the context is not exited, so it is removed
+        from the session before the next context uses it.
+        """
+        session = get_session(self.enode)
+        session.abort()
+        if self._restore is not None:
+            session.batch = None
+        self._queue = self._restore = None
+
+    def _close(self, commands):
+        """
+        Unregister this context, going back to the mode of the enclosing
+        context.
+
+        :param tuple commands: The post_commands of the context.
+        :rtype: list
+        :return: The commands to send to leave the mode of this context.
+        """
+        session = get_session(self.enode)
+        return self._pending(session.close(self._lines(commands)))
+
+    def _flush(self, failed=False):
+        """
+        End the batch if this context started it.
+
+        :param bool failed: True if the block of the context raised, then the
+         batch is dropped.
+        :rtype: tuple
+        :return: The commands of the batch to send, or ``None`` if there is
+         nothing to send, and the commands that go back to the mode the
+         batch ends in if one of them fails.
+        """
+        queue, self._queue = self._queue, None
+        restore, self._restore = self._restore, None
+        if restore is None:
+            return None, None
+
+        session = get_session(self.enode)
+        session.batch = None
+        if failed:
+            session.mode = restore
+            return None, None
+        return queue, transition([None], session.mode)
+
+
+class RangeState(object):
+    """
+    Calls recorded by a range of contexts, shared by the range classes of
+    :mod:`topology_lib_vtysh.library` and :mod:`topology_lib_vtysh.aio`.
+
+    :param list members: Values of the context argument, one per member.
+    """
+
+    context = None
+
+    def __init__(self, enode, members, batch=True):
+        self.enode = enode
+        self.members = [self.context(enode, member) for member in members]
+        self._batch = batch
+        self._calls = []
+
+    def _defer(self, name):
+        """
+        Get a function that records the calls to a method of the context, to
+        apply them to every member when the range exits.
+
+        Arguments are rendered when the function is called, so bad arguments
+        raise at the call.
+
+        :param str name: Name of the method.
+        :rtype: function
+        :raise AttributeError: If the context has no such method.
+        """
+        if name.startswith('_') or not callable(
+            getattr(self.context, name, None)
+        ):
+            raise AttributeError(name)
+
+        render = getattr(self.context, name).render
+
+        def defer(*args, **kwargs):
+            render(self.enode, args, kwargs)
+            self._calls.append((name, args, kwargs))
+        return defer
+
+    def _take(self):
+        """
+        Take the calls recorded since the range was entered.
+
+        :rtype: list
+        :return: ``(name, args, kwargs)`` tuples, in order.
+        """
+        calls, self._calls = self._calls, []
+        return calls
+
+
+def get_session(enode):
+    """
+    Get the session state of an enode, creating it if needed.
+
+    :param enode: Engine node to get the session of.
+    :type enode: topology.platforms.base.BaseNode
+    :rtype: Session
+    :return: The session of the enode.
+    """
+    session = _SESSIONS.get(enode)
+    if session is None:
+        session = _SESSIONS[enode] = Session()
+    return session
+
+
+__all__ = [
+    'normalize', 'transition', 'Session', 'ContextState', 'RangeState',
+    'get_session'
+]
@@ -0,0 +1,823 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Simulated switch, to run the library without a device.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.library import ConfigVlan, show_vlan
+    from topology_lib_vtysh.simulator import SimulatedSwitch
+
+    switches = [SimulatedSwitch('sw{}'.format(index)) for index in range(100)]
+    for switch in switches:
+        with ConfigVlan(switch, '10') as ctx:
+            ctx.no_shutdown()
+        assert show_vlan(switch)['10']['status'] == 'down'
+
+A simulated switch is an engine node that accepts every command of the vtysh
+specification, in the mode the specification defines it for, and answers the
+others as vtysh does, with an unknown command error. The grammar is compiled
+once from the command table of :mod:`topology_lib_vtysh.commands`, and shared
+by all the switches, so many of them can run in one process.
+
+The configuration of the VLANs, interfaces, LAGs, BGP router and neighbors
+and static routes is kept in memory, in ordered dictionaries, so it scales to
+tens of thousands of objects, and is rendered in the formats of the parsers
+by ``show vlan``, ``show lacp aggregates``, ``show running-config``,
+``show ip route``, ``show ipv6 route`` and ``show ip bgp summary``. The other
+commands of the specification are accepted without changing the state of
+the switch, and the other show commands have no output.
+
+Like vtysh, a switch runs every line of a shell call and echoes the commands
+after the first one, so the library sends it batches in a single call.
+
+The library is also available as the ``vtysh`` library of a switch, as for
+the enodes of a topology, see :mod:`topology_lib_vtysh.libs`:
+
+::
+
+    with switch.libs.vtysh.ConfigVlan('10') as ctx:
+        ctx.no_shutdown()
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import re
+from binascii import unhexlify
+from collections import OrderedDict
+from socket import inet_ntop, AF_INET, AF_INET6
+
+from . import commands
+from .dispatch import NAME, TEMPLATE, OPTIONAL
+from .libs import Libs
+from .routes import parse_prefix
+from .session import normalize
+
+
+_PLACEHOLDER = re.compile(r'%\((\w+)\)s|\{(\w+)\}')
+
+UNKNOWN_COMMAND = '% Unknown command.'
+
+# Prompt of the mode of every context
+_PROMPTS = {
+    'Configure': 'config',
+    'RouteMap': 'config-route-map',
+    'ConfigInterface': 'config-if',
+    'ConfigInterfaceVlan': 'config-if-vlan',
+    'ConfigInterfaceLoopback': 'config-loopback-if',
+    'ConfigInterfaceLag': 'config-lag-if',
+    'ConfigInterfaceMgmt': 'config-if-mgmt',
+    'ConfigRouterBgp': 'config-router',
+    'ConfigVlan': 'config-vlan',
+}
+
+
+def _pattern(template, rest=False):
+    """
+    Get the regular expression of a template, with a group per argument.
+    """
+    parts = []
+    end = 0
+    for found in _PLACEHOLDER.finditer(template):
+        parts.append(re.escape(template[end:found.start()]))
+        parts.append('(?P<{}>\\S+)'.format(found.group(1) or found.group(2)))
+        end = found.end()
+    parts.append(re.escape(template[end:]))
+    if rest and end and end == len(template):
+        parts[-2] = parts[-2].replace('\\S+', '.+')
+    return ''.join(parts)
+
+
+def _compile(template, optional=()):
+    """
+    Compile a command of the command table, or a mode command, into a
+    regular expression that matches it with its arguments.
+
+    The last argument of a command that ends with one, and has no optional
+    arguments, takes the rest of the line, as descriptions do. The optional
+    arguments already in the template are ignored.
+    """
+    optional = [
+        suffix for name, suffix in optional
+        if '%({})s'.format(name) not in template
+    ]
+    pattern = _pattern(template, rest=not optional) + ''.join(
+        '(?:{})?'.format(_pattern(suffix)) for suffix in optional
+    )
+    return re.compile(pattern + '$')
+
+
+def _key(command):
+    """
+    Key of a command in the indexes of the grammar, its first word, or its
+    first two words for the ``no`` commands.
+    """
+    words = command.split(' ', 2)
+    if words[0] == 'no' and len(words) > 1:
+        return 'no ' + words[1]
+    return words[0]
+
+
+def _literal(template):
+    return len(_PLACEHOLDER.sub('', template))
+
+
+class _Grammar(object):
+    """
+    Commands of every mode, compiled from the command table.
+
+    :var dict commands: Index of the commands of every context by
+     :func:`_key`, with the root commands under ``None``. Every command is a
+     ``(expression, template)`` tuple, the most specific ones first.
+    :var dict modes: The contexts entered from every context, as
+     ``(expression, context)`` tuples, with the ones entered from the exec
+     mode under ``None``.
+    """
+    def __init__(self):
+        self.commands = {None: self._index(commands.ROOT)}
+        self.modes = {}
+
+        parents = {(): None}
+        for context in commands.CONTEXTS:
+            name, pre_commands = context[0], context[3]
+            self.commands[name] = self._index(context[6])
+            parents[tuple(normalize(pre) for pre in pre_commands)] = name
+
+        for context in commands.CONTEXTS:
+            name, pre_commands = context[0], context[3]
+            pre_commands = [normalize(pre) for pre in pre_commands]
+            parent = parents[tuple(pre_commands[:-1])]
+            self.modes.setdefault(parent, []).append(
+                (_compile(pre_commands[-1]), name, _literal(pre_commands[-1]))
+            )
+        for modes in self.modes.values():
+            modes.sort(key=lambda mode: -mode[2])
+
+    @staticmethod
+    def _index(table):
+        index = {}
+        for command in table:
+            template = command[TEMPLATE]
+            index.setdefault(_key(template), []).append((
+                _compile(template, command[OPTIONAL]), command[NAME],
+                template, _literal(template)
+            ))
+        for candidates in index.values():
+            candidates.sort(key=lambda candidate: -candidate[3])
+        return index
+
+    def match(self, context, command):
+        """
+        Find the command of a context that matches a line.
+
+        :rtype: tuple
+        :return: A ``(template, values)`` tuple with the template of the
+         command and the values of its arguments, or ``None``.
+        """
+        for expression, _, template, _ in self.commands[context].get(
+            _key(command), ()
+        ):
+            found = expression.match(command)
+            if found:
+                return template, found.groupdict()
+        return None
+
+    def mode(self, context, command):
+        """
+        Find the context a line enters from a context.
+
+        :rtype: tuple
+        :return: A ``(context, values)`` tuple with the name of the context
+         and the values of its arguments, or ``None``.
+        """
+        for expression, name, _ in self.modes.get(context, ()):
+            found = expression.match(command)
+            if found:
+                return name, found.groupdict()
+        return None
+
+
+_GRAMMAR = []
+
+
+def _grammar():
+    if not _GRAMMAR:
+        _GRAMMAR.append(_Grammar())
+    return _GRAMMAR[0]
+
+
+def _network(address):
+    """
+    Get the network of an interface address, like ``10.0.0.0/24`` for
+    ``10.0.0.1/24``.
+    """
+    value, length, version = parse_prefix(address)
+    if version == 4:
+        packed = unhexlify('{:08x}'.format(value))
+        return 4, '{}/{}'.format(inet_ntop(AF_INET, packed), length)
+    packed = unhexlify('{:032x}'.format(value))
+    return 6, '{}/{}'.format(inet_ntop(AF_INET6, packed), length)
+
+
+def _interface():
+    return {
+        'shutdown': True, 'routing': True, 'ipv4': [], 'ipv6': [],
+        'access': None, 'trunk': [], 'lag': None,
+    }
+
+
+def _lag():
+    lag = _interface()
+    lag.update({
+        'mode': 'off', 'hash': 'l3-src-dst', 'rate': 'slow',
+        'fallback': False,
+    })
+    return lag
+
+
+class SimulatedSwitch(object):
+    """
+    Engine node of a simulated switch.
+
+    :param str hostname: Name of the switch, shown in its prompt.
+    :param dict ports: Map of the port labels of the switch to its ports,
+     ports ``1`` to ``54`` if not given.
+    :var int round_trips: Number of shell calls the switch answered.
+    :var OrderedDict vlans: The VLANs, by id.
+    :var OrderedDict interfaces: The interfaces configured, by port.
+    :var OrderedDict lags: The LAGs, by number.
+    :var dict bgp: The BGP router, or ``None`` if it is not configured.
+    :var dict routes: The static routes of every IP version, by prefix, as
+     ordered dictionaries of their distance by next hop.
+    """
+    vtysh_batch = True
+
+    def __init__(self, hostname='switch', ports=None):
+        self.hostname = hostname
+        if ports is None:
+            ports = {str(port): str(port) for port in range(1, 55)}
+        self.ports = ports
+        self.libs = Libs(self)
+        self.round_trips = 0
+
+        self.vlans = OrderedDict()
+        self.vlans['1'] = {
+            'name': 'DEFAULT_VLAN_1', 'shutdown': False, 'description': None
+        }
+        self.interfaces = OrderedDict()
+        self.lags = OrderedDict()
+        self.bgp = None
+        self.routes = {4: OrderedDict(), 6: OrderedDict()}
+
+        # The contexts of the current mode, as (name, values) tuples
+        self._mode = []
+
+    def __call__(self, command, shell=None):
+        self.round_trips += 1
+        if shell not in (None, 'vtysh'):
+            return ''
+
+        output = []
+        for index, line in enumerate(command.splitlines()):
+            if index:
+                output.append('{}# {}'.format(self.prompt, line))
+            result = self.run(line)
+            if result:
+                output.append(result)
+        return '\n'.join(output)
+
+    @property
+    def prompt(self):
+        """
+        Prompt of the current mode, like ``switch(config-if)``.
+        """
+        if not self._mode:
+            return self.hostname
+        return '{}({})'.format(
+            self.hostname, _PROMPTS.get(self._mode[-1][0], 'config')
+        )
+
+    def run(self, command):
+        """
+        Run a single command.
+
+        :param str command: The command line.
+        :rtype: str
+        :return: The output of the command.
+        """
+        command = ' '.join(command.split())
+        if not command:
+            return ''
+
+        grammar = _grammar()
+        if command == 'end':
+            del self._mode[:]
+            return ''
+        if command == 'exit':
+            if self._mode:
+                self._mode.pop()
+            return ''
+
+        # As in vtysh, the commands of the parent modes, and the modes
+        # entered from them, are run in them without exiting the current one
+        # first
+        for depth in range(len(self._mode), 0, -1):
+            context, mode = self._mode[depth - 1]
+            found = grammar.match(context, command)
+            if found is not None:
+                template, values = found
+                del self._mode[depth:]
+                handler = _HANDLERS.get(context, {}).get(template)
+                if handler is not None:
+                    handler(self, mode, values)
+                return ''
+
+        normalized = normalize(command)
+        for depth in range(len(self._mode), -1, -1):
+            parent = self._mode[depth - 1][0] if depth else None
+            found = grammar.mode(parent, normalized)
+            if found is not None:
+                name, values = found
+                enter = _ENTER.get(name)
+                if enter is not None:
+                    enter(self, values)
+                del self._mode[depth:]
+                self._mode.append((name, values))
+                return ''
+
+        found = grammar.match(None, command)
+        if found is not None:
+            template, values = found
+            show = _SHOWS.get(template)
+            return show(self, values) if show is not None else ''
+
+        return UNKNOWN_COMMAND
+
+    # Modes
+
+    def _enter_vlan(self, values):
+        vlan_id = values['vlan_id']
+        if vlan_id not in self.vlans:
+            self.vlans[vlan_id] = {
+                'name': 'VLAN{}'.format(vlan_id), 'shutdown': True,
+                'description': None,
+            }
+
+    def _enter_interface(self, values):
+        if values['port'] not in self.interfaces:
+            self.interfaces[values['port']] = _interface()
+
+    def _enter_lag(self, values):
+        if values['lag'] not in self.lags:
+            self.lags[values['lag']] = _lag()
+
+    def _enter_bgp(self, values):
+        if self.bgp is None or self.bgp['asn'] != values['asn']:
+            self.bgp = {
+                'asn': values['asn'], 'router_id': None,
+                'networks': OrderedDict(), 'neighbors': OrderedDict(),
+            }
+
+    def _object(self, mode):
+        """
+        Get the object configured by a context.
+        """
+        if 'vlan_id' in mode:
+            return self.vlans[mode['vlan_id']]
+        if 'port' in mode:
+            return self.interfaces[mode['port']]
+        return self.lags[mode['lag']]
+
+    # Global configuration
+
+    def _no_vlan(self, mode, values):
+        self.vlans.pop(values['vlan_id'], None)
+
+    def _no_lag(self, mode, values):
+        self.lags.pop(values['lag_id'], None)
+
+    def _route(self, mode, values):
+        version = 6 if 'ipv6' in values else 4
+        prefix = values.get('ipv6') or values['ipv4']
+        next_hops = self.routes[version].setdefault(prefix, OrderedDict())
+        next_hops[values['next_hop']] = values['metric'] or '1'
+
+    def _no_route(self, mode, values):
+        version = 6 if 'ipv6' in values else 4
+        prefix = values.get('ipv6') or values['ipv4']
+        next_hops = self.routes[version].get(prefix, {})
+        next_hops.pop(values['next_hop'], None)
+        if not next_hops:
+            self.routes[version].pop(prefix, None)
+
+    def _no_bgp(self, mode, values):
+        if self.bgp is not None and self.bgp['asn'] == values['asn']:
+            self.bgp = None
+
+    # VLANs, interfaces and LAGs
+
+    def _shutdown(self, mode, values):
+        self._object(mode)['shutdown'] = True
+
+    def _no_shutdown(self, mode, values):
+        self._object(mode)['shutdown'] = False
+
+    def _description(self, mode, values):
+        self._object(mode)['description'] = values['description']
+
+    def _no_description(self, mode, values):
+        self._object(mode)['description'] = None
+
+    def _address(self, mode, values):
+        key = 'ipv6' if 'ipv6' in values else 'ipv4'
+        addresses = self._object(mode)[key]
+        if values[key] not in addresses:
+            addresses.insert(0, values[key])
+
+    def _secondary(self, mode, values):
+        key = 'ipv6' if 'ipv6' in values else 'ipv4'
+        addresses = self._object(mode)[key]
+        if values[key] not in addresses:
+            addresses.append(values[key])
+
+    def _no_address(self, mode, values):
+        key = 'ipv6' if 'ipv6' in values else 'ipv4'
+        addresses = self._object(mode)[key]
+        if values[key] in addresses:
+            addresses.remove(values[key])
+
+    def _routing(self, mode, values):
+        self._object(mode)['routing'] = True
+
+    def _no_routing(self, mode, values):
+        self._object(mode)['routing'] = False
+
+    def _access(self, mode, values):
+        self._object(mode)['access'] = values['vlan_id']
+
+    def _no_access(self, mode, values):
+        self._object(mode)['access'] = None
+
+    def _trunk(self, mode, values):
+        trunk = self._object(mode)['trunk']
+        if values['vlan_id'] not in trunk:
+            trunk.append(values['vlan_id'])
+
+    def _no_trunk(self, mode, values):
+        trunk = self._object(mode)['trunk']
+        if values['vlan_id'] in trunk:
+            trunk.remove(values['vlan_id'])
+
+    def _lag_member(self, mode, values):
+        self._object(mode)['lag'] = values['lag_id']
+
+    def _no_lag_member(self, mode, values):
+        self._object(mode)['lag'] = None
+
+    # BGP
+
+    def _router_id(self, mode, values):
+        self.bgp['router_id'] = values['id']
+
+    def _no_router_id(self, mode, values):
+        self.bgp['router_id'] = None
+
+    def _bgp_network(self, mode, values):
+        self.bgp['networks'][values['network']] = True
+
+    def _no_bgp_network(self, mode, values):
+        self.bgp['networks'].pop(values['network'], None)
+
+    def _neighbor(self, mode, values):
+        neighbors = self.bgp['neighbors']
+        neighbor = neighbors.setdefault(values['ip'], {
+            'description': None, 'shutdown': False
+        })
+        neighbor['remote_as'] = values['asn']
+
+    def _no_neighbor(self, mode, values):
+        self.bgp['neighbors'].pop(values['ip'], None)
+
+    def _neighbor_description(self, mode, values):
+        neighbor = self.bgp['neighbors'].get(values['ip'])
+        if neighbor is not None:
+            neighbor['description'] = values.get('text')
+
+    # Show commands
+
+    def _show_vlan(self, values):
+        members = {}
+        for port, interface in self.interfaces.items():
+            for vlan_id in [interface['access']] + interface['trunk']:
+                members.setdefault(vlan_id, []).append(port)
+        for lag_id, lag in self.lags.items():
+            for vlan_id in [lag['access']] + lag['trunk']:
+                members.setdefault(vlan_id, []).append('lag' + lag_id)
+
+        vlans = self.vlans.items()
+        if values['vlanid']:
+            vlan = self.vlans.get(values['vlanid'])
+            if vlan is None:
+                return 'VLAN {} has not been configured'.format(
+                    values['vlanid']
+                )
+            vlans = [(values['vlanid'], vlan)]
+
+        lines = [
+            '-' * 80,
+            'VLAN    Name      Status   Reason         Reserved       Ports',
+            '-' * 80,
+        ]
+        for vlan_id, vlan in vlans:
+            ports = members.get(vlan_id, ())
+            if vlan['shutdown']:
+                status, reason = 'down', 'admin_down'
+            elif ports or vlan_id == '1':
+                status, reason = 'up', 'ok'
+            else:
+                status, reason = 'down', 'no_member_port'
+            lines.append('{:<7} {:<9} {:<8} {:<14} {:<14} {}'.format(
+                vlan_id, vlan['name'], status, reason, '', ', '.join(ports)
+            ).rstrip())
+        return '\n'.join(lines)
+
+    def _show_lacp_aggregates(self, values):
+        lags = self.lags.items()
+        if values['lag']:
+            lag_id = values['lag'].replace('lag', '')
+            lags = [
+                (key, lag) for key, lag in lags if key == lag_id
+            ]
+
+        members = {}
+        for port, interface in self.interfaces.items():
+            if interface['lag'] is not None:
+                members.setdefault(interface['lag'], []).append(port)
+
+        lines = []
+        for lag_id, lag in lags:
+            lines.extend([
+                'Aggregate-name        : lag{}'.format(lag_id),
+                'Aggregated-interfaces : {}'.format(
+                    ' '.join(members.get(lag_id, ()))
+                ),
+                'Heartbeat rate        : {}'.format(lag['rate']),
+                'Fallback              : {}'.format(
+                    'true' if lag['fallback'] else 'false'
+                ),
+                'Hash                  : {}'.format(lag['hash']),
+                'Aggregate mode        : {}'.format(lag['mode']),
+                '',
+            ])
+        return '\n'.join(lines)
+
+    def _connected(self, version):
+        """
+        Iterate over the routes to the networks of the addresses of the
+        interfaces that are up.
+        """
+        key = 'ipv4' if version == 4 else 'ipv6'
+        for port, interface in self.interfaces.items():
+            if interface['shutdown'] or not interface['routing']:
+                continue
+            for address in interface[key]:
+                yield _network(address)[1], port
+
+    def _show_route(self, version):
+        lines = [
+            'Displaying ipv{} routes selected for forwarding'.format(version),
+            '',
+            '\'[x/y]\' denotes [distance/metric]',
+            '',
+        ]
+        for network, port in self._connected(version):
+            lines.append('{},  1 unicast next-hops'.format(network))
+            lines.append('\tvia  {},  [0/0],  connected'.format(port))
+        for prefix, next_hops in self.routes[version].items():
+            lines.append('{},  {} unicast next-hops'.format(
+                prefix, len(next_hops)
+            ))
+            for next_hop, distance in next_hops.items():
+                lines.append('\tvia  {},  [{}/0],  static'.format(
+                    next_hop, distance
+                ))
+        return '\n'.join(lines)
+
+    def _show_ip_route(self, values):
+        return self._show_route(4)
+
+    def _show_ipv6_route(self, values):
+        return self._show_route(6)
+
+    def _show_ip_bgp_summary(self, values):
+        bgp = self.bgp
+        if bgp is None:
+            return 'No BGP process is configured'
+
+        lines = [
+            'BGP router identifier {}, local AS number {}'.format(
+                bgp['router_id'] or '0.0.0.0', bgp['asn']
+            ),
+            'RIB entries {}'.format(len(bgp['networks'])),
+            'Peers {}'.format(len(bgp['neighbors'])),
+            '',
+            'Neighbor             AS MsgRcvd MsgSent Up/Down  State',
+        ]
+        for ip, neighbor in bgp['neighbors'].items():
+            lines.append('{:<17} {:>5}       0       0 never  {:>14}'.format(
+                ip, neighbor['remote_as'],
+                'Idle' if neighbor['shutdown'] else 'Active'
+            ))
+        return '\n'.join(lines)
+
+    def _show_running_config(self, values):
+        lines = ['Current configuration:', '!', '!', '!']
+
+        for vlan_id, vlan in self.vlans.items():
+            lines.append('vlan {}'.format(vlan_id))
+            lines.append('    {}shutdown'.format(
+                '' if vlan['shutdown'] else 'no '
+            ))
+            if vlan['description'] is not None:
+                lines.append('    description {}'.format(vlan['description']))
+
+        interfaces = [
+            ('interface {}'.format(port), interface)
+            for port, interface in self.interfaces.items()
+        ] + [
+            ('interface lag {}'.format(lag_id), lag)
+            for lag_id, lag in self.lags.items()
+        ]
+        for header, interface in interfaces:
+            lines.append(header)
+            lines.append('    {}shutdown'.format(
+                '' if interface['shutdown'] else 'no '
+            ))
+            if not interface['routing']:
+                lines.append('    no routing')
+            for key, command in (('ipv4', 'ip'), ('ipv6', 'ipv6')):
+                for index, address in enumerate(interface[key]):
+                    lines.append('    {} address {}{}'.format(
+                        command, address, ' secondary' if index else ''
+                    ))
+            if interface['access'] is not None:
+                lines.append('    vlan access {}'.format(interface['access']))
+            for vlan_id in interface['trunk']:
+                lines.append('    vlan trunk allowed {}'.format(vlan_id))
+            if interface['lag'] is not None:
+                lines.append('    lag {}'.format(interface['lag']))
+            if 'mode' in interface and interface['mode'] != 'off':
+                lines.append('    lacp mode {}'.format(interface['mode']))
+
+        for version, command in ((4, 'ip'), (6, 'ipv6')):
+            for prefix, next_hops in self.routes[version].items():
+                for next_hop, distance in next_hops.items():
+                    lines.append('{} route {} {}{}'.format(
+                        command, prefix, next_hop,
+                        '' if distance == '1' else ' ' + distance
+                    ))
+
+        # The parser takes everything after the router as its section
+        bgp = self.bgp
+        if bgp is not None:
+            lines.append('!')
+            lines.append('router bgp {}'.format(bgp['asn']))
+            if bgp['router_id'] is not None:
+                lines.append('     bgp router-id {}'.format(bgp['router_id']))
+            for network in bgp['networks']:
+                lines.append('     network {}'.format(network))
+            for ip, neighbor in bgp['neighbors'].items():
+                lines.append('     neighbor {} remote-as {}'.format(
+                    ip, neighbor['remote_as']
+                ))
+                if neighbor['description'] is not None:
+                    lines.append('     neighbor {} description {}'.format(
+                        ip, neighbor['description']
+                    ))
+                if neighbor['shutdown']:
+                    lines.append('     neighbor {} shutdown'.format(ip))
+        lines.append('!')
+        return '\n'.join(lines)
+
+
+def _lag_setting(key, value):
+    def setting(switch, mode, values):
+        switch._object(mode)[key] = value
+    return setting
+
+
+def _neighbor_setting(key, value):
+    def setting(switch, mode, values):
+        neighbor = switch.bgp['neighbors'].get(values['ip'])
+        if neighbor is not None:
+            neighbor[key] = value
+    return setting
+
+
+_S = SimulatedSwitch
+
+_ENTER = {
+    'ConfigVlan': _S._enter_vlan,
+    'ConfigInterface': _S._enter_interface,
+    'ConfigInterfaceLag': _S._enter_lag,
+    'ConfigRouterBgp': _S._enter_bgp,
+}
+
+_ADDRESSES = {
+    'ip address %(ipv4)s': _S._address,
+    'no ip address %(ipv4)s': _S._no_address,
+    'ip address %(ipv4)s secondary': _S._secondary,
+    'no ip address %(ipv4)s secondary': _S._no_address,
+    'ipv6 address %(ipv6)s': _S._address,
+    'no ipv6 address %(ipv6)s': _S._no_address,
+    'ipv6 address %(ipv6)s secondary': _S._secondary,
+    'no ipv6 address %(ipv6)s secondary': _S._no_address,
+    'shutdown': _S._shutdown,
+    'no shutdown': _S._no_shutdown,
+    'routing': _S._routing,
+    'no routing': _S._no_routing,
+    'vlan access %(vlan_id)s': _S._access,
+    'no vlan access %(vlan_id)s': _S._no_access,
+    'vlan trunk allowed %(vlan_id)s': _S._trunk,
+    'no vlan trunk allowed %(vlan_id)s': _S._no_trunk,
+}
+
+# Handlers of the commands that change the state of the switch, by context
+# and template
+_HANDLERS = {
+    'Configure': {
+        'no vlan %(vlan_id)s': _S._no_vlan,
+        'no interface lag %(lag_id)s': _S._no_lag,
+        'ip route %(ipv4)s %(next_hop)s': _S._route,
+        'no ip route %(ipv4)s %(next_hop)s': _S._no_route,
+        'ipv6 route %(ipv6)s %(next_hop)s': _S._route,
+        'no ipv6 route %(ipv6)s %(next_hop)s': _S._no_route,
+        'no router bgp %(asn)s': _S._no_bgp,
+    },
+    'ConfigVlan': {
+        'shutdown': _S._shutdown,
+        'no shutdown': _S._no_shutdown,
+        'description %(description)s': _S._description,
+        'no description %(description)s': _S._no_description,
+    },
+    'ConfigInterface': dict(_ADDRESSES, **{
+        'lag %(lag_id)s': _S._lag_member,
+        'no lag %(lag_id)s': _S._no_lag_member,
+    }),
+    'ConfigInterfaceLag': dict(_ADDRESSES, **{
+        'lacp mode passive': _lag_setting('mode', 'passive'),
+        'no lacp mode passive': _lag_setting('mode', 'off'),
+        'lacp mode active': _lag_setting('mode', 'active'),
+        'no lacp mode active': _lag_setting('mode', 'off'),
+        'lacp fallback': _lag_setting('fallback', True),
+        'hash l2-src-dst': _lag_setting('hash', 'l2-src-dst'),
+        'hash l3-src-dst': _lag_setting('hash', 'l3-src-dst'),
+        'hash l4-src-dst': _lag_setting('hash', 'l4-src-dst'),
+        'lacp rate fast': _lag_setting('rate', 'fast'),
+        'no lacp rate fast': _lag_setting('rate', 'slow'),
+    }),
+    'ConfigRouterBgp': {
+        'bgp router-id %(id)s': _S._router_id,
+        'no bgp router-id %(id)s': _S._no_router_id,
+        'network %(network)s': _S._bgp_network,
+        'no network %(network)s': _S._no_bgp_network,
+        'neighbor %(ip)s remote-as %(asn)s': _S._neighbor,
+        'no neighbor %(ip)s': _S._no_neighbor,
+        'neighbor %(ip)s description %(text)s': _S._neighbor_description,
+        'no neighbor %(ip)s description': _S._neighbor_description,
+        'neighbor %(ip)s shutdown': _neighbor_setting('shutdown', True),
+        'no neighbor %(ip)s shutdown': _neighbor_setting('shutdown', False),
+    },
+}
+
+_SHOWS = {
+    'show vlan': _S._show_vlan,
+    'show lacp aggregates': _S._show_lacp_aggregates,
+    'show ip route': _S._show_ip_route,
+    'show ipv6 route': _S._show_ipv6_route,
+    'show ip bgp summary': _S._show_ip_bgp_summary,
+    'show running-config': _S._show_running_config,
+}
+
+del _S
+
+
+__all__ = ['UNKNOWN_COMMAND', 'SimulatedSwitch']
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Run several show functions of the library together.
+
+Usage:
+
+::
+
+    from topology_lib_vtysh.snapshot import snapshot
+
+    result = snapshot(enode, [
+        'show_vlan',
+        ('show_interface', '1'),
+        'show_ip_bgp_summary',
+    ])
+    vlans = result['show vlan']
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from functools import partial
+from collections import OrderedDict
+
+from six import string_types
+
+from . import parser, library
+from .batch import iter_batch
+from .exceptions import determine_exception
+
+
+def _resolve(enode, function):
+    """
+    Get a function of the library and the arguments that the partials
+    wrapping it give to it. An enode given first to a partial is not an
+    argument of the command, so it is dropped.
+    """
+    if isinstance(function, string_types):
+        function = getattr(library, function)
+
+    args = ()
+    kwargs = {}
+    while isinstance(function, partial):
+        args = function.args + args
+        keywords = dict(function.keywords or {})
+        keywords.update(kwargs)
+        kwargs = keywords
+        function = function.func
+
+    if args and args[0] is enode:
+        args = args[1:]
+    return function, args, kwargs
+
+
+def render(enode, function, *args, **kwargs):
+    """
+    Render the vtysh command a library function would run, without running
+    it.
+
+    :param enode: Engine node the command is meant for.
+    :type enode: topology.platforms.base.BaseNode
+    :param function: Root function of the library, or its name. A partial
+     of the function gives its arguments to it too, before the others.
+    :rtype: str
+    :return: The command the function would send to the shell.
+    :raise ValueError: If the function is not a root function of the
+     library.
+    """
+    function, bound, keywords = _resolve(enode, function)
+    render = getattr(function, 'render', None)
+    if render is None:
+        raise ValueError(
+            '{} is not a root function of the library'.format(
+                getattr(function, '__name__', function)
+            )
+        )
+    keywords.update(kwargs)
+    return render(enode, bound + args, keywords)
+
+
+def snapshot(enode, calls):
+    """
+    Run several root functions of the library together.
+
+    The commands are sent as one batch, in a single shell call if the enode
+    supports it (see :func:`topology_lib_vtysh.batch.supports_batch`), and
+    the output of every command is parsed with the parser of the function
+    that issued it.
+
+    :param enode: Engine node to communicate with.
+    :type enode: topology.platforms.base.BaseNode
+    :param list calls: Functions to run. Every item is either a root function
+     of :mod:`topology_lib_vtysh.library` (or its name, or a partial of it)
+     or a tuple with the function followed by its arguments.
+    :rtype: OrderedDict
+    :return: A dictionary mapping every command to the value the function
+     would have returned for it.
+    """
+    functions = []
+    commands = []
+    for call in calls:
+        if not isinstance(call, (tuple, list)):
+            call = (call,)
+        functions.append(_resolve(enode, call[0])[0])
+        commands.append(render(enode, call[0], *call[1:]))
+
+    result = OrderedDict()
+    if not commands:
+        return result
+
+    segments = iter_batch(enode, commands, name='snapshot')
+    for function, (command, segment) in zip(functions, segments):
+        parse = getattr(parser, 'parse_' + function.__name__, None)
+        if parse is not None:
+            result[command] = parse(segment)
+            continue
+        if segment:
+            raise determine_exception(segment)(segment, command=command)
+        result[command] = None
+
+    return result
+
+
+__all__ = ['render', 'snapshot']
@@ -16,7 +16,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from sys import version_info
+
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 
 
 def read(filename):
@@ -57,6 +60,22 @@ def find_requirements(filename):
     return requirements
 
 
+class BuildPy(build_py):
+    """
+    Leave out the modules that require a newer Python than the one that
+    builds the package.
+    """
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if version_info < (3, 5):
+            # The asyncio library uses the async syntax of Python 3.5
+            modules = [
+                (pkg, module, path) for pkg, module, path in modules
+                if (pkg, module) != ('topology_lib_vtysh', 'aio')
+            ]
+        return modules
+
+
 setup(
     name='topology_lib_vtysh',
     version=find_version('lib/topology_lib_vtysh/__init__.py'),
@@ -65,6 +84,9 @@ setup(
 
     # Dependencies
     install_requires=find_requirements('requirements.txt'),
+    extras_require={
+        'numpy': ['numpy'],
+    },
 
     # Metadata
     author='Hewlett Packard Enterprise Development LP',
@@ -88,6 +110,8 @@ setup(
         'Programming Language :: Python :: 3.4',
     ],
 
+    cmdclass={'build_py': BuildPy},
+
     # Entry points
     entry_points={
         'topology_library_10': [
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Shared fixtures for the topology_lib_vtysh test suite.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import pytest
+
+
+class FakeCommonLib(object):
+    """
+    Minimal stand-in for the ``common`` library of an enode.
+    """
+    def __init__(self, enode):
+        self.enode = enode
+
+    def assert_batch(self, commands, replace=None, shell=None):
+        for command in commands.splitlines():
+            command = command.strip()
+            if not command:
+                continue
+            if replace is not None:
+                command = command.format(**replace)
+            assert not self.enode(command, shell=shell)
+
+
+class FakeLibs(object):
+    def __init__(self, enode):
+        self.common = FakeCommonLib(enode)
+
+
+class FakeEnode(object):
+    """
+    Engine node that records every shell call it gets.
+
+    ``responses`` maps commands to their output. Like the shells of topology,
+    every call is answered with the output of a single command, up to its
+    prompt and without the echo of the command.
+    """
+    def __init__(self):
+        self.ports = {'1': '1', '2': '2', '3': '3', 'p4': '4'}
+        self.libs = FakeLibs(self)
+        self.responses = {}
+        self.calls = []
+
+    def __call__(self, command, shell=None):
+        self.calls.append(command)
+        return self.responses.get(command, '')
+
+
+class BatchEnode(FakeEnode):
+    """
+    Engine node that runs several commands sent in a single call.
+
+    The commands after the first one are echoed after a prompt the same way
+    the vtysh shell does.
+    """
+    vtysh_batch = True
+
+    def __call__(self, command, shell=None):
+        self.calls.append(command)
+        output = []
+        for index, line in enumerate(command.splitlines()):
+            if index:
+                output.append('switch# {}'.format(line))
+            if self.responses.get(line):
+                output.append(self.responses[line])
+        return '\n'.join(output)
+
+
+@pytest.fixture
+def enode():
+    return FakeEnode()
+
+
+@pytest.fixture
+def batch_enode():
+    return BatchEnode()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the asyncio library.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import asyncio
+
+from pytest import raises
+
+from conftest import FakeEnode, BatchEnode
+from topology_lib_vtysh.budget import RoundTripBudget, RoundTripBudgetExceeded
+from topology_lib_vtysh.exceptions import VtyshException
+from topology_lib_vtysh.aio import (
+    show_vlan, ConfigInterface, ConfigSession, ConfigVlan
+)
+
+
+class AsyncEnode(FakeEnode):
+    async def __call__(self, command, shell=None):
+        await asyncio.sleep(0)
+        return super(AsyncEnode, self).__call__(command, shell=shell)
+
+
+class AsyncBatchEnode(BatchEnode):
+    async def __call__(self, command, shell=None):
+        await asyncio.sleep(0)
+        return super(AsyncBatchEnode, self).__call__(command, shell=shell)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_show():
+    enode = AsyncEnode()
+
+    assert run(show_vlan(enode, '10')) == {}
+    assert enode.calls == ['show vlan 10']
+
+
+def configure(enode):
+    async def configure():
+        async with ConfigSession(enode, batch=True):
+            async with ConfigInterface(enode, 'p4') as ctx:
+                await ctx.no_shutdown()
+            async with ConfigVlan(enode, '2') as ctx:
+                await ctx.shutdown()
+
+    run(configure())
+
+
+def test_contexts():
+    enode = AsyncEnode()
+    configure(enode)
+
+    assert enode.calls == [
+        'config terminal',
+        'interface 4',
+        'no shutdown',
+        'exit',
+        'vlan 2',
+        'shutdown',
+        'end'
+    ]
+
+
+def test_contexts_single_call():
+    enode = AsyncBatchEnode()
+    configure(enode)
+
+    assert enode.calls == [
+        'config terminal\n'
+        'interface 4\n'
+        'no shutdown\n'
+        'exit\n'
+        'vlan 2\n'
+        'shutdown\n'
+        'end'
+    ]
+
+
+def test_batch_error():
+    enode = AsyncEnode()
+    enode.responses['interface 9'] = '% Unknown command.'
+
+    async def configure():
+        async with ConfigInterface(enode, '9', batch=True) as ctx:
+            await ctx.no_shutdown()
+
+    with raises(VtyshException) as excinfo:
+        run(configure())
+
+    assert excinfo.value.command == 'interface 9'
+    assert enode.calls == ['config terminal', 'interface 9', 'end']
+
+
+def test_batch_budget():
+    enode = AsyncEnode()
+
+    async def configure():
+        async with ConfigInterface(enode, '1', batch=True) as ctx:
+            await ctx.no_shutdown()
+
+    with raises(RoundTripBudgetExceeded):
+        with RoundTripBudget(enode, 1):
+            run(configure())
+
+    assert enode.calls == ['config terminal', 'interface 1', 'end']
+
+
+def test_many_enodes():
+    enodes = [AsyncEnode() for _ in range(100)]
+
+    async def poll():
+        return await asyncio.gather(*(show_vlan(enode) for enode in enodes))
+
+    assert run(poll()) == [{}] * 100
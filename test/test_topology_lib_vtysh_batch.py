@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the vtysh batch mode.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.batch import split_output, supports_batch
+from topology_lib_vtysh.exceptions import VtyshException
+from topology_lib_vtysh.library import (
+    Configure, ConfigInterface, ConfigInterfaceRange, ConfigVlan,
+    ConfigVlanRange
+)
+
+
+def test_split_output():
+    commands = ['vlan 10', 'no shutdown', 'name test']
+    output = """\
+switch(config-vlan)# no shutdown
+% Unknown command.
+switch(config-vlan)# name test
+"""
+
+    assert split_output(commands, output) == [
+        ('vlan 10', ''),
+        ('no shutdown', '% Unknown command.'),
+        ('name test', ''),
+    ]
+
+
+def test_batch(enode):
+    with ConfigInterface(enode, 'p4', batch=True) as ctx:
+        ctx.no_shutdown()
+        ctx.lldp_transmission()
+        assert not enode.calls
+
+    assert enode.calls == [
+        'config terminal',
+        'interface 4',
+        'no shutdown',
+        'lldp transmission',
+        'end'
+    ]
+
+
+def test_batch_single_call(batch_enode):
+    assert supports_batch(batch_enode)
+
+    with ConfigInterface(batch_enode, 'p4', batch=True) as ctx:
+        ctx.no_shutdown()
+        ctx.lldp_transmission()
+        assert not batch_enode.calls
+
+    assert batch_enode.calls == [
+        'config terminal\n'
+        'interface 4\n'
+        'no shutdown\n'
+        'lldp transmission\n'
+        'end'
+    ]
+
+
+def test_batch_error(enode):
+    enode.responses['lldp transmission'] = 'Unknown command'
+
+    with raises(VtyshException) as excinfo:
+        with ConfigInterface(enode, '1', batch=True) as ctx:
+            ctx.lldp_transmission()
+            ctx.no_shutdown()
+
+    assert excinfo.value.command == 'lldp transmission'
+    assert excinfo.value.output == 'Unknown command'
+    # The batch stops at the error and goes back to the exec mode
+    assert enode.calls == [
+        'config terminal', 'interface 1', 'lldp transmission', 'end'
+    ]
+
+
+def test_batch_error_nested(enode):
+    enode.responses['lldp transmission'] = 'Unknown command'
+
+    with Configure(enode):
+        with raises(VtyshException):
+            with ConfigInterface(enode, '1', batch=True) as ctx:
+                ctx.lldp_transmission()
+                ctx.no_shutdown()
+
+    # The enclosing context gets its mode back before the error is raised
+    assert enode.calls == [
+        'configure terminal',
+        'interface 1',
+        'lldp transmission',
+        'end',
+        'configure terminal',
+        'end'
+    ]
+
+
+def test_batch_single_call_error(batch_enode):
+    batch_enode.responses['lldp transmission'] = 'Unknown command'
+
+    with raises(VtyshException) as excinfo:
+        with ConfigInterface(batch_enode, '1', batch=True) as ctx:
+            ctx.no_shutdown()
+            ctx.lldp_transmission()
+
+    assert excinfo.value.command == 'lldp transmission'
+    assert excinfo.value.output == 'Unknown command'
+    assert len(batch_enode.calls) == 1
+
+
+def test_batch_discarded_on_error(enode):
+    with raises(RuntimeError):
+        with ConfigInterface(enode, '1', batch=True) as ctx:
+            ctx.no_shutdown()
+            raise RuntimeError()
+
+    assert not enode.calls
+
+
+def test_interface_range(batch_enode):
+    with ConfigInterfaceRange(batch_enode, ['1', 'p4']) as ctx:
+        ctx.no_shutdown()
+        ctx.lldp_transmission()
+        assert not batch_enode.calls
+
+    assert batch_enode.calls == [
+        'config terminal\n'
+        'interface 1\n'
+        'no shutdown\n'
+        'lldp transmission\n'
+        'exit\n'
+        'interface 4\n'
+        'no shutdown\n'
+        'lldp transmission\n'
+        'end'
+    ]
+
+
+def test_vlan_range(batch_enode):
+    with ConfigVlanRange(batch_enode, range(1, 4095)):
+        pass
+
+    assert len(batch_enode.calls) == 1
+    assert batch_enode.calls[0].count('\nvlan ') == 4094
+
+
+def test_range_bad_arguments(enode):
+    with raises(TypeError):
+        with ConfigInterfaceRange(enode, ['1', '2']) as ctx:
+            ctx.no_shutdown('bogus')
+
+    # The range left the session, so the next context is sent
+    with ConfigVlan(enode, '10') as ctx:
+        ctx.no_shutdown()
+
+    assert enode.calls == ['config terminal', 'vlan 10', 'no shutdown', 'end']
+
+
+def test_range_error(enode):
+    enode.responses['no shutdown'] = '% Unknown command.'
+
+    with raises(VtyshException):
+        with ConfigInterfaceRange(enode, ['1', '2'], batch=False) as ctx:
+            ctx.no_shutdown()
+
+    assert enode.calls == [
+        'config terminal', 'interface 1', 'no shutdown', 'end'
+    ]
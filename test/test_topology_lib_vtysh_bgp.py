@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the BGP tables indexed by AS number.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from random import Random
+
+from topology_lib_vtysh.bgp import BgpTable, parse_as_path
+from topology_lib_vtysh.parser import iter_show_ip_bgp
+
+
+IP_BGP = """\
+*> 10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i
+*  10.2.0.2/32   20.1.1.10  0   200 0   65000 64100 i
+*> 10.2.0.3/32   20.1.1.1   5   150 10  65000 {64101,64102} ?
+*> 10.2.0.4/32   20.1.1.1   0   0   0   65000 64100 64100 i
+*> 10.3.0.0/16   0.0.0.0    0   0   32768   i
+"""
+
+
+def test_parse_as_path():
+    assert parse_as_path('65000 64100 i') == ((65000, 64100), 'i')
+    assert parse_as_path('65000 {64101,64102} ?') == (
+        (65000, 64101, 64102), '?'
+    )
+    assert parse_as_path('i') == ((), 'i')
+    assert parse_as_path('') == ((), None)
+
+
+def test_bgp_table():
+    table = BgpTable(iter_show_ip_bgp(IP_BGP))
+    assert len(table) == 5
+    assert table[4]['network'] == '10.3.0.0/16'
+
+    # Entries with the same path share its tuple
+    assert table.as_path(0) == (65000, 64100)
+    assert table.as_path(1) is table.as_path(0)
+    assert len(table.as_paths) == 4
+
+    assert table.indexes_by_origin(64100) == [0, 1, 3]
+    assert table.prefixes_by_origin(64100) == ['10.2.0.2/32', '10.2.0.4/32']
+    assert table.prefixes_by_origin(64102) == ['10.2.0.3/32']
+    assert table.prefixes_by_origin(65000) == []
+    assert table.prefixes_by_origin(1) == []
+
+    # Prepending the origin AS does not make it a transit one
+    assert table.prefixes_by_transit(64100) == []
+    assert table.indexes_by_transit(65000) == [0, 1, 2, 3]
+    assert table.prefixes_by_transit(64101) == ['10.2.0.3/32']
+
+    table.add({'network': '10.4.0.0/16', 'path': '65001 64100 i'})
+    assert table.prefixes_by_origin(64100)[-1] == '10.4.0.0/16'
+    assert table.prefixes_by_transit(65001) == ['10.4.0.0/16']
+
+
+def test_bgp_table_random():
+    random = Random(19)
+    numbers = list(range(64000, 64020))
+
+    paths = []
+    for index in range(1000):
+        path = random.sample(numbers, random.randint(1, 5))
+        paths.append({
+            'network': '10.{}.{}.0/24'.format(index // 256, index % 256),
+            'path': ' '.join(str(number) for number in path) + ' i',
+        })
+    table = BgpTable(paths)
+    assert len(table.as_paths) <= len(paths)
+
+    # Same answers as going over all the paths
+    for number in numbers:
+        parsed = [parse_as_path(path['path'])[0] for path in paths]
+        assert table.indexes_by_origin(number) == [
+            index for index, path in enumerate(parsed) if path[-1] == number
+        ]
+        assert table.indexes_by_transit(number) == [
+            index for index, path in enumerate(parsed)
+            if number in path and path[-1] != number
+        ]
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the round trip counters and budgets.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.budget import (
+    RoundTripBudget, RoundTripBudgetExceeded, enable_counter,
+    disable_counter, get_counter, template
+)
+from topology_lib_vtysh.cache import enable_cache
+from topology_lib_vtysh.instrument import get_hooks
+from topology_lib_vtysh.library import (
+    show_running_config, ConfigInterface, ConfigVlan
+)
+
+
+def test_template():
+    assert template('show_running_config') == 'show running-config'
+    assert template('ConfigInterface.no_shutdown') == 'no shutdown'
+    assert template('ConfigInterface.vlan_access') == 'vlan access {vlan_id}'
+    assert template('show_interface') == 'show interface {port}'
+    assert template('ConfigInterface') == 'ConfigInterface mode'
+    assert template('batch') == 'batch'
+
+
+def test_counter(enode):
+    assert get_counter(enode) is None
+    counter = enable_counter(enode)
+    assert enable_counter(enode) is counter
+    assert get_counter(enode) is counter
+
+    show_running_config(enode)
+    with ConfigInterface(enode, '1') as ctx:
+        ctx.no_shutdown()
+        ctx.shutdown()
+    with ConfigVlan(enode, '2', batch=True) as ctx:
+        ctx.no_shutdown()
+
+    # Results served from the cache are not round trips
+    enable_cache(enode)
+    show_running_config(enode)
+    show_running_config(enode)
+
+    assert counter.total == len(enode.calls) == 11
+    assert counter.by_template() == {
+        'show running-config': 2,
+        'ConfigInterface mode': 3,
+        'no shutdown': 1,
+        'shutdown': 1,
+        'batch': 4,
+    }
+
+    disable_counter(enode)
+    assert get_counter(enode) is None
+    assert not get_hooks()
+
+
+def test_budget(enode, batch_enode):
+    with RoundTripBudget(batch_enode, 2) as budget:
+        show_running_config(batch_enode)
+        with ConfigVlan(batch_enode, '2', batch=True) as ctx:
+            ctx.no_shutdown()
+    assert budget.round_trips.total == 2
+
+    with raises(RoundTripBudgetExceeded) as excinfo:
+        with RoundTripBudget(enode, 2):
+            for _ in range(10):
+                show_running_config(enode)
+
+    # The first call over the budget raises
+    assert len(enode.calls) == 3
+    assert excinfo.value.round_trips.total == 3
+    assert str(excinfo.value).splitlines()[1:] == [
+        '         3  show running-config'
+    ]
+    assert not get_hooks()
+
+
+def test_nested_budgets(enode):
+    with raises(RoundTripBudgetExceeded) as excinfo:
+        with RoundTripBudget(enode, 10) as outer:
+            with RoundTripBudget(enode, 1):
+                with ConfigInterface(enode, '1') as ctx:
+                    ctx.no_shutdown()
+
+    assert excinfo.value.budget == 1
+    # The mode commands go over the inner budget when the context is entered,
+    # so its block does not run
+    assert outer.round_trips.by_name == {'ConfigInterface': 2}
+
+
+def test_budget_batch(enode):
+    with raises(RoundTripBudgetExceeded):
+        with RoundTripBudget(enode, 2):
+            with ConfigInterface(enode, '1', batch=True) as ctx:
+                ctx.no_shutdown()
+
+    # The batch stops at the call over the budget, and goes back to the exec
+    # mode before raising
+    assert enode.calls == [
+        'config terminal', 'interface 1', 'no shutdown', 'end'
+    ]
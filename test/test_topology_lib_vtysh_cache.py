@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the show functions result cache.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from topology_lib_vtysh.cache import ResultCache, enable_cache
+from topology_lib_vtysh.library import show_vlan, ConfigVlan
+
+
+def test_result_cache():
+    cache = ResultCache(ttl=60, maxsize=2)
+    cache.put('show a', 1)
+    cache.put('show b', 2)
+    assert cache.get('show a') == (True, 1)
+
+    # 'show b' is the least recently used one
+    cache.put('show c', 3)
+    assert cache.get('show b') == (False, None)
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    expired = ResultCache(ttl=-1)
+    expired.put('show a', 1)
+    assert expired.get('show a') == (False, None)
+
+
+def test_cache_disabled(enode):
+    show_vlan(enode)
+    show_vlan(enode)
+
+    assert enode.calls == ['show vlan', 'show vlan']
+
+
+def test_cache_invalidation(enode):
+    cache = enable_cache(enode, ttl=60)
+
+    show_vlan(enode)
+    show_vlan(enode)
+    show_vlan(enode, '10')
+    assert enode.calls == ['show vlan', 'show vlan 10']
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    with ConfigVlan(enode, '10') as ctx:
+        ctx.no_shutdown()
+    assert not len(cache)
+
+    show_vlan(enode)
+    assert enode.calls[-1] == 'show vlan'
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the columnar BGP tables.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises, importorskip
+
+from topology_lib_vtysh.columns import BgpColumns
+from topology_lib_vtysh.parser import parse_show_ip_bgp, parse_show_ipv6_bgp
+
+
+IP_BGP = """\
+*> 10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i
+*  10.2.0.2/32   20.1.1.10  0   200 0   65000 64100 i
+*> 10.2.0.3/32   20.1.1.1   5   150 10  65000 {64101,64102} ?
+*> 10.3.0.0/16   0.0.0.0    0   0   32768   i
+"""
+
+
+def test_columns():
+    columns = parse_show_ip_bgp(IP_BGP, columnar=True)
+    assert isinstance(columns, BgpColumns)
+    assert len(columns) == 4
+
+    assert list(columns.network) == [0x0a020002, 0x0a020002, 0x0a020003,
+                                     0x0a030000]
+    assert list(columns.length) == [32, 32, 32, 16]
+    assert list(columns.next_hop[:2]) == [
+        columns.address('20.1.1.1'), columns.address('20.1.1.10')
+    ]
+    assert list(columns.locprf) == [0, 200, 150, 0]
+    assert list(columns.weight) == [0, 0, 10, 32768]
+    assert [columns.statuses[code] for code in columns.status] == [
+        '*>', '*', '*>', '*>'
+    ]
+    assert [columns.origins[code] for code in columns.origin] == [
+        'i', 'i', '?', 'i'
+    ]
+
+    assert list(columns.path_offsets) == [0, 2, 4, 7, 7]
+    assert columns.path(2) == [65000, 64101, 64102]
+    assert columns.path(3) == []
+
+    assert list(columns.arrays()) == [
+        'network', 'next_hop', 'length', 'metric', 'locprf', 'weight',
+        'status', 'origin', 'path_offsets', 'path_values'
+    ]
+    with raises(ValueError):
+        columns.address('2001::1')
+    with raises(AttributeError):
+        columns.nothing
+
+
+def test_columns_ipv6():
+    columns = parse_show_ipv6_bgp(
+        '*> 10::/126   ::   0   0   0   65000 64100 i\n'
+        '*  10::/126   3::1  0  0  0   65000 64100 i\n',
+        columnar=True
+    )
+    assert list(columns.network) == [0x100000, 0, 0, 0] * 2
+    assert columns.address('3::1') == (0x30000, 0, 0, 1)
+    assert tuple(columns.next_hop[4:8]) == columns.address('3::1')
+    assert list(columns.length) == [126, 126]
+
+
+def test_columns_numpy():
+    importorskip('numpy')
+
+    columns = parse_show_ip_bgp(IP_BGP, columnar=True)
+    arrays = columns.numpy()
+    selected = (arrays['locprf'] > 100) & (
+        arrays['next_hop'] == columns.address('20.1.1.1')
+    )
+    assert selected.nonzero()[0].tolist() == [2]
+    assert arrays['path_values'][
+        arrays['path_offsets'][1]:arrays['path_offsets'][2]
+    ].tolist() == [65000, 64100]
+
+
+def test_columns_numpy_ipv6():
+    importorskip('numpy')
+
+    columns = parse_show_ipv6_bgp(
+        '*> 10::/126   ::   0   0   0   65000 64100 i\n'
+        '*  10::/126   3::1  0  0  0   65000 64100 i\n',
+        columnar=True
+    )
+    arrays = columns.numpy()
+    assert arrays['next_hop'].shape == (2, 4)
+    selected = (arrays['next_hop'] == columns.address('3::1')).all(axis=1)
+    assert selected.nonzero()[0].tolist() == [1]
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the comparison of route table snapshots.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from topology_lib_vtysh.diff import Snapshot, index, diff
+from topology_lib_vtysh.parser import (
+    parse_show_rib, iter_show_rib, parse_show_ip_bgp, iter_show_ip_bgp
+)
+
+
+RIB_BEFORE = """
+Displaying ipv4 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*140.0.0.0/30,  1 unicast next-hops
+    *via  10.10.0.2,  [20/0],  BGP
+*193.0.0.2/32,  2 unicast next-hops
+    *via  50.0.0.2,  [1/0],  static
+    *via  56.0.0.3,  [1/0],  static
+
+Displaying ipv6 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*2002::/64,  1 unicast next-hops
+    *via  4,  [0/0],  connected
+"""
+
+RIB_AFTER = """
+Displaying ipv4 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*140.0.0.0/30,  1 unicast next-hops
+    *via  10.10.0.2,  [20/10],  BGP
+*193.0.0.2/32,  2 unicast next-hops
+    *via  50.0.0.2,  [1/0],  static
+    *via  56.0.0.4,  [1/0],  static
+
+Displaying ipv6 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*2002::/64,  1 unicast next-hops
+    *via  4,  [0/0],  connected
+*2010:bd9::/32,  1 unicast next-hops
+    *via  2005::2,  [1/0],  static
+"""
+
+
+def test_diff_rib():
+    snapshot = Snapshot(parse_show_rib(RIB_BEFORE))
+    assert len(snapshot) == 4
+    assert not snapshot.diff(iter_show_rib(RIB_BEFORE))
+
+    changes = snapshot.update(iter_show_rib(RIB_AFTER))
+    assert changes
+    assert list(changes.added) == [
+        ('193.0.0.2/32', '56.0.0.4'), ('2010:bd9::/32', '2005::2')
+    ]
+    assert list(changes.removed) == [('193.0.0.2/32', '56.0.0.3')]
+    assert list(changes.changed) == [('140.0.0.0/30', '10.10.0.2')]
+
+    old, new = changes.changed[('140.0.0.0/30', '10.10.0.2')]
+    assert (old[1]['metric'], new[1]['metric']) == ('0', '10')
+    route, next_hop = changes.added[('2010:bd9::/32', '2005::2')]
+    assert route['id'] == '2010:bd9::/32'
+    assert next_hop['from'] == 'static'
+
+    # The snapshot is now the new table
+    assert not snapshot.diff(parse_show_rib(RIB_AFTER))
+    assert repr(changes) == '<Diff added=2 removed=1 changed=1>'
+
+
+def test_diff_route_attributes():
+    old = index([{'id': '2002::/64', 'selected': True, 'next_hops': []}])
+    new = index([{'id': '2002::/64', 'selected': False, 'next_hops': []}])
+    assert list(old) == [('2002::/64', None)]
+    assert list(diff(old, new).changed) == [('2002::/64', None)]
+
+
+def test_diff_bgp():
+    before = (
+        '*> 10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i\n'
+        '*  10.2.0.2/32   20.1.1.10  0   0   0   65000 64100 i\n'
+    )
+    after = (
+        '*  10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i\n'
+        '*> 10.2.0.2/32   20.1.1.10  0   0   0   65000 64100 i\n'
+        '*> 10.2.0.3/32   20.1.1.1   0   0   0   65000 i\n'
+    )
+
+    changes = Snapshot(parse_show_ip_bgp(before)).diff(
+        iter_show_ip_bgp(after)
+    )
+    assert list(changes.added) == [('10.2.0.3/32', '20.1.1.1')]
+    assert not changes.removed
+    assert [new['route_status'] for _, new in changes.changed.values()] == [
+        '*', '*>'
+    ]
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the table driven binding of the library.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import sys
+from subprocess import check_output
+
+from pytest import raises, mark
+
+from topology_lib_vtysh import library, parser
+from topology_lib_vtysh.commands import ROOT, CONTEXTS
+from topology_lib_vtysh.dispatch import NAME, renderer, Binder
+
+
+def get_command(name, context=None):
+    commands = ROOT
+    if context is not None:
+        commands = {row[0]: row for row in CONTEXTS}[context][6]
+    return {command[NAME]: command for command in commands}[name]
+
+
+def test_render(enode):
+    show_vlan = renderer(get_command('show_vlan'))
+    assert show_vlan(enode, (), {}) == 'show vlan'
+    assert show_vlan(enode, ('10', ), {}) == 'show vlan 10'
+    assert show_vlan(enode, (), {'vlanid': '10'}) == 'show vlan 10'
+    assert show_vlan(enode, ('', ), {}) == 'show vlan'
+
+    show_interface = renderer(get_command('show_interface'))
+    assert show_interface(enode, ('p4', ), {}) == 'show interface 4'
+    assert show_interface(enode, (), {'portlbl': '5'}) == 'show interface 5'
+
+    ip_route = renderer(get_command('ip_route', 'Configure'))
+    assert ip_route(enode, ('10.0.0.0/8', '1.1.1.1'), {}) == (
+        'ip route 10.0.0.0/8 1.1.1.1'
+    )
+    assert ip_route(enode, ('10.0.0.0/8', '1.1.1.1', '2'), {}) == (
+        'ip route 10.0.0.0/8 1.1.1.1 2'
+    )
+    assert ip_route(
+        enode, ('10.0.0.0/8', ), {'next_hop': '1.1.1.1', 'metric': '2'}
+    ) == 'ip route 10.0.0.0/8 1.1.1.1 2'
+    assert ip_route(
+        enode, (), {'metric': '2', 'next_hop': '1.1.1.1', 'ipv4': '10.0.0.0/8'}
+    ) == 'ip route 10.0.0.0/8 1.1.1.1 2'
+    assert ip_route(
+        enode, (), {'ipv4': '10.0.0.0/8', 'next_hop': '1.1.1.1', 'metric': ''}
+    ) == 'ip route 10.0.0.0/8 1.1.1.1'
+
+
+def test_render_errors(enode):
+    ip_route = renderer(get_command('ip_route', 'Configure'))
+
+    with raises(TypeError):
+        ip_route(enode, ('10.0.0.0/8', ), {})
+    with raises(TypeError):
+        ip_route(enode, ('10.0.0.0/8', '1.1.1.1', '2', '3'), {})
+    with raises(TypeError):
+        ip_route(enode, ('10.0.0.0/8', '1.1.1.1'), {'ipv4': '10.0.0.0/8'})
+    with raises(TypeError):
+        ip_route(enode, (), {'ipv4': '10.0.0.0/8', 'next': '1.1.1.1'})
+    with raises(TypeError):
+        ip_route(enode, (), {'ipv4': '10.0.0.0/8', 'metric': '2'})
+
+
+def test_library(enode):
+    for name in library.__all__:
+        assert getattr(library, name).__name__ == name
+    assert set(library.__all__) <= set(dir(library))
+
+    assert library.ConfigInterfaceRange.context is library.ConfigInterface
+    assert library.ConfigInterface.no_shutdown.__doc__.strip().startswith(
+        'no_shutdown()'
+    )
+
+    with raises(TypeError):
+        library.ConfigInterface(enode)
+    with raises(AttributeError):
+        library.show_nothing
+
+
+def test_binder():
+    created = []
+
+    def function(command, parse):
+        created.append(command[NAME])
+        return lambda enode: None
+
+    binder = Binder(
+        ROOT, CONTEXTS, function, function, library.ContextManager,
+        library.ContextRange
+    )
+    assert 'show_vlan' in binder.names()
+    assert 'ConfigVlanRange' in binder.names()
+    assert not created
+
+    assert binder.get('show_vlan') is binder.get('show_vlan')
+    assert created == ['show_vlan']
+
+    with raises(KeyError):
+        binder.get('show_nothing')
+
+
+@mark.skipif(sys.version_info < (3, ), reason='requires inspect.signature')
+def test_signature():
+    from inspect import signature
+
+    assert str(signature(library.show_vlan)) == "(enode, vlanid='')"
+    assert str(signature(library.ConfigInterface.vlan_access)) == (
+        '(self, vlan_id)'
+    )
+    assert str(signature(library.ConfigVlan)) == (
+        '(enode, vlan_id, batch=False)'
+    )
+
+
+LAZY_SCRIPT = """\
+import sys
+import topology_lib_vtysh.library as library
+print('topology_lib_vtysh.parser' in sys.modules)
+library.show_vlan
+print('topology_lib_vtysh.parser' in sys.modules)
+"""
+
+
+@mark.skipif(
+    sys.version_info < (3, 7), reason='requires module level __getattr__'
+)
+def test_lazy_parser():
+    assert check_output(
+        [sys.executable, '-c', LAZY_SCRIPT]
+    ).decode().split() == ['False', 'True']
+
+    assert library.parse_show_vlan is parser.parse_show_vlan
+    assert library.iter_show_rib is parser.iter_show_rib
+    assert set(parser.__all__) <= set(dir(library))
+    with raises(AttributeError):
+        library.parse_nothing
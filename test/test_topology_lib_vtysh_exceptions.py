@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the typed exceptions.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.exceptions import (
+    UnknownVtyshException, UnknownCommandException,
+    IncompleteCommandException, determine_exception, classify
+)
+from topology_lib_vtysh.library import (
+    clear_udld_statistics, Configure, ConfigInterface
+)
+
+
+def test_determine_exception():
+    assert determine_exception('% Unknown command.') is (
+        UnknownCommandException
+    )
+    assert determine_exception('unknown COMMAND') is UnknownCommandException
+    assert determine_exception('% Command incomplete.') is (
+        IncompleteCommandException
+    )
+    assert determine_exception('% Invalid input') is UnknownVtyshException
+    assert determine_exception('') is UnknownVtyshException
+
+
+def test_classify():
+    output = """\
+switch(config)# interface 1
+switch(config-if)# no shutdown
+switch(config-if)# lldp
+% Command incomplete.
+switch(config-if)# bogus
+% Unknown command.
+switch(config-if)# end"""
+
+    assert classify(output) == [
+        ('% Command incomplete.', IncompleteCommandException),
+        ('% Unknown command.', UnknownCommandException),
+    ]
+    assert classify('') == []
+
+
+def test_typed_batch_error(enode):
+    enode.responses['lldp transmission'] = '% Unknown command.'
+
+    with raises(UnknownCommandException) as excinfo:
+        with ConfigInterface(enode, '1', batch=True) as ctx:
+            ctx.lldp_transmission()
+
+    assert excinfo.value.command == 'lldp transmission'
+
+
+def test_typed_error(enode):
+    enode.responses['lldp transmission'] = '% Unknown command.'
+    enode.responses['no vlan 2'] = '% Command incomplete.'
+
+    with raises(UnknownCommandException) as excinfo:
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.lldp_transmission()
+    assert excinfo.value.command == 'lldp transmission'
+
+    with raises(IncompleteCommandException) as excinfo:
+        with Configure(enode) as ctx:
+            ctx.no_vlan('2')
+    assert excinfo.value.command == 'no vlan 2'
+
+    enode.responses['clear udld statistics'] = '% Unknown command.'
+    with raises(UnknownCommandException) as excinfo:
+        clear_udld_statistics(enode)
+    assert excinfo.value.command == 'clear udld statistics'
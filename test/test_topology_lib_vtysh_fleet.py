@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the fleet executor.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from time import sleep
+from concurrent.futures import TimeoutError
+
+from conftest import FakeEnode
+from topology_lib_vtysh.fleet import run_fleet
+
+
+class SlowEnode(FakeEnode):
+    def __call__(self, command, shell=None):
+        sleep(0.5)
+        return super(SlowEnode, self).__call__(command, shell=shell)
+
+
+def test_run_fleet():
+    enodes = [FakeEnode() for _ in range(5)]
+    enodes[2].responses['show lacp configuration'] = 'garbage'
+    enodes[4].responses['show lacp configuration'] = """\
+System-id       : 70:72:cf:af:66:e7
+System-priority : 65534"""
+
+    results = run_fleet(enodes, 'show_lacp_configuration', max_workers=2)
+
+    assert list(results.keys()) == enodes
+    assert isinstance(results[enodes[2]], AssertionError)
+    assert results[enodes[4]] == {
+        'id': '70:72:cf:af:66:e7', 'priority': 65534
+    }
+    assert all(enode.calls == ['show lacp configuration'] for enode in enodes)
+
+
+def test_run_fleet_timeout():
+    fast, slow = FakeEnode(), SlowEnode()
+
+    results = run_fleet(
+        [fast, slow], 'show_vlan', kwargs={'vlanid': '2'}, timeout=0.1
+    )
+
+    assert results[fast] == {}
+    assert isinstance(results[slow], TimeoutError)
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the instrumentation hooks.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from topology_lib_vtysh.instrument import (
+    Hook, Histogram, Collector, add_hook, remove_hook, get_hooks
+)
+from topology_lib_vtysh.library import (
+    show_vlan, ConfigInterface, ConfigVlan
+)
+
+
+VLANS = """\
+--------------------------------------------------------------------------------
+VLAN    Name      Status   Reason         Reserved       Ports
+--------------------------------------------------------------------------------
+2       vlan2     up       ok                            7, 3, 8, vlan2, 1
+"""
+
+
+class Events(Hook):
+    def __init__(self):
+        self.events = []
+
+    def pre_call(self, enode, name, command):
+        self.events.append(('pre_call', name, command))
+
+    def post_call(self, enode, name, command, seconds, size):
+        assert seconds >= 0
+        self.events.append(('post_call', name, command, size))
+
+    def pre_parse(self, enode, name, command, size):
+        self.events.append(('pre_parse', name, command, size))
+
+    def post_parse(self, enode, name, command, seconds, size):
+        assert seconds >= 0
+        self.events.append(('post_parse', name, command, size))
+
+
+def test_hooks(enode):
+    enode.responses['show vlan'] = VLANS
+    hook = Events()
+    add_hook(hook)
+    try:
+        assert get_hooks() == [hook]
+        show_vlan(enode)
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.no_shutdown()
+        with ConfigVlan(enode, '2', batch=True) as ctx:
+            ctx.shutdown()
+    finally:
+        remove_hook(hook)
+
+    size = len(VLANS)
+    assert hook.events == [
+        ('pre_call', 'show_vlan', 'show vlan'),
+        ('post_call', 'show_vlan', 'show vlan', size),
+        ('pre_parse', 'show_vlan', 'show vlan', size),
+        ('post_parse', 'show_vlan', 'show vlan', size),
+        ('pre_call', 'ConfigInterface', 'config terminal\ninterface 1'),
+        ('post_call', 'ConfigInterface', 'config terminal\ninterface 1', 0),
+        ('pre_call', 'ConfigInterface.no_shutdown', 'no shutdown'),
+        ('post_call', 'ConfigInterface.no_shutdown', 'no shutdown', 0),
+        ('pre_call', 'ConfigInterface', 'end'),
+        ('post_call', 'ConfigInterface', 'end', 0),
+    ] + [
+        (event, 'batch', command) + size
+        for command in ('config terminal', 'vlan 2', 'shutdown', 'end')
+        for event, size in (('pre_call', ()), ('post_call', (0,)))
+    ]
+
+    # Nothing is reported once the hook is removed
+    show_vlan(enode)
+    assert len(hook.events) == 18
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert histogram.percentile(50) is None
+
+    for microseconds in range(1, 10001):
+        histogram.record(microseconds / 1e6)
+
+    assert len(histogram) == 10000
+    assert histogram.minimum == 1e-6
+    assert histogram.maximum == 1e-2
+    for percent in (1, 50, 90, 99, 100):
+        expected = percent / 1e4
+        assert expected * 0.98 <= histogram.percentile(percent) <= expected
+
+    other = Histogram()
+    other.record(1.0)
+    histogram.merge(other)
+    assert histogram.count == 10001
+    assert histogram.maximum == 1.0
+    assert 0.98 <= histogram.percentile(100) <= 1.0
+
+
+def test_collector(enode):
+    enode.responses['show vlan'] = VLANS
+    collector = Collector()
+    add_hook(collector)
+    try:
+        for _ in range(3):
+            show_vlan(enode)
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.no_shutdown()
+    finally:
+        remove_hook(collector)
+
+    assert collector.calls['show_vlan'].count == 3
+    assert collector.parses['show_vlan'].count == 3
+    assert collector.sizes['show_vlan'] == 3 * len(VLANS)
+    assert 'ConfigInterface.no_shutdown' not in collector.parses
+    assert collector.most_frequent(1) == ['show_vlan']
+    assert sorted(collector.slowest()) == sorted(collector.calls)
+
+    summary = collector.summary()
+    assert summary.startswith('Slowest commands')
+    assert 'Most frequent commands' in summary
+    assert 'ConfigInterface.no_shutdown' in summary
@@ -21,8 +21,12 @@ OpenSwitch Test for vtysh related commands.
 
 from __future__ import unicode_literals
 
+from io import StringIO
+
 from deepdiff import DeepDiff
+from pytest import raises
 
+from topology_lib_vtysh.parser import _Patterns, _PATTERNS
 from topology_lib_vtysh.parser import (parse_show_interface,
                                        parse_show_vlan,
                                        parse_show_lacp_interface,
@@ -37,6 +41,11 @@ from topology_lib_vtysh.parser import (parse_show_interface,
                                        parse_show_ip_route,
                                        parse_show_ipv6_route,
                                        parse_show_rib,
+                                       iter_show_rib,
+                                       iter_show_ip_route,
+                                       iter_show_ipv6_route,
+                                       iter_show_ip_bgp,
+                                       iter_show_ipv6_bgp,
                                        parse_ping_repetitions,
                                        parse_ping6_repetitions,
                                        parse_show_running_config,
@@ -704,6 +713,12 @@ Total number of entries 10
     ddiff = DeepDiff(result, expected)
     assert not ddiff
 
+    # Lines can also be read one at a time, like from a file
+    result = list(iter_show_ipv6_bgp(StringIO(raw_result)))
+    ddiff = DeepDiff(result, expected)
+    assert not ddiff
+    assert iter_show_ipv6_bgp.__name__ == 'iter_show_ipv6_bgp'
+
 
 def test_parse_show_ip_bgp_neighbors():
     raw_result = """\
@@ -934,6 +949,11 @@ Total number of entries 6
     ddiff = DeepDiff(result, expected)
     assert not ddiff
 
+    # Lines can also be read one at a time, like from a file
+    result = list(iter_show_ip_bgp(StringIO(raw_result)))
+    ddiff = DeepDiff(result, expected)
+    assert not ddiff
+
 
 def test_parse_ping_repetitions():
     raw_result = """\
@@ -1144,6 +1164,82 @@ No ipv6 rib entries
     assert not ddiff
 
 
+def test_iter_show_rib():
+    raw_result = """\
+Displaying ipv4 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*140.0.0.0/30,  1 unicast next-hops
+    *via  10.10.0.2,  [20/0],  BGP
+10.10.0.0/24,  1 unicast next-hops
+    *via  1,  [0/0],  connected
+
+Displaying ipv6 rib entries
+
+*2002::/64,  1 unicast next-hops
+    via  4,  [0/0],  connected
+"""
+
+    expected = [
+        ('ipv4_entries', {
+            'id': '140.0.0.0',
+            'prefix': '30',
+            'selected': True,
+            'next_hops': [
+                {
+                    'selected': True,
+                    'via': '10.10.0.2',
+                    'distance': '20',
+                    'from': 'BGP',
+                    'metric': '0'
+                }
+            ]
+        }),
+        ('ipv4_entries', {
+            'id': '10.10.0.0',
+            'prefix': '24',
+            'selected': False,
+            'next_hops': [
+                {
+                    'selected': True,
+                    'via': '1',
+                    'distance': '0',
+                    'from': 'connected',
+                    'metric': '0'
+                }
+            ]
+        }),
+        ('ipv6_entries', {
+            'id': '2002::/64',
+            'selected': True,
+            'next_hops': [
+                {
+                    'selected': False,
+                    'via': '4',
+                    'distance': '0',
+                    'from': 'connected',
+                    'metric': '0'
+                }
+            ]
+        }),
+    ]
+
+    ddiff = DeepDiff(list(iter_show_rib(raw_result)), expected)
+    assert not ddiff
+
+    # Lines can be given one by one, like from a file
+    lines = raw_result.splitlines(True)
+    ddiff = DeepDiff(list(iter_show_rib(iter(lines))), expected)
+    assert not ddiff
+
+    # The output may end with the ipv4 entries
+    result = parse_show_rib(''.join(lines[:9]))
+    assert len(result['ipv4_entries']) == 2
+    assert not result['ipv6_entries']
+
+
 def test_parse_show_running_config():
     raw_result = """\
     Current configuration:
@@ -1287,6 +1383,11 @@ Displaying ipv4 routes selected for forwarding
     ddiff = DeepDiff(result, expected)
     assert not ddiff
 
+    # Lines can also be read one at a time, like from a file
+    result = list(iter_show_ip_route(StringIO(raw_result)))
+    ddiff = DeepDiff(result, expected)
+    assert not ddiff
+
 
 def test_parse_show_ipv6_route():
     raw_result = """
@@ -1350,6 +1451,42 @@ Displaying ipv6 routes selected for forwarding
     ddiff = DeepDiff(result, expected)
     assert not ddiff
 
+    # Lines can also be read one at a time, like from a file
+    result = list(iter_show_ipv6_route(StringIO(raw_result)))
+    ddiff = DeepDiff(result, expected)
+    assert not ddiff
+
+
+def test_parse_show_ipv6_route_garbled():
+    # Long lines of address fragments are parsed in linear time, and the
+    # address of a route can follow three colons of noise
+    raw_result = '\n'.join([
+        'ab1:' * 1000 + '/x',
+        ':::2002::/64,  1 unicast next-hops',
+        '        via  2004::2,  [1/0],  static',
+        '        via  ' + '2001:' * 1000 + 'x',
+        '2003:' * 1000 + ':::/64',
+    ])
+
+    result = parse_show_ipv6_route(raw_result)
+
+    expected = [
+        {
+            'id': '2002::/64',
+            'next_hops': [
+                {
+                    'via': '2004::2',
+                    'distance': '1',
+                    'from': 'static',
+                    'metric': '0'
+                }
+            ]
+        },
+    ]
+
+    ddiff = DeepDiff(result, expected)
+    assert not ddiff
+
 
 def test_parse_show_ntp_associations():
     raw_result = """\
@@ -1781,3 +1918,20 @@ Number of Samples             20
 
     ddiff = DeepDiff(result, expected)
     assert not ddiff
+
+
+def test_patterns():
+    patterns = _Patterns()
+    patterns.register('vlan_id', r'vlan (?P<vlan_id>\d+)')
+
+    assert 'vlan_id' not in vars(patterns)
+    assert patterns.vlan_id.search('show vlan 10').group('vlan_id') == '10'
+    assert patterns.vlan_id is patterns.vlan_id
+
+    with raises(AttributeError):
+        patterns.vlan_name
+    with raises(AssertionError):
+        patterns.register('vlan_id', r'(?P<vlan_id>\d+)')
+
+    # All the expressions of the parsers must compile
+    _PATTERNS.compile()
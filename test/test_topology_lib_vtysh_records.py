@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the compact records of the parsers.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pickle import dumps, loads
+
+from pytest import raises
+
+from topology_lib_vtysh.records import Route, NextHop, BgpPath
+from topology_lib_vtysh.routes import RouteTable
+from topology_lib_vtysh.parser import (
+    parse_show_rib, parse_show_ipv6_route, iter_show_ip_route,
+    parse_show_ip_bgp
+)
+
+
+RIB = """
+Displaying ipv4 rib entries
+
+*140.0.0.0/30,  1 unicast next-hops
+    *via  10.10.0.2,  [20/0],  BGP
+*140.0.0.4/30,  1 unicast next-hops
+    *via  10.10.0.2,  [20/0],  BGP
+
+Displaying ipv6 rib entries
+
+*2002::/64,  1 unicast next-hops
+    via  4,  [0/0],  connected
+"""
+
+
+def test_compact_rib():
+    result = parse_show_rib(RIB, compact=True)
+
+    first, second = result['ipv4_entries']
+    assert isinstance(first, Route)
+    assert isinstance(first.next_hops[0], NextHop)
+    assert not hasattr(first, '__dict__')
+
+    assert first.id == '140.0.0.0'
+    assert first.prefix == 30
+    assert first['next_hops'][0]['distance'] == 20
+    assert first.next_hops[0].from_ == first.next_hops[0]['from'] == 'BGP'
+
+    # Repeated strings of the table are shared
+    assert first.next_hops[0].via is second.next_hops[0].via
+
+    # Same keys as the dictionaries, with numbers as integers
+    ipv6 = result['ipv6_entries'][0]
+    assert 'prefix' not in ipv6
+    assert list(ipv6) == ['selected', 'id', 'next_hops']
+    assert dict(ipv6.next_hops[0]) == {
+        'selected': False, 'via': '4', 'distance': 0, 'metric': 0,
+        'from': 'connected'
+    }
+    with raises(KeyError):
+        ipv6['prefix']
+
+    assert loads(dumps(first)) == first
+    assert parse_show_rib(RIB, compact=True) == result
+
+
+def test_compact_routes():
+    raw_result = (
+        '10.0.0.0/8,  1 unicast next-hops\n'
+        '    via  10.10.0.2,  [20/0],  bgp\n'
+    )
+    route, = iter_show_ip_route(raw_result, compact=True)
+    assert list(route) == ['id', 'prefix', 'next_hops']
+    assert RouteTable([route]).lookup('10.1.1.1') is route
+
+    route, = parse_show_ipv6_route(
+        '2002::/64,  1 unicast next-hops\n'
+        '        via  1,  [0/0],  connected\n',
+        compact=True
+    )
+    assert route.id == '2002::/64'
+    assert route.next_hops[0].via == '1'
+
+
+def test_compact_bgp():
+    raw_result = (
+        '*> 10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i\n'
+        '*  10.2.0.3/32   20.1.1.1   0   0   0   65000 64100 i\n'
+    )
+    first, second = parse_show_ip_bgp(raw_result, compact=True)
+    assert isinstance(first, BgpPath)
+    assert dict(first) == parse_show_ip_bgp(raw_result)[0]
+    assert first.next_hop is second.next_hop
+    assert first.path is second.path
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the record and replay of the shell calls of an enode.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.batch import supports_batch
+from topology_lib_vtysh.library import show_vlan, ConfigInterface
+from topology_lib_vtysh.replay import (
+    ReplayError, Transcript, RecordingEnode, ReplayEnode
+)
+
+
+VLANS = """\
+--------------------------------------------------------------------------------
+VLAN    Name      Status   Reason         Reserved       Ports
+--------------------------------------------------------------------------------
+2       vlan2     up       ok                            7, 3, 8, vlan2, 1
+"""
+
+
+def playbook(enode):
+    before = show_vlan(enode)
+    with ConfigInterface(enode, '1') as ctx:
+        ctx.no_shutdown()
+    return before, show_vlan(enode)
+
+
+def test_record_replay(enode, tmpdir):
+    enode.responses['show vlan'] = VLANS
+    recorder = RecordingEnode(enode)
+    assert recorder.ports is enode.ports
+
+    expected = playbook(recorder)
+    transcript = recorder.transcript
+    assert [command for _, command, _, _ in transcript.calls] == enode.calls
+    assert [call[1] for call in transcript.calls] == [
+        'show vlan', 'config terminal', 'interface 1', 'no shutdown',
+        'end', 'show vlan'
+    ]
+    assert all(seconds >= 0 for _, _, _, seconds in transcript.calls)
+
+    for name in ('playbook.json', 'playbook.json.gz'):
+        path = str(tmpdir.join(name))
+        transcript.save(path)
+        loaded = Transcript.load(path)
+        assert loaded.calls == [
+            (shell, command, output, round(seconds, 6))
+            for shell, command, output, seconds in transcript.calls
+        ]
+        assert loaded.ports == enode.ports
+        assert not loaded.batch
+
+        replay = ReplayEnode(loaded)
+        assert not supports_batch(replay)
+        assert playbook(replay) == expected
+        assert replay.round_trips == len(transcript)
+        assert replay.seconds == loaded.seconds
+
+
+def test_record_replay_batch(batch_enode):
+    recorder = RecordingEnode(batch_enode)
+    with ConfigInterface(recorder, '1', batch=True) as ctx:
+        ctx.no_shutdown()
+    assert recorder.transcript.batch
+
+    replay = ReplayEnode(recorder.transcript)
+    assert supports_batch(replay)
+    with ConfigInterface(replay, '1', batch=True) as ctx:
+        ctx.no_shutdown()
+    assert replay.round_trips == 1
+
+
+def test_libs(enode):
+    enode.responses['show vlan'] = VLANS
+    enode.libs.lldp = lldp = object()
+    recorder = RecordingEnode(enode)
+
+    assert recorder.libs.lldp is lldp
+    with raises(AttributeError):
+        recorder.libs.openswitch
+
+    expected = recorder.libs.vtysh.show_vlan()
+    with recorder.libs.vtysh.ConfigInterface('1') as ctx:
+        ctx.no_shutdown()
+    assert [call[1] for call in recorder.transcript.calls] == [
+        'show vlan', 'config terminal', 'interface 1', 'no shutdown', 'end'
+    ]
+
+    replay = ReplayEnode(recorder.transcript)
+    assert replay.libs.vtysh.show_vlan() == expected
+    with raises(AttributeError):
+        replay.libs.vtysh.parse_show_vlan
+
+
+def test_replay_order():
+    transcript = Transcript()
+    transcript.append('vtysh', 'show vlan', 'first', 0.01)
+    transcript.append('bash', 'show vlan', 'other shell', 0.0)
+    transcript.append('vtysh', 'show vlan', 'second', 0.02)
+
+    replay = ReplayEnode(transcript)
+    assert replay('show vlan', shell='vtysh') == 'first'
+    assert replay('show vlan', shell='bash') == 'other shell'
+    assert replay('show vlan', shell='vtysh') == 'second'
+
+    # The last output is repeated once there are no more
+    assert replay('show vlan', shell='vtysh') == 'second'
+    assert replay.round_trips == 4
+    assert round(replay.seconds, 6) == 0.05
+
+    with raises(ReplayError) as info:
+        replay('show interface', shell='vtysh')
+    assert info.value.command == 'show interface'
+
+
+def test_replay_latency(monkeypatch):
+    waits = []
+    monkeypatch.setattr('topology_lib_vtysh.replay.sleep', waits.append)
+
+    transcript = Transcript()
+    transcript.append('vtysh', 'show vlan', '', 0.5)
+
+    ReplayEnode(transcript)('show vlan', shell='vtysh')
+    assert waits == []
+
+    ReplayEnode(transcript, latency=0.1)('show vlan', shell='vtysh')
+    assert waits == [0.05]
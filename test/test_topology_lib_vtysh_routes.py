@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the longest prefix match of the routes.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from random import Random
+
+from pytest import raises
+
+from topology_lib_vtysh.parser import (
+    iter_show_rib, iter_show_ip_route, parse_show_rib, parse_show_ipv6_route,
+    parse_show_ip_bgp
+)
+from topology_lib_vtysh.records import Route
+from topology_lib_vtysh.routes import (
+    parse_prefix, route_prefix, RouteTable, PrefixCache, PREFIXES
+)
+
+
+RIB = """
+Displaying ipv4 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*0.0.0.0/0,  1 unicast next-hops
+    *via  10.10.0.1,  [1/0],  static
+*10.0.0.0/8,  1 unicast next-hops
+    *via  10.10.0.2,  [20/0],  BGP
+*10.1.0.0/16,  1 unicast next-hops
+    *via  10.10.0.3,  [20/0],  BGP
+*10.1.2.0/24,  1 unicast next-hops
+    *via  1,  [0/0],  connected
+*10.2.0.0/16,  1 unicast next-hops
+    *via  10.10.0.4,  [20/0],  BGP
+
+Displaying ipv6 rib entries
+
+'*' denotes selected
+'[x/y]' denotes [distance/metric]
+
+*2002::/64,  1 unicast next-hops
+    *via  4,  [0/0],  connected
+*2010:bd9::/32,  1 unicast next-hops
+    *via  2005::2,  [1/0],  static
+"""
+
+
+def ids(routes):
+    return [route_prefix(route) for route in routes]
+
+
+def test_parse_prefix():
+    assert parse_prefix('10.1.2.3') == (0x0a010203, 32, 4)
+    assert parse_prefix('10.1.2.3/8') == (0x0a000000, 8, 4)
+    assert parse_prefix('2001::1/16') == (0x2001 << 112, 16, 6)
+    assert parse_prefix('::/0') == (0, 0, 6)
+
+    for prefix in ('10.1.2', '10.1.2.3/33', '10.1.2.3/x', '2001:::1'):
+        with raises(ValueError):
+            parse_prefix(prefix)
+
+
+def test_prefix_cache():
+    cache = PrefixCache(maxsize=2)
+    first = cache.get('10.0.0.0/8')
+    assert first == (0x0a000000, 8, 4)
+    assert cache.get('10.0.0.0/8') is first
+    assert cache.get('2001::1') == (0x2001 << 112 | 1, 128, 6)
+    assert len(cache) == 2
+
+    # A full cache starts over
+    cache.get('10.1.0.0/16')
+    assert len(cache) == 1
+
+    with raises(ValueError):
+        cache.get('10.1.2')
+
+
+def test_normalize():
+    result = parse_show_rib(RIB, normalize=True)
+    first, second = result['ipv4_entries'][:2]
+    assert first['id'] == (0, 0, 4)
+    assert 'prefix' not in first
+    assert first['next_hops'][0]['via'] == (0x0a0a0001, 32, 4)
+    assert result['ipv4_entries'][3]['next_hops'][0]['via'] == '1'
+
+    # IPv6 networks are split the same way
+    ipv6 = result['ipv6_entries'][1]
+    assert ipv6['id'] == (0x20100bd9 << 96, 32, 6)
+    assert ipv6['next_hops'][0]['via'] == (0x2005 << 112 | 2, 128, 6)
+
+    # Tuples are shared across parses, and sort by address
+    again = parse_show_rib(RIB, normalize=True)['ipv4_entries'][1]
+    assert again['id'] is second['id'] is PREFIXES.get('10.0.0.0/8')
+    assert sorted(
+        route['id'] for route in result['ipv4_entries']
+    ) == [route['id'] for route in result['ipv4_entries']]
+
+    table = RouteTable(iter_show_rib(RIB, normalize=True))
+    assert table.lookup('10.1.3.3')['id'] == PREFIXES.get('10.1.0.0/16')
+
+    cache = PrefixCache()
+    route, = parse_show_ipv6_route(
+        '2002::/64,  1 unicast next-hops\n'
+        '        via  2005::2,  [1/0],  static\n',
+        compact=True, normalize=cache
+    )
+    assert isinstance(route, Route)
+    assert route.id is cache.get('2002::/64')
+    assert len(cache) == 2
+
+    path, = parse_show_ip_bgp(
+        '*> 10.2.0.2/32   20.1.1.1   0   0   0   65000 64100 i\n',
+        normalize=True
+    )
+    assert path['network'] == (0x0a020002, 32, 4)
+    assert path['next_hop'] == (0x14010101, 32, 4)
+
+
+def test_route_table():
+    table = RouteTable(iter_show_rib(RIB))
+    assert len(table) == 7
+
+    assert route_prefix(table.lookup('10.1.2.3')) == '10.1.2.0/24'
+    assert route_prefix(table.lookup('10.1.3.3')) == '10.1.0.0/16'
+    assert route_prefix(table.lookup('10.3.0.1')) == '10.0.0.0/8'
+    assert route_prefix(table.lookup('11.0.0.1')) == '0.0.0.0/0'
+    assert table.lookup('10.1.2.3')['next_hops'][0]['via'] == '1'
+
+    assert route_prefix(table.lookup('2002::1')) == '2002::/64'
+    assert route_prefix(table.lookup('2010:bd9:1::1')) == '2010:bd9::/32'
+    assert table.lookup('2003::1') is None
+
+    assert ids(table.covering('10.1.2.128/25')) == [
+        '0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16', '10.1.2.0/24'
+    ]
+    assert ids(table.covering('10.1.0.0/16')) == [
+        '0.0.0.0/0', '10.0.0.0/8', '10.1.0.0/16'
+    ]
+    assert ids(table.more_specifics('10.0.0.0/8')) == [
+        '10.1.0.0/16', '10.1.2.0/24', '10.2.0.0/16'
+    ]
+    assert ids(table.more_specifics('10.0.0.0/15')) == [
+        '10.1.0.0/16', '10.1.2.0/24'
+    ]
+    assert table.more_specifics('10.1.2.0/24') == []
+    assert ids(table.more_specifics('::/0')) == [
+        '2002::/64', '2010:bd9::/32'
+    ]
+
+    # A route to the same network replaces the previous one
+    table.update(iter_show_ip_route(
+        '10.1.0.0/16,  1 unicast next-hops\n'
+        '    via  10.10.0.5,  [1/0],  static\n'
+    ))
+    assert len(table) == 7
+    assert table.lookup('10.1.3.3')['next_hops'][0]['via'] == '10.10.0.5'
+
+
+def test_route_table_random():
+    random = Random(14)
+
+    def text(value):
+        return '.'.join(str(value >> shift & 0xff) for shift in (24, 16, 8, 0))
+
+    def contains(network, length, value):
+        return network == value >> (32 - length) << (32 - length)
+
+    routes = {}
+    for _ in range(500):
+        length = random.randint(0, 32)
+        value = random.getrandbits(32) >> (32 - length) << (32 - length)
+        routes[(value, length)] = {'id': text(value), 'prefix': str(length)}
+    table = RouteTable(routes.values())
+    assert len(table) == len(routes)
+
+    # Same answers as going over all the routes
+    for _ in range(300):
+        network, _ = random.choice(list(routes))
+        value = network | random.getrandbits(32) >> random.randint(0, 32)
+        length = random.randint(0, 32)
+        network = value >> (32 - length) << (32 - length)
+        prefix = '{}/{}'.format(text(value), length)
+
+        matches = [key for key in routes if contains(*key + (value, ))]
+        longest = max(matches, key=lambda key: key[1]) if matches else None
+        assert table.lookup(text(value)) is routes.get(longest)
+
+        covering = sorted(
+            (key[1], key) for key in routes
+            if key[1] <= length and contains(*key + (network, ))
+        )
+        assert table.covering(prefix) == [
+            routes[key] for _, key in covering
+        ]
+
+        more_specifics = sorted(
+            key for key in routes
+            if key[1] > length and contains(network, length, key[0])
+        )
+        assert table.more_specifics(prefix) == [
+            routes[key] for key in more_specifics
+        ]
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the vtysh mode tracking of contexts.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.session import (
+    transition, get_session, ContextState
+)
+from topology_lib_vtysh.library import (
+    Configure, ConfigInterface, ConfigVlan, ConfigSession
+)
+
+
+def test_transition():
+    assert transition([], ['config terminal', 'vlan 2']) == [
+        'config terminal', 'vlan 2'
+    ]
+    assert transition(['configure terminal'], ['conf t', 'vlan 2']) == [
+        'vlan 2'
+    ]
+    assert transition(['conf t', 'router bgp 1'], ['conf t']) == ['exit']
+    assert transition(['conf t', 'vlan 2'], ['conf t', 'vlan 2']) == []
+    assert transition([None], ['conf t']) == ['end', 'conf t']
+
+
+def test_single_context(enode):
+    with ConfigInterface(enode, '1') as ctx:
+        ctx.no_shutdown()
+
+    assert enode.calls == [
+        'config terminal', 'interface 1', 'no shutdown', 'end'
+    ]
+
+
+def test_nested_contexts(enode):
+    with Configure(enode) as conf:
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.no_shutdown()
+        conf.no_vlan('2')
+
+    assert enode.calls == [
+        'configure terminal',
+        'interface 1',
+        'no shutdown',
+        'exit',
+        'no vlan 2',
+        'end'
+    ]
+
+
+def test_config_session(enode):
+    with ConfigSession(enode):
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.no_shutdown()
+        with ConfigVlan(enode, '2') as ctx:
+            ctx.no_shutdown()
+
+    assert enode.calls == [
+        'config terminal',
+        'interface 1',
+        'no shutdown',
+        'exit',
+        'vlan 2',
+        'no shutdown',
+        'end'
+    ]
+
+
+def test_config_session_batch(batch_enode):
+    enode = batch_enode
+    with ConfigSession(enode, batch=True):
+        with ConfigInterface(enode, '1') as ctx:
+            ctx.no_shutdown()
+        with ConfigVlan(enode, '2') as ctx:
+            ctx.no_shutdown()
+
+    assert enode.calls == [
+        'config terminal\n'
+        'interface 1\n'
+        'no shutdown\n'
+        'exit\n'
+        'vlan 2\n'
+        'no shutdown\n'
+        'end'
+    ]
+
+    # The session starts from the exec mode again
+    with ConfigVlan(enode, '3'):
+        pass
+
+    assert enode.calls[1:] == ['config terminal', 'vlan 3', 'end']
+
+
+def test_failed_enter(enode):
+    enode.responses['interface 9'] = '% Unknown command.'
+
+    with raises(AssertionError):
+        with ConfigInterface(enode, '9'):
+            pass
+
+    del enode.calls[:]
+    with ConfigVlan(enode, '10') as ctx:
+        ctx.no_shutdown()
+
+    assert enode.calls == ['config terminal', 'vlan 10', 'no shutdown', 'end']
+
+
+def test_failed_enter_nested(enode):
+    enode.responses['interface 9'] = '% Unknown command.'
+
+    with ConfigSession(enode):
+        with ConfigVlan(enode, '10'):
+            pass
+        with raises(AssertionError):
+            with ConfigInterface(enode, '9'):
+                pass
+        with ConfigVlan(enode, '11'):
+            pass
+
+    assert enode.calls == [
+        'config terminal',
+        'vlan 10',
+        'exit',
+        'interface 9',
+        'end',
+        'config terminal',
+        'vlan 11',
+        'end'
+    ]
+
+
+def test_context_state(enode):
+    class State(ContextState):
+        def __init__(self, enode, batch=False):
+            self.enode = enode
+            self._batch = batch
+
+    state = State(enode, batch=True)
+    assert state._open(['config terminal']) == []
+    assert state._close(['end']) == []
+    assert state._flush() == (['config terminal', 'end'], ['end'])
+    assert get_session(enode).batch is None
+
+    state = State(enode)
+    assert state._open(['config terminal']) == ['config terminal']
+    assert state._close(['end']) == ['end']
+    assert state._flush() == (None, None)
+    assert enode.calls == []
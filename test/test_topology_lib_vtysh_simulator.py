@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the simulated switch.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from pytest import raises
+
+from topology_lib_vtysh.batch import run_batch
+from topology_lib_vtysh.exceptions import VtyshException
+from topology_lib_vtysh.library import (
+    Configure, ConfigInterface, ConfigInterfaceLag, ConfigRouterBgp,
+    ConfigVlan, ConfigVlanRange, show_vlan, show_lacp_aggregates,
+    show_ip_route, show_ipv6_route, show_ip_bgp_summary, show_running_config
+)
+from topology_lib_vtysh.simulator import UNKNOWN_COMMAND, SimulatedSwitch
+
+
+def configure(switch, batch):
+    with ConfigVlan(switch, '10', batch=batch) as ctx:
+        ctx.no_shutdown()
+    with ConfigInterface(switch, '1', batch=batch) as ctx:
+        ctx.no_shutdown()
+        ctx.ip_address('10.0.0.1/24')
+        ctx.ipv6_address('2001::1/64')
+        ctx.vlan_access('10')
+    with ConfigInterfaceLag(switch, '2', batch=batch) as ctx:
+        ctx.lacp_mode_active()
+    with ConfigInterface(switch, '3', batch=batch) as ctx:
+        ctx.lag('2')
+    with Configure(switch, batch=batch) as ctx:
+        ctx.ip_route('10.1.0.0/16', '10.0.0.2')
+        ctx.ipv6_route('2002::/64', '2001::2', '5')
+    with ConfigRouterBgp(switch, '64001', batch=batch) as ctx:
+        ctx.bgp_router_id('1.1.1.1')
+        ctx.network('10.1.0.0/16')
+        ctx.neighbor_remote_as('10.0.0.2', '65000')
+        ctx.neighbor_shutdown('10.0.0.2')
+
+
+def test_simulator():
+    for batch in (False, True):
+        switch = SimulatedSwitch()
+        configure(switch, batch)
+
+        vlans = show_vlan(switch)
+        assert sorted(vlans) == ['1', '10']
+        assert vlans['10']['status'] == 'up'
+        assert vlans['10']['ports'] == ['1']
+
+        assert show_lacp_aggregates(switch)['lag2']['interfaces'] == ['3']
+        assert show_lacp_aggregates(switch)['lag2']['mode'] == 'active'
+
+        assert show_ip_route(switch) == [
+            {
+                'id': '10.0.0.0', 'prefix': '24',
+                'next_hops': [{
+                    'via': '1', 'distance': '0', 'metric': '0',
+                    'from': 'connected'
+                }],
+            },
+            {
+                'id': '10.1.0.0', 'prefix': '16',
+                'next_hops': [{
+                    'via': '10.0.0.2', 'distance': '1', 'metric': '0',
+                    'from': 'static'
+                }],
+            },
+        ]
+        assert [
+            (route['id'], route['next_hops'][0]['distance'])
+            for route in show_ipv6_route(switch)
+        ] == [('2001::/64', '0'), ('2002::/64', '5')]
+
+        summary = show_ip_bgp_summary(switch)
+        assert summary['bgp_router_identifier'] == '1.1.1.1'
+        assert summary['local_as_number'] == 64001
+        assert summary['10.0.0.2']['as_number'] == 65000
+        assert summary['10.0.0.2']['state'] == 'Idle'
+
+        assert show_running_config(switch) == {
+            'bgp': {
+                '64001': {
+                    'router_id': '1.1.1.1', 'networks': ['10.1.0.0/16']
+                }
+            }
+        }
+
+
+def test_modes():
+    switch = SimulatedSwitch('leaf1')
+
+    # Commands of the parent modes run without exiting the current one
+    assert switch(
+        'configure terminal\n'
+        'interface 1\n'
+        'vlan 20\n'
+        'ip route 10.2.0.0/16 10.0.0.3\n'
+        'description test'
+    ) == (
+        'leaf1(config)# interface 1\n'
+        'leaf1(config-if)# vlan 20\n'
+        'leaf1(config-vlan)# ip route 10.2.0.0/16 10.0.0.3\n'
+        'leaf1(config)# description test\n' +
+        UNKNOWN_COMMAND
+    )
+    assert switch.prompt == 'leaf1(config)'
+    assert switch('exit') == ''
+    assert switch.prompt == 'leaf1'
+
+    assert switch('no shutdown') == UNKNOWN_COMMAND
+    assert switch('show lacp configuration') == ''
+    assert '20' in show_vlan(switch)
+    assert switch.routes[4]['10.2.0.0/16'] == {'10.0.0.3': '1'}
+
+    with raises(VtyshException) as excinfo:
+        run_batch(switch, ['configure terminal', 'vlan 30', 'bogus', 'end'])
+    assert excinfo.value.command == 'bogus'
+
+
+def test_libs():
+    switch = SimulatedSwitch()
+    with switch.libs.vtysh.ConfigVlan('10', batch=True) as ctx:
+        ctx.no_shutdown()
+
+    assert switch.libs.vtysh.show_vlan()['10']['status'] == 'down'
+    assert switch.round_trips == 2
+    with raises(AttributeError):
+        switch.libs.lldp
+
+
+def test_scale():
+    switch = SimulatedSwitch()
+    with ConfigVlanRange(switch, range(2, 4095)):
+        pass
+
+    assert switch.round_trips == 1
+    assert len(show_vlan(switch)) == 4094
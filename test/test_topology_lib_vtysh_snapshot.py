@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for the multi-show snapshot.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from functools import partial
+
+from pytest import raises
+
+from topology_lib_vtysh.budget import RoundTripBudget, RoundTripBudgetExceeded
+from topology_lib_vtysh.instrument import Hook, add_hook, remove_hook
+from topology_lib_vtysh.library import show_vlan, show_interface
+from topology_lib_vtysh.snapshot import render, snapshot
+
+
+def test_render(enode):
+    assert render(enode, show_vlan) == 'show vlan'
+    assert render(enode, show_vlan, '10') == 'show vlan 10'
+    assert render(enode, show_interface, 'p4') == 'show interface 4'
+    assert render(enode, partial(show_vlan, '10')) == 'show vlan 10'
+    assert render(enode, partial(show_vlan, enode, '10')) == 'show vlan 10'
+    assert render(
+        enode, partial(show_vlan, vlanid='10'), vlanid='20'
+    ) == 'show vlan 20'
+    assert not enode.calls
+
+
+def check_snapshot(enode):
+    enode.responses['show vlan'] = """\
+--------------------------------------------------------------------------------
+VLAN    Name      Status   Reason         Reserved       Ports
+--------------------------------------------------------------------------------
+2       vlan2     up       ok                            7, 3"""
+    enode.responses['show lacp configuration'] = """\
+System-id       : 70:72:cf:af:66:e7
+System-priority : 65534"""
+
+    result = snapshot(enode, [show_vlan, 'show_lacp_configuration'])
+
+    assert list(result.keys()) == ['show vlan', 'show lacp configuration']
+    assert result['show vlan']['2']['ports'] == ['7', '3']
+    assert result['show lacp configuration'] == {
+        'id': '70:72:cf:af:66:e7',
+        'priority': 65534
+    }
+
+
+def test_snapshot(enode):
+    check_snapshot(enode)
+    assert enode.calls == ['show vlan', 'show lacp configuration']
+
+
+def test_snapshot_single_call(batch_enode):
+    check_snapshot(batch_enode)
+    assert len(batch_enode.calls) == 1
+
+
+def test_snapshot_hooks(enode, batch_enode):
+    events = []
+
+    class Events(Hook):
+        def pre_call(self, enode, name, command):
+            events.append(('pre_call', name, command))
+
+        def post_call(self, enode, name, command, seconds, size):
+            events.append(('post_call', name, command))
+
+    hook = Events()
+    add_hook(hook)
+    try:
+        assert render(enode, show_vlan) == 'show vlan'
+        assert not events
+        snapshot(enode, [show_vlan])
+    finally:
+        remove_hook(hook)
+
+    assert events == [
+        ('pre_call', 'snapshot', 'show vlan'),
+        ('post_call', 'snapshot', 'show vlan'),
+    ]
+
+    with raises(RoundTripBudgetExceeded):
+        with RoundTripBudget(enode, 0):
+            snapshot(enode, [show_vlan])
+
+    with RoundTripBudget(batch_enode, 1) as budget:
+        snapshot(batch_enode, [show_vlan, (show_vlan, '10')])
+    assert budget.round_trips.by_name == {'snapshot': 1}
+
+
+def test_render_errors(enode):
+    with raises(ValueError):
+        render(enode, len)
@@ -0,0 +1,147 @@
+{%- macro param_attrs(attrs) -%}
+{% if attrs -%}
+, {% for attr in attrs -%}
+{{ attr.name|variablize }}
+{%- if 'optional' in attr.keys() and attr.optional %}=''{% endif %}
+{%- if not loop.last %}, {% endif -%}
+{%- endfor %}
+{%- endif %}
+{%- endmacro -%}
+{%- macro command_row(command, first, width) -%}
+(
+    {{ command.command|methodize|literal }},
+    {{ command.command|templatize|literal }},{% if command.command|length > 79 - width - 16 %}  # noqa{% endif %}
+    (
+    {%- for attr in command.arguments -%}
+    {{ attr.name|variablize|literal }}, {% endfor -%}
+    ),
+    {% if command.arguments|selectattr('optional', 'defined')|list -%}
+    (
+    {%- for attr in command.arguments if 'optional' in attr.keys() and attr.optional %}
+        ({{ attr.name|variablize|literal }}, {{ (' %s%%(%s)s%s'|format(attr.prefix|default('')|replace('%', '%%'), attr.name|variablize, attr.suffix|default('')|replace('%', '%%')))|literal }}),
+    {%- endfor %}
+    ),
+    {%- else -%}
+    (),
+    {%- endif %}
+    {{ command|static|literal }},
+    {{ command|positional|literal }},{% if command.command|length > 79 - width - 8 %}  # noqa{% endif %}
+    {% if 'returns' in command.keys() and command.returns -%}
+    {{ 'parse_%s'|format(command.command|methodize)|literal }},
+    {%- else -%}
+    None,
+    {%- endif %}
+    r"""
+    {{ '%s(%s)'|format(command.command|methodize, (first ~ param_attrs(command.arguments)).lstrip(', '))|wordwrap(75 - width)|indent(8) }}
+
+    {{ command.doc|wordwrap(75 - width)|indent(4) }}
+
+    This function runs the following vtysh command:
+
+    ::
+
+        # {{ command.command }}{% if command.command|length > 79 - width - 10 %}  # noqa{% endif %}
+
+    {% for attr in command.arguments -%}
+    {{ ':param %s: %s'|format(attr.name, attr.doc)|wordwrap(75 - width)|indent(5) }}
+    {% endfor -%}
+    {%- if 'returns' in command.keys() and command.returns -%}
+    :return: A dictionary as returned by
+     :func:`topology_lib_vtysh.parser.{{ 'parse_%s'|format(command.command|methodize) }}`
+    {% endif -%}
+    """
+),
+{%- endmacro -%}
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Vtysh auto-generated command table.
+
+The format of the table is described in :mod:`topology_lib_vtysh.dispatch`,
+which turns it into the functions and classes of the library.
+
+.. warning::
+
+   This is auto-generated, do not modify manually!!
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+
+ROOT = (
+{%- for command in spec.root.commands %}
+    {{ command_row(command, 'enode', 8)|indent(4) }}
+{%- endfor %}
+)
+
+
+CONTEXTS = (
+{%- for context_name, context in spec.items() if context_name != 'root' %}
+    (
+        {{ context_name|objectize|literal }},
+        r"""
+        {{ context.doc|wordwrap(71)|indent(8) }}
+
+        pre_commands:
+
+        ::
+
+            {{ context.pre_commands }}
+
+        post_commands:
+
+        ::
+
+            {{ context.post_commands }}
+        """,
+        (
+        {%- for arg in context.arguments -%}
+            {{ arg.name|variablize|literal }}, {% endfor -%}
+        ),
+        (
+        {%- for pre_command in context.pre_commands %}
+            {{ pre_command|literal }},
+        {%- endfor %}
+        ),
+        (
+        {%- for post_command in context.post_commands %}
+            {{ post_command|literal }},
+        {%- endfor %}
+        ),
+        {% if 'range' in context.keys() and context.range -%}
+        r"""
+        Range of :class:`{{ context_name|objectize }}` contexts.
+
+        {{ ':param list members: List of %s values. %s'|format(context.arguments[0].name, context.arguments[0].doc)|wordwrap(67)|indent(9) }}
+        """,
+        {%- else -%}
+        None,
+        {%- endif %}
+        (
+        {%- for command in context.commands %}
+            {{ command_row(command, '', 16)|indent(12) }}
+        {%- endfor %}
+        ),
+    ),
+{%- endfor %}
+)
+
+
+__all__ = ['ROOT', 'CONTEXTS']
+{# #}
@@ -1,12 +1,3 @@
-{%- macro param_attrs(attrs) -%}
-{% if attrs -%}
-, {% for attr in attrs -%}
-{{ attr.name|variablize }}
-{%- if 'optional' in attr.keys() and attr.optional %}=''{% endif %}
-{%- if not loop.last %}, {% endif -%}
-{%- endfor %}
-{%- endif %}
-{%- endmacro -%}
 # -*- coding: utf-8 -*-
 #
 # Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
@@ -27,6 +18,12 @@
 """
 Vtysh auto-generated communication library module.
 
+The functions and contexts of this module are created from the command table
+in :mod:`topology_lib_vtysh.commands`. On Python 3.7 or later each one is
+created the first time it is used, and the parsers, that can be taken from
+this module too, are not imported until one of them is needed, so importing
+the module is cheap.
+
 .. warning::
 
    This is auto-generated, do not modify manually!!
@@ -35,11 +32,18 @@ Vtysh auto-generated communication library module.
 from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
-from .parser import *  # noqa
+from sys import version_info
+
 from .exceptions import determine_exception
+from .batch import run_batch
+from .session import ContextState, RangeState
+from .instrument import _HOOKS, pre_call, post_call, run_parser
+from .cache import _ENABLED, invalidate, run_cached
+from .dispatch import NAME, TEMPLATE, renderer, Binder
+from .commands import ROOT, CONTEXTS
 
 
-class ContextManager(object):
+class ContextManager(ContextState):
     """
     This class defines a context manager object.
 
@@ -55,173 +59,270 @@ class ContextManager(object):
     the **post_commands** will clean the vtysh terminal. Every implementation
     of this class document their pre_commands and post_commands.
 
+    The vtysh mode of every enode is tracked, so nested contexts only run the
+    pre_commands that are missing to get to their mode, and go back to the
+    mode of the enclosing context with ``exit`` instead of running their
+    post_commands. Only the outermost context runs its post_commands. To
+    share this between contexts that are used one after the other, enclose
+    them in a :class:`ConfigSession`.
+
+    Contexts can also be run in batch mode:
+
+    ::
+
+        with ClassName(parameters, batch=True) as ctx:
+            ctx.first_function()
+            ctx.second_function()
+
+    In batch mode nothing is sent to the enode until the context exits. Then
+    the pre_commands, the commands of every function called and the
+    post_commands are sent one after the other. The first one that fails
+    stops the batch, the commands that go back to the mode of the enclosing
+    context, or ``end`` for the outermost one, are sent, and its exception is
+    raised at the end of the ``with`` block, with the ``command`` attribute
+    telling which command failed. As every command is still a shell call,
+    batch mode saves no round trips on these enodes. Enodes that run several
+    commands sent in one shell call get the whole batch in a single call
+    instead, see :func:`topology_lib_vtysh.batch.supports_batch`, and run the
+    rest of the batch after an error. Contexts opened inside a batch context
+    join its batch. If the block raises, nothing is sent.
     """
 
-{% for context_name, context in spec.items() if context_name != 'root' %}
-class {{ context_name|objectize }}(ContextManager):
+    def __enter__(self):
+        self._enter(self._pre_commands)
+
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self._exit(self._post_commands, failed=type is not None)
+
+    def _send(self, commands):
+        """
+        Run a list of mode commands.
+        """
+        if commands:
+            name = type(self).__name__
+            line = '\n'.join(commands)
+            start = pre_call(self.enode, name, line)
+            self.enode.libs.common.assert_batch(line, shell='vtysh')
+            post_call(self.enode, name, line, start, '')
+
+    def _enter(self, commands):
+        """
+        Go to the mode of this context.
+
+        :param tuple commands: The pre_commands of the context, or ``None``
+         if the context does not care about the mode.
+        """
+        commands = self._open(commands)
+        try:
+            self._send(commands)
+        except Exception:
+            self._abort()
+            raise
+        invalidate(self.enode)
+
+    def _exit(self, commands, failed=False):
+        """
+        Leave the mode of this context, and send the batch if this context
+        started it.
+
+        :param tuple commands: The post_commands of the context.
+        :param bool failed: True if the ``with`` block raised.
+        """
+        try:
+            self._send(self._close(commands))
+        finally:
+            invalidate(self.enode)
+
+        queue, recover = self._flush(failed)
+        if queue is not None:
+            run_batch(self.enode, queue, recover=recover)
+            invalidate(self.enode)
+
+    def _run(self, command, name=None):
+        """
+        Run a context command, or queue it when in batch mode.
+        """
+        invalidate(self.enode)
+
+        if self._queue is not None:
+            self._queue.append(command)
+            return ''
+
+        name = name or type(self).__name__
+        start = pre_call(self.enode, name, command)
+        result = self.enode(command, shell='vtysh')
+        post_call(self.enode, name, command, start, result)
+        return result
+
+
+class ConfigSession(ContextManager):
     """
-    {{ context.doc|wordwrap(75)|indent(4) }}
+    Share the vtysh mode between several contexts.
 
-    pre_commands:
+    Contexts used inside a session go from the mode of one to the mode of the
+    next one directly, and ``end`` is run only once when the session exits:
 
     ::
 
-            {{ context.pre_commands }}
+        with ConfigSession(enode, batch=True):
+            with ConfigInterface(enode, '1') as ctx:
+                ctx.no_shutdown()
+            with ConfigVlan(enode, '10') as ctx:
+                ctx.no_shutdown()
+
+    .. note::
 
-    post_commands:
+       Inside a session the shell can remain in a configuration mode between
+       contexts, so commands that need the exec mode must be run outside it.
+    """
+    def __init__(self, enode, batch=False):
+        self.enode = enode
+        self._batch = batch
+
+
+class ContextRange(RangeState, ContextManager):
+    """
+    Run the functions of a context on several instances of it at once.
+
+    Usage:
 
     ::
 
-            {{ context.post_commands }}
+        with ClassNameRange(enode, ['1', '2', '3']) as ctx:
+            ctx.first_function()
+            ctx.second_function()
+
+    Every function called is applied to every member of the range when the
+    context exits, one member after the other, and everything is sent in a
+    single batch. Arguments are validated when the functions are called.
+
+    :param list members: Values of the context argument, one per member.
     """
-    def __init__({{ 'self, enode%s):'|format(param_attrs(context.arguments))|wordwrap(67)|indent(12) }}
-        self.enode = enode
-        {%- for arg in context.arguments %}
-        {% if arg.name == 'portlbl' -%}
-        self.port = enode.ports.get(portlbl, portlbl)
-        {%- else -%}
-        self.{{ arg.name }} = {{ arg.name }}
-        {%- endif %}
-        {%- endfor %}
 
-    def __enter__(self):
-        commands = """\
-        {%- for pre_command in context.pre_commands %}
-            {{ pre_command }}
-        {%- endfor %}
-        """
+    def __getattr__(self, name):
+        return self._defer(name)
 
-        self.enode.libs.common.assert_batch(
-            commands,
-            replace=self.__dict__,
-            shell='vtysh'
-        )
+    def __enter__(self):
+        self._enter(None)
+        self._take()
 
         return self
 
     def __exit__(self, type, value, traceback):
-        commands = """\
-        {%- for post_command in context.post_commands %}
-            {{ post_command }}
-        {%- endfor %}
-        """
-
-        self.enode.libs.common.assert_batch(
-            commands,
-            replace=self.__dict__,
-            shell='vtysh'
-        )
-{% for command in context.commands %}
-    def {{ command.command|methodize }}(
-            {{ 'self%s):'|format(param_attrs(command.arguments))|wordwrap(56)|indent(12) }}
-        """
-        {{ command.doc|wordwrap(71)|indent(8) }}
-
-        This function runs the following vtysh command:
-
-        ::
-
-            # {{ command.command }}{% if command.command|length > 65%}  # noqa{% endif %}
-
-        {% for attr in command.arguments -%}
-        {{ ':param %s: %s'|format(attr.name, attr.doc)|wordwrap(70)|indent(12) }}
-        {% endfor -%}
-        {%- if 'returns' in command.keys() and command.returns -%}
-        :return: A dictionary as returned by
-         :func:`topology_lib_vtysh.parser.{{ 'parse_%s'|format(command.command|methodize) }}`
-        {% endif -%}
-        """{% if command.command|length > 66%}  # noqa{% endif %}
-
-        cmd = [
-            '{{command.command}}'{% if command.command|length > 65%}  # noqa{% endif %}
-        ]
-        {%- for attr in command.arguments -%}
-            {% if attr.name == 'portlbl' %}
-
-        port = self.enode.ports.get(portlbl, portlbl)
-            {%- elif 'optional' in attr.keys() and attr.optional %}
-
-        if {{attr.name}}:
-            cmd.append(
-                '{{"{}{{"}}{{attr.name}}{{"}}{}"}}'.format(
-                    '{{ '' if 'prefix' not in attr.keys() else attr.prefix }}',
-                    {{-' '}}'{{ '' if 'suffix' not in attr.keys() else attr.suffix }}'
-                )
-            )
-            {%- endif -%}
-        {%- endfor %}
-
-        result = self.enode(
-            (' '.join(cmd)).format(**locals()),
-            shell='vtysh'
-        )
+        calls = self._take()
+        failed = True
+        try:
+            if type is None:
+                for member in self.members:
+                    with member:
+                        for name, args, kwargs in calls:
+                            getattr(member, name)(*args, **kwargs)
+                failed = False
+        finally:
+            self._exit((), failed=failed)
+
+
+def _function(command, parse):
+    """
+    Create a root function of the library from its command.
+    """
+    name = command[NAME]
+    cached = command[TEMPLATE].startswith('show ')
+    render = renderer(command)
+
+    def function(enode, *args, **kwargs):
+        line = render(enode, args, kwargs)
+        # Without hooks nor caches there is nothing to report or flush
+        if not _HOOKS and not _ENABLED:
+            result = enode(line, shell='vtysh')
+            if parse is not None:
+                return parse(result)
+        elif cached:
+            return run_cached(enode, line, parse, name)
+        else:
+            start = pre_call(enode, name, line)
+            result = enode(line, shell='vtysh')
+            post_call(enode, name, line, start, result)
+            if parse is not None:
+                return run_parser(enode, name, line, parse, result)
+            invalidate(enode)
 
-        {% if 'returns' in command.keys() and command.returns -%}
-        {{ 'return parse_%s(result)'|format(command.command|methodize) }}
-        {%- else -%}
         if result:
-            raise determine_exception(result)(result)
-        {%- endif %}
-{% endfor %}
-{% endfor -%}
-
-{% for command in spec.root.commands %}
-def {{ command.command|methodize }}(
-        {{'enode%s):'|format(param_attrs(command.arguments))|wordwrap(67)|indent(8) }}
-    """
-    {{ command.doc|wordwrap(71)|indent(4) }}
+            raise determine_exception(result)(result, command=line)
+    function.render = render
+    return function
 
-    This function runs the following vtysh command:
 
-    ::
+def _method(command, parse):
+    """
+    Create a context method of the library from its command.
+    """
+    name = command[NAME]
+    render = renderer(command)
+
+    def method(self, *args, **kwargs):
+        line = render(self.enode, args, kwargs)
+        if self._queue is None and not _HOOKS and not _ENABLED:
+            result = self.enode(line, shell='vtysh')
+            if parse is not None:
+                return parse(result)
+        else:
+            qualified = '{}.{}'.format(type(self).__name__, name)
+            result = self._run(line, qualified)
+            if parse is not None:
+                return run_parser(self.enode, qualified, line, parse, result)
 
-        # {{ command.command }}{% if command.command|length > 68%}  # noqa{% endif %}
-
-    {% for attr in command.arguments -%}
-    {{ ':param %s: %s'|format(attr.name, attr.doc)|wordwrap(75)|indent(5) }}
-    {% endfor -%}
-    {%- if 'returns' in command.keys() and command.returns -%}
-    :return: A dictionary as returned by
-     :func:`topology_lib_vtysh.parser.{{ 'parse_%s'|format(command.command|methodize) }}`
-    {% endif -%}
-    """{% if command.command|length > 69%}  # noqa{% endif %}
-
-    cmd = [
-        '{{command.command}}'
-    ]
-    {%- for attr in command.arguments -%}
-        {% if attr.name == 'portlbl' %}
-
-    port = enode.ports.get(portlbl, portlbl)
-        {%- elif 'optional' in attr.keys() and attr.optional %}
-
-    if {{attr.name}}:
-        cmd.append(
-            '{{"{}{{"}}{{attr.name}}{{"}}{}"}}'.format(
-                '{{ '' if 'prefix' not in attr.keys() else attr.prefix }}',
-                {{-' '}}'{{ '' if 'suffix' not in attr.keys() else attr.suffix }}'
-            )
+        if result:
+            raise determine_exception(result)(result, command=line)
+    method.render = render
+    return method
+
+
+_binder = Binder(
+    ROOT, CONTEXTS, _function, _method, ContextManager, ContextRange
+)
+
+if version_info >= (3, 7):
+    def _parser(name):
+        # The parsers can be taken from this module too, but the parser
+        # module is only imported when one of them is asked for
+        if name.startswith(('parse_', 'iter_')):
+            from . import parser
+            if name in parser.__all__:
+                return getattr(parser, name)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
         )
-        {%- endif -%}
-    {%- endfor %}
-
-    result = enode(
-        (' '.join(cmd)).format(**locals()),
-        shell='vtysh'
-    )
-
-    {% if 'returns' in command.keys() and command.returns -%}
-    {{ 'return parse_%s(result)'|format(command.command|methodize) }}
-    {%- else -%}
-    if result:
-        raise determine_exception(result)(result)
-    {%- endif %}
 
-{% endfor %}
+    def __getattr__(name):
+        try:
+            bound = _binder.get(name)
+        except KeyError:
+            bound = _parser(name)
+        globals()[name] = bound
+        return bound
+
+    def __dir__():
+        from . import parser
+        return sorted(
+            set(globals()) | set(_binder.names()) | set(parser.__all__)
+        )
+else:
+    from .parser import *  # noqa
+    globals().update(_binder.build())
+
+
 __all__ = [
     'ContextManager',
-{%- for context_name in spec.keys() if context_name != 'root' %}
+    'ConfigSession',
+    'ContextRange',
+{%- for context_name, context in spec.items() if context_name != 'root' %}
     '{{ context_name|objectize }}',
+    {%- if 'range' in context.keys() and context.range %}
+    '{{ context_name|objectize }}Range',
+    {%- endif %}
 {%- endfor %}
 {%- for function in spec.root.commands %}
     '{{ function.command|methodize }}'{% if not loop.last %},{% endif %}
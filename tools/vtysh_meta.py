@@ -977,6 +977,7 @@ VTYSH_SPEC = OrderedDict([
         ],
         'pre_commands': ['config terminal', 'interface {port}'],
         'post_commands': ['end'],
+        'range': True,
         'commands': [
             {
                 'command': 'ip address {ipv4}',
@@ -1429,6 +1430,7 @@ VTYSH_SPEC = OrderedDict([
         ],
         'pre_commands': ['config terminal', 'interface lag {lag}'],
         'post_commands': ['end'],
+        'range': True,
         'commands': [
             {
                 'command': 'ip address {ipv4}',
@@ -2267,6 +2269,7 @@ VTYSH_SPEC = OrderedDict([
         ],
         'pre_commands': ['config terminal', 'vlan {vlan_id}'],
         'post_commands': ['end'],
+        'range': True,
         'commands': [
             {
                 'command': 'shutdown',